@@ -246,7 +246,7 @@ async def stop_stream(
     """
     try:
         # Stop stream processing
-        metrics = await stream_processor.stop_stream()
+        metrics = await stream_processor.stop_stream(session_id)
 
         # Stop quality monitoring
         quality_report = await quality_monitor.stop_monitoring(session_id)
@@ -268,12 +268,12 @@ async def get_stream_status(
 ) -> Dict[str, Any]:
     """Get current stream status and metrics."""
 
-    if stream_processor.current_session_id != session_id:
+    if not stream_processor.has_session(session_id):
         raise HTTPException(
             status_code=404, detail=f"Stream session {session_id} not found"
         )
 
-    return stream_processor.get_stream_metrics()
+    return stream_processor.get_stream_metrics(session_id)
 
 
 # WebSocket endpoint for streaming
@@ -291,7 +291,7 @@ async def stream_websocket(
 
     try:
         # Verify session exists
-        if stream_processor.current_session_id != session_id:
+        if not stream_processor.has_session(session_id):
             await websocket.send_json({"error": f"Session {session_id} not found"})
             await websocket.close()
             return
@@ -306,11 +306,15 @@ async def stream_websocket(
                 chunk_data = np.array(data["data"], dtype=np.float32)
                 timestamp = data.get("timestamp")
 
-                success = await stream_processor.process_chunk(chunk_data, timestamp)
+                success = await stream_processor.process_chunk(
+                    chunk_data, timestamp, session_id=session_id
+                )
 
                 if success:
                     # Get latest features
-                    features = await stream_processor.get_latest_features()
+                    features = await stream_processor.get_latest_features(
+                        session_id=session_id
+                    )
 
                     # Send response
                     await websocket.send_json(
@@ -318,7 +322,7 @@ async def stream_websocket(
                             "type": "processed",
                             "session_id": session_id,
                             "features": features or {},
-                            "metrics": stream_processor.get_stream_metrics(),
+                            "metrics": stream_processor.get_stream_metrics(session_id),
                         }
                     )
                 else:
@@ -0,0 +1,7 @@
+"""Shared utilities for NeuraScale Neural Engine packages.
+
+Modules here depend only on NumPy and SciPy, so the processing stack, the
+Dataflow workers, the ledger and the model servers can import them without
+pulling in each other's dependencies. Import the modules directly, e.g.
+``from common.entropy import sample_entropy``.
+"""
@@ -0,0 +1,281 @@
+"""Prefetching batch loader filling preallocated, contiguous batch buffers."""
+
+import logging
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BatchLoader:
+    """Iterate over (data, labels) in batches prepared on background threads.
+
+    Each batch is gathered directly into one of a small ring of preallocated
+    ``(batch_size, ...)`` arrays, so no per-batch allocation or intermediate
+    copy is made. While the consumer works on a batch, worker threads fill
+    the next ``prefetch`` batches; NumPy releases the GIL while copying, so
+    reading from memory-mapped caches overlaps with training.
+
+    A yielded batch is a view of a reused buffer and stays valid until the
+    next batch is requested; copy it to keep it longer.
+
+    Shuffling is deterministic: the order of an epoch depends only on
+    ``seed`` and the epoch number set with ``set_epoch``. With ``num_shards``
+    > 1 every shard (e.g. one per training process) iterates a disjoint,
+    equally sized part of the same permutation.
+
+    ``data`` can be a NumPy array (including memory-mapped arrays), an object
+    with a ``take(indices, out=...)`` method such as the dataset cache's
+    ``ShardedArray``, or any sequence whose items are arrays or samples with
+    ``data`` and ``label`` attributes.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        labels: Optional[Any] = None,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        prefetch: int = 2,
+        num_workers: int = 1,
+        seed: Optional[int] = None,
+        num_shards: int = 1,
+        shard_index: int = 0,
+        dtype: Optional[Union[str, np.dtype]] = None,
+    ):
+        """
+        Initialize batch loader.
+
+        Args:
+            data: Samples indexed along the first axis
+            labels: Labels per sample (taken from the samples if None)
+            batch_size: Samples per batch
+            shuffle: Whether to shuffle the samples every epoch
+            drop_last: Whether to drop the last incomplete batch
+            prefetch: Batches prepared ahead (0 fills batches on demand)
+            num_workers: Threads filling batches
+            seed: Shuffle seed (drawn from NumPy's global RNG if None)
+            num_shards: Number of shards the samples are split into
+            shard_index: Shard iterated by this loader
+            dtype: Data type of the batches (the data's type if None)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(
+                f"shard_index must be in [0, {num_shards}), got {shard_index}"
+            )
+
+        self.data = data
+        self.labels = np.asarray(labels) if labels is not None else None
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = max(0, prefetch)
+        self.num_workers = max(1, num_workers)
+        self.seed = int(np.random.randint(2**31)) if seed is None else seed
+        self.num_shards = num_shards
+        self.shard_index = shard_index
+        self.epoch = 0
+
+        if hasattr(data, "shape") and hasattr(data, "dtype"):
+            self._from_items = False
+            self.sample_shape: Tuple[int, ...] = tuple(data.shape[1:])
+            self.dtype = np.dtype(dtype or data.dtype)
+        else:
+            first = data[0]
+            self._from_items = not isinstance(first, np.ndarray) and hasattr(
+                first, "data"
+            )
+            first = np.asarray(first.data if self._from_items else first)
+            self.sample_shape = first.shape
+            self.dtype = np.dtype(dtype or first.dtype)
+
+        if self.labels is not None:
+            self._label_spec: Optional[Tuple[Tuple[int, ...], np.dtype]] = (
+                self.labels.shape[1:],
+                self.labels.dtype,
+            )
+        elif self._from_items and getattr(data[0], "label", None) is not None:
+            label = np.asarray(data[0].label)
+            self._label_spec = (label.shape, label.dtype)
+        else:
+            self._label_spec = None
+
+    def set_epoch(self, epoch: int):
+        """
+        Select the epoch whose shuffled order is iterated next.
+
+        Args:
+            epoch: Epoch number
+        """
+        self.epoch = epoch
+
+    def epoch_indices(self, epoch: Optional[int] = None) -> np.ndarray:
+        """
+        Sample indices of this loader's shard in iteration order.
+
+        When the samples do not split evenly, the permutation is padded by
+        wrapping around so every shard gets the same number of samples.
+
+        Args:
+            epoch: Epoch number (the current epoch if None)
+
+        Returns:
+            Sample indices
+        """
+        epoch = self.epoch if epoch is None else epoch
+        n_samples = len(self.data)
+        if self.shuffle:
+            order = np.random.default_rng([self.seed, epoch]).permutation(n_samples)
+        else:
+            order = np.arange(n_samples)
+
+        if self.num_shards > 1:
+            per_shard = -(-n_samples // self.num_shards)
+            order = np.resize(order, per_shard * self.num_shards)
+            order = order[self.shard_index :: self.num_shards]
+        return order
+
+    def __len__(self) -> int:
+        """Number of batches per epoch."""
+        n_samples = len(self.epoch_indices())
+        if self.drop_last:
+            return n_samples // self.batch_size
+        return -(-n_samples // self.batch_size)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """Iterate over the batches of the current epoch."""
+        indices = self.epoch_indices()
+        batches = [
+            indices[start : start + self.batch_size]
+            for start in range(0, len(indices), self.batch_size)
+        ]
+        if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+            batches.pop()
+
+        if self.prefetch == 0:
+            return self._iter_sync(batches)
+        return self._iter_prefetch(batches)
+
+    def _allocate(self, n_buffers: int) -> List[Tuple[np.ndarray, Optional[Any]]]:
+        """Preallocate batch buffers."""
+        buffers = []
+        for _ in range(n_buffers):
+            data = np.empty((self.batch_size,) + self.sample_shape, dtype=self.dtype)
+            labels = None
+            if self._label_spec is not None:
+                shape, dtype = self._label_spec
+                labels = np.empty((self.batch_size,) + shape, dtype=dtype)
+            buffers.append((data, labels))
+        return buffers
+
+    def _fill(self, buffer: Tuple[np.ndarray, Optional[np.ndarray]], idx: np.ndarray):
+        """Gather the samples of a batch into a buffer."""
+        data_out = buffer[0][: len(idx)]
+        labels_out = buffer[1][: len(idx)] if buffer[1] is not None else None
+
+        if isinstance(self.data, np.ndarray):
+            np.take(self.data, idx, axis=0, out=data_out, mode="clip")
+        elif hasattr(self.data, "take"):
+            self.data.take(idx, out=data_out)
+        else:
+            for j, i in enumerate(idx):
+                sample = self.data[int(i)]
+                if self._from_items:
+                    data_out[j] = sample.data
+                    if self.labels is None and labels_out is not None:
+                        labels_out[j] = sample.label
+                else:
+                    data_out[j] = sample
+
+        if self.labels is not None:
+            np.take(self.labels, idx, axis=0, out=labels_out, mode="clip")
+
+    @staticmethod
+    def _view(
+        buffer: Tuple[np.ndarray, Optional[np.ndarray]], n: int
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """The filled part of a buffer."""
+        return buffer[0][:n], buffer[1][:n] if buffer[1] is not None else None
+
+    def _iter_sync(
+        self, batches: List[np.ndarray]
+    ) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """Fill each batch when it is requested."""
+        buffer = self._allocate(1)[0]
+        for idx in batches:
+            self._fill(buffer, idx)
+            yield self._view(buffer, len(idx))
+
+    def _iter_prefetch(
+        self, batches: List[np.ndarray]
+    ) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """Fill batches ahead of the consumer on worker threads."""
+        # One buffer is held by the consumer, the others are being filled
+        buffers = self._allocate(max(self.prefetch, self.num_workers) + 1)
+        free: "queue.Queue[Optional[int]]" = queue.Queue()
+        for buffer_id in range(len(buffers)):
+            free.put(buffer_id)
+
+        ready: Dict[int, Any] = {}
+        ready_cond = threading.Condition()
+        next_batch = [0]
+        next_lock = threading.Lock()
+
+        def worker():
+            while True:
+                # Take a buffer before a batch number, so the oldest pending
+                # batch always has a buffer and the consumer cannot starve
+                buffer_id = free.get()
+                if buffer_id is None:
+                    return
+                with next_lock:
+                    batch = next_batch[0]
+                    next_batch[0] += 1
+                if batch >= len(batches):
+                    return
+
+                try:
+                    self._fill(buffers[buffer_id], batches[batch])
+                    item: Any = buffer_id
+                except Exception as e:
+                    logger.error(f"Error preparing batch {batch}: {e}")
+                    item = e
+                with ready_cond:
+                    ready[batch] = item
+                    ready_cond.notify_all()
+
+        threads = [
+            threading.Thread(target=worker, name=f"batch-loader-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        held: Optional[int] = None
+        try:
+            for batch, idx in enumerate(batches):
+                # The consumer is done with the previous batch
+                if held is not None:
+                    free.put(held)
+                    held = None
+
+                with ready_cond:
+                    while batch not in ready:
+                        ready_cond.wait()
+                    item = ready.pop(batch)
+                if isinstance(item, Exception):
+                    raise item
+
+                held = item
+                yield self._view(buffers[held], len(idx))
+        finally:
+            for _ in threads:
+                free.put(None)
+            for thread in threads:
+                thread.join()
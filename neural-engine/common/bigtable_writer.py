@@ -0,0 +1,382 @@
+"""Batched asynchronous Bigtable writer shared by ingestion and the ledger.
+
+Rows are queued per table and flushed with one ``mutate_rows`` call when a
+batch reaches its size limit or when the flush interval elapses. The number
+of queued rows and of batches in flight are bounded, failed rows are retried
+with exponential backoff, and flush latency and batch size histograms are
+kept for monitoring. Backends are pluggable so the writer can run against
+an in-memory fake offline.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from common.histogram import Histogram
+
+logger = logging.getLogger(__name__)
+
+CellValue = Union[bytes, str, int]
+
+
+class BigtableWriteError(Exception):
+    """Raised for rows that could not be written after all retries."""
+
+
+@dataclass
+class RowMutation:
+    """Cells to write to one Bigtable row."""
+
+    table_id: str
+    row_key: bytes
+    cells: List[Tuple[str, str, CellValue, Optional[datetime]]] = field(
+        default_factory=list
+    )
+
+    def set_cell(
+        self,
+        column_family_id: str,
+        column: str,
+        value: CellValue,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Set a cell, mirroring ``DirectRow.set_cell``."""
+        self.cells.append((column_family_id, column, value, timestamp))
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate payload size of the mutation."""
+        size = len(self.row_key)
+        for family, column, value, _ in self.cells:
+            value_size = len(value) if isinstance(value, (bytes, str)) else 8
+            size += len(family) + len(column) + value_size
+        return size
+
+
+class BigtableBackend:
+    """Storage backend interface used by the batch writer."""
+
+    def mutate_rows(self, table_id: str, rows: Sequence[RowMutation]) -> List[bool]:
+        """Write rows to a table in one call.
+
+        Args:
+            table_id: Target table
+            rows: Rows to write
+
+        Returns:
+            Per-row success flags
+        """
+        raise NotImplementedError
+
+
+class CloudBigtableBackend(BigtableBackend):
+    """Backend writing through a ``google.cloud.bigtable`` client."""
+
+    def __init__(self, client: Any, instance_id: str):
+        """Initialize the backend.
+
+        Args:
+            client: Initialized Bigtable client
+            instance_id: Bigtable instance ID
+        """
+        self.instance = client.instance(instance_id)
+        self._tables: Dict[str, Any] = {}
+
+    def table(self, table_id: str) -> Any:
+        """Get a cached table handle."""
+        if table_id not in self._tables:
+            self._tables[table_id] = self.instance.table(table_id)
+        return self._tables[table_id]
+
+    def mutate_rows(self, table_id: str, rows: Sequence[RowMutation]) -> List[bool]:
+        """Write rows with a single ``Table.mutate_rows`` call."""
+        table = self.table(table_id)
+        direct_rows = []
+        for mutation in rows:
+            row = table.direct_row(mutation.row_key)
+            for family, column, value, timestamp in mutation.cells:
+                row.set_cell(family, column, value, timestamp=timestamp)
+            direct_rows.append(row)
+
+        statuses = table.mutate_rows(direct_rows)
+        return [status.code == 0 for status in statuses]
+
+
+class InMemoryBigtableBackend(BigtableBackend):
+    """In-memory fake backend for offline use and tests."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        """Initialize the fake backend.
+
+        Args:
+            latency_ms: Simulated latency of each mutate_rows call
+        """
+        self.latency_ms = latency_ms
+        self.tables: Dict[str, Dict[bytes, Dict[Tuple[str, str], CellValue]]] = {}
+        self.calls: List[Tuple[str, int]] = []
+        self._failures_remaining = 0
+        self._raise_remaining = 0
+
+    def fail_next_rows(self, count: int) -> None:
+        """Report the next ``count`` rows as failed."""
+        self._failures_remaining += count
+
+    def raise_next_calls(self, count: int) -> None:
+        """Raise from the next ``count`` mutate_rows calls."""
+        self._raise_remaining += count
+
+    def mutate_rows(self, table_id: str, rows: Sequence[RowMutation]) -> List[bool]:
+        """Store rows in memory, honouring injected failures."""
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        self.calls.append((table_id, len(rows)))
+
+        if self._raise_remaining:
+            self._raise_remaining -= 1
+            raise ConnectionError("Injected mutate_rows failure")
+
+        table = self.tables.setdefault(table_id, {})
+        results = []
+        for mutation in rows:
+            if self._failures_remaining:
+                self._failures_remaining -= 1
+                results.append(False)
+                continue
+            cells = table.setdefault(mutation.row_key, {})
+            for family, column, value, _ in mutation.cells:
+                cells[(family, column)] = value
+            results.append(True)
+
+        return results
+
+
+@dataclass
+class BatchWriterConfig:
+    """Configuration for the batch writer."""
+
+    max_batch_rows: int = 500
+    max_batch_bytes: int = 4 * 1024 * 1024
+    flush_interval_ms: float = 50.0
+    max_in_flight_batches: int = 4
+    max_pending_rows: int = 10000
+    max_retries: int = 5
+    initial_backoff_ms: float = 50.0
+    max_backoff_ms: float = 5000.0
+    backoff_multiplier: float = 2.0
+
+
+class BigtableBatchWriter:
+    """Asynchronous batching writer on top of a Bigtable backend."""
+
+    LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+    BATCH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(
+        self,
+        backend: BigtableBackend,
+        config: Optional[BatchWriterConfig] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """Initialize the batch writer.
+
+        Args:
+            backend: Storage backend
+            config: Writer configuration
+            executor: Thread pool for blocking backend calls
+        """
+        self.backend = backend
+        self.config = config or BatchWriterConfig()
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=self.config.max_in_flight_batches,
+            thread_name_prefix="bigtable-writer",
+        )
+        self._owns_executor = executor is None
+
+        # Queued rows per table with their completion futures
+        self._pending: Dict[str, List[Tuple[RowMutation, asyncio.Future]]] = {}
+        self._pending_bytes: Dict[str, int] = {}
+
+        # Created on first use inside the running event loop
+        self._capacity: Optional[asyncio.Semaphore] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+        self._closed = False
+
+        self.flush_latency_ms = Histogram(self.LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(self.BATCH_SIZE_BUCKETS)
+        self.stats = {
+            "rows_written": 0,
+            "rows_failed": 0,
+            "rows_retried": 0,
+            "batches_flushed": 0,
+        }
+
+    def _ensure_started(self) -> None:
+        """Create loop-bound primitives and the periodic flush task."""
+        if self._capacity is None:
+            self._capacity = asyncio.Semaphore(self.config.max_pending_rows)
+            self._in_flight = asyncio.Semaphore(self.config.max_in_flight_batches)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def write(self, mutation: RowMutation) -> asyncio.Future:
+        """Queue a row for writing.
+
+        Waits only while the writer is at its pending-row limit.
+
+        Args:
+            mutation: Row to write
+
+        Returns:
+            Future resolved once the row is written, or failed with
+            BigtableWriteError after all retries
+        """
+        if self._closed:
+            raise RuntimeError("Bigtable writer is closed")
+
+        self._ensure_started()
+        await self._capacity.acquire()
+
+        future = asyncio.get_running_loop().create_future()
+        table_id = mutation.table_id
+        self._pending.setdefault(table_id, []).append((mutation, future))
+        self._pending_bytes[table_id] = (
+            self._pending_bytes.get(table_id, 0) + mutation.size_bytes
+        )
+
+        if (
+            len(self._pending[table_id]) >= self.config.max_batch_rows
+            or self._pending_bytes[table_id] >= self.config.max_batch_bytes
+        ):
+            self._flush_table(table_id)
+
+        return future
+
+    async def flush(self) -> None:
+        """Flush all queued rows and wait for in-flight batches."""
+        for table_id in list(self._pending):
+            self._flush_table(table_id)
+        if self._batch_tasks:
+            await asyncio.gather(*list(self._batch_tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush remaining rows and stop the writer."""
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics and histograms."""
+        return {
+            **self.stats,
+            "pending_rows": sum(len(rows) for rows in self._pending.values()),
+            "in_flight_batches": len(self._batch_tasks),
+            "flush_latency_ms": self.flush_latency_ms.to_dict(),
+            "batch_size": self.batch_size.to_dict(),
+        }
+
+    async def _flush_loop(self) -> None:
+        """Flush queued rows every flush interval."""
+        interval = self.config.flush_interval_ms / 1000
+        while True:
+            await asyncio.sleep(interval)
+            for table_id in list(self._pending):
+                self._flush_table(table_id)
+
+    def _flush_table(self, table_id: str) -> None:
+        """Hand the queued rows of a table to a batch task."""
+        batch = self._pending.pop(table_id, None)
+        self._pending_bytes.pop(table_id, None)
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._write_batch(table_id, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _write_batch(
+        self, table_id: str, batch: List[Tuple[RowMutation, asyncio.Future]]
+    ) -> None:
+        """Write one batch, retrying failed rows with backoff."""
+        loop = asyncio.get_running_loop()
+        remaining = batch
+        attempt = 0
+
+        async with self._in_flight:
+            start_time = time.perf_counter()
+            self.batch_size.observe(len(batch))
+
+            while remaining:
+                rows = [mutation for mutation, _ in remaining]
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor, self.backend.mutate_rows, table_id, rows
+                    )
+                    error: Optional[Exception] = None
+                except Exception as e:
+                    results = [False] * len(rows)
+                    error = e
+
+                failed = []
+                for (mutation, future), ok in zip(remaining, results):
+                    if ok:
+                        self._complete(future, None)
+                    else:
+                        failed.append((mutation, future))
+
+                if not failed:
+                    break
+
+                attempt += 1
+                if attempt > self.config.max_retries:
+                    logger.error(
+                        f"Giving up on {len(failed)} rows for table {table_id} "
+                        f"after {self.config.max_retries} retries: {error}"
+                    )
+                    for _, future in failed:
+                        self._complete(
+                            future,
+                            BigtableWriteError(f"Failed to write row to {table_id}"),
+                        )
+                    break
+
+                self.stats["rows_retried"] += len(failed)
+                backoff_ms = min(
+                    self.config.max_backoff_ms,
+                    self.config.initial_backoff_ms
+                    * self.config.backoff_multiplier ** (attempt - 1),
+                )
+                # Full jitter keeps retries from many writers apart
+                await asyncio.sleep(random.uniform(0.5, 1.0) * backoff_ms / 1000)
+                remaining = failed
+
+            self.stats["batches_flushed"] += 1
+            self.flush_latency_ms.observe((time.perf_counter() - start_time) * 1000)
+
+    def _complete(self, future: asyncio.Future, error: Optional[Exception]) -> None:
+        """Resolve a row future and release its pending slot."""
+        if error is None:
+            self.stats["rows_written"] += 1
+            if not future.done():
+                future.set_result(None)
+        else:
+            self.stats["rows_failed"] += 1
+            if not future.done():
+                future.set_exception(error)
+        self._capacity.release()
@@ -0,0 +1,343 @@
+"""Entropy Features - Vectorized sample and approximate entropy.
+
+This module is the single implementation of template-matching entropies used
+by the feature extractors and the Dataflow pipeline. It depends only on NumPy
+so that the Dataflow workers can import it without the processing package.
+
+Templates are built with sliding-window views over the full window (no
+pattern subsampling). Matching pairs are found with a sorted sweep: templates
+of all channels are sorted by their first coordinate in one pass, so only
+pairs already within tolerance on that coordinate are compared on the
+remaining ones.
+"""
+
+import logging
+import math
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+# Sorted positions swept together; each block only scans its own max offset
+_BLOCK_SIZE = 8192
+
+# Supported sample entropy definitions, see sample_entropy
+SAMPLE_ENTROPY_DEFINITIONS = ("richman_moorman", "match_probability")
+
+
+def embed(data: np.ndarray, m: int) -> np.ndarray:
+    """Build delay-embedding templates without copying.
+
+    Args:
+        data: Signal data (channels x samples)
+        m: Template length
+
+    Returns:
+        Read-only view (channels x n_templates x m)
+    """
+    return sliding_window_view(data, m, axis=-1)
+
+
+def _match_counts(
+    templates: np.ndarray,
+    following: np.ndarray,
+    tolerance: np.ndarray,
+    per_template: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Count template pairs within a Chebyshev tolerance.
+
+    Templates are sorted by their first coordinate, so the candidates for
+    each template are the next few positions in sorted order. Sweeping the
+    offset between sorted positions compares contiguous slices for all
+    channels at once instead of materialising index pairs.
+
+    Args:
+        templates: Templates of length m (channels x n x m)
+        following: Sample following each template, NaN where the template
+            cannot be extended to length m + 1 (channels x n)
+        tolerance: Per-channel tolerance
+        per_template: Return counts per template instead of per channel
+
+    Returns:
+        Tuple of (matches_m, matches_m1) over unordered pairs of distinct
+        templates. Shapes are (channels,) or (channels x n) when
+        ``per_template`` is set, where each pair counts for both templates.
+    """
+    n_channels, n, m = templates.shape
+    size = n_channels * n
+
+    # Offset channels so one sort keeps them in disjoint, contiguous ranges
+    first = templates[:, :, 0]
+    span = np.ptp(first) + 2.0 * np.max(tolerance) + 1.0
+    keys = (first + (np.arange(n_channels) * span)[:, np.newaxis]).ravel()
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    tol = np.repeat(tolerance, n)[order]
+    limits = np.nextafter(sorted_keys + tol, np.inf)
+    n_candidates = np.searchsorted(sorted_keys, limits, side="right")
+    n_candidates -= np.arange(size) + 1
+
+    # Remaining coordinates, then the following sample, in sorted order
+    flat = templates.reshape(size, m)
+    columns = [flat[order, d] for d in range(1, m)]
+    extension = following.reshape(size)[order]
+
+    matches_m = np.zeros(size, dtype=np.int64)
+    matches_m1 = np.zeros(size, dtype=np.int64)
+
+    for start in range(0, size, _BLOCK_SIZE):
+        stop = min(start + _BLOCK_SIZE, size)
+        block_candidates = n_candidates[start:stop]
+        block_tol = tol[start:stop]
+
+        for offset in range(1, int(block_candidates.max()) + 1):
+            rows = slice(start, min(stop, size - offset))
+            cols = slice(rows.start + offset, rows.stop + offset)
+            width = rows.stop - rows.start
+
+            close_m = block_candidates[:width] >= offset
+            for column in columns:
+                close_m &= np.abs(column[rows] - column[cols]) <= block_tol[:width]
+            close_m1 = close_m & (
+                np.abs(extension[rows] - extension[cols]) <= block_tol[:width]
+            )
+
+            matches_m[rows] += close_m
+            matches_m1[rows] += close_m1
+            if per_template:
+                matches_m[cols] += close_m
+                matches_m1[cols] += close_m1
+
+    if per_template:
+        unsorted_m = np.empty(size, dtype=np.int64)
+        unsorted_m1 = np.empty(size, dtype=np.int64)
+        unsorted_m[order] = matches_m
+        unsorted_m1[order] = matches_m1
+        return unsorted_m.reshape(n_channels, n), unsorted_m1.reshape(n_channels, n)
+
+    # Sorted positions of each channel stay contiguous
+    return (
+        matches_m.reshape(n_channels, n).sum(axis=1),
+        matches_m1.reshape(n_channels, n).sum(axis=1),
+    )
+
+
+def pairs_for_error(max_error: float, confidence: float = 0.95) -> int:
+    """Number of sampled template pairs bounding the match probability error.
+
+    By Hoeffding's inequality, the match probability estimated from this many
+    randomly sampled pairs is within ``max_error`` of the exact value with the
+    given confidence.
+
+    Args:
+        max_error: Maximum absolute error of the match probability
+        confidence: Probability that the error stays within max_error
+
+    Returns:
+        Number of pairs to sample
+    """
+    return math.ceil(math.log(2 / (1 - confidence)) / (2 * max_error**2))
+
+
+def _sampled_match_probability(
+    data: np.ndarray,
+    m: int,
+    tolerance: np.ndarray,
+    n_sampled: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Estimate the match probability of each channel from sampled pairs.
+
+    Args:
+        data: Signal data (channels x samples)
+        m: Template length
+        tolerance: Per-channel tolerance
+        n_sampled: Number of pairs of distinct templates to sample
+        rng: Random generator
+
+    Returns:
+        Match probability per channel
+    """
+    templates = embed(data, m)
+    n_templates = templates.shape[1]
+
+    phi = np.empty(data.shape[0])
+    for ch, (channel, radius) in enumerate(zip(templates, tolerance)):
+        # Uniformly distributed pairs of distinct templates
+        first = rng.integers(0, n_templates, n_sampled)
+        second = rng.integers(0, n_templates - 1, n_sampled)
+        second += second >= first
+        distances = np.max(np.abs(channel[first] - channel[second]), axis=1)
+        phi[ch] = np.mean(distances <= radius)
+    return phi
+
+
+def sample_entropy(
+    data: np.ndarray,
+    m: int = 2,
+    r: float = 0.2,
+    definition: str = "richman_moorman",
+    max_error: Optional[float] = None,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> Union[np.ndarray, float]:
+    """Compute sample entropy over the full window.
+
+    With the default ``"richman_moorman"`` definition, the first N - m
+    templates are used for both lengths so that the counts for m and m + 1
+    are comparable. When no matches exist the conventional upper bound
+    ``-log(2 / ((N - m - 1) * (N - m)))`` is returned.
+
+    The previous per-extractor implementation returned ``-log((A + 1) /
+    (B + 1))`` over at most 100 templates. That smoothing only kept the
+    logarithm finite for the tiny subsampled counts; on the full window it
+    biases the estimate towards zero by an amount that depends on the window
+    length, so the unbiased ratio is used with the upper bound covering the
+    undefined case instead.
+
+    The ``"match_probability"`` definition, used by the seizure detector, is
+    ``-log(phi_m)`` where phi_m is the fraction of pairs of the N - m + 1
+    templates of length m that match. Only this definition supports the
+    approximate mode: with ``max_error`` set, windows with more pairs than
+    needed for that error bound estimate phi_m from randomly sampled pairs,
+    within ``max_error`` of the exact value with the given confidence.
+
+    Args:
+        data: Signal data (channels x samples) or a single channel
+        m: Template length
+        r: Tolerance as a fraction of each channel's standard deviation
+        definition: One of ``SAMPLE_ENTROPY_DEFINITIONS``
+        max_error: Error bound of the approximate mode, or None for exact
+        confidence: Confidence of the approximate error bound
+        seed: Seed for the pair sampling of the approximate mode
+
+    Returns:
+        Sample entropy per channel (float for 1D input)
+
+    Raises:
+        ValueError: If the definition is unknown, or max_error is set for
+            the Richman & Moorman definition
+    """
+    if definition not in SAMPLE_ENTROPY_DEFINITIONS:
+        raise ValueError(
+            f"Unknown sample entropy definition {definition!r}, "
+            f"expected one of {SAMPLE_ENTROPY_DEFINITIONS}"
+        )
+    if max_error is not None and definition != "match_probability":
+        raise ValueError("max_error requires the match_probability definition")
+
+    squeeze = np.ndim(data) == 1
+    data = np.atleast_2d(np.asarray(data, dtype=np.float64))
+    tolerance = r * np.std(data, axis=1)
+    n_channels, n_samples = data.shape
+
+    if definition == "match_probability":
+        result = _match_probability_entropy(
+            data, m, tolerance, max_error, confidence, seed
+        )
+        return float(result[0]) if squeeze else result
+
+    n_templates = n_samples - m
+
+    if m < 1 or n_templates < 2:
+        result = np.zeros(n_channels)
+        return float(result[0]) if squeeze else result
+
+    templates = embed(data, m)[:, :n_templates, :]
+    following = data[:, m:]
+    matches_m, matches_m1 = _match_counts(
+        templates, following, tolerance, per_template=False
+    )
+
+    upper_bound = -np.log(2.0 / ((n_templates - 1) * n_templates))
+    valid = (matches_m > 0) & (matches_m1 > 0)
+    result = np.full(n_channels, upper_bound)
+    result[valid] = -np.log(matches_m1[valid] / matches_m[valid])
+
+    return float(result[0]) if squeeze else result
+
+
+def _match_probability_entropy(
+    data: np.ndarray,
+    m: int,
+    tolerance: np.ndarray,
+    max_error: Optional[float],
+    confidence: float,
+    seed: Optional[int],
+) -> np.ndarray:
+    """Compute ``-log(phi_m)`` over the N - m + 1 templates of length m.
+
+    Args:
+        data: Signal data (channels x samples) in float64
+        m: Template length
+        tolerance: Per-channel tolerance
+        max_error: Error bound of the approximate mode, or None for exact
+        confidence: Confidence of the approximate error bound
+        seed: Seed for the pair sampling of the approximate mode
+
+    Returns:
+        Sample entropy per channel (0 where there are fewer than 2 templates)
+    """
+    n_channels, n_samples = data.shape
+    n_templates = n_samples - m + 1
+
+    if m < 1 or n_templates < 2:
+        return np.zeros(n_channels)
+
+    n_pairs = n_templates * (n_templates - 1) / 2
+    n_sampled = pairs_for_error(max_error, confidence) if max_error else None
+
+    if n_sampled is not None and n_sampled < n_pairs:
+        phi_m = _sampled_match_probability(
+            data, m, tolerance, n_sampled, np.random.default_rng(seed)
+        )
+    else:
+        # Only the length-m counts are used; no template is extended
+        following = np.full((n_channels, n_templates), np.nan)
+        matches_m, _ = _match_counts(
+            embed(data, m), following, tolerance, per_template=False
+        )
+        phi_m = matches_m / n_pairs
+
+    return -np.log(phi_m + 1e-15)
+
+
+def approximate_entropy(
+    data: np.ndarray, m: int = 2, r: float = 0.2
+) -> Union[np.ndarray, float]:
+    """Compute approximate entropy (Pincus) over the full window.
+
+    Args:
+        data: Signal data (channels x samples) or a single channel
+        m: Template length
+        r: Tolerance as a fraction of each channel's standard deviation
+
+    Returns:
+        Approximate entropy per channel (float for 1D input)
+    """
+    squeeze = np.ndim(data) == 1
+    data = np.atleast_2d(np.asarray(data, dtype=np.float64))
+    n_channels, n_samples = data.shape
+    n_templates = n_samples - m + 1
+
+    if m < 1 or n_templates < 2:
+        result = np.zeros(n_channels)
+        return float(result[0]) if squeeze else result
+
+    templates = embed(data, m)
+    following = np.full((n_channels, n_templates), np.nan)
+    following[:, :-1] = data[:, m:]
+
+    matches_m, matches_m1 = _match_counts(
+        templates, following, r * np.std(data, axis=1), per_template=True
+    )
+
+    # Every template matches itself
+    phi_m = np.mean(np.log((matches_m + 1) / n_templates), axis=1)
+    phi_m1 = np.mean(np.log((matches_m1[:, :-1] + 1) / (n_templates - 1)), axis=1)
+
+    result = phi_m - phi_m1
+    return float(result[0]) if squeeze else result
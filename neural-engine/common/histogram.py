@@ -0,0 +1,35 @@
+"""Fixed-bucket histograms for latency and size metrics."""
+
+import bisect
+from typing import Any, Dict, Sequence
+
+
+class Histogram:
+    """Fixed-bucket histogram."""
+
+    def __init__(self, bounds: Sequence[float]):
+        """Initialize the histogram.
+
+        Args:
+            bounds: Ascending upper bounds of the buckets
+        """
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export buckets keyed by upper bound."""
+        buckets = {str(bound): n for bound, n in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "buckets": buckets,
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+        }
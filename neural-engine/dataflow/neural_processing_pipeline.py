@@ -17,6 +17,9 @@ from scipy import signal as scipy_signal
 from scipy.stats import skew, kurtosis
 import scipy.fft
 
+from common.entropy import sample_entropy
+from common.wire_format import decode_message
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +31,7 @@ class NeuralSignalQualityCheck(beam.DoFn):
 
     def process(self, element: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         try:
-            data = np.array(element["data"])
+            data = np.asarray(element["data"])
 
             # Check for flat lines
             if np.std(data) < 0.1:
@@ -82,7 +85,7 @@ class ExtractBandPowers(beam.DoFn):
 
     def process(self, element: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         try:
-            data = np.array(element["data"])
+            data = np.asarray(element["data"])
 
             # Compute power spectral density
             freqs, psd = scipy_signal.welch(
@@ -115,7 +118,7 @@ class ExtractStatisticalFeatures(beam.DoFn):
 
     def process(self, element: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         try:
-            data = np.array(element["data"])
+            data = np.asarray(element["data"])
 
             stats = {
                 "mean": float(np.mean(data)),
@@ -147,7 +150,7 @@ class ExtractSpectralFeatures(beam.DoFn):
 
     def process(self, element: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         try:
-            data = np.array(element["data"])
+            data = np.asarray(element["data"])
 
             # FFT for spectral analysis
             fft_vals = scipy.fft.fft(data)
@@ -200,7 +203,7 @@ class ExtractTemporalFeatures(beam.DoFn):
 
     def process(self, element: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         try:
-            data = np.array(element["data"])
+            data = np.asarray(element["data"])
 
             # Autocorrelation at different lags
             autocorr_lags = [1, 5, 10, 20]
@@ -213,37 +216,10 @@ class ExtractTemporalFeatures(beam.DoFn):
                         float(autocorr) if not np.isnan(autocorr) else 0.0
                     )
 
-            # Sample entropy
-            def sample_entropy(data: np.ndarray, m: int = 2, r: float = 0.2) -> float:
-                N = len(data)
-                r = r * np.std(data)
-
-                def _maxdist(xi: np.ndarray, xj: np.ndarray, m: int) -> float:
-                    return float(
-                        max([abs(ua - va) for ua, va in zip(xi[0:m], xj[0:m])])
-                    )
-
-                def _phi(m: int) -> float:
-                    patterns = np.array([data[i : i + m] for i in range(N - m + 1)])
-                    C = 0
-                    for i in range(N - m + 1):
-                        matches = sum(
-                            [
-                                1
-                                for j in range(N - m + 1)
-                                if i != j and _maxdist(patterns[i], patterns[j], m) <= r
-                            ]
-                        )
-                        C += matches
-                    return C / (N - m + 1) / (N - m)
-
-                return -np.log(_phi(m + 1) / _phi(m)) if _phi(m) > 0 else 0
-
             temporal_features = {
                 **autocorr_features,
-                "sample_entropy": float(
-                    sample_entropy(data[: min(len(data), 100)])
-                ),  # Limit for performance
+                # One value per channel, stored in a REPEATED column
+                "sample_entropy": np.atleast_1d(sample_entropy(data)).tolist(),
             }
 
             element["temporal_features"] = temporal_features
@@ -369,7 +345,7 @@ class NeuralProcessingPipeline:
                 {"name": "temp_autocorr_lag_5", "type": "FLOAT", "mode": "NULLABLE"},
                 {"name": "temp_autocorr_lag_10", "type": "FLOAT", "mode": "NULLABLE"},
                 {"name": "temp_autocorr_lag_20", "type": "FLOAT", "mode": "NULLABLE"},
-                {"name": "temp_sample_entropy", "type": "FLOAT", "mode": "NULLABLE"},
+                {"name": "temp_sample_entropy", "type": "FLOAT", "mode": "REPEATED"},
             ]
         }
 
@@ -382,7 +358,8 @@ class NeuralProcessingPipeline:
             neural_data = (
                 pipeline
                 | "ReadFromPubSub" >> ReadFromPubSub(topic=pubsub_topic)
-                | "ParseJSON" >> beam.Map(lambda x: json.loads(x.decode("utf-8")))
+                # Binary wire format, or JSON fallback
+                | "DecodePacket" >> beam.Map(decode_message)
             )
 
             # Apply windowing for streaming (50ms windows for real-time processing)
@@ -16,6 +16,7 @@ from .base import (
     ConnectionType,
     SignalQuality,
     DataSample,
+    DataBlock,
     DeviceEvent,
 )
 from .device_manager import (
@@ -47,6 +48,7 @@ __all__ = [
     "ConnectionType",
     "SignalQuality",
     "DataSample",
+    "DataBlock",
     "DeviceEvent",
     # Core management classes
     "DeviceManager",
@@ -35,8 +35,9 @@ from ..base import (
     DeviceType,
     DeviceStatus,
     ConnectionType,
-    DataSample,
+    DataBlock,
 )
+from ..filters import BlockFilterChain, FilterChainConfig
 
 logger = logging.getLogger(__name__)
 
@@ -89,17 +90,25 @@ class BrainFlowAdapter(BaseDevice):
         # Data processing
         self.sample_counter = 0
         self.last_timestamp = 0.0
+        self.filter_chain: Optional[BlockFilterChain] = None
 
         # Configuration
         self.enable_filtering = device_info.connection_params.get(
             "enable_filtering", False
         )
+        self.filter_config = FilterChainConfig.from_dict(
+            device_info.connection_params.get("filter_config", {})
+        )
         self.buffer_size = device_info.connection_params.get("buffer_size", 4096)
+        self.block_duration_ms = device_info.connection_params.get(
+            "block_duration_ms", 20.0
+        )  # Board data is read once this much has accumulated
 
         # Performance tracking
         self.samples_processed = 0
         self.data_acquisition_rate = 0.0
         self.last_rate_calculation = datetime.utcnow()
+        self._rate_sample_count = 0
 
         self._setup_board_params()
 
@@ -183,6 +192,8 @@ class BrainFlowAdapter(BaseDevice):
             # Reset counters
             self.sample_counter = 0
             self.samples_processed = 0
+            if self.filter_chain:
+                self.filter_chain.reset()
             self.last_rate_calculation = datetime.utcnow()
 
             self._emit_event("brainflow_streaming_started")
@@ -231,6 +242,21 @@ class BrainFlowAdapter(BaseDevice):
                     self.enable_filtering
                 )
 
+            if "filter_config" in config:
+                self.filter_config = FilterChainConfig.from_dict(
+                    config["filter_config"]
+                )
+                self.device_info.connection_params["filter_config"] = config[
+                    "filter_config"
+                ]
+                self._setup_filter_chain()
+
+            if "block_duration_ms" in config:
+                self.block_duration_ms = float(config["block_duration_ms"])
+                self.device_info.connection_params["block_duration_ms"] = (
+                    self.block_duration_ms
+                )
+
             # Update buffer size
             if "buffer_size" in config:
                 self.buffer_size = int(config["buffer_size"])
@@ -482,7 +508,6 @@ class BrainFlowAdapter(BaseDevice):
         try:
             # Get channel indices
             self.eeg_channels = BoardShim.get_eeg_channels(self.board_id)
-            self.aux_channels = BoardShim.get_other_channels(self.board_id)
 
             # Get special channels
             try:
@@ -495,6 +520,23 @@ class BrainFlowAdapter(BaseDevice):
             except Exception:
                 self.marker_channel = -1
 
+            try:
+                package_channel = BoardShim.get_package_num_channel(self.board_id)
+            except Exception:
+                package_channel = -1
+
+            # Every remaining row of the board data is auxiliary data
+            aux_mask = np.ones(BoardShim.get_num_rows(self.board_id), dtype=bool)
+            aux_mask[self.eeg_channels] = False
+            for channel in (
+                self.timestamp_channel,
+                self.marker_channel,
+                package_channel,
+            ):
+                if channel >= 0:
+                    aux_mask[channel] = False
+            self.aux_channels = np.flatnonzero(aux_mask).tolist()
+
             logger.debug(
                 f"BrainFlow channels - EEG: {self.eeg_channels}, AUX: {self.aux_channels}"
             )
@@ -514,6 +556,7 @@ class BrainFlowAdapter(BaseDevice):
 
             # Update channel count
             self.device_info.channel_count = len(self.eeg_channels)
+            self._setup_filter_chain()
 
             # Update capabilities based on board
             # Board descriptor would be used here for real devices
@@ -554,24 +597,49 @@ class BrainFlowAdapter(BaseDevice):
 
         logger.debug("Stopped BrainFlow data thread")
 
+    def _setup_filter_chain(self) -> None:
+        """Build the streaming filter chain for the current board settings."""
+        self.filter_chain = BlockFilterChain(
+            self.filter_config,
+            self.device_info.sampling_rate,
+            len(self.eeg_channels),
+        )
+
     def _data_thread_worker(self) -> None:
-        """Worker thread for data acquisition."""
+        """Worker thread for data acquisition.
+
+        Reads the board buffer once a block's worth of samples is available
+        and otherwise sleeps for roughly the time needed to fill the block.
+        """
         logger.debug("BrainFlow data thread started")
 
         while self.is_data_thread_running and not self.data_thread_stop_event.is_set():
             try:
+                wait_time = self.block_duration_ms / 1000.0
                 if self.board and self.is_streaming:
-                    # Get available data
-                    data = self.board.get_board_data()
-
-                    if data.size > 0:
+                    block_samples = max(
+                        1,
+                        int(self.device_info.sampling_rate * wait_time),
+                    )
+                    available = self.board.get_board_data_count()
+
+                    if available >= block_samples:
+                        if available >= self.buffer_size:
+                            logger.warning(
+                                "BrainFlow ring buffer full, samples may be lost"
+                            )
+                        data = self.board.get_board_data(available)
                         self._process_board_data(data)
 
                         # Update rate calculation
                         self._update_data_rate(data.shape[1])
+                        continue
 
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)  # 10ms
+                    wait_time = (
+                        block_samples - available
+                    ) / self.device_info.sampling_rate
+
+                self.data_thread_stop_event.wait(max(wait_time, 0.001))
 
             except Exception as e:
                 logger.error(f"Error in BrainFlow data thread: {str(e)}")
@@ -579,13 +647,14 @@ class BrainFlowAdapter(BaseDevice):
 
         logger.debug("BrainFlow data thread stopped")
 
-    def _process_board_data(self, data: np.ndarray) -> None:  # noqa: C901
-        """Process board data from BrainFlow.
+    def _process_board_data(self, data: np.ndarray) -> None:
+        """Process a block of board data from BrainFlow.
 
         Args:
-            data: Raw board data (channels x samples)
+            data: Raw board data (rows x samples)
         """
-        if data.size == 0:
+        n_samples = data.shape[1]
+        if n_samples == 0:
             return
 
         # Extract EEG channels
@@ -595,83 +664,68 @@ class BrainFlowAdapter(BaseDevice):
         if self.timestamp_channel >= 0:
             timestamps = data[self.timestamp_channel, :]
         else:
-            # Generate timestamps
+            # Generate timestamps ending now
             timestamps = (
-                np.arange(data.shape[1]) / self.device_info.sampling_rate + time.time()
-            )
-
-        # Process each sample
-        for i in range(data.shape[1]):
-            sample_data = eeg_data[:, i]
-            timestamp = timestamps[i]
-
-            # Apply filtering if enabled
-            if self.enable_filtering:
-                sample_data = self._apply_filtering(sample_data)
-
-            # Create data sample
-            data_sample = DataSample(
-                timestamp=timestamp,
-                channel_data=sample_data,
-                sample_number=self.sample_counter,
-                device_id=self.device_info.device_id,
-                sampling_rate=self.device_info.sampling_rate,
-                metadata={
-                    "brainflow_board_id": self.board_id,
-                    "filtering_enabled": self.enable_filtering,
-                },
+                time.time()
+                - (n_samples - 1 - np.arange(n_samples))
+                / self.device_info.sampling_rate
             )
 
-            # Add auxiliary data if available
-            if len(self.aux_channels) > 0:
-                aux_data = data[self.aux_channels, i]
-                data_sample.metadata["aux_data"] = aux_data.tolist()
+        if self.enable_filtering:
+            eeg_data = self._apply_filtering(eeg_data)
+
+        data_block = DataBlock(
+            data=eeg_data,
+            timestamps=timestamps,
+            first_sample_number=self.sample_counter,
+            device_id=self.device_info.device_id,
+            sampling_rate=self.device_info.sampling_rate,
+            metadata={
+                "brainflow_board_id": self.board_id,
+                "filtering_enabled": self.enable_filtering,
+            },
+        )
 
-            # Add marker data if available
-            if self.marker_channel >= 0:
-                marker = data[self.marker_channel, i]
-                if marker != 0:  # Non-zero markers are events
-                    data_sample.metadata["marker"] = int(marker)
+        # Add auxiliary data if available
+        if len(self.aux_channels) > 0:
+            data_block.metadata["aux_data"] = data[self.aux_channels, :].tolist()
+
+        # Non-zero marker values are events; record them by block offset
+        if self.marker_channel >= 0:
+            marker_row = data[self.marker_channel, :]
+            offsets = np.flatnonzero(marker_row)
+            if len(offsets) > 0:
+                data_block.metadata["markers"] = [
+                    {"sample_offset": int(offset), "marker": int(marker)}
+                    for offset, marker in zip(offsets, marker_row[offsets])
+                ]
 
-            # Calculate signal quality
-            try:
-                quality = await self.calculate_signal_quality(
-                    sample_data.reshape(1, -1)
-                )
-                data_sample.signal_quality = {"overall": quality.value}
-                self.device_info.signal_quality = quality
-            except Exception:
-                # Fallback if async call fails in sync context
-                data_sample.signal_quality = {"overall": "unknown"}
+        # Calculate signal quality over the whole block
+        quality = self._assess_signal_quality(data_block.data)
+        data_block.signal_quality = {"overall": quality.value}
 
-            # Update device metrics
-            self.device_info.data_rate_hz = self.data_acquisition_rate
-            self.device_info.last_seen = datetime.utcnow()
+        # Update device metrics
+        self.device_info.data_rate_hz = self.data_acquisition_rate
+        self.device_info.last_seen = datetime.utcnow()
 
-            # Emit data sample
-            self._emit_data(data_sample)
+        self._emit_block(data_block)
 
-            self.sample_counter += 1
-            self.samples_processed += 1
+        self.sample_counter += n_samples
+        self.samples_processed += n_samples
 
     def _apply_filtering(self, data: np.ndarray) -> np.ndarray:
-        """Apply basic filtering to data.
+        """Apply the streaming filter chain to a block.
 
         Args:
-            data: Input signal data
+            data: EEG data (channels x samples)
 
         Returns:
-            Filtered signal data
+            Filtered data, or the input if filtering fails
         """
         try:
-            # Apply basic bandpass filter (1-50 Hz for EEG)
-            # This is a simplified example - real implementation would be more sophisticated
-            filtered_data = data.copy()
-
-            # BrainFlow filtering would be applied here
-            # DataFilter.perform_bandpass(filtered_data, sampling_rate, 1.0, 50.0, ...)
-
-            return filtered_data
+            if self.filter_chain is None:
+                self._setup_filter_chain()
+            return self.filter_chain.process(data)
 
         except Exception as e:
             logger.error(f"Error applying filtering: {str(e)}")
@@ -683,12 +737,14 @@ class BrainFlowAdapter(BaseDevice):
         Args:
             samples_count: Number of samples processed
         """
+        self._rate_sample_count += samples_count
         current_time = datetime.utcnow()
         time_diff = (current_time - self.last_rate_calculation).total_seconds()
 
         if time_diff >= 1.0:  # Update every second
-            self.data_acquisition_rate = samples_count / time_diff
+            self.data_acquisition_rate = self._rate_sample_count / time_diff
             self.last_rate_calculation = current_time
+            self._rate_sample_count = 0
 
     @classmethod
     async def discover_devices(cls) -> List[DeviceInfo]:
@@ -21,7 +21,7 @@ from ..base import (
     DeviceType,
     DeviceStatus,
     ConnectionType,
-    DataSample,
+    DataBlock,
 )
 from ..lsl_integration import LSLIntegration, LSLStreamInfo
 
@@ -108,7 +108,7 @@ class LSLAdapter(BaseDevice):
                 self.is_connected = True
 
                 # Register for data callbacks
-                self.lsl_integration.add_data_callback(self._handle_lsl_data)
+                self.lsl_integration.add_block_callback(self._handle_lsl_block)
 
                 await self.update_status(DeviceStatus.CONNECTED)
                 self._emit_event("lsl_connected", {"stream_name": self.stream_name})
@@ -325,12 +325,12 @@ class LSLAdapter(BaseDevice):
 
         return test_results
 
-    def _handle_lsl_data(self, stream_id: str, data_sample: DataSample) -> None:
+    def _handle_lsl_block(self, stream_id: str, data_block: DataBlock) -> None:
         """Handle data from LSL integration.
 
         Args:
             stream_id: Stream identifier
-            data_sample: Received data sample
+            data_block: Received data block
         """
         # Only process data from our stream
         if (
@@ -344,27 +344,23 @@ class LSLAdapter(BaseDevice):
 
         try:
             # Update sample tracking
-            self.sample_count += 1
+            self.sample_count += data_block.n_samples
             self.last_data_time = datetime.utcnow()
 
             # Update device info
-            data_sample.device_id = self.device_info.device_id
-            data_sample.sampling_rate = self.device_info.sampling_rate
+            data_block.sampling_rate = self.device_info.sampling_rate
 
             # Calculate signal quality
             # Note: Can't use await in non-async function
             # Signal quality will be calculated elsewhere
-            data_sample.signal_quality = {
-                "overall": "unknown",
-                "snr": getattr(data_sample, "snr", 0.0),
-            }
+            data_block.signal_quality = {"overall": "unknown", "snr": 0.0}
 
             # Update device metrics
             self.device_info.data_rate_hz = self.device_info.sampling_rate
             self.device_info.last_seen = datetime.utcnow()
 
             # Emit data to callbacks
-            self._emit_data(data_sample)
+            self._emit_block(data_block)
 
         except Exception as e:
             logger.error(f"Error handling LSL data: {str(e)}")
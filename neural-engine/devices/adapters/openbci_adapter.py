@@ -6,8 +6,9 @@ for Cyton, Ganglion, and other OpenBCI board variants.
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 import struct
 import time
@@ -18,6 +19,7 @@ from ..base import (
     DeviceType,
     DeviceStatus,
     ConnectionType,
+    DataBlock,
     DataSample,
 )
 from ..protocols.serial_protocol import SerialProtocol, SerialConfig
@@ -223,6 +225,201 @@ class OpenBCIPacketParser:
             return None
 
 
+@dataclass
+class CytonFrames:
+    """Samples decoded from one batch of Cyton serial data."""
+
+    sample_nums: np.ndarray  # Board sample number of each column
+    channel_data: np.ndarray  # (channels x samples), microvolts
+    aux_data: np.ndarray  # (3 x samples), raw accelerometer / aux counts
+    dropped_samples: int = 0
+    discarded_bytes: int = 0
+
+    @property
+    def n_samples(self) -> int:
+        """Number of decoded samples."""
+        return self.channel_data.shape[1]
+
+
+class CytonStreamDecoder:
+    """Vectorized decoder for the Cyton 33-byte serial frame stream.
+
+    Serial reads of any size are appended to a framed byte buffer. All valid
+    frames (start byte 0xA0, stop byte 0xCx, 33 bytes apart) are located at
+    once with NumPy masks and their 24-bit samples are sign-extended in one
+    operation. With a Daisy module, consecutive even / odd sample numbers are
+    merged into 16-channel samples.
+    """
+
+    FRAME_SIZE = OpenBCIPacketParser.PACKET_SIZE_CYTON
+
+    def __init__(self, daisy: bool = False, initial_capacity: int = 4096):
+        """Initialize the decoder.
+
+        Args:
+            daisy: Whether a Daisy module interleaves channels 9-16
+            initial_capacity: Initial byte buffer size
+        """
+        self.daisy = daisy
+        self._buffer = np.empty(initial_capacity, dtype=np.uint8)
+        self._length = 0
+        self.last_sample_num: Optional[int] = None
+
+        # Byte offsets of the 24-bit channel and 16-bit aux fields in a frame
+        self._channel_offsets = 2 + np.arange(24)
+        self._aux_offsets = 26 + np.arange(6)
+        self._frame_offsets = np.arange(self.FRAME_SIZE)
+
+    def reset(self) -> None:
+        """Drop buffered bytes and sample number history."""
+        self._length = 0
+        self.last_sample_num = None
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Number of bytes waiting to be decoded."""
+        return self._length
+
+    def feed(self, data: bytes) -> None:
+        """Buffer serial bytes without decoding them yet.
+
+        Args:
+            data: Raw serial bytes of any length
+        """
+        needed = self._length + len(data)
+        if needed > len(self._buffer):
+            grown = np.empty(max(needed, 2 * len(self._buffer)), dtype=np.uint8)
+            grown[: self._length] = self._buffer[: self._length]
+            self._buffer = grown
+        self._buffer[self._length : needed] = np.frombuffer(data, dtype=np.uint8)
+        self._length = needed
+
+    def decode(self, data: bytes = b"") -> CytonFrames:
+        """Decode all complete frames available after appending ``data``.
+
+        Args:
+            data: Raw serial bytes of any length
+
+        Returns:
+            Decoded samples; incomplete trailing frames stay buffered
+        """
+        self.feed(data)
+        buffer = self._buffer[: self._length]
+        frame_size = self.FRAME_SIZE
+
+        starts, consumed = self._locate_frames(buffer)
+        discarded = consumed - len(starts) * frame_size
+
+        frames = buffer[starts[:, np.newaxis] + self._frame_offsets]
+        sample_nums = frames[:, 1].astype(np.int64)
+
+        if self.daisy and len(starts) and sample_nums[-1] % 2 == 0:
+            # Keep a trailing Daisy half buffered until its Cyton half arrives
+            consumed = int(starts[-1])
+            frames, sample_nums = frames[:-1], sample_nums[:-1]
+
+        dropped = self._count_dropped(sample_nums)
+        channel_data = self._decode_channels(frames)
+        aux_data = frames[:, self._aux_offsets].copy().view(">i2").astype(np.int16).T
+
+        if self.daisy:
+            channel_data, aux_data, sample_nums, orphans = self._merge_daisy(
+                channel_data, aux_data, sample_nums
+            )
+            discarded += orphans * frame_size
+
+        self._consume(consumed)
+
+        return CytonFrames(
+            sample_nums=sample_nums,
+            channel_data=channel_data,
+            aux_data=aux_data,
+            dropped_samples=dropped,
+            discarded_bytes=discarded,
+        )
+
+    def _consume(self, count: int) -> None:
+        """Drop the first ``count`` bytes, keeping the remainder at the front."""
+        remaining = self._length - count
+        if remaining > 0:
+            self._buffer[:remaining] = self._buffer[count : self._length].copy()
+        self._length = max(remaining, 0)
+
+    def _locate_frames(self, buffer: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Find non-overlapping frames with start and stop byte masks.
+
+        Returns:
+            Frame start offsets and the number of bytes that can be dropped
+        """
+        frame_size = self.FRAME_SIZE
+        n_candidates = len(buffer) - frame_size + 1
+        if n_candidates <= 0:
+            return np.empty(0, dtype=np.int64), 0
+
+        valid = (buffer[:n_candidates] == OpenBCIPacketParser.START_BYTE) & (
+            (buffer[frame_size - 1 :] & 0xF0) == OpenBCIPacketParser.STOP_BYTE
+        )
+
+        # Follow runs of back-to-back frames; one run per resynchronisation
+        runs = []
+        position = 0
+        while True:
+            candidates = np.flatnonzero(valid[position:])
+            if len(candidates) == 0:
+                break
+            first = position + int(candidates[0])
+            chained = valid[first::frame_size]
+            run_length = len(chained) if chained.all() else int(np.argmin(chained))
+            runs.append(first + frame_size * np.arange(run_length))
+            position = first + frame_size * run_length
+            if position >= n_candidates:
+                break
+
+        starts = np.concatenate(runs) if runs else np.empty(0, dtype=np.int64)
+
+        # Offsets too close to the end to hold a whole frame are kept
+        return starts, max(position, n_candidates)
+
+    def _count_dropped(self, sample_nums: np.ndarray) -> int:
+        """Count missing sample numbers across the batch (wrapping at 256)."""
+        if len(sample_nums) == 0:
+            return 0
+
+        previous = np.empty_like(sample_nums)
+        previous[1:] = sample_nums[:-1]
+        if self.last_sample_num is None:
+            previous[0] = (sample_nums[0] - 1) % 256
+        else:
+            previous[0] = self.last_sample_num
+        self.last_sample_num = int(sample_nums[-1])
+
+        return int(np.sum((sample_nums - previous - 1) % 256))
+
+    def _decode_channels(self, frames: np.ndarray) -> np.ndarray:
+        """Sign-extend all 24-bit samples and scale to microvolts."""
+        raw = frames[:, self._channel_offsets].astype(np.int32).reshape(-1, 8, 3)
+        counts = (raw[:, :, 0] << 16) | (raw[:, :, 1] << 8) | raw[:, :, 2]
+        counts = (counts ^ 0x800000) - 0x800000
+        return (counts * (OpenBCIPacketParser.SCALE_FACTOR_24BIT * 1e6)).T
+
+    def _merge_daisy(
+        self, channel_data: np.ndarray, aux_data: np.ndarray, sample_nums: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Merge Daisy (even) and Cyton (odd) frames into 16-channel samples.
+
+        Returns:
+            Channel data, aux data, sample numbers and unpaired frame count
+        """
+        pairs = np.flatnonzero(
+            (sample_nums[:-1] % 2 == 0) & (sample_nums[1:] == sample_nums[:-1] + 1)
+        )
+        merged = np.concatenate(
+            [channel_data[:, pairs + 1], channel_data[:, pairs]], axis=0
+        )
+        orphans = len(sample_nums) - 2 * len(pairs)
+        return merged, aux_data[:, pairs + 1], sample_nums[pairs + 1], orphans
+
+
 class OpenBCIAdapter(BaseDevice):
     """OpenBCI device adapter for Cyton and Ganglion boards."""
 
@@ -252,6 +449,18 @@ class OpenBCIAdapter(BaseDevice):
         self.sample_counter = 0
         self.last_sample_num = None
 
+        # Cyton frames are buffered and decoded one block at a time, since
+        # serial reads are far smaller than a useful batch
+        self.cyton_decoder = CytonStreamDecoder(daisy=device_info.channel_count == 16)
+        block_duration_ms = device_info.connection_params.get("block_duration_ms", 20.0)
+        block_samples = max(
+            1, int(device_info.sampling_rate * block_duration_ms / 1000.0)
+        )
+        frames_per_sample = 2 if self.cyton_decoder.daisy else 1
+        self.block_bytes = (
+            block_samples * frames_per_sample * OpenBCIPacketParser.PACKET_SIZE_CYTON
+        )
+
         # Configuration
         self.test_signal_enabled = False
         self.impedance_testing = False
@@ -355,6 +564,7 @@ class OpenBCIAdapter(BaseDevice):
             await self.update_status(DeviceStatus.STREAMING)
 
             # Reset counters
+            self.cyton_decoder.reset()
             self.sample_counter = 0
             self.packets_received = 0
             self.packets_dropped = 0
@@ -707,18 +917,78 @@ class OpenBCIAdapter(BaseDevice):
         if not self.is_streaming:
             return
 
+        if self.board_type.startswith("Cyton"):
+            self._process_cyton_data(data)
+            return
+
         # Add to packet buffer
         self.packet_buffer += data
 
         # Process complete packets
         self._process_packet_buffer()
 
+    def _process_cyton_data(self, data: bytes) -> None:
+        """Buffer Cyton frames and emit each decoded block.
+
+        Args:
+            data: Raw serial data
+        """
+        self.cyton_decoder.feed(data)
+        if self.cyton_decoder.buffered_bytes < self.block_bytes:
+            return
+
+        try:
+            frames = self.cyton_decoder.decode()
+        except Exception as e:
+            logger.error(f"Error decoding Cyton data: {str(e)}")
+            self.cyton_decoder.reset()
+            return
+
+        if frames.dropped_samples:
+            self.packets_dropped += frames.dropped_samples
+            logger.warning(f"Dropped {frames.dropped_samples} samples")
+        if frames.discarded_bytes:
+            logger.debug(f"Discarded {frames.discarded_bytes} unframed bytes")
+
+        n_samples = frames.n_samples
+        if n_samples == 0:
+            return
+
+        sampling_rate = self.device_info.sampling_rate
+        end_time = datetime.utcnow().timestamp()
+        timestamps = end_time - (n_samples - 1 - np.arange(n_samples)) / sampling_rate
+
+        data_block = DataBlock(
+            data=frames.channel_data,
+            timestamps=timestamps,
+            first_sample_number=self.sample_counter,
+            device_id=self.device_info.device_id,
+            sampling_rate=sampling_rate,
+            metadata={
+                "board_sample_nums": frames.sample_nums.tolist(),
+                "board_type": self.board_type,
+                "test_signal": self.test_signal_enabled,
+                "aux_data": frames.aux_data.tolist(),
+            },
+        )
+
+        # Calculate signal quality over the whole block
+        quality = self._assess_signal_quality(data_block.data)
+        data_block.signal_quality = {"overall": quality.value}
+
+        # Update device metrics
+        self.packets_received += n_samples
+        self.last_sample_num = self.cyton_decoder.last_sample_num
+        self.last_packet_time = datetime.utcnow()
+        self.device_info.data_rate_hz = sampling_rate
+        self.device_info.last_seen = self.last_packet_time
+
+        self._emit_block(data_block)
+        self.sample_counter += n_samples
+
     def _process_packet_buffer(self) -> None:  # noqa: C901
-        """Process accumulated packet data."""
-        if self.board_type == "Cyton":
-            packet_size = OpenBCIPacketParser.PACKET_SIZE_CYTON
-        else:
-            packet_size = OpenBCIPacketParser.PACKET_SIZE_GANGLION
+        """Process accumulated Ganglion packet data."""
+        packet_size = OpenBCIPacketParser.PACKET_SIZE_GANGLION
 
         while len(self.packet_buffer) >= packet_size:
             # Look for start byte
@@ -746,10 +1016,7 @@ class OpenBCIAdapter(BaseDevice):
 
             # Parse packet
             try:
-                if self.board_type == "Cyton":
-                    parsed_data = OpenBCIPacketParser.parse_cyton_packet(packet)
-                else:
-                    parsed_data = OpenBCIPacketParser.parse_ganglion_packet(packet)
+                parsed_data = OpenBCIPacketParser.parse_ganglion_packet(packet)
 
                 if parsed_data:
                     self._process_parsed_data(parsed_data)
@@ -805,15 +1072,10 @@ class OpenBCIAdapter(BaseDevice):
             data_sample.metadata["accel_data"] = parsed_data["accel_data"].tolist()
 
         # Calculate signal quality
-        try:
-            quality = await self.calculate_signal_quality(
-                parsed_data["channel_data"].reshape(1, -1)
-            )
-            data_sample.signal_quality = {"overall": quality.value}
-            self.device_info.signal_quality = quality
-        except Exception:
-            # Fallback if async call fails in sync context
-            data_sample.signal_quality = {"overall": "unknown"}
+        quality = self._assess_signal_quality(
+            parsed_data["channel_data"].reshape(1, -1)
+        )
+        data_sample.signal_quality = {"overall": quality.value}
 
         # Update device metrics
         self.device_info.data_rate_hz = self.device_info.sampling_rate
@@ -19,7 +19,7 @@ from ..base import (
     DeviceStatus,
     ConnectionType,
     SignalQuality,
-    DataSample,
+    DataBlock,
 )
 
 logger = logging.getLogger(__name__)
@@ -79,6 +79,9 @@ class SyntheticAdapter(BaseDevice):
         # Data generation state
         self.sample_counter = 0
         self.time_offset = 0.0
+        self.block_duration_ms = device_info.connection_params.get(
+            "block_duration_ms", 20.0
+        )  # Samples are emitted in blocks of this duration
         self.streaming_task: Optional[asyncio.Task] = None
 
         # Signal generators
@@ -235,6 +238,12 @@ class SyntheticAdapter(BaseDevice):
             if "sampling_rate" in config:
                 self.device_info.sampling_rate = float(config["sampling_rate"])
 
+            if "block_duration_ms" in config:
+                self.block_duration_ms = float(config["block_duration_ms"])
+                self.device_info.connection_params["block_duration_ms"] = (
+                    self.block_duration_ms
+                )
+
             # Update simulation parameters
             if "simulate_artifacts" in config:
                 self.simulate_artifacts = bool(config["simulate_artifacts"])
@@ -448,113 +457,107 @@ class SyntheticAdapter(BaseDevice):
                 f"Simulated electrode displacement on channel {channel_idx + 1}"
             )
 
-    def _generate_sample_data(self) -> np.ndarray:  # noqa: C901
+    def _generate_sample_data(self) -> Optional[np.ndarray]:
         """Generate a single sample of synthetic data."""
-        current_time = self.sample_counter / self.device_info.sampling_rate
-        data = np.zeros(self.device_info.channel_count)
+        block = self._generate_block_data(1)
+        if block.shape[1] == 0:
+            return None  # Dropped packet
+        return block[:, 0]
+
+    def _generate_block_data(self, n_samples: int) -> np.ndarray:  # noqa: C901
+        """Generate a block of synthetic data.
+
+        Args:
+            n_samples: Number of samples requested
+
+        Returns:
+            Data array (channels x samples); fewer columns than requested
+            when packet loss is simulated
+        """
+        n_channels = self.device_info.channel_count
+
+        # Simulate packet loss
+        if self.simulate_connection_issues:  # 0.1% packet loss
+            dropped = int(np.sum(np.random.random(n_samples) < 0.001))
+            self.packet_loss_counter += dropped
+            n_samples -= dropped
+
+        sample_numbers = self.sample_counter + np.arange(n_samples)
+        t = sample_numbers / self.device_info.sampling_rate
+        freqs = self.channel_frequencies[:, np.newaxis]
+        amps = self.channel_amplitudes[:, np.newaxis]
+        phases = self.channel_phases[:, np.newaxis]
 
         if self.signal_type == SyntheticSignalType.SINE_WAVE:
             # Simple sine wave
-            for i in range(self.device_info.channel_count):
-                data[i] = self.channel_amplitudes[i] * np.sin(
-                    2 * np.pi * self.channel_frequencies[i] * current_time
-                    + self.channel_phases[i]
-                )
+            data = amps * np.sin(2 * np.pi * freqs * t + phases)
 
         elif self.signal_type == SyntheticSignalType.NOISE:
             # White noise
-            data = np.random.normal(0, self.amplitude, self.device_info.channel_count)
+            data = np.random.normal(0, self.amplitude, (n_channels, n_samples))
 
         elif self.signal_type == SyntheticSignalType.ERP:
             # Event-Related Potential simulation
             # Simple P300-like response
-            if self.sample_counter % int(self.device_info.sampling_rate * 2) < int(
-                self.device_info.sampling_rate * 0.5
-            ):
-                # During ERP window
-                erp_time = (
-                    self.sample_counter % int(self.device_info.sampling_rate * 2)
-                ) / self.device_info.sampling_rate
-                if 0.3 <= erp_time <= 0.4:  # P300 peak around 300-400ms
-                    p300_amplitude = (
-                        self.amplitude * 2 * np.exp(-((erp_time - 0.35) ** 2) / 0.01)
-                    )
-                    data.fill(p300_amplitude)
+            data = np.zeros((n_channels, n_samples))
+            period = int(self.device_info.sampling_rate * 2)
+            erp_time = (sample_numbers % period) / self.device_info.sampling_rate
+            in_peak = (
+                (sample_numbers % period < int(self.device_info.sampling_rate * 0.5))
+                & (erp_time >= 0.3)
+                & (erp_time <= 0.4)
+            )  # P300 peak around 300-400ms
+            p300_amplitude = (
+                self.amplitude * 2 * np.exp(-((erp_time - 0.35) ** 2) / 0.01)
+            )
+            data[:, in_peak] = p300_amplitude[in_peak]
 
         elif self.signal_type == SyntheticSignalType.SSVEP:
             # Steady-State Visual Evoked Potential
-            # Strong response at stimulus frequency
-            stimulus_freq = self.frequency
-            for i in range(self.device_info.channel_count):
-                # Stronger response in posterior channels (simulated)
-                response_strength = (
-                    1.5 if i >= self.device_info.channel_count // 2 else 0.5
-                )
-                data[i] = (
-                    self.channel_amplitudes[i]
-                    * response_strength
-                    * np.sin(
-                        2 * np.pi * stimulus_freq * current_time
-                        + self.channel_phases[i]
-                    )
-                )
+            # Stronger response in posterior channels (simulated)
+            response_strength = np.where(
+                np.arange(n_channels) >= n_channels // 2, 1.5, 0.5
+            )[:, np.newaxis]
+            data = (
+                amps
+                * response_strength
+                * np.sin(2 * np.pi * self.frequency * t + phases)
+            )
 
         elif self.signal_type == SyntheticSignalType.REALISTIC_EEG:
-            # Realistic EEG simulation
-            for i in range(self.device_info.channel_count):
-                # Primary frequency component
-                signal = self.channel_amplitudes[i] * np.sin(
-                    2 * np.pi * self.channel_frequencies[i] * current_time
-                    + self.channel_phases[i]
-                )
-
-                # Add harmonics
-                signal += (
-                    0.3
-                    * self.channel_amplitudes[i]
-                    * np.sin(
-                        2 * np.pi * self.channel_frequencies[i] * 2 * current_time
-                        + self.channel_phases[i] * 1.5
-                    )
+            # Primary frequency component
+            data = amps * np.sin(2 * np.pi * freqs * t + phases)
+
+            # Add harmonics
+            data += 0.3 * amps * np.sin(2 * np.pi * freqs * 2 * t + phases * 1.5)
+
+            # Add 1 / f noise (pink noise approximation)
+            data += (
+                0.2
+                * amps
+                * np.sin(
+                    2 * np.pi * (freqs / 4) * t
+                    + np.random.random((n_channels, n_samples)) * 2 * np.pi
                 )
-
-                # Add 1 / f noise (pink noise approximation)
-                low_freq_noise = (
-                    0.2
-                    * self.channel_amplitudes[i]
-                    * np.sin(
-                        2 * np.pi * (self.channel_frequencies[i] / 4) * current_time
-                        + random.random() * 2 * np.pi
-                    )
-                )
-
-                data[i] = signal + low_freq_noise
+            )
 
         else:
             # Default: mixed signal
-            for i in range(self.device_info.channel_count):
-                data[i] = self.channel_amplitudes[i] * np.sin(
-                    2 * np.pi * self.channel_frequencies[i] * current_time
-                    + self.channel_phases[i]
-                )
+            data = amps * np.sin(2 * np.pi * freqs * t + phases)
 
         # Add noise
-        noise = np.random.normal(0, self.noise_level, self.device_info.channel_count)
-        data += noise
+        data += np.random.normal(0, self.noise_level, (n_channels, n_samples))
 
         # Simulate artifacts
-        if self.simulate_artifacts and random.random() < self.artifact_probability:
-            artifact_type = random.choice(["eye_blink", "muscle", "electrode_pop"])
-            data = self._add_artifact(data, artifact_type)
-
-        # Simulate packet loss
-        if (
-            self.simulate_connection_issues and random.random() < 0.001
-        ):  # 0.1% packet loss
-            self.packet_loss_counter += 1
-            return None  # Dropped packet
+        if self.simulate_artifacts:
+            artifact_columns = np.flatnonzero(
+                np.random.random(n_samples) < self.artifact_probability
+            )
+            for column in artifact_columns:
+                artifact_type = random.choice(["eye_blink", "muscle", "electrode_pop"])
+                data[:, column] = self._add_artifact(data[:, column], artifact_type)
 
-        self.sample_counter += 1
+        self.sample_counter += n_samples
         return data
 
     def _add_artifact(self, data: np.ndarray, artifact_type: str) -> np.ndarray:
@@ -592,44 +595,50 @@ class SyntheticAdapter(BaseDevice):
         return data
 
     async def _data_generation_loop(self) -> None:
-        """Background task for continuous data generation."""
+        """Background task for continuous block-wise data generation."""
         logger.info("Starting synthetic data generation loop")
 
-        target_interval = 1.0 / self.device_info.sampling_rate  # Seconds per sample
+        sampling_rate = self.device_info.sampling_rate
+        block_size = max(1, int(sampling_rate * self.block_duration_ms / 1000.0))
+        target_interval = block_size / sampling_rate  # Seconds per block
 
         while self.is_streaming:
             try:
                 loop_start = asyncio.get_event_loop().time()
 
-                # Generate sample data
-                sample_data = self._generate_sample_data()
+                # Generate block data
+                first_sample = self.sample_counter
+                block_data = self._generate_block_data(block_size)
+                n_samples = block_data.shape[1]
+
+                if n_samples > 0:  # Not entirely dropped due to packet loss
+                    end_time = datetime.utcnow().timestamp()
+                    timestamps = end_time - (n_samples - 1 - np.arange(n_samples)) / (
+                        sampling_rate
+                    )
 
-                if sample_data is not None:  # Not dropped due to packet loss
-                    # Create data sample
-                    data_sample = DataSample(
-                        timestamp=datetime.utcnow().timestamp(),
-                        channel_data=sample_data,
-                        sample_number=self.sample_counter,
+                    data_block = DataBlock(
+                        data=block_data,
+                        timestamps=timestamps,
+                        first_sample_number=first_sample,
                         device_id=self.device_info.device_id,
-                        sampling_rate=self.device_info.sampling_rate,
+                        sampling_rate=sampling_rate,
                         metadata={"signal_type": self.signal_type, "synthetic": True},
                     )
 
-                    # Calculate signal quality
-                    quality = await self.calculate_signal_quality(
-                        sample_data.reshape(1, -1)
-                    )
-                    data_sample.signal_quality = {"overall": quality.value}
+                    # Calculate signal quality over the whole block
+                    quality = await self.calculate_signal_quality(data_block.data)
+                    data_block.signal_quality = {"overall": quality.value}
 
                     # Update device metrics
-                    self.device_info.data_rate_hz = self.device_info.sampling_rate
+                    self.device_info.data_rate_hz = sampling_rate
                     self.device_info.last_seen = datetime.utcnow()
                     self.device_info.signal_quality = quality
 
-                    # Emit data sample
-                    self._emit_data(data_sample)
+                    # Emit data block
+                    self._emit_block(data_block)
 
-                # Calculate how long to wait for next sample
+                # Calculate how long to wait for next block
                 loop_duration = asyncio.get_event_loop().time() - loop_start
                 sleep_time = max(0, target_interval - loop_duration)
 
@@ -9,7 +9,7 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
 from dataclasses import dataclass, field
 import numpy as np
 
@@ -153,6 +153,102 @@ class DataSample:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class DataBlock:
+    """Contiguous block of samples from a BCI device.
+
+    Carries a ``(channels x samples)`` float32 array together with one
+    timestamp per sample. Sample numbers are implicit: the block covers the
+    half-open range ``[first_sample_number, first_sample_number + n_samples)``.
+    """
+
+    # Core data
+    data: np.ndarray
+    timestamps: np.ndarray
+    first_sample_number: int
+
+    # Quality indicators
+    signal_quality: Dict[str, float] = field(default_factory=dict)
+    artifacts_detected: List[str] = field(default_factory=list)
+
+    # Device context
+    device_id: str = ""
+    sampling_rate: float = 250.0
+
+    # Additional metadata
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Normalise data and timestamps to contiguous arrays."""
+        self.data = np.ascontiguousarray(self.data, dtype=np.float32)
+        if self.data.ndim == 1:
+            self.data = self.data.reshape(-1, 1)
+        self.timestamps = np.ascontiguousarray(self.timestamps, dtype=np.float64)
+
+        if self.timestamps.shape != (self.data.shape[1],):
+            raise ValueError(
+                f"Expected {self.data.shape[1]} timestamps, "
+                f"got {self.timestamps.shape[0]}"
+            )
+
+    @property
+    def n_channels(self) -> int:
+        """Number of channels in the block."""
+        return self.data.shape[0]
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples in the block."""
+        return self.data.shape[1]
+
+    @property
+    def sample_range(self) -> Tuple[int, int]:
+        """Half-open range of sample numbers covered by the block."""
+        return self.first_sample_number, self.first_sample_number + self.n_samples
+
+    @classmethod
+    def from_sample(cls, sample: DataSample) -> "DataBlock":
+        """Wrap a single sample into a one-column block.
+
+        Args:
+            sample: Data sample to wrap
+
+        Returns:
+            Block containing the sample
+        """
+        return cls(
+            data=np.asarray(sample.channel_data, dtype=np.float32).reshape(-1, 1),
+            timestamps=np.array([sample.timestamp], dtype=np.float64),
+            first_sample_number=sample.sample_number,
+            signal_quality=sample.signal_quality,
+            artifacts_detected=sample.artifacts_detected,
+            device_id=sample.device_id,
+            sampling_rate=sample.sampling_rate,
+            metadata=sample.metadata,
+        )
+
+    def iter_samples(self) -> Iterator[DataSample]:
+        """Expand the block into per-sample objects.
+
+        Only intended for consumers of the legacy per-sample API; channel
+        data of each sample is a view into the block.
+
+        Yields:
+            One DataSample per column of the block
+        """
+        for i in range(self.n_samples):
+            yield DataSample(
+                timestamp=float(self.timestamps[i]),
+                channel_data=self.data[:, i],
+                sample_number=self.first_sample_number + i,
+                signal_quality=self.signal_quality,
+                artifacts_detected=self.artifacts_detected,
+                device_id=self.device_id,
+                sampling_rate=self.sampling_rate,
+                metadata=self.metadata,
+            )
+
+
 @dataclass
 class DeviceEvent:
     """Device state change or notification event."""
@@ -180,6 +276,10 @@ class BaseDevice(ABC):
         # Event callbacks
         self._event_callbacks: List[Callable[[DeviceEvent], None]] = []
         self._data_callbacks: List[Callable[[DataSample], None]] = []
+        self._block_callbacks: List[Callable[[DataBlock], None]] = []
+        self._stream_handlers: List[
+            Tuple[Callable[[DataSample], None], Callable[[DataBlock], None]]
+        ] = []
 
         # Internal state
         self._connection_task: Optional[asyncio.Task] = None
@@ -292,6 +392,56 @@ class BaseDevice(ABC):
         if callback in self._data_callbacks:
             self._data_callbacks.remove(callback)
 
+    def add_block_callback(self, callback: Callable[[DataBlock], None]) -> None:
+        """Add callback for data blocks.
+
+        Block callbacks receive every sample the device produces, whether
+        the adapter emits blocks or individual samples.
+
+        Args:
+            callback: Function to call when a new block arrives
+        """
+        self._block_callbacks.append(callback)
+
+    def remove_block_callback(self, callback: Callable[[DataBlock], None]) -> None:
+        """Remove block callback.
+
+        Args:
+            callback: Function to remove from callbacks
+        """
+        if callback in self._block_callbacks:
+            self._block_callbacks.remove(callback)
+
+    def add_stream_handler(
+        self,
+        on_sample: Callable[[DataSample], None],
+        on_block: Callable[[DataBlock], None],
+    ) -> None:
+        """Add a consumer that accepts both samples and blocks.
+
+        Unlike data and block callbacks, a stream handler gets data in the
+        form the adapter emits it, so nothing is converted on its behalf.
+
+        Args:
+            on_sample: Function to call for each emitted sample
+            on_block: Function to call for each emitted block
+        """
+        self._stream_handlers.append((on_sample, on_block))
+
+    def remove_stream_handler(
+        self,
+        on_sample: Callable[[DataSample], None],
+        on_block: Callable[[DataBlock], None],
+    ) -> None:
+        """Remove stream handler.
+
+        Args:
+            on_sample: Sample function the handler was added with
+            on_block: Block function the handler was added with
+        """
+        if (on_sample, on_block) in self._stream_handlers:
+            self._stream_handlers.remove((on_sample, on_block))
+
     def _emit_event(
         self, event_type: str, data: Dict[str, Any] = None, severity: str = "info"
     ) -> None:
@@ -330,6 +480,51 @@ class BaseDevice(ABC):
             except Exception as e:
                 logger.error(f"Error in data callback: {str(e)}")
 
+        for on_sample, _ in self._stream_handlers:
+            try:
+                on_sample(sample)
+            except Exception as e:
+                logger.error(f"Error in stream handler: {str(e)}")
+
+        if self._block_callbacks:
+            block = DataBlock.from_sample(sample)
+            for callback in self._block_callbacks:
+                try:
+                    callback(block)
+                except Exception as e:
+                    logger.error(f"Error in block callback: {str(e)}")
+
+    def _emit_block(self, block: DataBlock) -> None:
+        """Emit a data block to all registered callbacks.
+
+        Block callbacks receive the block as-is. Per-sample callbacks are
+        served by expanding the block, so adapters only need to emit blocks.
+
+        Args:
+            block: Data block to emit
+        """
+        block.device_id = self.device_info.device_id
+
+        for callback in self._block_callbacks:
+            try:
+                callback(block)
+            except Exception as e:
+                logger.error(f"Error in block callback: {str(e)}")
+
+        for _, on_block in self._stream_handlers:
+            try:
+                on_block(block)
+            except Exception as e:
+                logger.error(f"Error in stream handler: {str(e)}")
+
+        if self._data_callbacks:
+            for sample in block.iter_samples():
+                for callback in self._data_callbacks:
+                    try:
+                        callback(sample)
+                    except Exception as e:
+                        logger.error(f"Error in data callback: {str(e)}")
+
     async def get_status(self) -> DeviceStatus:
         """Get current device status.
 
@@ -368,6 +563,17 @@ class BaseDevice(ABC):
     async def calculate_signal_quality(self, data: np.ndarray) -> SignalQuality:
         """Calculate signal quality from data.
 
+        Args:
+            data: Channel data for quality assessment
+
+        Returns:
+            Signal quality assessment
+        """
+        return self._assess_signal_quality(data)
+
+    def _assess_signal_quality(self, data: np.ndarray) -> SignalQuality:
+        """Synchronous signal quality assessment for use in data callbacks.
+
         Args:
             data: Channel data for quality assessment
 
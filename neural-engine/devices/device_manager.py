@@ -18,6 +18,7 @@ from .base import (
     DeviceStatus,
     DeviceEvent,
     DataSample,
+    DataBlock,
 )
 from .device_registry import DeviceRegistry
 from .health_monitor import HealthMonitor
@@ -85,6 +86,7 @@ class DeviceManagerStats:
     # Events
     events_processed: int = 0
     data_samples_processed: int = 0
+    data_blocks_processed: int = 0
 
     # Performance
     uptime_seconds: float = 0.0
@@ -124,6 +126,7 @@ class DeviceManager:
         # Event handling
         self.event_callbacks: List[Callable[[DeviceEvent], None]] = []
         self.data_callbacks: List[Callable[[DataSample], None]] = []
+        self.block_callbacks: List[Callable[[DataBlock], None]] = []
         self.event_queue: asyncio.Queue = asyncio.Queue(
             maxsize=self.config.event_queue_max_size
         )
@@ -307,7 +310,9 @@ class DeviceManager:
 
             # Setup event handling
             device.add_event_callback(self._handle_device_event)
-            device.add_data_callback(self._handle_device_data)
+            device.add_stream_handler(
+                self._handle_device_data, self._handle_device_block
+            )
 
             # Attempt connection
             success = await asyncio.wait_for(
@@ -542,6 +547,17 @@ class DeviceManager:
         """
         self.data_callbacks.append(callback)
 
+    def add_block_callback(self, callback: Callable[[DataBlock], None]) -> None:
+        """Add callback for device data blocks.
+
+        Prefer this over add_data_callback for high-rate consumers: blocks
+        are delivered without per-sample object construction.
+
+        Args:
+            callback: Function to call when a data block is received
+        """
+        self.block_callbacks.append(callback)
+
     async def get_stats(self) -> DeviceManagerStats:
         """Get device manager statistics.
 
@@ -767,6 +783,40 @@ class DeviceManager:
             except Exception as e:
                 logger.error(f"Error in data callback: {str(e)}")
 
+        # Wrap the sample only when a block consumer needs it
+        if self.block_callbacks:
+            block = DataBlock.from_sample(sample)
+            for callback in self.block_callbacks:
+                try:
+                    callback(block)
+                except Exception as e:
+                    logger.error(f"Error in block callback: {str(e)}")
+
+    def _handle_device_block(self, block: DataBlock) -> None:
+        """Handle data blocks from devices.
+
+        Args:
+            block: Data block
+        """
+        self.stats.data_blocks_processed += 1
+        self.stats.data_samples_processed += block.n_samples
+
+        # Call registered block callbacks
+        for callback in self.block_callbacks:
+            try:
+                callback(block)
+            except Exception as e:
+                logger.error(f"Error in block callback: {str(e)}")
+
+        # Expand into samples only for legacy per-sample consumers
+        if self.data_callbacks:
+            for sample in block.iter_samples():
+                for callback in self.data_callbacks:
+                    try:
+                        callback(sample)
+                    except Exception as e:
+                        logger.error(f"Error in data callback: {str(e)}")
+
     def _emit_event(
         self, event_type: str, data: Dict[str, Any] = None, severity: str = "info"
     ) -> None:
@@ -0,0 +1,118 @@
+"""Block-wise streaming filters for device adapters.
+
+Adapters receive data in blocks of arbitrary size. The filter chain here
+designs the device-side cascade; running it on whole ``(channels x samples)``
+blocks with state carried from one block to the next is shared with the
+processing pipeline through ``common.streaming_filter``.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from scipy import signal
+
+from common.streaming_filter import StreamingFilterBank
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FilterChainConfig:
+    """Configuration of the streaming filter chain.
+
+    Any stage can be disabled by setting its frequencies to None / empty.
+    """
+
+    bandpass_low_hz: Optional[float] = 1.0
+    bandpass_high_hz: Optional[float] = 50.0
+    bandpass_order: int = 4
+    notch_freqs_hz: List[float] = field(default_factory=lambda: [60.0])
+    notch_quality: float = 30.0
+    detrend: bool = True  # Remove DC drift with a one-pole DC blocker
+    detrend_cutoff_hz: float = 0.1
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "FilterChainConfig":
+        """Create a configuration from a (partial) dictionary.
+
+        Args:
+            config: Configuration values keyed by field name
+
+        Returns:
+            Filter chain configuration
+        """
+        known = cls.__dataclass_fields__
+        unknown = set(config) - set(known)
+        if unknown:
+            logger.warning(f"Ignoring unknown filter settings: {sorted(unknown)}")
+        return cls(**{key: value for key, value in config.items() if key in known})
+
+
+class BlockFilterChain(StreamingFilterBank):
+    """Causal detrend / notch / bandpass cascade with state across blocks.
+
+    All stages are combined into one second-order-sections matrix and
+    applied to every channel with a single ``sosfilt`` call per block.
+    """
+
+    def __init__(
+        self, config: FilterChainConfig, sampling_rate: float, n_channels: int
+    ):
+        """Initialize the filter chain.
+
+        Args:
+            config: Filter chain configuration
+            sampling_rate: Sampling rate in Hz
+            n_channels: Number of channels filtered in parallel
+        """
+        self.config = config
+        self.sampling_rate = sampling_rate
+        super().__init__(self._design(config, sampling_rate), n_channels)
+
+    @staticmethod
+    def _design(config: FilterChainConfig, sampling_rate: float) -> np.ndarray:
+        """Design the combined second-order sections for all stages."""
+        nyquist = sampling_rate / 2.0
+        sections = []
+
+        if config.detrend:
+            # y[n] = x[n] - x[n-1] + r * y[n-1]
+            r = np.exp(-2.0 * np.pi * config.detrend_cutoff_hz / sampling_rate)
+            sections.append(np.array([[1.0, -1.0, 0.0, 1.0, -r, 0.0]]))
+
+        for freq in config.notch_freqs_hz:
+            if 0 < freq < nyquist:
+                b, a = signal.iirnotch(freq, config.notch_quality, fs=sampling_rate)
+                sections.append(signal.tf2sos(b, a))
+
+        low = config.bandpass_low_hz
+        high = config.bandpass_high_hz
+        if high is not None and high >= nyquist:
+            high = None
+        if low is not None and high is not None:
+            band: Optional[tuple] = ("bandpass", [low, high])
+        elif low is not None:
+            band = ("highpass", low)
+        elif high is not None:
+            band = ("lowpass", high)
+        else:
+            band = None
+
+        if band is not None:
+            btype, cutoff = band
+            sections.append(
+                signal.butter(
+                    config.bandpass_order,
+                    cutoff,
+                    btype=btype,
+                    fs=sampling_rate,
+                    output="sos",
+                )
+            )
+
+        if not sections:
+            # Identity section keeps the processing path uniform
+            return np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]])
+        return np.vstack(sections)
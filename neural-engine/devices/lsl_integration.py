@@ -23,7 +23,7 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("pylsl not available, LSL integration disabled")
 
-from .base import DeviceInfo, DataSample, DeviceEvent
+from .base import DeviceInfo, DataSample, DataBlock, DeviceEvent
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +148,7 @@ class LSLIntegration:
         # Event callbacks
         self.stream_callbacks: List[Callable[[str, LSLStreamInfo], None]] = []
         self.data_callbacks: List[Callable[[str, DataSample], None]] = []
+        self.block_callbacks: List[Callable[[str, DataBlock], None]] = []
         self.event_callbacks: List[Callable[[DeviceEvent], None]] = []
 
         # Background tasks
@@ -521,6 +522,17 @@ class LSLIntegration:
         """
         self.data_callbacks.append(callback)
 
+    def add_block_callback(self, callback: Callable[[str, DataBlock], None]) -> None:
+        """Add callback for data blocks.
+
+        Each pulled chunk is delivered as a single block, which avoids
+        per-sample object construction for high-rate streams.
+
+        Args:
+            callback: Function to call when a chunk is received
+        """
+        self.block_callbacks.append(callback)
+
     def add_event_callback(self, callback: Callable[[DeviceEvent], None]) -> None:
         """Add callback for LSL events.
 
@@ -783,35 +795,40 @@ class LSLIntegration:
             )
 
             if samples:
-                # Convert to numpy array
-                # data = np.array(samples).T  # Transpose to get channels x samples
-                # Process samples directly without intermediate variable
-
-                # Process each sample
-                for i, sample in enumerate(samples):
-                    sample_data = np.array(sample)
-                    timestamp = timestamps[i] if i < len(timestamps) else time.time()
-
-                    # Create data sample
-                    data_sample = DataSample(
-                        timestamp=timestamp,
-                        channel_data=sample_data,
-                        sample_number=inlet_info.samples_received,
-                        device_id=stream_id,
-                        sampling_rate=inlet_info.stream_info.sampling_rate,
-                    )
-
-                    # Update metrics
-                    inlet_info.samples_received += 1
-                    inlet_info.last_sample_time = datetime.utcnow()
-                    self.stats["samples_received"] += 1
-
-                    # Call data callbacks
-                    for callback in self.data_callbacks:
-                        try:
-                            callback(stream_id, data_sample)
-                        except Exception as e:
-                            logger.error(f"Error in LSL data callback: {str(e)}")
+                # Convert the whole chunk to a channels x samples block
+                n_samples = len(samples)
+                timestamps = np.asarray(timestamps, dtype=np.float64)
+                if timestamps.shape[0] != n_samples:
+                    timestamps = np.full(n_samples, time.time())
+
+                data_block = DataBlock(
+                    data=np.asarray(samples, dtype=np.float32).T,
+                    timestamps=timestamps,
+                    first_sample_number=inlet_info.samples_received,
+                    device_id=stream_id,
+                    sampling_rate=inlet_info.stream_info.sampling_rate,
+                )
+
+                # Update metrics
+                inlet_info.samples_received += n_samples
+                inlet_info.last_sample_time = datetime.utcnow()
+                self.stats["samples_received"] += n_samples
+
+                # Call block callbacks
+                for callback in self.block_callbacks:
+                    try:
+                        callback(stream_id, data_block)
+                    except Exception as e:
+                        logger.error(f"Error in LSL block callback: {str(e)}")
+
+                # Expand into samples only for legacy per-sample consumers
+                if self.data_callbacks:
+                    for data_sample in data_block.iter_samples():
+                        for callback in self.data_callbacks:
+                            try:
+                                callback(stream_id, data_sample)
+                            except Exception as e:
+                                logger.error(f"Error in LSL data callback: {str(e)}")
 
         except Exception as e:
             logger.error(f"Error processing inlet data for {stream_id}: {str(e)}")
@@ -13,6 +13,8 @@ from google.cloud import monitoring_v3
 from google.cloud import error_reporting
 import numpy as np
 
+from common.wire_format import decode_message
+
 # Set up logging
 logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
@@ -99,7 +101,7 @@ class NeuralDataProcessor:
                 return False
 
         # Check data dimensions
-        neural_data = np.array(data["data"])
+        neural_data = np.asarray(data["data"])
         if neural_data.shape[0] == 0:
             logger.error("Empty data array")
             return False
@@ -254,7 +256,7 @@ class NeuralDataProcessor:
                 raise ValueError("Invalid data format")
 
             # Extract and preprocess data
-            raw_data = np.array(message_data["data"])
+            raw_data = np.asarray(message_data["data"])
             processed_data = self.preprocess_data(raw_data)
 
             # Extract features
@@ -297,11 +299,11 @@ def process_neural_stream(cloud_event: Any) -> None:
     """Cloud Function entry point for processing neural data streams."""
     # Extract message data
     message = cloud_event.data["message"]
-    message_data = base64.b64decode(message["data"]).decode()
+    message_data = base64.b64decode(message["data"])
 
     try:
-        # Parse JSON data
-        data = json.loads(message_data)
+        # Binary wire format, or JSON fallback
+        data = decode_message(message_data)
 
         # Initialize processor
         if SIGNAL_TYPE is None:
@@ -6,7 +6,7 @@ import os
 # Add parent directory to path to import base processor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_processor import NeuralDataProcessor  # noqa: E402, F401
+from base_processor import NeuralDataProcessor, decode_message  # noqa: E402
 import numpy as np  # noqa: E402
 from scipy import signal  # noqa: E402
 import logging  # noqa: E402
@@ -87,18 +87,17 @@ class EEGProcessor(NeuralDataProcessor):
 def process_neural_stream(cloud_event: Any) -> None:
     """Cloud Function entry point for processing EEG data streams."""
     import base64
-    import json
     from google.cloud import error_reporting
 
     error_client = error_reporting.Client()
 
     # Extract message data
     message = cloud_event.data["message"]
-    message_data = base64.b64decode(message["data"]).decode()
+    message_data = base64.b64decode(message["data"])
 
     try:
-        # Parse JSON data
-        data = json.loads(message_data)
+        # Binary wire format, or JSON fallback
+        data = decode_message(message_data)
 
         # Initialize EEG processor
         processor = EEGProcessor()
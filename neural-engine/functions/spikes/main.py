@@ -5,7 +5,7 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_processor import NeuralDataProcessor  # noqa: E402, F401
+from base_processor import NeuralDataProcessor, decode_message  # noqa: E402
 import numpy as np  # noqa: E402
 from scipy import signal  # noqa: E402
 import logging  # noqa: E402
@@ -63,16 +63,15 @@ class SpikeProcessor(NeuralDataProcessor):
 def process_neural_stream(cloud_event: Any) -> None:
     """Cloud Function entry point for processing spike data streams."""
     import base64
-    import json
     from google.cloud import error_reporting
 
     error_client = error_reporting.Client()
 
     message = cloud_event.data["message"]
-    message_data = base64.b64decode(message["data"]).decode()
+    message_data = base64.b64decode(message["data"])
 
     try:
-        data = json.loads(message_data)
+        data = decode_message(message_data)
         processor = SpikeProcessor()
         result = processor.process(data)
         logger.info(f"Spike processing result: {result}")
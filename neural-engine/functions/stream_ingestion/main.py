@@ -7,6 +7,8 @@ from datetime import datetime
 import logging
 import os
 
+import numpy as np
+
 # from google.cloud import pubsub_v1  # Unused import
 from google.cloud import bigtable
 
@@ -14,6 +16,8 @@ from google.cloud import bigtable
 # from google.cloud.bigtable import row_filters  # Unused import
 from typing import Any
 
+from common.wire_format import decode_message
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,8 +34,9 @@ def process_neural_stream(cloud_event: Any) -> None:
     """Process neural data stream from Pub/Sub."""
     try:
         # Decode the Pub/Sub message
-        pubsub_message = base64.b64decode(cloud_event.data["message"]["data"]).decode()
-        data = json.loads(pubsub_message)
+        pubsub_message = base64.b64decode(cloud_event.data["message"]["data"])
+        # Binary wire format, or JSON fallback
+        data = decode_message(pubsub_message)
 
         logger.info(f"Processing neural data from device: {data.get('device_id')}")
 
@@ -75,6 +80,8 @@ def process_neural_stream(cloud_event: Any) -> None:
             row.set_cell("metadata", "channel_count", str(len(channels)))
 
             # Store sample data as JSON (simplified)
+            if isinstance(samples, np.ndarray):
+                samples = samples.tolist()
             row.set_cell("data", "samples", json.dumps(samples))
             row.set_cell("data", "channels", json.dumps(channels))
 
@@ -223,6 +223,11 @@ resource "google_bigquery_table" "events" {
       type = "STRING"
       mode = "REQUIRED"
     },
+    {
+      name = "sequence"
+      type = "INTEGER"
+      mode = "NULLABLE"
+    },
     {
       name = "signature"
       type = "STRING"
@@ -9,7 +9,7 @@ from .event_schema import (
     MLEvent,
     AccessEvent,
 )
-from .hash_chain import HashChain
+from .hash_chain import ChainCheckpoint, HashChain
 from .event_signer import EventSigner
 from .event_processor import EventProcessor
 from .query_service import LedgerQueryService
@@ -24,6 +24,7 @@ __all__ = [
     "MLEvent",
     "AccessEvent",
     "HashChain",
+    "ChainCheckpoint",
     "EventSigner",
     "EventProcessor",
     "LedgerQueryService",
@@ -13,6 +13,11 @@ from concurrent.futures import ThreadPoolExecutor
 
 from google.cloud import bigtable, firestore, bigquery
 from google.cloud import kms
+from common.bigtable_writer import (
+    BigtableBatchWriter,
+    CloudBigtableBackend,
+    RowMutation,
+)
 from .event_schema import NeuralLedgerEvent, EventType, requires_signature
 from .event_signer import EventSigner
 from .monitoring import LedgerMonitoring
@@ -76,6 +81,12 @@ class EventProcessor:
         # Thread pool for I / O operations
         self.executor = ThreadPoolExecutor(max_workers=10)
 
+        # Batched Bigtable writes with cached table handles
+        self.bigtable_writer = BigtableBatchWriter(
+            CloudBigtableBackend(bigtable_client, self.bigtable_instance_id),
+            executor=self.executor,
+        )
+
         # Metrics
         self.metrics = {
             "events_processed": 0,
@@ -221,56 +232,53 @@ class EventProcessor:
         return is_valid
 
     async def _write_to_bigtable(self, event: NeuralLedgerEvent) -> None:
-        """Write event to Bigtable for high-frequency queries."""
-        loop = asyncio.get_event_loop()
-
-        def write() -> None:
-            # Get table reference
-            instance = self.bigtable_client.instance(self.bigtable_instance_id)
-            table = instance.table(self.bigtable_table_id)
-
-            # Create row key: reversed timestamp + event_id for time-based sorting
-            timestamp_str = event.timestamp.strftime("%Y%m%d%H%M%S%")
-            reversed_timestamp = str(9999999999999999 - int(timestamp_str))
-            row_key = f"{reversed_timestamp}#{event.event_id}"
-
-            # Create row
-            row = table.direct_row(row_key.encode())
+        """Write event to Bigtable for high-frequency queries.
 
-            # Add event data to different column families
-            row.set_cell("event", "event_id", event.event_id)
-            row.set_cell("event", "event_type", event.event_type.value)
-            row.set_cell("event", "timestamp", event.timestamp.isoformat())
-
-            if event.session_id:
-                row.set_cell("event", "session_id", event.session_id)
-            if event.device_id:
-                row.set_cell("event", "device_id", event.device_id)
-            if event.user_id:
-                row.set_cell("event", "user_id", event.user_id)
-            if event.data_hash:
-                row.set_cell("event", "data_hash", event.data_hash)
-
-            # Metadata as JSON
-            if event.metadata:
-                row.set_cell("metadata", "data", json.dumps(event.metadata))
-
-            # Chain data
-            row.set_cell("chain", "previous_hash", event.previous_hash)
-            row.set_cell("chain", "event_hash", event.event_hash)
-
-            if event.signature:
-                row.set_cell("chain", "signature", event.signature)
-            if event.signing_key_id:
-                row.set_cell("chain", "signing_key_id", event.signing_key_id)
-
-            # Commit row
-            row.commit()
-
-            logger.debug(f"Wrote event {event.event_id} to Bigtable")
-
-        # Execute in thread pool
-        await loop.run_in_executor(self.executor, write)
+        Events are batched with concurrent writes; this returns once the
+        event's row has been committed.
+        """
+        # Create row key: reversed timestamp + event_id for time-based sorting
+        timestamp_str = event.timestamp.strftime("%Y%m%d%H%M%S%")
+        reversed_timestamp = str(9999999999999999 - int(timestamp_str))
+        row_key = f"{reversed_timestamp}#{event.event_id}"
+
+        # Create row
+        row = RowMutation(self.bigtable_table_id, row_key.encode())
+
+        # Add event data to different column families
+        row.set_cell("event", "event_id", event.event_id)
+        row.set_cell("event", "event_type", event.event_type.value)
+        row.set_cell("event", "timestamp", event.timestamp.isoformat())
+
+        if event.session_id:
+            row.set_cell("event", "session_id", event.session_id)
+        if event.device_id:
+            row.set_cell("event", "device_id", event.device_id)
+        if event.user_id:
+            row.set_cell("event", "user_id", event.user_id)
+        if event.data_hash:
+            row.set_cell("event", "data_hash", event.data_hash)
+
+        # Metadata as JSON
+        if event.metadata:
+            row.set_cell("metadata", "data", json.dumps(event.metadata))
+
+        # Chain data
+        row.set_cell("chain", "previous_hash", event.previous_hash)
+        row.set_cell("chain", "event_hash", event.event_hash)
+        if event.sequence is not None:
+            row.set_cell("chain", "sequence", str(event.sequence))
+
+        if event.signature:
+            row.set_cell("chain", "signature", event.signature)
+        if event.signing_key_id:
+            row.set_cell("chain", "signing_key_id", event.signing_key_id)
+
+        # Wait for the batch holding this row to commit
+        commit = await self.bigtable_writer.write(row)
+        await commit
+
+        logger.debug(f"Wrote event {event.event_id} to Bigtable")
 
     async def _write_to_firestore(self, event: NeuralLedgerEvent) -> None:
         """Write event to Firestore for real-time queries."""
@@ -333,6 +341,7 @@ class EventProcessor:
                 "metadata": json.dumps(event.metadata) if event.metadata else None,
                 "previous_hash": event.previous_hash,
                 "event_hash": event.event_hash,
+                "sequence": event.sequence,
                 "signature": event.signature,
                 "signing_key_id": event.signing_key_id,
             }
@@ -71,6 +71,7 @@ class NeuralLedgerEvent:
     # Chain integrity
     previous_hash: str = "0" * 64  # Hash of previous event
     event_hash: str = ""  # Hash of this event
+    sequence: Optional[int] = None  # Position in the chain from genesis
 
     # Security
     signature: Optional[str] = None  # Digital signature for critical events
@@ -94,6 +95,7 @@ class NeuralLedgerEvent:
             "metadata": self.metadata,
             "previous_hash": self.previous_hash,
             "event_hash": self.event_hash,
+            "sequence": self.sequence,
             "signature": self.signature,
             "signing_key_id": self.signing_key_id,
         }
@@ -112,6 +114,7 @@ class NeuralLedgerEvent:
             metadata=data.get("metadata", {}),
             previous_hash=data.get("previous_hash", "0" * 64),
             event_hash=data.get("event_hash", ""),
+            sequence=data.get("sequence"),
             signature=data.get("signature"),
             signing_key_id=data.get("signing_key_id"),
         )
@@ -2,13 +2,100 @@
 
 import hashlib
 import json
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import logging
 
 from .event_schema import NeuralLedgerEvent
 
 logger = logging.getLogger(__name__)
 
+GENESIS_HASH = "0" * 64
+
+# Events per checkpointed segment
+DEFAULT_SEGMENT_SIZE = 1024
+
+# Chains shorter than this are verified in-process
+PARALLEL_MIN_EVENTS = 16384
+
+
+@dataclass
+class ChainCheckpoint:
+    """Trusted Merkle checkpoint over a fixed-size segment of the chain.
+
+    Each checkpoint covers events ``[start_index, end_index)``. The
+    ``chain_root`` folds the segment's Merkle root into the previous
+    checkpoint's, so one checkpoint authenticates every segment before it.
+    """
+
+    segment_index: int
+    start_index: int
+    end_index: int
+    previous_hash: str  # Chain hash entering the segment
+    last_hash: str  # Hash of the segment's final event
+    merkle_root: str
+    chain_root: str
+    last_event_id: str
+    last_timestamp: datetime
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert checkpoint to dictionary for storage."""
+        return {
+            "segment_index": self.segment_index,
+            "start_index": self.start_index,
+            "end_index": self.end_index,
+            "previous_hash": self.previous_hash,
+            "last_hash": self.last_hash,
+            "merkle_root": self.merkle_root,
+            "chain_root": self.chain_root,
+            "last_event_id": self.last_event_id,
+            "last_timestamp": self.last_timestamp.isoformat(),
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChainCheckpoint":
+        """Create checkpoint from dictionary."""
+        return cls(
+            segment_index=data["segment_index"],
+            start_index=data["start_index"],
+            end_index=data["end_index"],
+            previous_hash=data["previous_hash"],
+            last_hash=data["last_hash"],
+            merkle_root=data["merkle_root"],
+            chain_root=data["chain_root"],
+            last_event_id=data["last_event_id"],
+            last_timestamp=datetime.fromisoformat(data["last_timestamp"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+
+def _verify_segment_task(
+    args: Tuple[List[NeuralLedgerEvent], str, int],
+) -> Optional[int]:
+    """Process pool entry point for segment verification."""
+    events, previous_hash, start_index = args
+    return HashChain.verify_segment(events, previous_hash, start_index)
+
+
+def _verify_and_root_task(
+    args: Tuple[List[NeuralLedgerEvent], str, int],
+) -> Tuple[Optional[int], Optional[str]]:
+    """Process pool entry point for verifying a segment and its Merkle root."""
+    events, previous_hash, start_index = args
+    break_index = HashChain.verify_segment(events, previous_hash, start_index)
+    if break_index is not None:
+        return break_index, None
+    return None, HashChain.compute_merkle_root(events)
+
+
+def _merkle_root_task(hashes: List[str]) -> str:
+    """Process pool entry point for segment Merkle roots."""
+    return HashChain.compute_merkle_root_from_hashes(hashes)
+
 
 class HashChain:
     """Implements cryptographic hash chain for event integrity.
@@ -78,22 +165,24 @@ class HashChain:
         return event.event_hash == expected_hash
 
     @staticmethod
-    def verify_chain(events: List[NeuralLedgerEvent]) -> bool:
-        """Verify integrity of event chain.
+    def verify_segment(
+        events: Sequence[NeuralLedgerEvent],
+        previous_hash: str = GENESIS_HASH,
+        start_index: int = 0,
+    ) -> Optional[int]:
+        """Re-hash a contiguous run of events.
 
         Args:
-            events: List of events in chronological order
+            events: Events in chronological order
+            previous_hash: Chain hash preceding the first event
+            start_index: Chain index of the first event, used in results
 
         Returns:
-            True if entire chain is valid
+            Chain index of the first invalid event, or None if all are valid
         """
-        if not events:
-            return True
-
-        # Genesis block has all-zero previous hash
-        previous_hash = "0" * 64
+        for offset, event in enumerate(events):
+            i = start_index + offset
 
-        for i, event in enumerate(events):
             # Verify event's previous_hash matches
             if event.previous_hash != previous_hash:
                 logger.error(
@@ -101,7 +190,7 @@ class HashChain:
                     f"expected previous_hash={previous_hash}, "
                     f"got={event.previous_hash}"
                 )
-                return False
+                return i
 
             # Verify event's hash
             expected_hash = HashChain.compute_event_hash(event, previous_hash)
@@ -111,18 +200,57 @@ class HashChain:
                     f"expected={expected_hash}, "
                     f"got={event.event_hash}"
                 )
-                return False
+                return i
 
             previous_hash = event.event_hash
 
-        return True
+        return None
+
+    @staticmethod
+    def verify_chain(
+        events: List[NeuralLedgerEvent],
+        previous_hash: str = GENESIS_HASH,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> bool:
+        """Verify integrity of event chain.
+
+        Args:
+            events: List of events in chronological order
+            previous_hash: Chain hash preceding the first event
+            segment_size: Events per segment for parallel verification
+            max_workers: Worker processes for long chains (1 disables)
+
+        Returns:
+            True if entire chain is valid
+        """
+        return (
+            HashChain.find_chain_break(
+                events,
+                previous_hash=previous_hash,
+                segment_size=segment_size,
+                max_workers=max_workers,
+            )
+            is None
+        )
 
     @staticmethod
-    def find_chain_break(events: List[NeuralLedgerEvent]) -> Optional[int]:
+    def find_chain_break(
+        events: List[NeuralLedgerEvent],
+        previous_hash: str = GENESIS_HASH,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> Optional[int]:
         """Find the index where the chain breaks.
 
+        Segments are independent once each is seeded with the stored hash of
+        the event before it, so long chains are verified in parallel.
+
         Args:
             events: List of events in chronological order
+            previous_hash: Chain hash preceding the first event
+            segment_size: Events per segment for parallel verification
+            max_workers: Worker processes for long chains (1 disables)
 
         Returns:
             Index of first invalid event, or None if chain is valid
@@ -130,21 +258,53 @@ class HashChain:
         if not events:
             return None
 
-        previous_hash = "0" * 64
+        if len(events) < PARALLEL_MIN_EVENTS or max_workers == 1:
+            return HashChain.verify_segment(events, previous_hash)
 
-        for i, event in enumerate(events):
-            # Check previous hash
-            if event.previous_hash != previous_hash:
-                return i
+        tasks = []
+        for start in range(0, len(events), segment_size):
+            seed = previous_hash if start == 0 else events[start - 1].event_hash
+            tasks.append((events[start : start + segment_size], seed, start))
 
-            # Check event hash
-            expected_hash = HashChain.compute_event_hash(event, previous_hash)
-            if event.event_hash != expected_hash:
-                return i
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                breaks = list(executor.map(_verify_segment_task, tasks))
+        except Exception as e:
+            logger.warning(f"Parallel verification failed, verifying inline: {e}")
+            return HashChain.verify_segment(events, previous_hash)
 
-            previous_hash = event.event_hash
+        breaks = [index for index in breaks if index is not None]
+        return min(breaks) if breaks else None
 
-        return None
+    @staticmethod
+    def chain_order(
+        events: Sequence[Any], previous_hash: str = GENESIS_HASH
+    ) -> List[Any]:
+        """Order events by following their hash links.
+
+        Args:
+            events: Objects with ``previous_hash`` and ``event_hash``
+                attributes; ties between forks keep this order
+            previous_hash: Chain hash preceding the first event
+
+        Returns:
+            Events linked from ``previous_hash`` in chain order, followed by
+            any events the links do not reach, in their input order
+        """
+        children: Dict[str, List[int]] = {}
+        for index, event in enumerate(events):
+            children.setdefault(event.previous_hash, []).append(index)
+
+        ordered: List[int] = []
+        linked = set()
+        while children.get(previous_hash):
+            index = children[previous_hash].pop(0)
+            ordered.append(index)
+            linked.add(index)
+            previous_hash = events[index].event_hash
+
+        ordered += [index for index in range(len(events)) if index not in linked]
+        return [events[index] for index in ordered]
 
     @staticmethod
     def repair_chain(events: List[NeuralLedgerEvent]) -> List[NeuralLedgerEvent]:
@@ -192,11 +352,24 @@ class HashChain:
         Returns:
             Merkle root hash as hex string
         """
-        if not events:
-            return "0" * 64
+        return HashChain.compute_merkle_root_from_hashes(
+            [event.event_hash for event in events]
+        )
 
-        # Start with event hashes
-        hashes = [event.event_hash for event in events]
+    @staticmethod
+    def compute_merkle_root_from_hashes(hashes: Sequence[str]) -> str:
+        """Compute Merkle tree root over event hashes.
+
+        Args:
+            hashes: Event hashes in chain order
+
+        Returns:
+            Merkle root hash as hex string
+        """
+        if not hashes:
+            return GENESIS_HASH
+
+        hashes = list(hashes)
 
         # Build Merkle tree
         while len(hashes) > 1:
@@ -214,3 +387,274 @@ class HashChain:
             hashes = next_level
 
         return hashes[0]
+
+    @staticmethod
+    def compute_chain_root(previous_chain_root: str, merkle_root: str) -> str:
+        """Fold a segment's Merkle root into the running checkpoint root."""
+        combined = previous_chain_root + merkle_root
+        return hashlib.sha256(combined.encode()).hexdigest()
+
+    @staticmethod
+    def verify_segments(
+        events: List[NeuralLedgerEvent],
+        checkpoint: Optional[ChainCheckpoint] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[Optional[int], List[str]]:
+        """Verify the events after a checkpoint and compute their segment roots.
+
+        Segments follow the checkpoint's size, so the roots can be handed to
+        ``build_checkpoints`` without re-hashing the events.
+
+        Args:
+            events: Events following ``checkpoint`` (or from genesis)
+            checkpoint: Most recent trusted checkpoint
+            segment_size: Events per segment when there is no checkpoint
+            max_workers: Worker processes for long chains (1 disables)
+
+        Returns:
+            Index into ``events`` of the first invalid event (or None), and
+            the Merkle roots of the complete segments before it
+        """
+        if checkpoint is not None:
+            segment_size = checkpoint.end_index - checkpoint.start_index
+            previous_hash = checkpoint.last_hash
+        else:
+            previous_hash = GENESIS_HASH
+
+        tasks = []
+        for start in range(0, len(events), segment_size):
+            seed = previous_hash if start == 0 else events[start - 1].event_hash
+            tasks.append((events[start : start + segment_size], seed, start))
+
+        # Sequential results are lazy so verification stops at the first break
+        results = map(_verify_and_root_task, tasks)
+        if len(events) >= PARALLEL_MIN_EVENTS and max_workers != 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(_verify_and_root_task, tasks))
+            except Exception as e:
+                logger.warning(f"Parallel verification failed, verifying inline: {e}")
+
+        roots = []
+        for (segment, _, _), (break_index, root) in zip(tasks, results):
+            if break_index is not None:
+                return break_index, roots
+            if len(segment) == segment_size:
+                roots.append(root)
+
+        return None, roots
+
+    @staticmethod
+    def build_checkpoints(
+        events: List[NeuralLedgerEvent],
+        last_checkpoint: Optional[ChainCheckpoint] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_workers: Optional[int] = None,
+        roots: Optional[Sequence[str]] = None,
+    ) -> List[ChainCheckpoint]:
+        """Create checkpoints for completed segments after the last one.
+
+        Only segments that verify are checkpointed; checkpoint creation stops
+        at the first invalid event.
+
+        Args:
+            events: Events following ``last_checkpoint`` (or from genesis)
+            last_checkpoint: Most recent trusted checkpoint
+            segment_size: Events per segment
+            max_workers: Worker processes for verification
+            roots: Segment roots from ``verify_segments`` over the same
+                events; when given the events are not verified again
+
+        Returns:
+            New checkpoints in chain order
+        """
+        if last_checkpoint is not None:
+            segment_size = last_checkpoint.end_index - last_checkpoint.start_index
+            previous_hash = last_checkpoint.last_hash
+            chain_root = last_checkpoint.chain_root
+            segment_index = last_checkpoint.segment_index + 1
+            base_index = last_checkpoint.end_index
+        else:
+            previous_hash = chain_root = GENESIS_HASH
+            segment_index = base_index = 0
+
+        if roots is None:
+            _, roots = HashChain.verify_segments(
+                events, last_checkpoint, segment_size, max_workers
+            )
+
+        checkpoints = []
+        for offset, merkle_root in enumerate(roots):
+            start = offset * segment_size
+            last_event = events[start + segment_size - 1]
+            chain_root = HashChain.compute_chain_root(chain_root, merkle_root)
+            checkpoints.append(
+                ChainCheckpoint(
+                    segment_index=segment_index,
+                    start_index=base_index + start,
+                    end_index=base_index + start + segment_size,
+                    previous_hash=previous_hash,
+                    last_hash=last_event.event_hash,
+                    merkle_root=merkle_root,
+                    chain_root=chain_root,
+                    last_event_id=last_event.event_id,
+                    last_timestamp=last_event.timestamp,
+                )
+            )
+            previous_hash = last_event.event_hash
+            segment_index += 1
+
+        return checkpoints
+
+    @staticmethod
+    def verify_from_checkpoint(
+        events: List[NeuralLedgerEvent],
+        checkpoint: Optional[ChainCheckpoint] = None,
+        max_workers: Optional[int] = None,
+    ) -> bool:
+        """Verify only the events after a trusted checkpoint.
+
+        Args:
+            events: Events following ``checkpoint`` (or from genesis)
+            checkpoint: Most recent trusted checkpoint
+            max_workers: Worker processes for long chains
+
+        Returns:
+            True if the events extend the checkpointed chain validly
+        """
+        break_index, _ = HashChain.verify_segments(
+            events, checkpoint, max_workers=max_workers
+        )
+        return break_index is None
+
+    @staticmethod
+    def locate_chain_break(
+        events: List[NeuralLedgerEvent],
+        checkpoints: List[ChainCheckpoint],
+        start_index: int = 0,
+        max_workers: Optional[int] = None,
+    ) -> Optional[int]:
+        """Find the first break in a run of events using trusted checkpoints.
+
+        Checkpoints whose segments lie inside the events, and whose
+        predecessor's chain root is known, form a contiguous run. Because each
+        chain root folds in every segment before it, the first checkpoint that
+        disagrees with the recomputed roots is found by bisection; segment
+        roots are computed from stored event hashes only as far as the probes
+        reach. Only that segment, and events outside the run, are re-hashed.
+        Content changes that leave stored hashes intact within checkpointed
+        segments are only found by ``find_chain_break``.
+
+        Args:
+            events: Contiguous events in chain order
+            checkpoints: Trusted checkpoints in chain order, including the one
+                ending at or spanning ``start_index`` when it is not genesis
+            start_index: Chain index of the first event
+            max_workers: Worker processes for root computation
+
+        Returns:
+            Chain index of the first invalid event (or the start of the first
+            segment that no longer matches its checkpoint), or None
+        """
+        if not events:
+            return None
+
+        end_index = start_index + len(events)
+        last_hashes = {0: GENESIS_HASH}
+        chain_roots_at = {0: GENESIS_HASH}
+        for checkpoint in checkpoints:
+            last_hashes[checkpoint.end_index] = checkpoint.last_hash
+            chain_roots_at[checkpoint.end_index] = checkpoint.chain_root
+
+        # The hash entering a window that starts mid-segment cannot be checked
+        previous_hash = last_hashes.get(start_index, events[0].previous_hash)
+        if events[0].previous_hash != previous_hash:
+            logger.error(f"Chain broken entering event {start_index}")
+            return start_index
+
+        run: List[ChainCheckpoint] = []
+        for checkpoint in checkpoints:
+            if run:
+                if checkpoint.start_index != run[-1].end_index:
+                    break
+            elif (
+                checkpoint.start_index < start_index
+                or checkpoint.start_index not in chain_roots_at
+            ):
+                continue
+            if checkpoint.end_index > end_index:
+                break
+            run.append(checkpoint)
+
+        if not run:
+            break_index = HashChain.find_chain_break(
+                events, previous_hash=previous_hash, max_workers=max_workers
+            )
+            return None if break_index is None else start_index + break_index
+
+        # Re-hash events ahead of the run and check they lead into it
+        head = events[: run[0].start_index - start_index]
+        break_index = HashChain.verify_segment(head, previous_hash, start_index)
+        if break_index is not None:
+            return break_index
+        if head and head[-1].event_hash != run[0].previous_hash:
+            return run[0].start_index - 1
+
+        parallel = len(events) >= PARALLEL_MIN_EVENTS and max_workers != 1
+        executor = ProcessPoolExecutor(max_workers=max_workers) if parallel else None
+        chain_roots: List[str] = []
+        lo, hi = 0, len(run)
+        try:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if len(chain_roots) <= mid:
+                    segments = []
+                    for checkpoint in run[len(chain_roots) : mid + 1]:
+                        first = checkpoint.start_index - start_index
+                        last = checkpoint.end_index - start_index
+                        segments.append([e.event_hash for e in events[first:last]])
+                    if executor is not None:
+                        roots = executor.map(_merkle_root_task, segments)
+                    else:
+                        roots = map(_merkle_root_task, segments)
+                    chain_root = (
+                        chain_roots[-1]
+                        if chain_roots
+                        else chain_roots_at[run[0].start_index]
+                    )
+                    for root in roots:
+                        chain_root = HashChain.compute_chain_root(chain_root, root)
+                        chain_roots.append(chain_root)
+
+                if chain_roots[mid] == run[mid].chain_root:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if lo < len(run):
+            checkpoint = run[lo]
+            first = checkpoint.start_index - start_index
+            last = checkpoint.end_index - start_index
+            break_index = HashChain.verify_segment(
+                events[first:last], checkpoint.previous_hash, checkpoint.start_index
+            )
+            if break_index is None:
+                logger.error(
+                    f"Segment {checkpoint.segment_index} no longer matches "
+                    f"its checkpoint"
+                )
+                return checkpoint.start_index
+            return break_index
+
+        # Checkpointed run matches; re-hash only the tail
+        tail_start = run[-1].end_index
+        break_index = HashChain.find_chain_break(
+            events[tail_start - start_index :],
+            previous_hash=run[-1].last_hash,
+            max_workers=max_workers,
+        )
+        return None if break_index is None else tail_start + break_index
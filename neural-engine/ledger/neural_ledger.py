@@ -7,9 +7,10 @@ Priority: HIGHEST (Week 1, Days 1-4)
 Compliance: HIPAA, GDPR, FDA 21 CFR Part 11
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 from google.cloud import pubsub_v1, bigtable, firestore, bigquery
 from google.cloud import kms
@@ -20,11 +21,18 @@ from .event_schema import (
     EventType,
     requires_signature,
 )
-from .hash_chain import HashChain
+from .hash_chain import ChainCheckpoint, HashChain
 from .event_processor import EventProcessor
 
 logger = logging.getLogger(__name__)
 
+# Events numbered per MERGE statement when backfilling sequences
+SEQUENCE_BACKFILL_BATCH_SIZE = 10000
+
+# Chain order of stored events; rows written before sequences were stored
+# sort first, by time, until they are backfilled
+CHAIN_ORDER = "COALESCE(sequence, -1), timestamp"
+
 
 class NeuralLedger:
     """Main Neural Ledger implementation with multi-tier storage.
@@ -63,6 +71,7 @@ class NeuralLedger:
         self.bigtable_instance_id = "neural-ledger"
         self.bigtable_table_id = "events"
         self.bigquery_dataset_id = "neural_ledger"
+        self.checkpoint_collection = "ledger_checkpoints"
 
         # Initialize event processor
         self.event_processor = EventProcessor(
@@ -76,6 +85,7 @@ class NeuralLedger:
 
         # Chain state
         self._last_event_hash = "0" * 64  # Genesis block
+        self._next_sequence = 0
 
     async def initialize(self):
         """Initialize all GCP resources for the ledger."""
@@ -131,6 +141,7 @@ class NeuralLedger:
             data_hash=data_hash,
             metadata=metadata or {},
             previous_hash=self._last_event_hash,
+            sequence=self._next_sequence,
         )
 
         # Compute event hash
@@ -145,6 +156,7 @@ class NeuralLedger:
 
         # Update chain state
         self._last_event_hash = event.event_hash
+        self._next_sequence += 1
 
         # Log performance metrics
         logger.info(
@@ -241,6 +253,10 @@ class NeuralLedger:
     ) -> bool:
         """Verify the integrity of the hash chain.
 
+        Without a time range only events after the last persisted checkpoint
+        are re-hashed, and checkpoints are added for newly completed
+        segments.
+
         Args:
             start_time: Start of time range to verify
             end_time: End of time range to verify
@@ -248,12 +264,15 @@ class NeuralLedger:
         Returns:
             True if chain is valid, False if compromised
         """
+        if start_time is None and end_time is None:
+            return await self._verify_since_checkpoint()
+
         # Query events from BigQuery for the time range
-        query = """
+        query = f"""
         SELECT *
         FROM `{self.project_id}.{self.bigquery_dataset_id}.events`
         WHERE timestamp BETWEEN @start_time AND @end_time
-        ORDER BY timestamp ASC
+        ORDER BY {CHAIN_ORDER}
         """
 
         if not start_time:
@@ -278,16 +297,125 @@ class NeuralLedger:
             event_data = dict(row)
             events.append(NeuralLedgerEvent.from_dict(event_data))
 
-        # Verify chain
-        is_valid = HashChain.verify_chain(events)
+        if not events:
+            return True
+
+        # Verify chain, skipping segments that still match their checkpoints
+        start_index = events[0].sequence or 0
+        checkpoints = await self._load_checkpoints(
+            start_index, start_index + len(events)
+        )
+        break_index = HashChain.locate_chain_break(events, checkpoints, start_index)
 
-        if not is_valid:
+        if break_index is not None:
             logger.error(
                 f"Chain integrity violation detected between {start_time} and {end_time}"
             )
-            # TODO: Trigger compliance alert
+            self._alert_chain_violation(
+                events[break_index - start_index].event_type.value
+            )
+            return False
+
+        return True
+
+    async def _verify_since_checkpoint(self) -> bool:
+        """Verify events after the last trusted checkpoint."""
+        checkpoint = await self._load_latest_checkpoint()
+
+        query = f"""
+        SELECT *
+        FROM `{self.project_id}.{self.bigquery_dataset_id}.events`
+        WHERE sequence >= @start OR sequence IS NULL
+        ORDER BY {CHAIN_ORDER}
+        """
+        start = checkpoint.end_index if checkpoint else 0
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("start", "INT64", start),
+            ]
+        )
+
+        # Events missing a sequence are never skipped; until they are
+        # backfilled they sort first and fail verification past genesis
+        query_job = self.bigquery_client.query(query, job_config=job_config)
+        events = [NeuralLedgerEvent.from_dict(dict(row)) for row in query_job.result()]
+
+        break_index, roots = HashChain.verify_segments(events, checkpoint)
+
+        if break_index is not None:
+            logger.error(
+                "Chain integrity violation detected after checkpoint "
+                f"{checkpoint.segment_index if checkpoint else 'genesis'}"
+            )
+            self._alert_chain_violation(events[break_index].event_type.value)
+            return False
 
-        return is_valid
+        await self._save_checkpoints(
+            HashChain.build_checkpoints(events, checkpoint, roots=roots)
+        )
+        return True
+
+    def _alert_chain_violation(self, event_type: str) -> None:
+        """Raise a compliance alert for a hash chain violation."""
+        try:
+            self.event_processor.monitoring.record_chain_violation(event_type)
+        except Exception as e:
+            logger.error(f"Failed to record chain violation: {e}")
+
+    async def _load_latest_checkpoint(self) -> Optional[ChainCheckpoint]:
+        """Load the most recent trusted chain checkpoint."""
+        loop = asyncio.get_event_loop()
+
+        def load() -> Optional[ChainCheckpoint]:
+            query = (
+                self.firestore_client.collection(self.checkpoint_collection)
+                .order_by("segment_index", direction=firestore.Query.DESCENDING)
+                .limit(1)
+            )
+            for doc in query.stream():
+                return ChainCheckpoint.from_dict(doc.to_dict())
+            return None
+
+        return await loop.run_in_executor(None, load)
+
+    async def _load_checkpoints(
+        self, start_index: int, end_index: int
+    ) -> List[ChainCheckpoint]:
+        """Load checkpoints ending within ``[start_index, end_index]``."""
+        loop = asyncio.get_event_loop()
+
+        def load() -> List[ChainCheckpoint]:
+            query = (
+                self.firestore_client.collection(self.checkpoint_collection)
+                .where("end_index", ">=", start_index)
+                .where("end_index", "<=", end_index)
+                .order_by("end_index")
+            )
+            return [ChainCheckpoint.from_dict(doc.to_dict()) for doc in query.stream()]
+
+        return await loop.run_in_executor(None, load)
+
+    async def _save_checkpoints(self, checkpoints: List[ChainCheckpoint]) -> None:
+        """Persist new chain checkpoints."""
+        if not checkpoints:
+            return
+
+        loop = asyncio.get_event_loop()
+
+        def save() -> None:
+            collection = self.firestore_client.collection(self.checkpoint_collection)
+            batch = self.firestore_client.batch()
+            for checkpoint in checkpoints:
+                doc_ref = collection.document(f"{checkpoint.segment_index:012d}")
+                batch.set(doc_ref, checkpoint.to_dict())
+            batch.commit()
+
+        await loop.run_in_executor(None, save)
+
+        logger.info(
+            f"Saved {len(checkpoints)} chain checkpoints up to segment "
+            f"{checkpoints[-1].segment_index}"
+        )
 
     async def get_compliance_report(
         self, report_type: str, start_date: datetime, end_date: datetime
@@ -375,6 +503,7 @@ class NeuralLedger:
             bigquery.SchemaField("metadata", "JSON"),
             bigquery.SchemaField("previous_hash", "STRING", mode="REQUIRED"),
             bigquery.SchemaField("event_hash", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("sequence", "INTEGER"),
             bigquery.SchemaField("signature", "STRING"),
             bigquery.SchemaField("signing_key_id", "STRING"),
         ]
@@ -393,20 +522,34 @@ class NeuralLedger:
                 raise
 
     async def _load_chain_state(self):
-        """Load the last event hash for chain continuity."""
-        query = """
-        SELECT event_hash
-        FROM `{self.project_id}.{self.bigquery_dataset_id}.events`
-        ORDER BY timestamp DESC
+        """Load the last event hash and sequence for chain continuity."""
+        table = f"{self.project_id}.{self.bigquery_dataset_id}.events"
+        query = f"""
+        SELECT
+          event_hash,
+          sequence,
+          (SELECT COUNT(*) FROM `{table}`) AS event_count
+        FROM `{table}`
+        ORDER BY COALESCE(sequence, -1) DESC, timestamp DESC
         LIMIT 1
         """
 
+        try:
+            await self._backfill_sequences()
+        except Exception as e:
+            logger.error(f"Failed to backfill event sequences: {e}")
+
         try:
             query_job = self.bigquery_client.query(query)
             results = list(query_job.result())
 
             if results:
                 self._last_event_hash = results[0].event_hash
+                # Without a stored sequence the chain is numbered by row count
+                if results[0].sequence is not None:
+                    self._next_sequence = results[0].sequence + 1
+                else:
+                    self._next_sequence = results[0].event_count
                 logger.info(
                     f"Loaded chain state: last_hash={self._last_event_hash[:8]}..."
                 )
@@ -415,6 +558,60 @@ class NeuralLedger:
         except NotFound:
             logger.info("Events table not found, starting with genesis block")
 
+    async def _backfill_sequences(self) -> int:
+        """Number the events stored before sequences were recorded.
+
+        The events are put in chain order by following their hash links from
+        genesis, so the numbers match the order the chain was built in.
+
+        Returns:
+            Number of events numbered
+        """
+        table = f"{self.project_id}.{self.bigquery_dataset_id}.events"
+        query = f"""
+        SELECT event_id, previous_hash, event_hash
+        FROM `{table}`
+        WHERE sequence IS NULL
+        ORDER BY timestamp ASC, event_id ASC
+        """
+        rows = list(self.bigquery_client.query(query).result())
+        if not rows:
+            return 0
+
+        merge = f"""
+        MERGE `{table}` AS events
+        USING UNNEST(@sequences) AS numbered
+        ON events.event_id = numbered.event_id AND events.sequence IS NULL
+        WHEN MATCHED THEN UPDATE SET sequence = numbered.sequence
+        """
+        ordered = HashChain.chain_order(rows)
+        for start in range(0, len(ordered), SEQUENCE_BACKFILL_BATCH_SIZE):
+            batch = ordered[start : start + SEQUENCE_BACKFILL_BATCH_SIZE]
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ArrayQueryParameter(
+                        "sequences",
+                        "STRUCT",
+                        [
+                            bigquery.StructQueryParameter(
+                                None,
+                                bigquery.ScalarQueryParameter(
+                                    "event_id", "STRING", row.event_id
+                                ),
+                                bigquery.ScalarQueryParameter(
+                                    "sequence", "INT64", start + offset
+                                ),
+                            )
+                            for offset, row in enumerate(batch)
+                        ],
+                    )
+                ]
+            )
+            self.bigquery_client.query(merge, job_config=job_config).result()
+
+        logger.info(f"Backfilled sequences of {len(ordered)} ledger events")
+        return len(ordered)
+
     async def _sign_event(self, event: NeuralLedgerEvent):
         """Add digital signature to critical events."""
         # TODO: Implement actual KMS signing
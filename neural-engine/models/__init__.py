@@ -20,6 +20,7 @@ from .emotion_classifier import (
 from .training_pipeline import NeuralModelTrainingPipeline
 
 from .inference_server import NeuralInferenceServer, ModelRegistry, ModelOptimizer
+from .dynamic_batching import BatchingConfig, ModelBatcher
 
 __all__ = [
     # Base models
@@ -42,4 +43,6 @@ __all__ = [
     "NeuralInferenceServer",
     "ModelRegistry",
     "ModelOptimizer",
+    "BatchingConfig",
+    "ModelBatcher",
 ]
@@ -11,6 +11,9 @@ import torch.nn as nn
 from datetime import datetime
 import json
 import os
+import time
+
+from common.batch_loader import BatchLoader
 
 logger = logging.getLogger(__name__)
 
@@ -246,14 +249,19 @@ class PyTorchBaseModel(BaseNeuralModel):
         X_val: Optional[np.ndarray] = None,
         y_val: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
-        """Train PyTorch model."""
+        """
+        Train PyTorch model.
+
+        Training batches are gathered from X_train (which may be memory-mapped)
+        into reused buffers on background threads while the previous batch
+        trains, so the training set is never copied to the device as a whole.
+        Config keys prefetch_batches, loader_workers and seed control the
+        loader; num_shards and shard_index split each epoch between data
+        parallel workers.
+        """
         if self.model is None:
             self.model = self.build_model().to(self.device)
 
-        # Convert to tensors
-        X_train_tensor = torch.FloatTensor(X_train).to(self.device)
-        y_train_tensor = torch.LongTensor(y_train).to(self.device)
-
         if X_val is not None:
             X_val_tensor = torch.FloatTensor(X_val).to(self.device)
             y_val_tensor = torch.LongTensor(y_val).to(self.device)
@@ -272,15 +280,26 @@ class PyTorchBaseModel(BaseNeuralModel):
         epochs = self.config.get("epochs", 100)
 
         # Create data loader
-        dataset = torch.utils.data.TensorDataset(X_train_tensor, y_train_tensor)
-        dataloader = torch.utils.data.DataLoader(
-            dataset, batch_size=batch_size, shuffle=True
+        dataloader = BatchLoader(
+            X_train,
+            np.asarray(y_train, dtype=np.int64),
+            batch_size=batch_size,
+            shuffle=True,
+            prefetch=self.config.get("prefetch_batches", 2),
+            num_workers=self.config.get("loader_workers", 1),
+            seed=self.config.get("seed"),
+            num_shards=self.config.get("num_shards", 1),
+            shard_index=self.config.get("shard_index", 0),
+            dtype=np.float32,
         )
+        non_blocking = self.device.type == "cuda"
 
         # Training history
         history: Dict[str, List[float]] = {"loss": [], "val_loss": []}
         best_val_loss = float("inf")
         patience_counter = 0
+        samples_seen = 0
+        train_time = 0.0
 
         # Training loop
         for epoch in range(epochs):
@@ -288,8 +307,19 @@ class PyTorchBaseModel(BaseNeuralModel):
             assert self.model is not None
             self.model.train()
             train_loss = 0.0
-
-            for batch_X, batch_y in dataloader:
+            dataloader.set_epoch(epoch)
+            epoch_start = time.perf_counter()
+
+            for batch_X_np, batch_y_np in dataloader:
+                # The batch buffers are reused, which is safe because each
+                # step finishes before the next batch is requested
+                batch_X = torch.from_numpy(batch_X_np).to(
+                    self.device, non_blocking=non_blocking
+                )
+                batch_y = torch.from_numpy(batch_y_np).to(
+                    self.device, non_blocking=non_blocking
+                )
+                samples_seen += len(batch_X_np)
                 assert self.optimizer is not None and self.model is not None
                 self.optimizer.zero_grad()
                 outputs = self.model(batch_X)
@@ -299,6 +329,7 @@ class PyTorchBaseModel(BaseNeuralModel):
                 self.optimizer.step()
                 train_loss += loss.item()
 
+            train_time += time.perf_counter() - epoch_start
             avg_train_loss = train_loss / len(dataloader)
             history["loss"].append(avg_train_loss)
 
@@ -338,6 +369,7 @@ class PyTorchBaseModel(BaseNeuralModel):
             "history": history,
             "final_loss": float(history["loss"][-1]),
             "final_val_loss": float(history.get("val_loss", [0])[-1]),
+            "samples_per_sec": samples_seen / train_time if train_time else 0.0,
         }
 
     def predict(self, X: np.ndarray) -> np.ndarray:
@@ -0,0 +1,219 @@
+"""Adaptive per - model request batching for the inference server."""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+from common.histogram import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchingConfig:
+    """Configuration for adaptive batching."""
+
+    max_batch_size: int = 32
+    batch_timeout_ms: float = 50.0  # Maximum wait for a batch to fill
+    latency_target_ms: float = 100.0  # p99 request latency objective
+    initial_batch_size: int = 4
+    latency_window: int = 200  # Recent requests used for the p99
+    min_latency_samples: int = 20
+
+
+@dataclass
+class _PendingRequest:
+    """Example waiting in a model queue."""
+
+    data: np.ndarray
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class ModelBatcher:
+    """Coalesces requests for one model version into adaptive batches.
+
+    Each batcher owns its queue and worker task, so a slow model cannot
+    delay another. The batch size limit grows while the p99 request latency
+    (queue wait plus inference) stays under the target, and is halved when
+    the target is exceeded.
+    """
+
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+    LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(
+        self,
+        name: str,
+        run_batch: Callable[[np.ndarray], Awaitable[np.ndarray]],
+        config: Optional[BatchingConfig] = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            name: Model key used in logs and metrics
+            run_batch: Coroutine running the model on a stacked batch
+            config: Batching configuration
+        """
+        self.name = name
+        self.run_batch = run_batch
+        self.config = config or BatchingConfig()
+
+        self.batch_limit = max(
+            1, min(self.config.initial_batch_size, self.config.max_batch_size)
+        )
+        self._latencies: Deque[float] = deque(maxlen=self.config.latency_window)
+
+        # Created on first use inside the running event loop
+        self._queue: Optional[asyncio.Queue[_PendingRequest]] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.batch_size = Histogram(self.BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(self.LATENCY_BUCKETS_MS)
+        self.latency_ms = Histogram(self.LATENCY_BUCKETS_MS)
+
+    async def submit(self, data: np.ndarray) -> np.ndarray:
+        """Queue one example and wait for its prediction.
+
+        Args:
+            data: Single example without a batch dimension
+
+        Returns:
+            Prediction for the example
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._process_queue())
+
+        future = loop.create_future()
+        await self._queue.put(_PendingRequest(data, future, loop.time()))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker and fail queued and in-flight requests."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            request = self._queue.get_nowait()
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("Batcher closed"))
+
+    def p99_latency_ms(self) -> Optional[float]:
+        """Get the p99 latency of recent requests."""
+        if len(self._latencies) < self.config.min_latency_samples:
+            return None
+        return float(np.percentile(self._latencies, 99))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics and histograms."""
+        return {
+            "batch_limit": self.batch_limit,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "p99_latency_ms": self.p99_latency_ms(),
+            "batch_size": self.batch_size.to_dict(),
+            "queue_wait_ms": self.queue_wait_ms.to_dict(),
+            "latency_ms": self.latency_ms.to_dict(),
+        }
+
+    async def _process_queue(self) -> None:
+        """Collect and run batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        timeout = self.config.batch_timeout_ms / 1000
+
+        batch: List[_PendingRequest] = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + timeout
+
+                while len(batch) < self.batch_limit:
+                    # Take whatever is already queued before waiting
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._run(batch)
+
+        except asyncio.CancelledError:
+            # Requests already taken from the queue would otherwise never resolve
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(RuntimeError("Batcher closed"))
+            raise
+
+    async def _run(self, batch: List[_PendingRequest]) -> None:
+        """Run one batch and resolve its requests."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        self.batch_size.observe(len(batch))
+
+        # Examples of different shapes cannot be stacked together
+        groups: Dict[tuple, List[_PendingRequest]] = {}
+        for request in batch:
+            groups.setdefault(request.data.shape, []).append(request)
+            self.queue_wait_ms.observe((start_time - request.enqueued_at) * 1000)
+
+        for requests in groups.values():
+            try:
+                predictions = await self.run_batch(
+                    np.stack([request.data for request in requests])
+                )
+                for request, prediction in zip(requests, predictions):
+                    if not request.future.done():
+                        request.future.set_result(prediction)
+            except Exception as e:
+                logger.error(f"Batch inference failed for {self.name}: {e}")
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+        end_time = loop.time()
+        for request in batch:
+            latency = (end_time - request.enqueued_at) * 1000
+            self._latencies.append(latency)
+            self.latency_ms.observe(latency)
+
+        self._adapt(len(batch))
+
+    def _adapt(self, batch_size: int) -> None:
+        """Resize the batch limit from the recent p99 latency."""
+        p99 = self.p99_latency_ms()
+
+        if p99 is not None and p99 > self.config.latency_target_ms:
+            # Back off quickly and measure the new size afresh
+            self.batch_limit = max(1, self.batch_limit // 2)
+            self._latencies.clear()
+            logger.debug(
+                f"{self.name}: p99 {p99:.1f} ms over target, "
+                f"batch limit {self.batch_limit}"
+            )
+        elif batch_size >= self.batch_limit:
+            # Only grow while the limit is what bounds the batch
+            self.batch_limit = min(
+                self.config.max_batch_size,
+                self.batch_limit + max(1, self.batch_limit // 4),
+            )
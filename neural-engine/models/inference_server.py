@@ -16,6 +16,7 @@ from pydantic import BaseModel
 import uvicorn
 
 from .base_models import BaseNeuralModel
+from .dynamic_batching import BatchingConfig, ModelBatcher
 
 # from .movement_decoder import MovementDecoder, KalmanFilterDecoder  # Unused imports
 # from .emotion_classifier import EmotionClassifier, ValenceArousalRegressor  # Unused imports
@@ -75,10 +76,8 @@ class ModelRegistry:
 
         logger.info(f"Registered model: {model_name} version {version}")
 
-    def get_model(
-        self, model_name: str, version: Optional[str] = None
-    ) -> BaseNeuralModel:
-        """Get a model from the registry."""
+    def resolve_version(self, model_name: str, version: Optional[str] = None) -> str:
+        """Resolve a requested version to a registered version."""
         if model_name not in self.models:
             raise ValueError(f"Model {model_name} not found")
 
@@ -90,6 +89,13 @@ class ModelRegistry:
         if version not in self.models[model_name]:
             raise ValueError(f"Version {version} not found for model {model_name}")
 
+        return version
+
+    def get_model(
+        self, model_name: str, version: Optional[str] = None
+    ) -> BaseNeuralModel:
+        """Get a model from the registry."""
+        version = self.resolve_version(model_name, version)
         return self.models[model_name][version]
 
     def list_models(self) -> Dict[str, List[str]]:
@@ -115,7 +121,11 @@ class NeuralInferenceServer:
     """High - performance inference server for neural models."""
 
     def __init__(
-        self, max_batch_size: int = 32, batch_timeout_ms: int = 50, num_workers: int = 4
+        self,
+        max_batch_size: int = 32,
+        batch_timeout_ms: int = 50,
+        num_workers: int = 4,
+        latency_target_ms: float = 100.0,
     ):
         """
         Initialize inference server.
@@ -124,14 +134,20 @@ class NeuralInferenceServer:
             max_batch_size: Maximum batch size for inference
             batch_timeout_ms: Maximum wait time for batching
             num_workers: Number of worker threads
+            latency_target_ms: p99 request latency target for batch sizing
         """
         self.app = FastAPI(title="Neural Inference Server")
         self.registry = ModelRegistry()
         self.max_batch_size = max_batch_size
         self.batch_timeout_ms = batch_timeout_ms
 
-        # Inference queue and batch processing
-        self.inference_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        # Per - model request queues with adaptive batch sizing
+        self.batching_config = BatchingConfig(
+            max_batch_size=max_batch_size,
+            batch_timeout_ms=batch_timeout_ms,
+            latency_target_ms=latency_target_ms,
+        )
+        self.batchers: Dict[Tuple[str, str], ModelBatcher] = {}
         self.executor = ThreadPoolExecutor(max_workers=num_workers)
 
         # WebSocket connections for streaming
@@ -164,35 +180,21 @@ class NeuralInferenceServer:
             start_time = time.time()
 
             try:
-                # Get model
-                model = self.registry.get_model(
-                    request.model_name, request.model_version
+                # Queue the example for batched inference
+                prediction = await self._infer(
+                    request.model_name, request.model_version, request.data
                 )
 
-                # Prepare data
-                data = np.array(request.data)
-                if len(data.shape) == 2:
-                    data = data[np.newaxis, :]  # Add batch dimension
-
-                # Run inference
-                predictions = await self._run_inference(model, data)
-
                 # Calculate inference time
                 inference_time = (time.time() - start_time) * 1000
 
                 # Update metrics
-                self.metrics["total_requests"] = int(self.metrics["total_requests"]) + 1
-                self.metrics["total_inference_time"] = (
-                    float(self.metrics["total_inference_time"]) + inference_time
-                )
-                if request.model_name not in self.metrics["model_request_counts"]:
-                    self.metrics["model_request_counts"][request.model_name] = 0
-                self.metrics["model_request_counts"][request.model_name] += 1
+                self._record_request(request.model_name, inference_time)
 
                 # Prepare response
                 response = InferenceResponse(
                     session_id=request.session_id,
-                    predictions=predictions[0].tolist(),
+                    predictions=prediction.tolist(),
                     model_name=request.model_name,
                     model_version=request.model_version or "latest",
                     inference_time_ms=inference_time,
@@ -211,37 +213,32 @@ class NeuralInferenceServer:
             requests: List[InferenceRequest],
         ) -> List[InferenceResponse]:
             """Batch inference endpoint."""
-            # Group requests by model
-            model_groups: Dict[Tuple[str, Optional[str]], List[InferenceRequest]] = {}
-            for req in requests:
-                key = (req.model_name, req.model_version)
-                if key not in model_groups:
-                    model_groups[key] = []
-                model_groups[key].append(req)
-
-            # Process each group
-            responses = []
-            for (model_name, version), group_requests in model_groups.items():
-                model = self.registry.get_model(model_name, version)
-
-                # Prepare batch data
-                batch_data = np.array([req.data for req in group_requests])
+            start_time = time.time()
 
-                # Run batch inference
-                predictions = await self._run_inference(model, batch_data)
+            # Examples join the per - model queues with other traffic
+            predictions = await asyncio.gather(
+                *[
+                    self._infer(req.model_name, req.model_version, req.data)
+                    for req in requests
+                ]
+            )
+            inference_time = (time.time() - start_time) * 1000
 
-                # Create responses
-                for i, req in enumerate(group_requests):
-                    response = InferenceResponse(
+            # Create responses
+            responses = []
+            for req, prediction in zip(requests, predictions):
+                self._record_request(req.model_name, inference_time)
+                responses.append(
+                    InferenceResponse(
                         session_id=req.session_id,
-                        predictions=predictions[i].tolist(),
-                        model_name=model_name,
-                        model_version=version or "latest",
-                        inference_time_ms=0,  # Will be updated
+                        predictions=prediction.tolist(),
+                        model_name=req.model_name,
+                        model_version=req.model_version or "latest",
+                        inference_time_ms=inference_time,
                         timestamp=datetime.utcnow().isoformat(),
                         metadata=req.metadata,
                     )
-                    responses.append(response)
+                )
 
             return responses
 
@@ -259,21 +256,18 @@ class NeuralInferenceServer:
                     # Create inference request
                     request = InferenceRequest(**data)
 
-                    # Get model
-                    model = self.registry.get_model(
-                        request.model_name, request.model_version
-                    )
-
                     # Run inference
-                    input_data = np.array(request.data)
-                    if len(input_data.shape) == 2:
-                        input_data = input_data[np.newaxis, :]
-
-                    predictions = await self._run_inference(model, input_data)
+                    start_time = time.time()
+                    prediction = await self._infer(
+                        request.model_name, request.model_version, request.data
+                    )
+                    self._record_request(
+                        request.model_name, (time.time() - start_time) * 1000
+                    )
 
                     # Send response
                     response = {
-                        "predictions": predictions[0].tolist(),
+                        "predictions": prediction.tolist(),
                         "timestamp": datetime.utcnow().isoformat(),
                     }
 
@@ -299,8 +293,18 @@ class NeuralInferenceServer:
                 "model_request_counts": self.metrics["model_request_counts"],
                 "active_connections": len(self.active_connections),
                 "models_loaded": len(self.registry.models),
+                "batching": {
+                    f"{name}:{version}": batcher.get_stats()
+                    for (name, version), batcher in self.batchers.items()
+                },
             }
 
+        @self.app.on_event("shutdown")
+        async def shutdown() -> None:
+            """Stop the per - model batchers."""
+            for batcher in self.batchers.values():
+                await batcher.close()
+
         @self.app.post("/models / reload/{model_name}")
         async def reload_model(model_name: str, model_path: str) -> Dict[str, str]:
             """Reload a model from disk."""
@@ -315,62 +319,52 @@ class NeuralInferenceServer:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self.executor, model.predict, data)
 
-    async def _batch_processor(self) -> None:
-        """Background task for processing batched requests."""
-        while True:
-            batch: List[Dict[str, Any]] = []
-            batch_start_time = time.time()
-
-            # Collect batch
-            while len(batch) < self.max_batch_size:
-                try:
-                    timeout = (self.batch_timeout_ms / 1000) - (
-                        time.time() - batch_start_time
-                    )
-                    if timeout <= 0:
-                        break
+    def _get_batcher(
+        self, model_name: str, version: Optional[str] = None
+    ) -> ModelBatcher:
+        """Get the request batcher for a model version."""
+        version = self.registry.resolve_version(model_name, version)
+        key = (model_name, version)
 
-                    item = await asyncio.wait_for(
-                        self.inference_queue.get(), timeout=timeout
-                    )
-                    batch.append(item)
-
-                except asyncio.TimeoutError:
-                    break
-
-            if batch:
-                # Process batch
-                await self._process_batch(batch)
-
-    async def _process_batch(self, batch: List[Dict[str, Any]]) -> None:
-        """Process a batch of inference requests."""
-        # Group by model
-        model_batches: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
-        for item in batch:
-            model_key = (item["model_name"], item["model_version"])
-            if model_key not in model_batches:
-                model_batches[model_key] = []
-            model_batches[model_key].append(item)
-
-        # Process each model batch
-        for (model_name, version), model_batch in model_batches.items():
-            try:
+        if key not in self.batchers:
+
+            async def run_batch(data: np.ndarray) -> np.ndarray:
+                # Look the model up per batch so re-registering a version
+                # takes effect without replacing its queue
                 model = self.registry.get_model(model_name, version)
+                return await self._run_inference(model, data)
 
-                # Prepare batch data
-                batch_data = np.array([item["data"] for item in model_batch])
+            self.batchers[key] = ModelBatcher(
+                f"{model_name}:{version}", run_batch, self.batching_config
+            )
 
-                # Run inference
-                predictions = await self._run_inference(model, batch_data)
+        return self.batchers[key]
 
-                # Send results
-                for i, item in enumerate(model_batch):
-                    item["future"].set_result(predictions[i])
+    async def _infer(
+        self, model_name: str, version: Optional[str], data: Any
+    ) -> np.ndarray:
+        """Run one example through its model's batching queue.
 
-            except Exception as e:
-                # Set exception for all items in batch
-                for item in model_batch:
-                    item["future"].set_exception(e)
+        Args:
+            model_name: Registered model name
+            version: Requested model version
+            data: Single example (n_samples, n_channels)
+
+        Returns:
+            Prediction for the example
+        """
+        batcher = self._get_batcher(model_name, version)
+        return await batcher.submit(np.asarray(data, dtype=np.float32))
+
+    def _record_request(self, model_name: str, inference_time: float) -> None:
+        """Update request metrics."""
+        self.metrics["total_requests"] = int(self.metrics["total_requests"]) + 1
+        self.metrics["total_inference_time"] = (
+            float(self.metrics["total_inference_time"]) + inference_time
+        )
+        if model_name not in self.metrics["model_request_counts"]:
+            self.metrics["model_request_counts"][model_name] = 0
+        self.metrics["model_request_counts"][model_name] += 1
 
     def load_models_from_config(self, config_path: str) -> None:
         """Load models from configuration file."""
@@ -384,9 +378,6 @@ class NeuralInferenceServer:
 
     def run(self, host: str = "0.0.0.0", port: int = 8000) -> None:
         """Run the inference server."""
-        # Start batch processor
-        asyncio.create_task(self._batch_processor())
-
         # Run FastAPI app
         uvicorn.run(self.app, host=host, port=port)
 
@@ -195,9 +195,19 @@ class NeuralModelTrainingPipeline:
 
         self.training_history = results
 
+        if "samples_per_sec" in training_results:
+            logger.info(
+                f"Training throughput: {training_results['samples_per_sec']:.0f} "
+                "samples/sec"
+            )
+
         # Log results
         if self.use_wandb:
             wandb.log(test_metrics)
+            if "samples_per_sec" in training_results:
+                wandb.log(
+                    {"train/samples_per_sec": training_results["samples_per_sec"]}
+                )
 
             # Log training curves
             if "history" in training_results:
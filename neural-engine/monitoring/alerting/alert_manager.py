@@ -5,15 +5,26 @@ alert triggering, suppression, and integration with notification services.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
 from collections import defaultdict, deque
 
+import numpy as np
+
+from .rule_engine import CompiledRuleSet
+
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(timestamp: datetime) -> float:
+    """Seconds since the epoch of a naive UTC timestamp."""
+    return (timestamp - _EPOCH).total_seconds()
+
 
 class AlertSeverity(Enum):
     """Alert severity levels."""
@@ -174,9 +185,12 @@ class AlertManager:
         self.active_alerts: Dict[str, Alert] = {}
         self.alert_history: deque = deque(maxlen=1000)
 
-        # Evaluation tracking
-        self.rule_states: Dict[str, Dict] = defaultdict(dict)
+        # Evaluation tracking; rule state lives in the compiled rule arrays,
+        # which are rebuilt lazily after rules are added or removed
+        self.compiled_rules = CompiledRuleSet([])
+        self._rules_changed = False
         self.suppressed_rules: Dict[str, datetime] = {}
+        self._rule_alerts: Dict[str, str] = {}  # rule id -> active alert id
 
         # Notification integration
         self.notification_service = None
@@ -341,11 +355,7 @@ class AlertManager:
                 return False
 
             self.rules[rule.id] = rule
-            self.rule_states[rule.id] = {
-                "condition_met": False,
-                "condition_start": None,
-                "last_value": None,
-            }
+            self._rules_changed = True
 
             logger.info(f"Registered alert rule: {rule.id}")
             return True
@@ -378,9 +388,10 @@ class AlertManager:
             for alert in alerts_to_resolve:
                 self.resolve_alert(alert.id, "Rule unregistered")
 
-            # Remove rule and state
+            # Remove rule; its state is dropped with the next compilation
             del self.rules[rule_id]
-            del self.rule_states[rule_id]
+            self.suppressed_rules.pop(rule_id, None)
+            self._rules_changed = True
 
             logger.info(f"Unregistered alert rule: {rule_id}")
             return True
@@ -389,7 +400,63 @@ class AlertManager:
             logger.error(f"Failed to unregister rule {rule_id}: {str(e)}")
             return False
 
-    async def evaluate_rule(  # noqa: C901
+    def _compiled(self) -> CompiledRuleSet:
+        """Compiled rules, recompiled if rules were added or removed."""
+        if self._rules_changed:
+            self.compiled_rules = CompiledRuleSet(
+                list(self.rules.values()), previous=self.compiled_rules
+            )
+            self._rules_changed = False
+        return self.compiled_rules
+
+    def set_rule_enabled(self, rule_id: str, enabled: bool) -> bool:
+        """Enable or disable an alert rule.
+
+        Args:
+            rule_id: ID of rule to update
+            enabled: Whether the rule is evaluated
+
+        Returns:
+            True if the rule exists
+        """
+        if rule_id not in self.rules:
+            logger.warning(f"Alert rule {rule_id} not found")
+            return False
+
+        self.rules[rule_id].enabled = enabled
+        compiled = self._compiled()
+        compiled.set_enabled(compiled.index[rule_id], enabled)
+        return True
+
+    def get_rule_state(self, rule_id: str) -> Optional[Dict[str, Any]]:
+        """Get the evaluation state of an alert rule.
+
+        Args:
+            rule_id: Rule ID
+
+        Returns:
+            Rule state or None if the rule is not found
+        """
+        if rule_id not in self.rules:
+            return None
+
+        compiled = self._compiled()
+        i = compiled.index[rule_id]
+        last_value = compiled.last_value[i]
+        last_evaluation = compiled.last_evaluation[i]
+        return {
+            "condition_met": not np.isnan(compiled.condition_start[i]),
+            "condition_start": self.rules[rule_id].condition_met_since,
+            "firing": bool(compiled.firing[i]),
+            "last_value": None if np.isnan(last_value) else float(last_value),
+            "last_evaluation": (
+                None
+                if np.isnan(last_evaluation)
+                else _EPOCH + timedelta(seconds=float(last_evaluation))
+            ),
+        }
+
+    async def evaluate_rule(
         self, rule_id: str, current_metrics: Dict[str, float]
     ) -> bool:
         """Evaluate a specific alert rule.
@@ -405,63 +472,11 @@ class AlertManager:
             logger.warning(f"Rule {rule_id} not found")
             return False
 
-        rule = self.rules[rule_id]
-
-        if not rule.enabled:
-            return True
-
-        # Check if rule is suppressed
-        if rule_id in self.suppressed_rules:
-            if datetime.utcnow() < self.suppressed_rules[rule_id]:
-                return True  # Still suppressed
-            else:
-                del self.suppressed_rules[rule_id]  # Suppression expired
-
         try:
-            current_time = datetime.utcnow()
-            rule.last_evaluation = current_time
-
-            # Get metric value
-            metric_value = current_metrics.get(rule.metric_name)
-            if metric_value is None:
-                logger.debug(f"Metric {rule.metric_name} not found for rule {rule_id}")
-                return True
-
-            # Evaluate condition
-            condition_met = self._evaluate_condition(
-                metric_value, rule.condition, rule.threshold
-            )
-
-            state = self.rule_states[rule_id]
-            state["last_value"] = metric_value
-
-            if condition_met:
-                if not state["condition_met"]:
-                    # Condition just became true
-                    state["condition_met"] = True
-                    state["condition_start"] = current_time
-                    rule.condition_met_since = current_time
-
-                # Check if condition has been true long enough
-                elif state["condition_start"]:
-                    duration = (current_time - state["condition_start"]).total_seconds()
-                    if duration >= rule.for_duration:
-                        # Trigger alert if not already active
-                        await self._trigger_alert_if_needed(rule, metric_value)
-
-            else:
-                if state["condition_met"]:
-                    # Condition is no longer true
-                    state["condition_met"] = False
-                    state["condition_start"] = None
-                    rule.condition_met_since = None
-
-                    # Resolve any active alerts for this rule
-                    await self._resolve_alerts_for_rule(
-                        rule_id, "Condition no longer met"
-                    )
-
-            self.total_evaluations += 1
+            compiled = self._compiled()
+            i = compiled.index[rule_id]
+            compiled.set_enabled(i, self.rules[rule_id].enabled)
+            await self._evaluate_compiled(current_metrics, [i])
             return True
 
         except Exception as e:
@@ -470,12 +485,18 @@ class AlertManager:
             return False
 
     async def evaluate_all_rules(
-        self, current_metrics: Optional[Dict[str, float]] = None
+        self,
+        current_metrics: Optional[Union[Dict[str, float], np.ndarray]] = None,
     ) -> int:
-        """Evaluate all enabled alert rules.
+        """Evaluate all enabled alert rules in one vectorized pass.
+
+        Rule enablement is read from the compiled rules; use
+        ``set_rule_enabled`` rather than changing ``AlertRule.enabled``.
 
         Args:
-            current_metrics: Optional current metric values
+            current_metrics: Optional current metric values, by name or as a
+                vector aligned with ``compiled_rules.metric_names`` (NaN for
+                missing metrics)
 
         Returns:
             Number of alerts triggered
@@ -483,15 +504,62 @@ class AlertManager:
         if current_metrics is None:
             current_metrics = {}
 
-        alerts_triggered = 0
+        try:
+            return await self._evaluate_compiled(current_metrics)
+        except Exception as e:
+            logger.error(f"Error evaluating rules: {str(e)}")
+            self.evaluation_errors += 1
+            return 0
+
+    async def _evaluate_compiled(
+        self,
+        current_metrics: Union[Dict[str, float], np.ndarray],
+        rule_indices: Optional[Sequence[int]] = None,
+    ) -> int:
+        """Evaluate compiled rules and act on their state transitions.
+
+        Args:
+            current_metrics: Metric values by name or as a metric vector
+            rule_indices: Optional indices of the rules to evaluate
 
-        for rule_id in self.rules.keys():
-            try:
-                await self.evaluate_rule(rule_id, current_metrics)
-            except Exception as e:
-                logger.error(f"Error evaluating rule {rule_id}: {str(e)}")
+        Returns:
+            Number of alerts triggered
+        """
+        compiled = self._compiled()
+        if isinstance(current_metrics, np.ndarray):
+            values = current_metrics
+        else:
+            values = compiled.metric_vector(current_metrics)
+
+        current_time = datetime.utcnow()
+        transitions = compiled.evaluate(values, _seconds(current_time), rule_indices)
+        rule_ids = compiled.rule_ids
+
+        for i in transitions.unsuppressed:
+            self.suppressed_rules.pop(rule_ids[i], None)
+        for i in transitions.started:
+            self.rules[rule_ids[i]].condition_met_since = current_time
+        for i in transitions.cleared:
+            self.rules[rule_ids[i]].condition_met_since = None
+
+        # Keep the value of firing alerts current without notifying
+        if len(transitions.firing):
+            updated = current_time.isoformat()
+            for i in transitions.firing:
+                alert = self.active_alerts.get(self._rule_alerts.get(rule_ids[i], ""))
+                if alert is not None:
+                    alert.metric_value = float(compiled.last_value[i])
+                    alert.details["last_updated"] = updated
+
+        for i in transitions.fired:
+            await self._trigger_alert_if_needed(
+                self.rules[rule_ids[i]], float(compiled.last_value[i])
+            )
+        for i in transitions.resolved:
+            await self._resolve_alerts_for_rule(rule_ids[i], "Condition no longer met")
 
-        return alerts_triggered
+        self.total_evaluations += transitions.evaluated
+        return len(transitions.fired)
 
     async def trigger_manual_alert(
         self,
@@ -601,6 +669,8 @@ class AlertManager:
             # Move to history and remove from active
             self.alert_history.append(alert)
             del self.active_alerts[alert_id]
+            if self._rule_alerts.get(alert.rule_id) == alert_id:
+                del self._rule_alerts[alert.rule_id]
 
             self.total_alerts_resolved += 1
 
@@ -612,6 +682,11 @@ class AlertManager:
                 )
                 self.suppressed_rules[alert.rule_id] = cooldown_end
 
+                compiled = self._compiled()
+                compiled.release(
+                    [compiled.index[alert.rule_id]], _seconds(cooldown_end)
+                )
+
             logger.info(f"Alert {alert_id} resolved: {resolution_reason}")
             return True
 
@@ -676,41 +751,12 @@ class AlertManager:
             logger.error(f"Failed to get alert summary: {str(e)}")
             return {"error": str(e)}
 
-    def _evaluate_condition(
-        self, value: float, condition: RuleCondition, threshold: float
-    ) -> bool:
-        """Evaluate rule condition."""
-        try:
-            if condition == RuleCondition.GREATER_THAN:
-                return value > threshold
-            elif condition == RuleCondition.LESS_THAN:
-                return value < threshold
-            elif condition == RuleCondition.EQUALS:
-                return abs(value - threshold) < 0.001  # Float equality
-            elif condition == RuleCondition.NOT_EQUALS:
-                return abs(value - threshold) >= 0.001
-            elif condition == RuleCondition.GREATER_EQUAL:
-                return value >= threshold
-            elif condition == RuleCondition.LESS_EQUAL:
-                return value <= threshold
-            else:
-                logger.warning(f"Unsupported condition: {condition}")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error evaluating condition: {str(e)}")
-            return False
-
     async def _trigger_alert_if_needed(
         self, rule: AlertRule, metric_value: float
     ) -> None:
         """Trigger alert if not already active for this rule."""
         # Check if there's already an active alert for this rule
-        existing_alert = None
-        for alert in self.active_alerts.values():
-            if alert.rule_id == rule.id and alert.status == AlertStatus.TRIGGERED:
-                existing_alert = alert
-                break
+        existing_alert = self.active_alerts.get(self._rule_alerts.get(rule.id, ""))
 
         if existing_alert:
             # Update existing alert with new metric value
@@ -742,6 +788,7 @@ class AlertManager:
         )
 
         self.active_alerts[alert_id] = alert
+        self._rule_alerts[rule.id] = alert_id
         self.alert_history.append(alert)
         self.total_alerts_triggered += 1
 
@@ -754,13 +801,8 @@ class AlertManager:
 
     async def _resolve_alerts_for_rule(self, rule_id: str, reason: str) -> None:
         """Resolve all active alerts for a specific rule."""
-        alerts_to_resolve = [
-            alert_id
-            for alert_id, alert in self.active_alerts.items()
-            if alert.rule_id == rule_id
-        ]
-
-        for alert_id in alerts_to_resolve:
+        alert_id = self._rule_alerts.get(rule_id)
+        if alert_id is not None:
             self.resolve_alert(alert_id, reason)
 
     async def _send_alert_notifications(self, alert: Alert) -> None:
@@ -0,0 +1,282 @@
+"""Columnar alert rule evaluation for NeuraScale Neural Engine monitoring.
+
+Rules are compiled into parallel arrays (metric index, comparator, threshold,
+for-duration) and evaluated against a vector of metric values in one NumPy
+pass. The per-rule state (when the condition started holding, whether an
+alert is firing, suppression deadlines) is kept in arrays as well, so an
+evaluation only touches Python objects for rules that change state.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Comparator codes, indexed by RuleCondition value; unsupported conditions
+# (contains, regex) never hold
+COMPARATORS: Dict[str, int] = {
+    "gt": 0,
+    "lt": 1,
+    "eq": 2,
+    "ne": 3,
+    "ge": 4,
+    "le": 5,
+}
+_UNSUPPORTED = len(COMPARATORS)
+
+# Tolerance of the (float) equality comparators
+EQUALITY_TOLERANCE = 0.001
+
+# Whether each comparator holds (rows) for each category of value - threshold
+# (columns): <= -tol, (-tol, 0), == 0, (0, tol), >= tol, missing
+_TRUTH_TABLE = np.array(
+    [
+        [False, False, False, True, True, False],  # gt
+        [True, True, False, False, False, False],  # lt
+        [False, True, True, True, False, False],  # eq
+        [True, False, False, False, True, False],  # ne
+        [False, False, True, True, True, False],  # ge
+        [True, True, True, False, False, False],  # le
+        [False, False, False, False, False, False],  # unsupported
+    ]
+)
+_MISSING = _TRUTH_TABLE.shape[1] - 1
+
+
+@dataclass
+class RuleTransitions:
+    """Rules whose state changed in one evaluation (indices into the set)."""
+
+    started: np.ndarray  # condition started holding
+    fired: np.ndarray  # condition held for its duration, alert starts firing
+    cleared: np.ndarray  # condition stopped holding
+    resolved: np.ndarray  # cleared rules with a firing alert
+    unsuppressed: np.ndarray  # suppression expired
+    firing: np.ndarray  # evaluated rules that keep firing
+    evaluated: int = 0
+
+
+class CompiledRuleSet:
+    """Alert rules compiled into arrays with array-held evaluation state.
+
+    Metric values are passed as a vector aligned with ``metric_names``; NaN
+    marks a missing metric, whose rules keep their state. Times are seconds
+    on a clock shared by all calls.
+    """
+
+    def __init__(self, rules: Sequence, previous: Optional["CompiledRuleSet"] = None):
+        """Compile rules.
+
+        Args:
+            rules: AlertRule instances, in evaluation order
+            previous: Set whose state is carried over for rules with the
+                same id
+        """
+        self.rule_ids: List[str] = [rule.id for rule in rules]
+        self.index: Dict[str, int] = {
+            rule_id: i for i, rule_id in enumerate(self.rule_ids)
+        }
+
+        self.metric_names: List[str] = []
+        self.metric_index: Dict[str, int] = {}
+        for rule in rules:
+            if rule.metric_name not in self.metric_index:
+                self.metric_index[rule.metric_name] = len(self.metric_names)
+                self.metric_names.append(rule.metric_name)
+
+        n_rules = len(rules)
+        self.metric = np.fromiter(
+            (self.metric_index[rule.metric_name] for rule in rules),
+            dtype=np.intp,
+            count=n_rules,
+        )
+        self.comparator = np.fromiter(
+            (COMPARATORS.get(rule.condition.value, _UNSUPPORTED) for rule in rules),
+            dtype=np.intp,
+            count=n_rules,
+        )
+        self.threshold = np.fromiter(
+            (rule.threshold for rule in rules), dtype=np.float64, count=n_rules
+        )
+        self.for_duration = np.fromiter(
+            (rule.for_duration for rule in rules), dtype=np.float64, count=n_rules
+        )
+        self.enabled = np.fromiter(
+            (rule.enabled for rule in rules), dtype=bool, count=n_rules
+        )
+
+        n_unsupported = int(np.count_nonzero(self.comparator == _UNSUPPORTED))
+        if n_unsupported:
+            logger.warning(
+                f"{n_unsupported} rules use unsupported conditions and never trigger"
+            )
+
+        # Evaluation state
+        self.condition_start = np.full(n_rules, np.nan)  # NaN: not holding
+        self.firing = np.zeros(n_rules, dtype=bool)
+        self.suppressed_until = np.full(n_rules, -np.inf)
+        self.last_value = np.full(n_rules, np.nan)
+        self.last_evaluation = np.full(n_rules, np.nan)
+
+        if previous is not None:
+            self._carry_state(previous)
+
+    def __len__(self) -> int:
+        """Number of compiled rules."""
+        return len(self.rule_ids)
+
+    def _carry_state(self, previous: "CompiledRuleSet") -> None:
+        """Copy the state of rules that were already compiled."""
+        pairs = [
+            (i, previous.index[rule_id])
+            for i, rule_id in enumerate(self.rule_ids)
+            if rule_id in previous.index
+        ]
+        if not pairs:
+            return
+        new, old = np.array(pairs, dtype=np.intp).T
+        for name in (
+            "condition_start",
+            "firing",
+            "suppressed_until",
+            "last_value",
+            "last_evaluation",
+        ):
+            getattr(self, name)[new] = getattr(previous, name)[old]
+
+    def metric_vector(self, metrics: Mapping[str, float]) -> np.ndarray:
+        """Metric values aligned with ``metric_names``.
+
+        Args:
+            metrics: Metric values by name; unknown names are ignored
+
+        Returns:
+            Vector with NaN for metrics that are not given
+        """
+        values = np.full(len(self.metric_names), np.nan)
+        for name, value in metrics.items():
+            position = self.metric_index.get(name)
+            if position is not None and value is not None:
+                values[position] = value
+        return values
+
+    def conditions(
+        self, values: np.ndarray, rules: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Whether each rule's condition holds for the metric values.
+
+        Args:
+            values: Metric vector aligned with ``metric_names``
+            rules: Optional indices of the rules to check (all if None)
+
+        Returns:
+            Boolean per rule
+        """
+        rules = slice(None) if rules is None else rules
+        difference = values[self.metric[rules]] - self.threshold[rules]
+        category = (difference > -EQUALITY_TOLERANCE).view(np.int8)
+        category += difference >= 0
+        category += difference > 0
+        category += difference >= EQUALITY_TOLERANCE
+        category[np.isnan(difference)] = _MISSING
+        return _TRUTH_TABLE[self.comparator[rules], category]
+
+    def evaluate(
+        self,
+        values: np.ndarray,
+        now: float,
+        rules: Optional[Sequence[int]] = None,
+    ) -> RuleTransitions:
+        """Evaluate rules against metric values and advance their state.
+
+        A condition that starts holding records its start time; once it has
+        held for the rule's duration on a later evaluation, the rule starts
+        firing. A firing rule keeps firing until its condition clears or the
+        alert is released with ``release``. Disabled and suppressed rules and
+        rules whose metric is missing are skipped.
+
+        Args:
+            values: Metric vector aligned with ``metric_names``
+            now: Evaluation time in seconds
+            rules: Optional indices of the rules to evaluate (all if None)
+
+        Returns:
+            RuleTransitions of this evaluation, as indices into the set
+        """
+        # Basic slicing gives views that are updated in place; the state of
+        # selected rules is gathered and written back
+        rows: Any = slice(None) if rules is None else np.asarray(rules, np.intp)
+
+        suppressed_until = self.suppressed_until[rows]
+        condition_start = self.condition_start[rows]
+        firing = self.firing[rows]
+        last_value = self.last_value[rows]
+        last_evaluation = self.last_evaluation[rows]
+
+        suppressed = suppressed_until > now
+        unsuppressed = ~suppressed & np.isfinite(suppressed_until)
+
+        value = values[self.metric[rows]]
+        evaluated = self.enabled[rows] & ~suppressed & ~np.isnan(value)
+        held = self.conditions(values, rows) & evaluated
+        was_held = ~np.isnan(condition_start)
+
+        started = held & ~was_held
+        cleared = evaluated & ~held & was_held
+        due = held & was_held & (now - condition_start >= self.for_duration[rows])
+        fired = due & ~firing
+        resolved = cleared & firing
+        still_firing = held & firing
+
+        suppressed_until[unsuppressed] = -np.inf
+        condition_start[started] = now
+        condition_start[cleared] = np.nan
+        firing[fired] = True
+        firing[resolved] = False
+        np.copyto(last_value, value, where=evaluated)
+        last_evaluation[evaluated] = now
+
+        if rules is None:
+            indices = np.flatnonzero
+        else:
+            self.suppressed_until[rows] = suppressed_until
+            self.condition_start[rows] = condition_start
+            self.firing[rows] = firing
+            self.last_value[rows] = last_value
+            self.last_evaluation[rows] = last_evaluation
+
+            def indices(mask: np.ndarray) -> np.ndarray:
+                return rows[mask]
+
+        return RuleTransitions(
+            started=indices(started),
+            fired=indices(fired),
+            cleared=indices(cleared),
+            resolved=indices(resolved),
+            unsuppressed=indices(unsuppressed),
+            firing=indices(still_firing),
+            evaluated=int(np.count_nonzero(evaluated)),
+        )
+
+    def release(self, indices: Iterable[int], suppress_until: float) -> None:
+        """Stop firing rules whose alerts were resolved and suppress them.
+
+        Args:
+            indices: Rule indices
+            suppress_until: End of the suppression, in seconds
+        """
+        indices = np.fromiter(indices, dtype=np.intp)
+        self.firing[indices] = False
+        self.suppressed_until[indices] = suppress_until
+
+    def set_enabled(self, index: int, enabled: bool) -> None:
+        """Enable or disable a compiled rule.
+
+        Args:
+            index: Rule index
+            enabled: Whether the rule is evaluated
+        """
+        self.enabled[index] = enabled
@@ -7,12 +7,10 @@ and exporting them to monitoring systems.
 from .prometheus_collector import PrometheusCollector
 from .opentelemetry_tracer import NeuralTracer
 from .health_checker import HealthChecker, HealthStatus
-from .log_collector import LogCollector
 
 __all__ = [
     "PrometheusCollector",
     "NeuralTracer",
     "HealthChecker",
     "HealthStatus",
-    "LogCollector",
 ]
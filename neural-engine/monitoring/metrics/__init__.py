@@ -9,6 +9,7 @@ from .device_metrics import DeviceMetrics, DeviceMetricsCollector
 from .system_metrics import SystemMetricsCollector
 from .api_metrics import APIMetricsCollector
 from .custom_metrics import CustomMetricsCollector
+from .quantile_sketch import DDSketch, MetricSeries
 
 __all__ = [
     "NeuralMetrics",
@@ -18,4 +19,6 @@ __all__ = [
     "SystemMetricsCollector",
     "APIMetricsCollector",
     "CustomMetricsCollector",
+    "DDSketch",
+    "MetricSeries",
 ]
@@ -1,16 +1,20 @@
 """Custom business metrics collection for NeuraScale Neural Engine.
 
 This module handles application-specific metrics that don't fit into
-standard categories but are important for business monitoring.
+standard categories but are important for business monitoring. Observations
+are kept per metric and label set in ``MetricSeries`` (quantile sketches and
+time-bucketed arrays), so recording does not allocate per event.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-from collections import defaultdict, deque
-import statistics
+import time
+from collections import defaultdict
+
+from .quantile_sketch import DDSketch, MetricSeries
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +43,20 @@ class CustomMetric:
     count: int = 0
 
     # For histogram / timer metrics
-    min_value: float = float("in")
-    max_value: float = float("-in")
+    min_value: float = float("inf")
+    max_value: float = float("-inf")
     sum_value: float = 0.0
 
     # Timestamps
     created_at: datetime = field(default_factory=datetime.utcnow)
-    last_updated: datetime = field(default_factory=datetime.utcnow)
+    updated_at: float = field(default_factory=time.time)  # Unix time
+
+    @property
+    def last_updated(self) -> datetime:
+        """Time of the last update (naive UTC, like ``created_at``)."""
+        return datetime.fromtimestamp(self.updated_at, timezone.utc).replace(
+            tzinfo=None
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metric to dictionary format."""
@@ -57,8 +68,8 @@ class CustomMetric:
             "tags": self.tags,
             "value": self.value,
             "count": self.count,
-            "min_value": self.min_value if self.min_value != float("in") else None,
-            "max_value": self.max_value if self.max_value != float("-in") else None,
+            "min_value": self.min_value if self.min_value != float("inf") else None,
+            "max_value": self.max_value if self.max_value != float("-inf") else None,
             "sum_value": self.sum_value,
             "average_value": self.sum_value / self.count if self.count > 0 else 0,
             "created_at": self.created_at.isoformat(),
@@ -77,6 +88,9 @@ class MetricEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
 class CustomMetricsCollector:
     """Collects and manages custom business metrics."""
 
@@ -90,7 +104,11 @@ class CustomMetricsCollector:
 
         # Metrics storage
         self.metrics: Dict[str, CustomMetric] = {}
-        self.metric_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+
+        # Observations per metric and label set
+        self.series: Dict[str, Dict[LabelKey, MetricSeries]] = defaultdict(dict)
+        self.bucket_seconds = getattr(config, "custom_metrics_bucket_seconds", 60.0)
+        self.n_buckets = getattr(config, "custom_metrics_buckets", 60)
 
         # Pre-defined neural engine metrics
         self._initialize_neural_metrics()
@@ -276,19 +294,13 @@ class CustomMetricsCollector:
                 return False
 
             # Update metric
+            now = time.time()
             metric.value += value
             metric.count += 1
-            metric.last_updated = datetime.utcnow()
+            metric.updated_at = now
 
             # Record event
-            event = MetricEvent(
-                metric_name=name,
-                value=value,
-                timestamp=datetime.utcnow(),
-                tags=tags or {},
-            )
-
-            self.metric_history[name].append(event)
+            self._series(name, tags).record(value, now)
             self.total_events_recorded += 1
 
             return True
@@ -323,19 +335,13 @@ class CustomMetricsCollector:
                 return False
 
             # Update metric
+            now = time.time()
             metric.value = value
             metric.count += 1
-            metric.last_updated = datetime.utcnow()
+            metric.updated_at = now
 
             # Record event
-            event = MetricEvent(
-                metric_name=name,
-                value=value,
-                timestamp=datetime.utcnow(),
-                tags=tags or {},
-            )
-
-            self.metric_history[name].append(event)
+            self._series(name, tags).record(value, now)
             self.total_events_recorded += 1
 
             return True
@@ -379,17 +385,11 @@ class CustomMetricsCollector:
             if value > metric.max_value:
                 metric.max_value = value
 
-            metric.last_updated = datetime.utcnow()
+            now = time.time()
+            metric.updated_at = now
 
             # Record event
-            event = MetricEvent(
-                metric_name=name,
-                value=value,
-                timestamp=datetime.utcnow(),
-                tags=tags or {},
-            )
-
-            self.metric_history[name].append(event)
+            self._series(name, tags).record(value, now)
             self.total_events_recorded += 1
 
             return True
@@ -399,6 +399,34 @@ class CustomMetricsCollector:
             self.collection_errors += 1
             return False
 
+    def _series(self, name: str, tags: Optional[Dict[str, str]]) -> MetricSeries:
+        """Series of a metric and label set, created on first use.
+
+        Args:
+            name: Metric name
+            tags: Labels of the observation
+
+        Returns:
+            The series
+        """
+        key: LabelKey = tuple(sorted(tags.items())) if tags else ()
+        series = self.series[name].get(key)
+        if series is None:
+            series = MetricSeries(self.bucket_seconds, self.n_buckets)
+            self.series[name][key] = series
+        return series
+
+    def _matching_series(
+        self, name: str, tags: Optional[Dict[str, str]]
+    ) -> List[MetricSeries]:
+        """Series of a metric whose labels include the given tags."""
+        wanted = set((tags or {}).items())
+        return [
+            series
+            for key, series in self.series.get(name, {}).items()
+            if wanted.issubset(key)
+        ]
+
     def start_timer(self, name: str) -> Optional[str]:
         """Start a timer for a timer metric.
 
@@ -496,13 +524,21 @@ class CustomMetricsCollector:
         return list(self.metrics.values())
 
     def get_metric_summary(
-        self, name: str, time_window_minutes: int = 60
+        self,
+        name: str,
+        time_window_minutes: int = 60,
+        tags: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Get summary statistics for a metric over a time window.
 
+        The window is resolved to whole time buckets; percentiles and the
+        median come from the merged quantile sketches and are accurate to
+        the sketches' relative accuracy.
+
         Args:
             name: Metric name
             time_window_minutes: Time window for summary
+            tags: Only include label sets with these tags (all if None)
 
         Returns:
             Summary statistics
@@ -513,15 +549,19 @@ class CustomMetricsCollector:
 
             metric = self.metrics[name]
 
-            # Get recent events
-            cutoff_time = datetime.utcnow() - timedelta(minutes=time_window_minutes)
-            recent_events = [
-                event
-                for event in self.metric_history[name]
-                if event.timestamp >= cutoff_time
-            ]
+            # Merge recent buckets of all matching label sets
+            now = time.time()
+            window = DDSketch()
+            latest_value, latest_time = None, -float("inf")
+            for series in self._matching_series(name, tags):
+                sketch, last_value, last_time = series.window(
+                    time_window_minutes * 60, now
+                )
+                window.merge(sketch)
+                if last_time is not None and last_time > latest_time:
+                    latest_value, latest_time = last_value, last_time
 
-            if not recent_events:
+            if window.count == 0:
                 return {
                     "metric_name": name,
                     "metric_type": metric.metric_type.value,
@@ -530,39 +570,44 @@ class CustomMetricsCollector:
                     "message": "No recent events",
                 }
 
-            values = [event.value for event in recent_events]
-
             summary = {
                 "metric_name": name,
                 "metric_type": metric.metric_type.value,
                 "description": metric.description,
                 "unit": metric.unit,
                 "time_window_minutes": time_window_minutes,
-                "events_count": len(recent_events),
+                "events_count": window.count,
                 "current_value": metric.value,
             }
 
             if metric.metric_type in [MetricType.HISTOGRAM, MetricType.TIMER]:
+                p50, p90, p95, p99 = window.quantiles([0.5, 0.9, 0.95, 0.99])
                 summary.update(
                     {
-                        "min_value": min(values),
-                        "max_value": max(values),
-                        "average_value": statistics.mean(values),
-                        "median_value": statistics.median(values),
-                        "total_sum": sum(values),
+                        "min_value": window.min,
+                        "max_value": window.max,
+                        "average_value": window.mean,
+                        "median_value": float(p50),
+                        "total_sum": window.sum,
+                        "percentiles": {
+                            "p50": float(p50),
+                            "p90": float(p90),
+                            "p95": float(p95),
+                            "p99": float(p99),
+                        },
                     }
                 )
 
-                if len(values) > 1:
-                    summary["std_deviation"] = statistics.stdev(values)
+                if window.count > 1:
+                    summary["std_deviation"] = window.std
 
             elif metric.metric_type == MetricType.COUNTER:
                 summary.update(
                     {
-                        "total_increments": len(recent_events),
-                        "sum_increments": sum(values),
+                        "total_increments": window.count,
+                        "sum_increments": window.sum,
                         "rate_per_minute": (
-                            sum(values) / time_window_minutes
+                            window.sum / time_window_minutes
                             if time_window_minutes > 0
                             else 0
                         ),
@@ -572,10 +617,10 @@ class CustomMetricsCollector:
             elif metric.metric_type == MetricType.GAUGE:
                 summary.update(
                     {
-                        "latest_value": values[-1] if values else None,
-                        "min_value": min(values),
-                        "max_value": max(values),
-                        "average_value": statistics.mean(values),
+                        "latest_value": latest_value,
+                        "min_value": window.min,
+                        "max_value": window.max,
+                        "average_value": window.mean,
                     }
                 )
 
@@ -585,6 +630,70 @@ class CustomMetricsCollector:
             logger.error(f"Failed to get metric summary for {name}: {str(e)}")
             return {"error": str(e)}
 
+    def get_sketch(
+        self, name: str, tags: Optional[Dict[str, str]] = None
+    ) -> Optional[DDSketch]:
+        """Get the lifetime quantile sketch of a metric.
+
+        Args:
+            name: Metric name
+            tags: Only include label sets with these tags (all if None)
+
+        Returns:
+            Merged sketch, or None if the metric has no observations
+        """
+        matching = self._matching_series(name, tags)
+        if not matching:
+            return None
+
+        sketch = DDSketch(matching[0].mapping)
+        for series in matching:
+            series.flush()
+            sketch.merge(series.sketch)
+        return sketch
+
+    def export_sketches(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Serialize the lifetime sketches of all metrics and label sets.
+
+        Returns:
+            Mapping of metric name to a list of {"tags", "sketch"} entries
+        """
+        exported: Dict[str, List[Dict[str, Any]]] = {}
+        for name, by_labels in self.series.items():
+            entries = []
+            for key, series in by_labels.items():
+                series.flush()
+                entries.append({"tags": dict(key), "sketch": series.sketch.to_dict()})
+            exported[name] = entries
+        return exported
+
+    def merge_sketches(self, exported: Dict[str, List[Dict[str, Any]]]) -> int:
+        """Merge sketches exported by another collector (e.g. a worker).
+
+        Only the lifetime sketches are merged; time-window summaries cover
+        this collector's own observations.
+
+        Args:
+            exported: Output of another collector's ``export_sketches``
+
+        Returns:
+            Number of sketches merged
+        """
+        merged = 0
+        for name, entries in exported.items():
+            if name not in self.metrics:
+                logger.warning(f"Metric {name} not found, skipping its sketches")
+                continue
+            for entry in entries:
+                try:
+                    sketch = DDSketch.from_dict(entry["sketch"])
+                    self._series(name, entry["tags"]).sketch.merge(sketch)
+                    merged += 1
+                except Exception as e:
+                    logger.error(f"Failed to merge sketch for {name}: {str(e)}")
+                    self.collection_errors += 1
+        return merged
+
     def get_business_dashboard_data(self) -> Dict[str, Any]:  # noqa: C901
         """Get key business metrics for dashboard display.
 
@@ -713,6 +822,9 @@ class CustomMetricsCollector:
             "registered_metrics": len(self.metrics),
             "active_timers": active_timers,
             "metric_history_size": sum(
-                len(history) for history in self.metric_history.values()
+                series.retained
+                for by_labels in self.series.values()
+                for series in by_labels.values()
             ),
+            "metric_series": sum(len(by_labels) for by_labels in self.series.values()),
         }
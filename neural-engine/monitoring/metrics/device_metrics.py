@@ -47,20 +47,22 @@ class DeviceMetrics:
     # Connection metrics
     connection_stability: float  # 0-1 score
     uptime_seconds: float
-    reconnection_count: int = 0
 
     # Data flow metrics
     data_rate: float  # Hz (samples per second)
     expected_data_rate: float  # Expected Hz
-    data_loss_percent: float = 0.0
 
     # Signal quality metrics
     signal_quality: float  # 0-1 score
-    noise_level: float = 0.0
-    artifact_count: int = 0
 
     # Error metrics
     error_rate: float  # errors per second
+
+    # Defaulted connection, data flow, signal quality and error metrics
+    reconnection_count: int = 0
+    data_loss_percent: float = 0.0
+    noise_level: float = 0.0
+    artifact_count: int = 0
     total_errors: int = 0
     last_error_time: Optional[datetime] = None
 
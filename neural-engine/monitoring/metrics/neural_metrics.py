@@ -96,8 +96,8 @@ class MetricAggregation:
 
     count: int = 0
     sum: float = 0.0
-    min: float = float("in")
-    max: float = float("-in")
+    min: float = float("inf")
+    max: float = float("-inf")
     mean: float = 0.0
     p50: float = 0.0
     p95: float = 0.0
@@ -0,0 +1,371 @@
+"""Mergeable quantile sketches and time-bucketed metric series.
+
+This module provides the storage behind custom metrics. A ``DDSketch``
+counts observations in logarithmically spaced buckets, so any quantile is
+known to within a fixed relative error and two sketches with the same
+mapping merge by adding their counts (e.g. across workers). A
+``MetricSeries`` keeps a lifetime sketch plus a ring of fixed-length time
+buckets, each with its own sketch and running statistics, all stored in
+preallocated NumPy arrays. Recording writes the value and its timestamp
+into a staging buffer; staged values are folded into the buckets in one
+vectorized pass when the buffer is full or a summary is requested.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LogBucketMapping:
+    """Maps values to logarithmically spaced buckets.
+
+    Bucket ``i`` > 0 holds values in (min_value * gamma^(i-1),
+    min_value * gamma^i], with gamma = (1 + alpha) / (1 - alpha), so the
+    bucket's representative value is within ``relative_accuracy`` of every
+    value it holds. Bucket 0 holds values at or below ``min_value``
+    (including zero and negatives); values above ``max_value`` are counted
+    in the last bucket.
+    """
+
+    relative_accuracy: float = 0.02
+    min_value: float = 1e-6
+    max_value: float = 1e6
+    gamma: float = field(init=False)
+    n_bins: int = field(init=False)
+
+    def __post_init__(self):
+        """Derive the bucket growth factor and count."""
+        if not 0 < self.relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        n_bins = math.ceil(math.log(self.max_value / self.min_value, gamma)) + 2
+        object.__setattr__(self, "gamma", gamma)
+        object.__setattr__(self, "n_bins", n_bins)
+        object.__setattr__(self, "_log_gamma", math.log(gamma))
+        object.__setattr__(self, "_log_min", math.log(self.min_value))
+
+    def index(self, value: float) -> int:
+        """Bucket index of a single value."""
+        if value <= self.min_value:
+            return 0
+        i = math.ceil((math.log(value) - self._log_min) / self._log_gamma)
+        return min(i, self.n_bins - 1)
+
+    def indices(self, values: np.ndarray) -> np.ndarray:
+        """Bucket indices of an array of values."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = (np.log(values) - self._log_min) / self._log_gamma
+        scaled = np.nan_to_num(scaled, nan=0.0, neginf=0.0)
+        return np.clip(np.ceil(scaled), 0, self.n_bins - 1).astype(np.intp)
+
+    def values(self) -> np.ndarray:
+        """Representative value of every bucket."""
+        i = np.arange(self.n_bins, dtype=np.float64)
+        upper = self.min_value * self.gamma**i
+        # Midpoint (in relative terms) of (upper / gamma, upper]
+        values = 2 * upper / (1 + self.gamma)
+        values[0] = self.min_value
+        return values
+
+
+DEFAULT_MAPPING = LogBucketMapping()
+
+
+class DDSketch:
+    """Quantile sketch with bounded relative error that merges exactly."""
+
+    def __init__(self, mapping: LogBucketMapping = DEFAULT_MAPPING):
+        """Initialize sketch.
+
+        Args:
+            mapping: Value to bucket mapping (must match to merge)
+        """
+        self.mapping = mapping
+        self.counts = np.zeros(mapping.n_bins, dtype=np.int64)
+        self.count = 0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one observation.
+
+        Args:
+            value: Observed value
+        """
+        self.counts[self.mapping.index(value)] += 1
+        self.count += 1
+        self.sum += value
+        self.sum_squares += value * value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Add an array of observations.
+
+        Args:
+            values: Observed values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        self.counts += np.bincount(
+            self.mapping.indices(values), minlength=self.mapping.n_bins
+        )
+        self.count += values.size
+        self.sum += float(values.sum())
+        self.sum_squares += float(np.dot(values, values))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """Add another sketch's observations to this one.
+
+        Args:
+            other: Sketch with the same mapping
+
+        Returns:
+            This sketch
+        """
+        if other.mapping != self.mapping:
+            raise ValueError("Cannot merge sketches with different mappings")
+        self.counts += other.counts
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_squares += other.sum_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Estimate several quantiles.
+
+        Args:
+            qs: Quantiles in [0, 1]
+
+        Returns:
+            Estimates, clipped to the exact minimum and maximum (NaN if empty)
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+        ranks = np.floor(qs * (self.count - 1))
+        buckets = np.searchsorted(np.cumsum(self.counts), ranks, side="right")
+        estimates = np.clip(self.mapping.values()[buckets], self.min, self.max)
+        # The extremes are tracked exactly
+        estimates[qs <= 0] = self.min
+        estimates[qs >= 1] = self.max
+        return estimates
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimate (NaN if the sketch is empty)
+        """
+        return float(self.quantiles([q])[0])
+
+    @property
+    def mean(self) -> float:
+        """Mean of the observations (NaN if empty)."""
+        return self.sum / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the observations (NaN if < 2)."""
+        if self.count < 2:
+            return math.nan
+        variance = (self.sum_squares - self.sum * self.sum / self.count) / (
+            self.count - 1
+        )
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch, e.g. to send it to another worker."""
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "mapping": {
+                "relative_accuracy": self.mapping.relative_accuracy,
+                "min_value": self.mapping.min_value,
+                "max_value": self.mapping.max_value,
+            },
+            "bins": nonzero.tolist(),
+            "counts": self.counts[nonzero].tolist(),
+            "count": self.count,
+            "sum": self.sum,
+            "sum_squares": self.sum_squares,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        """Deserialize a sketch created by ``to_dict``."""
+        sketch = cls(LogBucketMapping(**data["mapping"]))
+        sketch.counts[data["bins"]] = data["counts"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        sketch.sum_squares = data["sum_squares"]
+        if data["count"]:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class MetricSeries:
+    """Observations of one metric and label set.
+
+    Keeps a lifetime ``DDSketch`` and a ring of ``n_buckets`` time buckets of
+    ``bucket_seconds`` each. Every time bucket stores the count, sum, sum of
+    squares, minimum, maximum and latest value of its observations, and
+    their bucket counts, in preallocated arrays. ``record`` only writes into
+    a staging buffer; summaries cost O(time buckets x value buckets)
+    regardless of how many values were recorded.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: float = 60.0,
+        n_buckets: int = 60,
+        mapping: LogBucketMapping = DEFAULT_MAPPING,
+        staging_size: int = 256,
+    ):
+        """Initialize series.
+
+        Args:
+            bucket_seconds: Length of a time bucket
+            n_buckets: Number of time buckets kept
+            mapping: Value to bucket mapping of the sketches
+            staging_size: Observations staged before they are folded in
+        """
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = n_buckets
+        self.mapping = mapping
+        self.sketch = DDSketch(mapping)
+
+        self._epochs = np.full(n_buckets, -1, dtype=np.int64)
+        self._count = np.zeros(n_buckets, dtype=np.int64)
+        self._sum = np.zeros(n_buckets)
+        self._sum_squares = np.zeros(n_buckets)
+        self._min = np.full(n_buckets, np.inf)
+        self._max = np.full(n_buckets, -np.inf)
+        self._last = np.zeros(n_buckets)
+        self._last_time = np.zeros(n_buckets)
+        self._bins = np.zeros((n_buckets, mapping.n_bins), dtype=np.int32)
+
+        self._staged_values = np.empty(staging_size)
+        self._staged_times = np.empty(staging_size)
+        self._n_staged = 0
+
+    def record(self, value: float, timestamp: Optional[float] = None) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+            timestamp: Unix time of the observation (now if None)
+        """
+        i = self._n_staged
+        self._staged_values[i] = value
+        self._staged_times[i] = time.time() if timestamp is None else timestamp
+        self._n_staged = i + 1
+        if self._n_staged == len(self._staged_values):
+            self.flush()
+
+    def flush(self) -> None:
+        """Fold staged observations into the sketches and time buckets."""
+        n = self._n_staged
+        if n == 0:
+            return
+        values = self._staged_values[:n]
+        times = self._staged_times[:n]
+        self._n_staged = 0
+
+        self.sketch.add_many(values)
+        bins = self.mapping.indices(values)
+        epochs = (times // self.bucket_seconds).astype(np.int64)
+
+        for epoch in np.unique(epochs):
+            slot = epoch % self.n_buckets
+            if self._epochs[slot] > epoch:
+                continue  # Older than the retained window
+            if self._epochs[slot] != epoch:
+                self._reset_slot(slot, epoch)
+
+            selected = epochs == epoch
+            bucket_values = values[selected]
+            self._count[slot] += bucket_values.size
+            self._sum[slot] += bucket_values.sum()
+            self._sum_squares[slot] += np.dot(bucket_values, bucket_values)
+            self._min[slot] = min(self._min[slot], bucket_values.min())
+            self._max[slot] = max(self._max[slot], bucket_values.max())
+            self._last[slot] = bucket_values[-1]
+            self._last_time[slot] = times[selected][-1]
+            self._bins[slot] += np.bincount(
+                bins[selected], minlength=self.mapping.n_bins
+            ).astype(np.int32)
+
+    def _reset_slot(self, slot: int, epoch: int) -> None:
+        """Reuse a time bucket for a new interval."""
+        self._epochs[slot] = epoch
+        self._count[slot] = 0
+        self._sum[slot] = 0.0
+        self._sum_squares[slot] = 0.0
+        self._min[slot] = np.inf
+        self._max[slot] = -np.inf
+        self._bins[slot] = 0
+
+    def window(
+        self, window_seconds: float, now: Optional[float] = None
+    ) -> Tuple[DDSketch, Optional[float], Optional[float]]:
+        """Merge the time buckets overlapping a recent window.
+
+        The window is resolved to whole time buckets and limited to the
+        ``n_buckets * bucket_seconds`` that are retained.
+
+        Args:
+            window_seconds: Length of the window ending now
+            now: Unix time of the window end (now if None)
+
+        Returns:
+            Tuple of (sketch of the window, latest value, its timestamp)
+        """
+        self.flush()
+        now = time.time() if now is None else now
+        newest = int(now // self.bucket_seconds)
+        oldest = int((now - window_seconds) // self.bucket_seconds)
+        selected = (
+            (self._epochs >= oldest) & (self._epochs <= newest) & (self._count > 0)
+        )
+
+        sketch = DDSketch(self.mapping)
+        if not np.any(selected):
+            return sketch, None, None
+
+        sketch.counts += self._bins[selected].sum(axis=0)
+        sketch.count = int(self._count[selected].sum())
+        sketch.sum = float(self._sum[selected].sum())
+        sketch.sum_squares = float(self._sum_squares[selected].sum())
+        sketch.min = float(self._min[selected].min())
+        sketch.max = float(self._max[selected].max())
+
+        latest = np.flatnonzero(selected)[np.argmax(self._epochs[selected])]
+        return sketch, float(self._last[latest]), float(self._last_time[latest])
+
+    @property
+    def retained(self) -> int:
+        """Number of observations held in the time buckets."""
+        self.flush()
+        return int(self._count[self._epochs >= 0].sum())
@@ -24,19 +24,21 @@ class SystemMetrics:
     # CPU metrics
     cpu_percent: float
     cpu_per_core: List[float]
-    load_average: List[float] = field(default_factory=list)
 
     # Memory metrics
     memory_percent: float
     memory_available_mb: float
     memory_used_mb: float
     memory_total_mb: float
-    swap_percent: float = 0.0
 
     # Disk metrics
     disk_usage_percent: float
     disk_free_gb: float
     disk_total_gb: float
+
+    # Defaulted CPU, memory and disk metrics
+    load_average: List[float] = field(default_factory=list)
+    swap_percent: float = 0.0
     disk_io_read_mb: float = 0.0
     disk_io_write_mb: float = 0.0
 
@@ -37,6 +37,8 @@ class MonitoringConfig:
     # Storage and retention
     metrics_retention_days: int = 30
     high_frequency_retention_hours: int = 24
+    custom_metrics_bucket_seconds: float = 60.0  # time bucket of custom metrics
+    custom_metrics_buckets: int = 60  # time buckets kept per metric and labels
 
     # Alerting
     alerting_enabled: bool = True
@@ -7,6 +7,7 @@ datasets, and custom formats.
 
 from .base_dataset import BaseDataset, DatasetInfo, DatasetSplit, DataSample
 from .dataset_manager import DatasetManager, DatasetRegistry
+from .memory_cache import EvictionPolicy, SizeAwareCache
 from .synthetic_dataset import SyntheticNeuralDataset
 
 __all__ = [
@@ -16,6 +17,8 @@ __all__ = [
     "DataSample",
     "DatasetManager",
     "DatasetRegistry",
+    "EvictionPolicy",
+    "SizeAwareCache",
     "SyntheticNeuralDataset",
 ]
 
@@ -15,6 +15,8 @@ import numpy as np
 import hashlib
 import json
 
+from .memory_cache import SizeAwareCache, get_default_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,6 +141,7 @@ class BaseDataset(abc.ABC):
         download: bool = True,
         transform: Optional[Any] = None,
         target_transform: Optional[Any] = None,
+        memory_cache: Optional[SizeAwareCache] = None,
     ):
         """
         Initialize dataset.
@@ -149,6 +152,7 @@ class BaseDataset(abc.ABC):
             download: Whether to download the dataset if not found
             transform: Transform to apply to data
             target_transform: Transform to apply to labels
+            memory_cache: In-memory cache (the process-wide cache if None)
         """
         self.data_dir = Path(data_dir) if data_dir else self._default_data_dir()
         self.cache_dir = Path(cache_dir) if cache_dir else self._default_cache_dir()
@@ -159,8 +163,8 @@ class BaseDataset(abc.ABC):
         # Dataset info
         self._info: Optional[DatasetInfo] = None
 
-        # Cache for loaded data
-        self._cache: Dict[str, Any] = {}
+        # Bounded cache for loaded data, shared with other datasets
+        self._cache = memory_cache if memory_cache is not None else get_default_cache()
         self._cache_enabled = True
 
         # Initialize dataset
@@ -316,35 +320,68 @@ class BaseDataset(abc.ABC):
         key_data = json.dumps(args, sort_keys=True)
         return hashlib.md5(key_data.encode()).hexdigest()
 
+    def _disk_cache_paths(self, key: str) -> Dict[str, Path]:
+        """Disk cache files of a key: arrays as .npy, other values as JSON."""
+        return {
+            "array": self.cache_dir / f"{key}.npy",
+            "json": self.cache_dir / f"{key}.json",
+        }
+
+    def _memory_cache_key(self, key: str) -> str:
+        """Key in the shared cache, distinguishing datasets of the same name."""
+        return f"{self.cache_dir}:{key}"
+
     def get_cached(self, key: str) -> Optional[Any]:
-        """Get cached data."""
-        if self._cache_enabled and key in self._cache:
-            logger.debug(f"Cache hit for key: {key}")
-            return self._cache[key]
+        """
+        Get cached data.
+
+        Arrays persisted to disk are returned memory-mapped, so only the
+        parts that are accessed are read.
+        """
+        if self._cache_enabled:
+            value = self._cache.get(self._memory_cache_key(key), self.name)
+            if value is not None:
+                logger.debug(f"Cache hit for key: {key}")
+                return value
 
         # Check disk cache
-        cache_file = self.cache_dir / f"{key}.npz"
-        if cache_file.exists():
-            logger.debug(f"Loading from disk cache: {cache_file}")
-            data = np.load(cache_file, allow_pickle=True)
-            return data
+        paths = self._disk_cache_paths(key)
+        if paths["array"].exists():
+            logger.debug(f"Loading from disk cache: {paths['array']}")
+            return np.load(paths["array"], mmap_mode="r", allow_pickle=False)
+        if paths["json"].exists():
+            logger.debug(f"Loading from disk cache: {paths['json']}")
+            with open(paths["json"], "r") as f:
+                return json.load(f)
 
         return None
 
     def set_cached(self, key: str, value: Any, persist: bool = False):
-        """Set cached data."""
+        """
+        Set cached data.
+
+        The value is kept in the bounded in-memory cache under this dataset's
+        namespace and may be evicted; with persist it is also saved to disk.
+        """
         if self._cache_enabled:
-            self._cache[key] = value
+            self._cache.put(self._memory_cache_key(key), value, self.name)
 
             if persist:
-                # Save to disk
-                cache_file = self.cache_dir / f"{key}.npz"
-                np.savez_compressed(cache_file, data=value)
+                # Save to disk, uncompressed so that arrays can be memory-mapped
+                paths = self._disk_cache_paths(key)
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    cache_file = paths["array"]
+                    np.save(cache_file, value, allow_pickle=False)
+                else:
+                    cache_file = paths["json"]
+                    with open(cache_file, "w") as f:
+                        json.dump(value, f)
                 logger.debug(f"Saved to disk cache: {cache_file}")
 
     def clear_cache(self):
         """Clear memory cache."""
-        self._cache.clear()
+        prefix = self._memory_cache_key("")
+        self._cache.clear(self.name, lambda key: str(key).startswith(prefix))
         logger.info(f"Cleared memory cache for dataset {self.name}")
 
     def enable_cache(self):
@@ -356,36 +393,42 @@ class BaseDataset(abc.ABC):
         self._cache_enabled = False
         self.clear_cache()
 
-    def compute_statistics(self) -> Dict[str, Any]:
+    def compute_statistics(
+        self,
+        max_samples: Optional[int] = 1000,
+        median_reservoir_size: int = 1_000_000,
+    ) -> Dict[str, Any]:
         """
         Compute dataset statistics.
 
+        Samples are folded in one at a time, so memory use does not grow
+        with the number of samples: mean and standard deviation are exact
+        (Welford/Chan updates), the median is taken from a uniform reservoir
+        of time points and is exact while all of them fit.
+
+        Args:
+            max_samples: Number of leading samples to use (all if None)
+            median_reservoir_size: Values per reservoir for the median
+
         Returns:
             Dictionary with statistics (mean, std, etc.)
         """
         # Check cache
-        cache_key = self.cache_key("statistics", self.version)
+        cache_key = self.cache_key(
+            "statistics", self.version, max_samples, median_reservoir_size
+        )
         cached = self.get_cached(cache_key)
         if cached is not None:
-            return cached.item()
+            return cached
 
         logger.info(f"Computing statistics for dataset {self.name}...")
 
-        # Compute statistics
-        all_data = []
-        for i in range(min(1000, len(self))):  # Sample first 1000 items
-            sample = self[i]
-            all_data.append(sample.data)
+        n_items = len(self) if max_samples is None else min(max_samples, len(self))
+        running = _RunningStatistics(median_reservoir_size)
+        for i in range(n_items):
+            running.update(np.asarray(self[i].data, dtype=np.float64))
 
-        all_data = np.concatenate(all_data, axis=1)
-
-        stats = {
-            "mean": np.mean(all_data, axis=1).tolist(),
-            "std": np.std(all_data, axis=1).tolist(),
-            "min": np.min(all_data, axis=1).tolist(),
-            "max": np.max(all_data, axis=1).tolist(),
-            "median": np.median(all_data, axis=1).tolist(),
-        }
+        stats = running.result()
 
         # Cache results
         self.set_cached(cache_key, stats, persist=True)
@@ -402,3 +445,78 @@ class BaseDataset(abc.ABC):
             f"data_dir='{self.data_dir}'"
             f")"
         )
+
+
+class _RunningStatistics:
+    """Per-channel statistics accumulated over (n_channels, n_samples) blocks."""
+
+    def __init__(self, reservoir_size: int, seed: int = 0):
+        """
+        Initialize accumulator.
+
+        Args:
+            reservoir_size: Values kept for the median across all channels
+            seed: Seed of the reservoir sampling
+        """
+        self.reservoir_size = reservoir_size
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+        self.min: Optional[np.ndarray] = None
+        self.max: Optional[np.ndarray] = None
+        self.reservoir: Optional[np.ndarray] = None
+        self.reservoir_fill = 0
+
+    def update(self, block: np.ndarray):
+        """Fold in a block of shape (n_channels, n_samples)."""
+        n = block.shape[1]
+        if n == 0:
+            return
+
+        block_mean = block.mean(axis=1)
+        block_m2 = ((block - block_mean[:, None]) ** 2).sum(axis=1)
+        if self.mean is None:
+            self.mean, self.m2 = block_mean, block_m2
+            self.min, self.max = block.min(axis=1), block.max(axis=1)
+            capacity = max(1, self.reservoir_size // block.shape[0])
+            self.reservoir = np.empty((block.shape[0], capacity))
+        else:
+            total = self.count + n
+            delta = block_mean - self.mean
+            self.mean = self.mean + delta * (n / total)
+            self.m2 = self.m2 + block_m2 + delta**2 * (self.count * n / total)
+            np.minimum(self.min, block.min(axis=1), out=self.min)
+            np.maximum(self.max, block.max(axis=1), out=self.max)
+
+        self._sample(block)
+        self.count += n
+
+    def _sample(self, block: np.ndarray):
+        """Reservoir-sample the block's time points (Algorithm R)."""
+        capacity = self.reservoir.shape[1]
+        n = block.shape[1]
+        take = min(capacity - self.reservoir_fill, n)
+        if take > 0:
+            fill = self.reservoir_fill
+            self.reservoir[:, fill : fill + take] = block[:, :take]
+            self.reservoir_fill += take
+        if take < n:
+            seen = self.count + np.arange(take, n)
+            slots = self.rng.integers(0, seen + 1)
+            keep = slots < capacity
+            self.reservoir[:, slots[keep]] = block[:, take:][:, keep]
+
+    def result(self) -> Dict[str, Any]:
+        """Statistics as lists with one value per channel."""
+        if self.count == 0:
+            return {"mean": [], "std": [], "min": [], "max": [], "median": []}
+        return {
+            "mean": self.mean.tolist(),
+            "std": np.sqrt(self.m2 / self.count).tolist(),
+            "min": self.min.tolist(),
+            "max": self.max.tolist(),
+            "median": np.median(
+                self.reservoir[:, : self.reservoir_fill], axis=1
+            ).tolist(),
+        }
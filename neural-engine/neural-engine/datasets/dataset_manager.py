@@ -13,6 +13,12 @@ import pickle
 import hashlib
 
 from .base_dataset import BaseDataset, DatasetInfo, DatasetSplit
+from .memory_cache import (
+    DEFAULT_MAX_BYTES,
+    EvictionPolicy,
+    SizeAwareCache,
+    get_default_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +123,9 @@ class DatasetManager:
         data_root: Optional[Path] = None,
         cache_root: Optional[Path] = None,
         registry: Optional[DatasetRegistry] = None,
+        max_cache_bytes: int = DEFAULT_MAX_BYTES,
+        cache_policy: EvictionPolicy = EvictionPolicy.LRU,
+        cache_quotas: Optional[Dict[str, int]] = None,
     ):
         """
         Initialize dataset manager.
@@ -125,6 +134,9 @@ class DatasetManager:
             data_root: Root directory for dataset storage
             cache_root: Root directory for cache storage
             registry: Dataset registry (creates new one if None)
+            max_cache_bytes: Memory budget for loaded dataset instances
+            cache_policy: Eviction policy for loaded dataset instances
+            cache_quotas: Byte quota per registered dataset name
         """
         self.data_root = Path(data_root) if data_root else self._default_data_root()
         self.cache_root = Path(cache_root) if cache_root else self._default_cache_root()
@@ -134,8 +146,13 @@ class DatasetManager:
         self.data_root.mkdir(parents=True, exist_ok=True)
         self.cache_root.mkdir(parents=True, exist_ok=True)
 
-        # Loaded datasets cache
-        self._loaded_datasets: Dict[str, BaseDataset] = {}
+        # Loaded datasets cache, one namespace per registered dataset name.
+        # Instances are not spilled; they are cheap to rebuild from disk.
+        self._loaded_datasets = SizeAwareCache(
+            max_bytes=max_cache_bytes,
+            policy=cache_policy,
+            namespace_quotas=cache_quotas,
+        )
         self._dataset_info_cache: Dict[str, DatasetInfo] = {}
 
         # Metadata storage
@@ -228,9 +245,11 @@ class DatasetManager:
         cache_key = self._generate_cache_key(name, split, kwargs)
 
         # Check if already loaded
-        if not force_reload and cache_key in self._loaded_datasets:
-            logger.info(f"Using cached dataset: {name}")
-            return self._loaded_datasets[cache_key]
+        if not force_reload:
+            dataset = self._loaded_datasets.get(cache_key, name)
+            if dataset is not None:
+                logger.info(f"Using cached dataset: {name}")
+                return dataset
 
         # Get dataset class
         dataset_class = self.registry.get(name)
@@ -265,7 +284,7 @@ class DatasetManager:
 
         # Cache dataset
         if self._lazy_loading:
-            self._loaded_datasets[cache_key] = dataset
+            self._loaded_datasets.put(cache_key, dataset, name, spill=False)
 
         # Cache dataset info
         if name not in self._dataset_info_cache:
@@ -314,7 +333,7 @@ class DatasetManager:
         # Unload dataset if lazy loading is enabled
         if self._lazy_loading:
             cache_key = self._generate_cache_key(name, None, {})
-            self._loaded_datasets.pop(cache_key, None)
+            self._loaded_datasets.pop(cache_key, name)
 
         return info
 
@@ -367,9 +386,7 @@ class DatasetManager:
             delete_cache: Whether to also delete cached data
         """
         # Remove from loaded datasets
-        keys_to_remove = [key for key in self._loaded_datasets if key.startswith(name)]
-        for key in keys_to_remove:
-            del self._loaded_datasets[key]
+        self._loaded_datasets.clear(name)
 
         # Delete data directory
         dataset_dir = self.data_root / name
@@ -399,20 +416,16 @@ class DatasetManager:
         Args:
             name: Dataset name (clears all if None)
         """
-        if name is None:
-            # Clear all caches
-            self._loaded_datasets.clear()
-            for dataset in self._loaded_datasets.values():
+        for dataset in self._loaded_datasets.values(name):
+            try:
                 dataset.clear_cache()
+            except Exception as e:
+                logger.warning(f"Failed to clear data cache of {dataset!r}: {e}")
+        self._loaded_datasets.clear(name)
+
+        if name is None:
             logger.info("Cleared all dataset caches")
         else:
-            # Clear specific dataset cache
-            keys_to_remove = [
-                key for key in self._loaded_datasets if key.startswith(name)
-            ]
-            for key in keys_to_remove:
-                dataset = self._loaded_datasets.pop(key)
-                dataset.clear_cache()
             logger.info(f"Cleared cache for dataset: {name}")
 
     def preload_datasets(
@@ -449,6 +462,32 @@ class DatasetManager:
         dataset = self.load_dataset(name)
         return dataset.compute_statistics()
 
+    def set_cache_quota(self, name: str, max_bytes: Optional[int]):
+        """
+        Limit the memory held by loaded instances of a dataset.
+
+        Quotas for a dataset's cached arrays are set on the shared data
+        cache under the dataset's own name (``BaseDataset.name``).
+
+        Args:
+            name: Registered dataset name
+            max_bytes: Quota in bytes (None removes the quota)
+        """
+        self._loaded_datasets.set_quota(name, max_bytes)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit, miss and eviction counters of the in-memory caches.
+
+        Returns:
+            Counters of the loaded dataset instances and of the data cache
+            shared by all datasets
+        """
+        return {
+            "datasets": self._loaded_datasets.get_stats(),
+            "data": get_default_cache().get_stats(),
+        }
+
     def enable_lazy_loading(self):
         """Enable lazy loading of datasets."""
         self._lazy_loading = True
@@ -509,6 +548,6 @@ class DatasetManager:
             f"DatasetManager("
             f"data_root='{self.data_root}', "
             f"datasets={self.registry.list_datasets()}, "
-            f"loaded={list(self._loaded_datasets.keys())}"
+            f"loaded={len(self._loaded_datasets)}"
             f")"
         )
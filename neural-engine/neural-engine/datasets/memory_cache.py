@@ -0,0 +1,499 @@
+"""Bounded, size-aware in-memory cache shared by datasets.
+
+This module provides the cache behind ``BaseDataset.get_cached`` /
+``set_cached`` and the dataset instances kept by ``DatasetManager``. Entries
+are accounted by their size in bytes and evicted by recency (LRU) or
+frequency (LFU) when the total budget or the quota of their namespace is
+exceeded. Evicted entries can optionally be spilled to disk and are then
+reloaded on access instead of being recomputed.
+"""
+
+import hashlib
+import logging
+import pickle
+import sys
+import threading
+import types
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NAMESPACE = "default"
+DEFAULT_MAX_BYTES = 1024**3  # 1 GiB
+
+
+class EvictionPolicy(Enum):
+    """Order in which entries are evicted."""
+
+    LRU = "lru"  # Least recently used first
+    LFU = "lfu"  # Least frequently used first, ties broken by recency
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spills: int = 0
+    spill_hits: int = 0
+    entries: int = 0
+    current_bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory or the spill directory."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "spills": self.spills,
+            "spill_hits": self.spill_hits,
+            "entries": self.entries,
+            "current_bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@dataclass
+class _CacheEntry:
+    """A cached value with its accounting data."""
+
+    value: Any
+    size_bytes: int
+    spill: bool
+    hits: int = 0
+    spill_path: Optional[Path] = None  # Backing file of a memory-mapped value
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a value in bytes.
+
+    Arrays count their buffer, containers and objects their contents.
+    Memory-mapped arrays only count their header since their pages belong
+    to the OS page cache, and caches, classes, modules and functions are
+    not followed.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    skip = (
+        SizeAwareCache,
+        type,
+        types.ModuleType,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+        types.MethodType,
+    )
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, skip):
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, np.memmap):
+            total += sys.getsizeof(obj)
+        elif isinstance(obj, np.ndarray):
+            total += obj.nbytes
+            if obj.dtype == object:
+                stack.extend(obj.ravel().tolist())
+        elif isinstance(obj, (str, bytes, bytearray, int, float, bool)):
+            total += sys.getsizeof(obj)
+        elif isinstance(obj, dict):
+            total += sys.getsizeof(obj)
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            total += sys.getsizeof(obj)
+            stack.extend(obj)
+        else:
+            total += sys.getsizeof(obj)
+            if hasattr(obj, "__dict__"):
+                stack.append(vars(obj))
+
+    return total
+
+
+class SizeAwareCache:
+    """
+    Thread-safe in-memory cache bounded by size in bytes.
+
+    Entries live in namespaces (typically one per dataset) which can be given
+    their own byte quota in addition to the overall budget. When either is
+    exceeded, entries of the affected scope are evicted according to the
+    eviction policy. With a spill directory, evicted entries that allow it
+    are written to disk: arrays as ``.npy`` files that are memory-mapped on
+    the next access, other values pickled.
+
+    Sizes are measured when an entry is stored; objects that keep growing
+    afterwards, such as datasets loading their data lazily, are not
+    re-measured.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        policy: EvictionPolicy = EvictionPolicy.LRU,
+        spill_dir: Optional[Path] = None,
+        namespace_quotas: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Total memory budget in bytes
+            policy: Eviction policy
+            spill_dir: Directory for evicted entries (None disables spilling)
+            namespace_quotas: Byte quota per namespace
+        """
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[Tuple[str, Hashable], _CacheEntry]" = OrderedDict()
+        self._spilled: Dict[Tuple[str, Hashable], Path] = {}
+        self._quotas: Dict[str, int] = dict(namespace_quotas or {})
+        self._namespace_bytes: Dict[str, int] = {}
+        self._stats = CacheStats(max_bytes=max_bytes)
+        self._lock = threading.RLock()
+
+    def set_quota(self, namespace: str, max_bytes: Optional[int]):
+        """
+        Set or remove the byte quota of a namespace.
+
+        Args:
+            namespace: Namespace, typically a dataset name
+            max_bytes: Quota in bytes (None removes the quota)
+        """
+        with self._lock:
+            if max_bytes is None:
+                self._quotas.pop(namespace, None)
+            else:
+                self._quotas[namespace] = max_bytes
+                self._evict(namespace)
+
+    def get(
+        self,
+        key: Hashable,
+        namespace: str = DEFAULT_NAMESPACE,
+        default: Any = None,
+    ) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Entry key
+            namespace: Entry namespace
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default if the key is not cached
+        """
+        with self._lock:
+            entry_key = (namespace, key)
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                entry.hits += 1
+                self._stats.hits += 1
+                return entry.value
+
+            if entry_key in self._spilled:
+                value = self._load_spilled(entry_key)
+                if value is not None:
+                    self._stats.hits += 1
+                    self._stats.spill_hits += 1
+                    return value
+
+            self._stats.misses += 1
+            return default
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        namespace: str = DEFAULT_NAMESPACE,
+        size_bytes: Optional[int] = None,
+        spill: bool = True,
+    ):
+        """
+        Store a value, evicting other entries as needed.
+
+        A value larger than the budget or its namespace quota is not kept in
+        memory; it is spilled right away if spilling is possible.
+
+        Args:
+            key: Entry key
+            value: Value to cache
+            namespace: Entry namespace
+            size_bytes: Size of the value (estimated if None)
+            spill: Whether the value may be spilled to disk when evicted
+        """
+        if size_bytes is None:
+            size_bytes = estimate_size(value)
+
+        with self._lock:
+            self._remove((namespace, key))
+            self._insert((namespace, key), _CacheEntry(value, size_bytes, spill))
+
+    def pop(self, key: Hashable, namespace: str = DEFAULT_NAMESPACE) -> Any:
+        """
+        Remove an entry, including a spilled copy.
+
+        Args:
+            key: Entry key
+            namespace: Entry namespace
+
+        Returns:
+            The value held in memory, or None
+        """
+        with self._lock:
+            entry = self._remove((namespace, key))
+            return entry.value if entry is not None else None
+
+    def clear(
+        self,
+        namespace: Optional[str] = None,
+        predicate: Optional[Callable[[Hashable], bool]] = None,
+    ):
+        """
+        Remove entries, including spilled copies.
+
+        Args:
+            namespace: Namespace to clear (all namespaces if None)
+            predicate: Only remove keys for which this returns True
+        """
+        with self._lock:
+            entry_keys = set(self._entries) | set(self._spilled)
+            for entry_key in entry_keys:
+                if namespace is not None and entry_key[0] != namespace:
+                    continue
+                if predicate is not None and not predicate(entry_key[1]):
+                    continue
+                self._remove(entry_key)
+
+    def values(self, namespace: Optional[str] = None) -> List[Any]:
+        """
+        Values held in memory, without counting as accesses.
+
+        Args:
+            namespace: Namespace to list (all namespaces if None)
+
+        Returns:
+            Values, least recently used first
+        """
+        with self._lock:
+            return [
+                entry.value
+                for (entry_namespace, _), entry in self._entries.items()
+                if namespace is None or entry_namespace == namespace
+            ]
+
+    def namespace_bytes(self, namespace: str) -> int:
+        """Bytes held in memory by a namespace."""
+        with self._lock:
+            return self._namespace_bytes.get(namespace, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Hit, miss, eviction and spill counters, the current size and the
+            bytes held per namespace
+        """
+        with self._lock:
+            stats = self._stats.to_dict()
+            stats["entries"] = len(self._entries)
+            stats["current_bytes"] = self.current_bytes
+            stats["namespaces"] = dict(self._namespace_bytes)
+            return stats
+
+    @property
+    def current_bytes(self) -> int:
+        """Bytes held in memory."""
+        return sum(self._namespace_bytes.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key of the default namespace is held in memory."""
+        with self._lock:
+            return (DEFAULT_NAMESPACE, key) in self._entries
+
+    def __len__(self) -> int:
+        """Number of entries held in memory."""
+        return len(self._entries)
+
+    def _insert(self, entry_key: Tuple[str, Hashable], entry: _CacheEntry):
+        """Add an entry and evict until the budget and quota are met."""
+        namespace = entry_key[0]
+        limit = min(self.max_bytes, self._quotas.get(namespace, self.max_bytes))
+        if entry.size_bytes > limit:
+            logger.debug(
+                f"Cache entry {entry_key} ({entry.size_bytes} bytes) exceeds the "
+                f"limit of {limit} bytes"
+            )
+            self._stats.evictions += 1
+            self._spill(entry_key, entry)
+            return
+
+        self._entries[entry_key] = entry
+        self._namespace_bytes[namespace] = (
+            self._namespace_bytes.get(namespace, 0) + entry.size_bytes
+        )
+        self._evict(namespace, keep=entry_key)
+
+    def _remove(self, entry_key: Tuple[str, Hashable]) -> Optional[_CacheEntry]:
+        """Drop an entry from memory and the spill directory."""
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._release(entry_key[0], entry.size_bytes)
+
+        spill_path = self._spilled.pop(entry_key, None)
+        if entry is not None and entry.spill_path is not None:
+            spill_path = entry.spill_path
+        if spill_path is not None:
+            spill_path.unlink(missing_ok=True)
+        return entry
+
+    def _release(self, namespace: str, size_bytes: int):
+        """Subtract an entry's size from its namespace."""
+        remaining = self._namespace_bytes.get(namespace, 0) - size_bytes
+        if remaining > 0:
+            self._namespace_bytes[namespace] = remaining
+        else:
+            self._namespace_bytes.pop(namespace, None)
+
+    def _evict(self, namespace: str, keep: Optional[Tuple[str, Hashable]] = None):
+        """
+        Evict entries until the namespace quota and the budget are met.
+
+        Args:
+            namespace: Namespace whose quota to enforce
+            keep: Entry that must not be evicted (the one just stored)
+        """
+        quota = self._quotas.get(namespace)
+        while quota is not None and self._namespace_bytes.get(namespace, 0) > quota:
+            self._evict_one(namespace, keep)
+        while self.current_bytes > self.max_bytes:
+            self._evict_one(None, keep)
+
+    def _evict_one(
+        self, namespace: Optional[str], keep: Optional[Tuple[str, Hashable]]
+    ):
+        """Evict the policy's victim, restricted to a namespace if given."""
+        candidates = (
+            (position, entry_key, entry)
+            for position, (entry_key, entry) in enumerate(self._entries.items())
+            if (namespace is None or entry_key[0] == namespace) and entry_key != keep
+        )
+        if self.policy == EvictionPolicy.LFU:
+            _, entry_key, entry = min(candidates, key=lambda c: (c[2].hits, c[0]))
+        else:
+            _, entry_key, entry = next(candidates)
+
+        del self._entries[entry_key]
+        self._release(entry_key[0], entry.size_bytes)
+        self._stats.evictions += 1
+        self._spill(entry_key, entry)
+
+    def _spill_path(self, entry_key: Tuple[str, Hashable], suffix: str) -> Path:
+        """File an entry is spilled to."""
+        digest = hashlib.md5(repr(entry_key).encode()).hexdigest()
+        return self.spill_dir / f"{digest}{suffix}"
+
+    def _spill(self, entry_key: Tuple[str, Hashable], entry: _CacheEntry):
+        """Write an evicted entry to the spill directory, if enabled."""
+        if entry.spill_path is not None:
+            # Memory-mapped from an earlier spill, the file is still valid
+            self._spilled[entry_key] = entry.spill_path
+            return
+        if self.spill_dir is None or not entry.spill:
+            return
+
+        try:
+            value = entry.value
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                path = self._spill_path(entry_key, ".npy")
+                np.save(path, value, allow_pickle=False)
+            else:
+                path = self._spill_path(entry_key, ".pkl")
+                with open(path, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Failed to spill cache entry {entry_key}: {e}")
+            return
+
+        self._spilled[entry_key] = path
+        self._stats.spills += 1
+
+    def _load_spilled(self, entry_key: Tuple[str, Hashable]) -> Any:
+        """Reload a spilled entry and move it back into memory."""
+        path = self._spilled.pop(entry_key)
+        try:
+            if path.suffix == ".npy":
+                value = np.load(path, mmap_mode="r", allow_pickle=False)
+                entry = _CacheEntry(value, estimate_size(value), True)
+                entry.spill_path = path
+            else:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                path.unlink(missing_ok=True)
+                entry = _CacheEntry(value, estimate_size(value), True)
+        except Exception as e:
+            logger.error(f"Failed to load spilled cache entry {entry_key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        self._insert(entry_key, entry)
+        return value
+
+
+_default_cache: Optional[SizeAwareCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> SizeAwareCache:
+    """Get the process-wide cache shared by all datasets."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SizeAwareCache()
+        return _default_cache
+
+
+def set_default_cache(cache: SizeAwareCache):
+    """
+    Replace the process-wide cache.
+
+    Datasets created afterwards use the new cache.
+
+    Args:
+        cache: Cache to share between datasets
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -352,6 +352,29 @@ class TestBaseDataset:
         dataset.clear_cache()
         assert dataset.get_cached("test_key") is None
 
+    def test_persisted_cache(self, temp_dir):
+        """Test persisted arrays are memory-mapped and other values kept."""
+        dataset = MockDataset(
+            data_dir=temp_dir / "data",
+            cache_dir=temp_dir / "cache",
+            download=True,
+        )
+        array = np.random.randn(16, 8)
+        dataset.set_cached("array_key", array, persist=True)
+        dataset.set_cached("dict_key", {"mean": [1.0, 2.0]}, persist=True)
+        dataset.clear_cache()
+
+        cached = dataset.get_cached("array_key")
+        assert isinstance(cached, np.memmap)
+        np.testing.assert_array_equal(cached, array)
+        assert dataset.get_cached("dict_key") == {"mean": [1.0, 2.0]}
+
+        # Statistics are served from the memory and disk caches
+        stats = dataset.compute_statistics()
+        assert dataset.compute_statistics() == stats
+        dataset.clear_cache()
+        assert dataset.compute_statistics() == stats
+
     def test_dataset_statistics(self, temp_dir):
         """Test computing dataset statistics."""
         dataset = MockDataset(
@@ -372,6 +395,19 @@ class TestBaseDataset:
         assert len(stats["mean"]) == 8  # 8 channels
         assert len(stats["std"]) == 8
 
+        # Streaming statistics match the concatenated data
+        all_data = np.concatenate([dataset[i].data for i in range(100)], axis=1)
+        np.testing.assert_allclose(stats["mean"], all_data.mean(axis=1))
+        np.testing.assert_allclose(stats["std"], all_data.std(axis=1))
+        np.testing.assert_allclose(stats["min"], all_data.min(axis=1))
+        np.testing.assert_allclose(stats["max"], all_data.max(axis=1))
+        np.testing.assert_allclose(stats["median"], np.median(all_data, axis=1))
+
+        # A reservoir smaller than the data approximates the median
+        approx = dataset.compute_statistics(median_reservoir_size=8 * 5000)
+        np.testing.assert_allclose(approx["mean"], stats["mean"])
+        np.testing.assert_allclose(approx["median"], stats["median"], atol=0.05)
+
     def test_batch_iteration(self, temp_dir):
         """Test batch iteration."""
         dataset = MockDataset(
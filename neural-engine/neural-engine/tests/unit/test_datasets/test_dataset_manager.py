@@ -240,6 +240,20 @@ class TestDatasetManager:
         assert dataset3 is not dataset1  # Mock was cleared
         assert dataset4 is dataset2  # Another was not cleared
 
+    def test_cache_quota_and_stats(self, manager):
+        """Test per-dataset quotas evict loaded instances and are counted."""
+        dataset1 = manager.load_dataset("mock")
+        assert manager.load_dataset("mock") is dataset1
+
+        # A quota below the instance size keeps nothing for this dataset
+        manager.set_cache_quota("mock", 1)
+        assert manager.load_dataset("mock") is not dataset1
+
+        stats = manager.get_cache_stats()["datasets"]
+        assert stats["hits"] == 1
+        assert stats["evictions"] >= 2
+        assert "mock" not in stats["namespaces"]
+
     def test_preload_datasets(self, manager):
         """Test preloading multiple datasets."""
         manager.preload_datasets(["mock", "another"])
@@ -0,0 +1,145 @@
+"""Unit tests for the bounded in-memory dataset cache."""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import tempfile
+import shutil
+
+from neural_engine.datasets.memory_cache import (
+    EvictionPolicy,
+    SizeAwareCache,
+    estimate_size,
+)
+
+
+def _array(n_bytes: int, fill: float = 0.0) -> np.ndarray:
+    """Float64 array of the given size."""
+    return np.full(n_bytes // 8, fill)
+
+
+class TestEstimateSize:
+    """Test estimate_size."""
+
+    def test_arrays_and_containers(self):
+        """Test array buffers are counted inside containers and objects."""
+
+        class Holder:
+            def __init__(self):
+                self.data = _array(8000)
+                self.same = self.data
+
+        assert estimate_size(_array(8000)) == 8000
+        assert estimate_size({"a": [_array(800), _array(800)]}) > 1600
+        # Shared references are only counted once
+        assert 8000 < estimate_size(Holder()) < 9000
+
+    def test_memmap_is_not_counted(self):
+        """Test memory-mapped arrays only count their header."""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            np.save(temp_dir / "a.npy", _array(80000))
+            mapped = np.load(temp_dir / "a.npy", mmap_mode="r")
+            assert estimate_size(mapped) < 1000
+            del mapped
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestSizeAwareCache:
+    """Test SizeAwareCache."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = SizeAwareCache(max_bytes=3000)
+        for key in "abc":
+            cache.put(key, _array(1000))
+        cache.get("a")
+        cache.put("d", _array(1000))
+
+        assert "a" in cache and "c" in cache and "d" in cache
+        assert "b" not in cache
+        assert cache.current_bytes == 3000
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 3
+
+    def test_lfu_eviction(self):
+        """Test the least frequently used entry is evicted first."""
+        cache = SizeAwareCache(max_bytes=3000, policy=EvictionPolicy.LFU)
+        for key in "abc":
+            cache.put(key, _array(1000))
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+        cache.get("c")
+        cache.get("c")
+        cache.put("d", _array(1000))
+
+        assert "b" not in cache
+        assert all(key in cache for key in "acd")
+
+    def test_namespace_quota(self):
+        """Test a namespace over its quota only evicts its own entries."""
+        cache = SizeAwareCache(max_bytes=10000, namespace_quotas={"big": 2000})
+        cache.put("x", _array(1000), namespace="small")
+        for key in range(3):
+            cache.put(key, _array(1000), namespace="big")
+
+        assert cache.namespace_bytes("big") == 2000
+        assert cache.get(0, "big") is None
+        assert cache.get("x", "small") is not None
+
+        # Entries larger than the quota are not kept
+        cache.put("huge", _array(4000), namespace="big")
+        assert cache.get("huge", "big") is None
+        assert cache.namespace_bytes("big") == 2000
+
+    def test_spill_to_disk(self, temp_dir):
+        """Test evicted entries are reloaded from the spill directory."""
+        cache = SizeAwareCache(max_bytes=2000, spill_dir=temp_dir)
+        array = np.arange(125, dtype=np.float64)
+        cache.put("array", array)
+        cache.put("stats", {"mean": [1.0]}, size_bytes=1000)
+        cache.put("other", _array(1000))
+        cache.put("no_spill", _array(1000), spill=False)
+        cache.put("last", _array(1000))
+
+        # Everything but the last entry was evicted, all but one spilled
+        stats = cache.get_stats()
+        assert stats["spills"] == 3
+        assert len(list(temp_dir.iterdir())) == 3
+
+        reloaded = cache.get("array")
+        assert isinstance(reloaded, np.memmap)
+        np.testing.assert_array_equal(reloaded, array)
+        assert cache.get("stats") == {"mean": [1.0]}
+        assert cache.get("no_spill") is None
+        assert cache.get_stats()["spill_hits"] == 2
+
+        cache.clear()
+        assert len(cache) == 0
+        assert not any(temp_dir.iterdir())
+
+    def test_clear_with_predicate(self):
+        """Test clearing only matching keys of a namespace."""
+        cache = SizeAwareCache()
+        cache.put("a:1", 1, namespace="ds")
+        cache.put("b:1", 2, namespace="ds")
+        cache.put("a:1", 3, namespace="other")
+
+        cache.clear("ds", lambda key: key.startswith("a:"))
+
+        assert cache.get("a:1", "ds") is None
+        assert cache.get("b:1", "ds") == 2
+        assert cache.get("a:1", "other") == 3
+        assert cache.get_stats()["misses"] == 1
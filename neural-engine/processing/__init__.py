@@ -12,7 +12,12 @@ from .signal_processor import (
     SignalQualityMetrics,
 )
 
-from .stream_processor import StreamProcessor, StreamConfig, StreamMetrics
+from .stream_processor import (
+    StreamProcessor,
+    StreamConfig,
+    StreamMetrics,
+    SessionStream,
+)
 
 from .buffer_manager import BufferManager, StreamBuffer
 
@@ -34,6 +39,7 @@ __all__ = [
     "StreamProcessor",
     "StreamConfig",
     "StreamMetrics",
+    "SessionStream",
     # Buffer management
     "BufferManager",
     "StreamBuffer",
@@ -40,6 +40,9 @@ class StreamBuffer:
     # Window tracking
     last_window_end: int = 0
 
+    # Optional causal filter applied once as samples enter the buffer
+    filter_bank: Optional[Any] = None
+
     def __post_init__(self):
         """Initialize the circular buffer."""
         self.buffer = np.zeros((self.n_channels, self.max_samples), dtype=np.float32)
@@ -65,6 +68,10 @@ class StreamBuffer:
             logger.error(f"Data chunk ({n_new_samples} samples) exceeds buffer size")
             return False
 
+        # Filter on entry so every sample is filtered exactly once
+        if self.filter_bank is not None:
+            data = self.filter_bank.process(data)
+
         # Handle circular wrapping
         if self.write_pos + n_new_samples <= self.max_samples:
             # Simple case: no wrapping needed
@@ -212,6 +219,8 @@ class StreamBuffer:
         self.sample_count = 0
         self.last_window_end = 0
         self.timestamps.clear()
+        if self.filter_bank is not None:
+            self.filter_bank.reset()
 
     def _estimate_timestamp(self, sample_position: int) -> Optional[float]:
         """Estimate timestamp for a sample position.
@@ -264,13 +273,17 @@ class BufferManager:
         logger.info(f"BufferManager initialized: max duration {max_duration}s")
 
     async def create_stream_buffer(
-        self, session_id: str, stream_info: Dict[str, Any]
+        self,
+        session_id: str,
+        stream_info: Dict[str, Any],
+        filter_bank: Optional[Any] = None,
     ) -> bool:
         """Create a new stream buffer.
 
         Args:
             session_id: Unique session identifier
             stream_info: Stream metadata
+            filter_bank: Optional streaming filter applied to incoming samples
 
         Returns:
             Success status
@@ -296,6 +309,7 @@ class BufferManager:
                     n_channels=n_channels,
                     sampling_rate=sampling_rate,
                     max_samples=max_samples,
+                    filter_bank=filter_bank,
                 )
 
                 self.buffers[session_id] = buffer
@@ -340,6 +354,23 @@ class BufferManager:
 
             return buffer.add_samples(data, timestamp)
 
+    async def add_block(self, session_id: str, block: Any) -> bool:
+        """Add a device data block to a stream buffer.
+
+        The block's contiguous float32 array is written into the circular
+        buffer without per-sample conversion.
+
+        Args:
+            session_id: Session identifier
+            block: Data block with ``data`` (channels x samples) and
+                per-sample ``timestamps``
+
+        Returns:
+            Success status
+        """
+        timestamp = float(block.timestamps[-1]) if block.n_samples else None
+        return await self.add_samples(session_id, block.data, timestamp)
+
     async def get_samples(
         self, session_id: str, n_samples: int, from_end: bool = True
     ) -> Optional[np.ndarray]:
@@ -413,6 +444,7 @@ class BufferManager:
                 "max_samples": buffer.max_samples,
                 "current_samples": buffer.sample_count,
                 "total_samples_written": buffer.total_samples_written,
+                "filtered_on_entry": buffer.filter_bank is not None,
                 "buffer_fill_percent": (buffer.sample_count / buffer.max_samples) * 100,
                 "created_at": buffer.created_at.isoformat(),
                 "last_write": (
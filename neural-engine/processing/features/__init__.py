@@ -10,6 +10,9 @@ from .frequency_domain import FrequencyDomainFeatures
 from .time_frequency import TimeFrequencyFeatures
 from .spatial_features import SpatialFeatures
 from .connectivity import ConnectivityFeatures
+from common.entropy import sample_entropy, approximate_entropy
+from .cross_spectrum import CrossSpectrum, compute_cross_spectrum, phase_locking_value
+from .wavelet_bank import TimeFrequencyTensor, compute_wavelet_transform
 
 __all__ = [
     "FeatureExtractor",
@@ -18,4 +21,11 @@ __all__ = [
     "TimeFrequencyFeatures",
     "SpatialFeatures",
     "ConnectivityFeatures",
+    "sample_entropy",
+    "approximate_entropy",
+    "CrossSpectrum",
+    "compute_cross_spectrum",
+    "phase_locking_value",
+    "TimeFrequencyTensor",
+    "compute_wavelet_transform",
 ]
@@ -11,6 +11,8 @@ from scipy import signal
 from scipy.stats import entropy
 import warnings
 
+from .cross_spectrum import compute_cross_spectrum, phase_locking_value
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,46 +67,26 @@ class ConnectivityFeatures:
             return features
 
         try:
-            # Compute pairwise coherence for each band
-            for band_name, (low_freq, high_freq) in freq_bands.items():
-                # Initialize connectivity matrices
-                coherence_matrix = np.zeros((n_channels, n_channels))
-                imaginary_coherence = np.zeros((n_channels, n_channels))
-
-                # Compute pairwise coherence
-                for i in range(n_channels):
-                    for j in range(i + 1, n_channels):
-                        # Compute coherence
-                        freqs, Cxy = signal.coherence(
-                            data[i, :],
-                            data[j, :],
-                            fs=self.sampling_rate,
-                            window="hann",
-                            nperseg=self.nperseg,
-                            noverlap=self.noverlap,
-                        )
+            # One cross-spectral tensor serves every pair and band
+            spectrum = compute_cross_spectrum(
+                data,
+                self.sampling_rate,
+                nperseg=self.nperseg,
+                noverlap=self.noverlap,
+                window="hann",
+            )
+            coherence = spectrum.coherence()
+            # Imaginary part of the cross-spectrum (less sensitive to
+            # volume conduction)
+            imaginary_csd = np.abs(np.imag(spectrum.csd))
 
-                        # Band-specific coherence
-                        band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                        if np.any(band_mask):
-                            # Mean coherence in band
-                            band_coherence = np.mean(Cxy[band_mask])
-                            coherence_matrix[i, j] = band_coherence
-                            coherence_matrix[j, i] = band_coherence
-
-                            # Imaginary coherence (less sensitive to volume conduction)
-                            _, Pxy = signal.csd(
-                                data[i, :],
-                                data[j, :],
-                                fs=self.sampling_rate,
-                                window="hann",
-                                nperseg=self.nperseg,
-                                noverlap=self.noverlap,
-                            )
-
-                            imag_coh = np.mean(np.abs(np.imag(Pxy[band_mask])))
-                            imaginary_coherence[i, j] = imag_coh
-                            imaginary_coherence[j, i] = imag_coh
+            for band_name, (low_freq, high_freq) in freq_bands.items():
+                coherence_matrix = spectrum.band_average(coherence, low_freq, high_freq)
+                imaginary_coherence = spectrum.band_average(
+                    imaginary_csd, low_freq, high_freq
+                )
+                np.fill_diagonal(coherence_matrix, 0.0)
+                np.fill_diagonal(imaginary_coherence, 0.0)
 
                 # Extract network features
                 network_features = await self._extract_network_features(
@@ -209,24 +191,11 @@ class ConnectivityFeatures:
                     output="sos",
                 )
 
-                # Get instantaneous phase for each channel
-                phases = np.zeros((n_channels, data.shape[1]))
-                for ch in range(n_channels):
-                    filtered = signal.sosfiltfilt(sos, data[ch, :])
-                    phases[ch, :] = np.angle(signal.hilbert(filtered))
-
-                # Compute PLV matrix
-                plv_matrix = np.zeros((n_channels, n_channels))
-
-                for i in range(n_channels):
-                    for j in range(i + 1, n_channels):
-                        # Phase difference
-                        phase_diff = phases[i, :] - phases[j, :]
+                # Instantaneous phase for all channels
+                filtered = signal.sosfiltfilt(sos, data, axis=1)
+                phases = np.angle(signal.hilbert(filtered, axis=1))
 
-                        # PLV
-                        plv = np.abs(np.mean(np.exp(1j * phase_diff)))
-                        plv_matrix[i, j] = plv
-                        plv_matrix[j, i] = plv
+                plv_matrix = phase_locking_value(phases)
 
                 # Extract network features
                 network_features = await self._extract_network_features(
@@ -5,8 +5,12 @@ preprocessed neural signals.
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import logging
-from typing import Dict, Any
+import threading
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 import time
 
@@ -18,6 +22,87 @@ from .connectivity import ConnectivityFeatures
 
 logger = logging.getLogger(__name__)
 
+# Category name -> coroutine method extracting it
+CATEGORY_METHODS = {
+    "time_domain": "_extract_time_features",
+    "frequency_domain": "_extract_frequency_features",
+    "time_frequency": "_extract_time_frequency_features",
+    "spatial": "_extract_spatial_features",
+    "connectivity": "_extract_connectivity_features",
+}
+
+EXECUTOR_BACKENDS = ("inline", "thread", "process")
+
+# Event loop per executor thread for running category coroutines
+_thread_state = threading.local()
+
+# Extractor owned by each process-pool worker
+_process_extractor: Optional["FeatureExtractor"] = None
+
+
+def _run_category_sync(
+    extractor: "FeatureExtractor",
+    category: str,
+    data: np.ndarray,
+    quality_score: float,
+) -> Tuple[Dict[str, np.ndarray], float]:
+    """Run one category coroutine to completion on this thread.
+
+    Args:
+        extractor: Feature extractor owning the category
+        category: Feature category name
+        data: Signal data (channels x samples)
+        quality_score: Quality score
+
+    Returns:
+        Tuple of (features, elapsed time in ms)
+    """
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+        extractor._register_thread_loop(loop)
+
+    start_time = time.perf_counter()
+    method = getattr(extractor, CATEGORY_METHODS[category])
+    features = loop.run_until_complete(method(data, quality_score))
+    return features, (time.perf_counter() - start_time) * 1000
+
+
+def _init_process_worker(config: Any) -> None:
+    """Create the extractor used by a process-pool worker."""
+    global _process_extractor
+    _process_extractor = FeatureExtractor(config)
+
+
+def _run_category_in_process(
+    category: str,
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    quality_score: float,
+) -> Tuple[Dict[str, np.ndarray], float]:
+    """Run one category in a worker process on shared-memory input.
+
+    Args:
+        category: Feature category name
+        shm_name: Name of the shared memory block holding the window
+        shape: Shape of the window
+        dtype: Data type of the window
+        quality_score: Quality score
+
+    Returns:
+        Tuple of (features, elapsed time in ms)
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        result = _run_category_sync(_process_extractor, category, data, quality_score)
+        del data
+        return result
+    finally:
+        shm.close()
+
 
 class FeatureExtractor:
     """Main feature extraction orchestrator."""
@@ -40,8 +125,23 @@ class FeatureExtractor:
         # Feature selection
         self.enabled_features = set(config.feature_types)
 
+        # Executor backend per category
+        self.default_executor = config.default_feature_executor
+        self.category_executors = dict(config.feature_executors)
+        self.max_workers = config.feature_workers or len(CATEGORY_METHODS)
+        self._thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+        # Event loops of the thread-pool workers, closed on cleanup
+        self._thread_loops: List[asyncio.AbstractEventLoop] = []
+
+        # Guards lazy pool creation and timing statistics; the extractor is
+        # shared by the stream worker threads
+        self._lock = threading.Lock()
+
         # Performance tracking
         self.extraction_times = {}
+        self.category_timings: Dict[str, Dict[str, Any]] = {}
 
         logger.info(
             f"FeatureExtractor initialized with features: {self.enabled_features}"
@@ -68,27 +168,23 @@ class FeatureExtractor:
             Dictionary of feature_name -> feature_array
         """
         features = {}
+        shm = None
 
         try:
-            # Parallel feature extraction for efficiency
-            tasks = []
-
-            if "time_domain" in self.enabled_features:
-                tasks.append(self._extract_time_features(data, quality_score))
-
-            if "frequency_domain" in self.enabled_features:
-                tasks.append(self._extract_frequency_features(data, quality_score))
+            categories = [c for c in CATEGORY_METHODS if c in self.enabled_features]
 
-            if "time_frequency" in self.enabled_features:
-                tasks.append(self._extract_time_frequency_features(data, quality_score))
+            # Share the window once with all process-pool categories
+            if any(self.get_executor(c) == "process" for c in categories):
+                data = np.ascontiguousarray(data)
+                shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+                np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
 
-            if "spatial" in self.enabled_features:
-                tasks.append(self._extract_spatial_features(data, quality_score))
+            # Categories run concurrently on their executor backends
+            tasks = [
+                self._run_category(category, data, quality_score, shm)
+                for category in categories
+            ]
 
-            if "connectivity" in self.enabled_features:
-                tasks.append(self._extract_connectivity_features(data, quality_score))
-
-            # Execute all feature extractions in parallel
             if tasks:
                 results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -115,6 +211,130 @@ class FeatureExtractor:
             logger.error(f"Error in feature extraction: {str(e)}")
             return features
 
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def get_executor(self, category: str) -> str:
+        """Get the executor backend used for a feature category.
+
+        Args:
+            category: Feature category name
+
+        Returns:
+            'inline', 'thread' or 'process'
+        """
+        return self.category_executors.get(category, self.default_executor)
+
+    async def _run_category(
+        self,
+        category: str,
+        data: np.ndarray,
+        quality_score: float,
+        shm: Optional[shared_memory.SharedMemory],
+    ) -> Dict[str, np.ndarray]:
+        """Extract one feature category on its executor backend.
+
+        Args:
+            category: Feature category name
+            data: Signal data
+            quality_score: Quality score
+            shm: Shared memory holding the data for process-pool categories
+
+        Returns:
+            Dictionary of features for the category
+        """
+        backend = self.get_executor(category)
+        loop = asyncio.get_running_loop()
+
+        if backend == "thread":
+            features, elapsed_ms = await loop.run_in_executor(
+                self._get_thread_pool(),
+                _run_category_sync,
+                self,
+                category,
+                data,
+                quality_score,
+            )
+        elif backend == "process":
+            features, elapsed_ms = await loop.run_in_executor(
+                self._get_process_pool(),
+                _run_category_in_process,
+                category,
+                shm.name,
+                data.shape,
+                data.dtype.str,
+                quality_score,
+            )
+        else:
+            start_time = time.perf_counter()
+            features = await getattr(self, CATEGORY_METHODS[category])(
+                data, quality_score
+            )
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        self._record_timing(category, backend, elapsed_ms)
+        return features
+
+    def _get_thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use."""
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="features"
+                )
+            return self._thread_pool
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_process_worker,
+                    initargs=(self.config,),
+                )
+            return self._process_pool
+
+    def _register_thread_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Track the event loop created by a thread-pool worker."""
+        with self._lock:
+            self._thread_loops.append(loop)
+
+    def _record_timing(self, category: str, backend: str, elapsed_ms: float) -> None:
+        """Update per-category timing statistics.
+
+        Args:
+            category: Feature category name
+            backend: Executor backend used
+            elapsed_ms: Time spent extracting the category
+        """
+        with self._lock:
+            self.extraction_times[category] = elapsed_ms
+
+            stats = self.category_timings.setdefault(
+                category, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["backend"] = backend
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["last_ms"] = elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["avg_ms"] = stats["total_ms"] / stats["count"]
+
+    def get_category_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-category extraction timing statistics.
+
+        Returns:
+            Dictionary of category -> timing statistics in ms
+        """
+        with self._lock:
+            return {
+                category: dict(stats)
+                for category, stats in self.category_timings.items()
+            }
+
     async def _extract_time_features(
         self, data: np.ndarray, quality_score: float
     ) -> Dict[str, np.ndarray]:
@@ -348,6 +568,10 @@ class FeatureExtractor:
                 "connectivity",
             ],
             "extraction_times_ms": self.extraction_times,
+            "category_timings_ms": self.get_category_timings(),
+            "executors": {
+                category: self.get_executor(category) for category in CATEGORY_METHODS
+            },
             "feature_descriptions": {
                 "time_domain": "Statistical, complexity, amplitude, and temporal features",
                 "frequency_domain": "Power spectral density, spectral entropy, phase features",
@@ -369,6 +593,15 @@ class FeatureExtractor:
             self.enabled_features = set(params["feature_types"])
             logger.info(f"Updated enabled features: {self.enabled_features}")
 
+        if "feature_executors" in params:
+            for category, backend in params["feature_executors"].items():
+                if backend in EXECUTOR_BACKENDS:
+                    self.category_executors[category] = backend
+                else:
+                    logger.warning(
+                        f"Unknown executor '{backend}' for {category}, ignoring"
+                    )
+
         # Update component configurations
         self.time_domain.update_config(params)
         self.frequency_domain.update_config(params)
@@ -381,7 +614,27 @@ class FeatureExtractor:
         # Cleanup components
         await self.connectivity.cleanup()
 
-        # Clear timing data
-        self.extraction_times.clear()
+        with self._lock:
+            thread_pool, self._thread_pool = self._thread_pool, None
+            process_pool, self._process_pool = self._process_pool, None
+
+            # Clear timing data
+            self.extraction_times.clear()
+            self.category_timings.clear()
+
+        # Shut down executor pools; worker processes take their loops with them
+        if process_pool is not None:
+            process_pool.shutdown(wait=False, cancel_futures=True)
+        if thread_pool is not None:
+            # Running categories must finish before their loops are closed
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(thread_pool.shutdown, wait=True, cancel_futures=True),
+            )
+
+        with self._lock:
+            thread_loops, self._thread_loops = self._thread_loops, []
+        for loop in thread_loops:
+            loop.close()
 
         logger.info("Feature extractor cleanup complete")
@@ -8,9 +8,11 @@ import logging
 from typing import Dict, Any, Optional, Tuple
 import numpy as np
 from scipy import signal
-from scipy.integrate import simps
+from scipy.integrate import simpson
 import warnings
 
+from .cross_spectrum import compute_cross_spectrum, phase_locking_value
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,14 +99,14 @@ class FrequencyDomainFeatures:
                 psd = psd[freq_mask]
 
                 # Total power
-                total_power = simps(psd, freqs)
+                total_power = simpson(psd, x=freqs)
                 features["total_power"][ch] = total_power
 
                 # Band powers
                 for band_name, (low_freq, high_freq) in freq_bands.items():
                     band_mask = (freqs >= low_freq) & (freqs <= high_freq)
                     if np.any(band_mask):
-                        band_power = simps(psd[band_mask], freqs[band_mask])
+                        band_power = simpson(psd[band_mask], x=freqs[band_mask])
                         features[f"{band_name}_power"][ch] = band_power
 
                         # Relative power
@@ -241,28 +243,18 @@ class FrequencyDomainFeatures:
                 logger.warning("Need at least 2 channels for coherence computation")
                 return features
 
-            # Compute pairwise coherence for each band
+            # One cross-spectral tensor serves every pair and band
+            spectrum = compute_cross_spectrum(
+                data,
+                self.sampling_rate,
+                nperseg=self.nperseg,
+                noverlap=self.noverlap,
+                window="hann",
+            )
+            coherence = spectrum.coherence()
+
             for band_name, (low_freq, high_freq) in freq_bands.items():
-                coherence_matrix = np.zeros((n_channels, n_channels))
-
-                for i in range(n_channels):
-                    for j in range(i + 1, n_channels):
-                        # Compute coherence
-                        freqs, coh = signal.coherence(
-                            data[i, :],
-                            data[j, :],
-                            fs=self.sampling_rate,
-                            window="hann",
-                            nperseg=self.nperseg,
-                            noverlap=self.noverlap,
-                        )
-
-                        # Average coherence in band
-                        band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                        if np.any(band_mask):
-                            band_coherence = np.mean(coh[band_mask])
-                            coherence_matrix[i, j] = band_coherence
-                            coherence_matrix[j, i] = band_coherence
+                coherence_matrix = spectrum.band_average(coherence, low_freq, high_freq)
 
                 # Extract features from coherence matrix
                 # Mean coherence
@@ -408,17 +400,7 @@ class FrequencyDomainFeatures:
         phase = np.angle(analytic_signal)
 
         # Phase locking value (PLV)
-        plv_matrix = np.zeros((n_channels, n_channels))
-
-        for i in range(n_channels):
-            for j in range(i + 1, n_channels):
-                # Phase difference
-                phase_diff = phase[i, :] - phase[j, :]
-
-                # PLV
-                plv = np.abs(np.mean(np.exp(1j * phase_diff)))
-                plv_matrix[i, j] = plv
-                plv_matrix[j, i] = plv
+        plv_matrix = phase_locking_value(phase)
 
         # Extract features from PLV matrix
         upper_triangle = plv_matrix[np.triu_indices(n_channels, k=1)]
@@ -10,6 +10,8 @@ import numpy as np
 from scipy import stats, signal
 import warnings
 
+from common.entropy import sample_entropy, approximate_entropy
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,8 +110,7 @@ class TimeDomainFeatures:
                 features.update(hjorth_features)
 
             # Sample entropy
-            sample_entropy = await self._compute_sample_entropy(data)
-            features["sample_entropy"] = sample_entropy
+            features["sample_entropy"] = await self._compute_sample_entropy(data)
 
             # Approximate entropy
             approx_entropy = await self._compute_approximate_entropy(data)
@@ -269,7 +270,7 @@ class TimeDomainFeatures:
     async def _compute_sample_entropy(
         self, data: np.ndarray, m: int = 2, r: float = 0.2
     ) -> np.ndarray:
-        """Compute sample entropy for each channel.
+        """Compute sample entropy for each channel over the full window.
 
         Args:
             data: Signal data (channels x samples)
@@ -279,50 +280,12 @@ class TimeDomainFeatures:
         Returns:
             Sample entropy values
         """
-        n_channels = data.shape[0]
-        sample_entropy = np.zeros(n_channels)
-
-        for ch in range(n_channels):
-            ch_data = data[ch, :]
-            N = len(ch_data)
-
-            # Tolerance based on standard deviation
-            tolerance = r * np.std(ch_data)
-
-            # Count patterns of length m
-            B = 0  # matches for length m
-            A = 0  # matches for length m+1
-
-            # Limit computation for efficiency
-            max_patterns = min(N - m, 100)
-
-            for i in range(max_patterns):
-                # Pattern of length m
-                pattern_m = ch_data[i : i + m]
-
-                # Count matches for length m
-                for j in range(max_patterns):
-                    if i != j:
-                        if np.max(np.abs(ch_data[j : j + m] - pattern_m)) <= tolerance:
-                            B += 1
-
-                            # Check m+1 if within bounds
-                            if i + m < N and j + m < N:
-                                if np.abs(ch_data[i + m] - ch_data[j + m]) <= tolerance:
-                                    A += 1
-
-            # Calculate sample entropy
-            if B > 0:
-                sample_entropy[ch] = -np.log((A + 1) / (B + 1))
-            else:
-                sample_entropy[ch] = -np.log(1 / max_patterns)
-
-        return sample_entropy
+        return sample_entropy(data, m=m, r=r)
 
     async def _compute_approximate_entropy(
         self, data: np.ndarray, m: int = 2, r: float = 0.2
     ) -> np.ndarray:
-        """Compute approximate entropy for each channel.
+        """Compute approximate entropy for each channel over the full window.
 
         Args:
             data: Signal data (channels x samples)
@@ -332,37 +295,7 @@ class TimeDomainFeatures:
         Returns:
             Approximate entropy values
         """
-        n_channels = data.shape[0]
-        approx_entropy = np.zeros(n_channels)
-
-        for ch in range(n_channels):
-            ch_data = data[ch, :]
-            N = len(ch_data)
-
-            # Tolerance based on standard deviation
-            tolerance = r * np.std(ch_data)
-
-            def _count_patterns(data, m, tolerance):
-                """Count matching patterns."""
-                patterns = np.array([data[i : i + m] for i in range(N - m + 1)])
-                count = 0
-
-                for i in range(len(patterns)):
-                    template = patterns[i]
-                    matches = np.sum(
-                        np.max(np.abs(patterns - template), axis=1) <= tolerance
-                    )
-                    count += np.log(matches / (N - m + 1))
-
-                return count / (N - m + 1)
-
-            # Compute for m and m+1
-            phi_m = _count_patterns(ch_data, m, tolerance)
-            phi_m1 = _count_patterns(ch_data, m + 1, tolerance)
-
-            approx_entropy[ch] = phi_m - phi_m1
-
-        return approx_entropy
+        return approximate_entropy(data, m=m, r=r)
 
     async def _compute_hurst_exponent(self, data: np.ndarray) -> np.ndarray:
         """Compute Hurst exponent using R / S analysis.
@@ -2,6 +2,8 @@
 
 This module implements continuous wavelet transform, discrete wavelet transform,
 Morlet wavelets, and Hilbert-Huang transform for time-frequency feature extraction.
+Morlet, coupling and Stockwell features share one batched wavelet transform per
+window (see ``wavelet_bank``).
 """
 
 import logging
@@ -11,6 +13,8 @@ from scipy import signal
 import pywt
 import warnings
 
+from .wavelet_bank import TimeFrequencyTensor, compute_wavelet_transform
+
 logger = logging.getLogger(__name__)
 
 
@@ -127,38 +131,25 @@ class TimeFrequencyFeatures:
         features = {}
 
         try:
-            n_channels = data.shape[0]
-
-            for freq in frequencies:
-                # Initialize feature arrays for this frequency
-                features[f"morlet_{freq}hz_power"] = np.zeros(n_channels)
-                features[f"morlet_{freq}hz_phase_consistency"] = np.zeros(n_channels)
-                features[f"morlet_{freq}hz_amplitude_std"] = np.zeros(n_channels)
-
-                for ch in range(n_channels):
-                    # Compute Morlet wavelet transform
-                    scales = self._freq_to_scale(freq, self.cwt_wavelet)
-                    cwt_coeffs = signal.cwt(
-                        data[ch, :], signal.morlet2, [scales], w=self.morlet_width
-                    )
-
-                    # Extract amplitude and phase
-                    amplitude = np.abs(cwt_coeffs[0, :])
-                    phase = np.angle(cwt_coeffs[0, :])
-
-                    # Compute features
-                    features[f"morlet_{freq}hz_power"][ch] = np.mean(amplitude**2)
-                    features[f"morlet_{freq}hz_amplitude_std"][ch] = np.std(amplitude)
+            # All channels and frequencies in one batched transform
+            tf = compute_wavelet_transform(
+                data, self.sampling_rate, frequencies, omega0=self.morlet_width
+            )
+            amplitude = tf.amplitude
+            power = tf.power()
+            amplitude_std = np.std(amplitude, axis=-1)
+            phase_consistency = tf.phase_consistency()
 
-                    # Phase consistency (mean resultant length)
-                    features[f"morlet_{freq}hz_phase_consistency"][ch] = np.abs(
-                        np.mean(np.exp(1j * phase))
-                    )
+            for i, freq in enumerate(frequencies):
+                features[f"morlet_{freq}hz_power"] = power[:, i]
+                # Phase consistency (mean resultant length)
+                features[f"morlet_{freq}hz_phase_consistency"] = phase_consistency[:, i]
+                features[f"morlet_{freq}hz_amplitude_std"] = amplitude_std[:, i]
 
             # Cross-frequency coupling features
             if len(frequencies) >= 2:
                 cfc_features = await self._compute_cross_frequency_coupling(
-                    data, frequencies
+                    tf, frequencies
                 )
                 features.update(cfc_features)
 
@@ -258,31 +249,31 @@ class TimeFrequencyFeatures:
                 features[f"stockwell_{band_name}_power"] = np.zeros(n_channels)
                 features[f"stockwell_{band_name}_complexity"] = np.zeros(n_channels)
 
-            for ch in range(n_channels):
-                # Compute S-transform
-                st_matrix = await self._stockwell_transform(data[ch, :])
-
-                if st_matrix is not None:
-                    freqs = np.fft.fftfreq(data.shape[1], 1 / self.sampling_rate)[
-                        : data.shape[1] // 2
-                    ]
-
-                    # Extract features for each band
-                    for band_name, (low_freq, high_freq) in freq_bands.items():
-                        band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                        if np.any(band_mask):
-                            band_st = st_matrix[band_mask, :]
-
-                            # Average power in band
-                            features[f"stockwell_{band_name}_power"][ch] = np.mean(
-                                np.abs(band_st) ** 2
-                            )
-
-                            # Time-frequency complexity (entropy)
-                            tf_entropy = await self._compute_tf_entropy(np.abs(band_st))
-                            features[f"stockwell_{band_name}_complexity"][
-                                ch
-                            ] = tf_entropy
+            # Compute S-transform of all channels at once, within the bands
+            st = await self._stockwell_transform(
+                data,
+                min(low for low, _ in freq_bands.values()),
+                max(high for _, high in freq_bands.values()),
+            )
+
+            if st is not None:
+                st_power = st.coefficients.real**2 + st.coefficients.imag**2
+
+                # Extract features for each band
+                for band_name, (low_freq, high_freq) in freq_bands.items():
+                    band_mask = st.band_mask(low_freq, high_freq)
+                    if np.any(band_mask):
+                        band_power = st_power[:, band_mask, :]
+
+                        # Average power in band
+                        features[f"stockwell_{band_name}_power"] = np.mean(
+                            band_power, axis=(1, 2)
+                        )
+
+                        # Time-frequency complexity (entropy)
+                        features[f"stockwell_{band_name}_complexity"] = (
+                            self._tf_entropy(band_power)
+                        )
 
             return features
 
@@ -417,78 +408,35 @@ class TimeFrequencyFeatures:
         return features
 
     async def _compute_cross_frequency_coupling(
-        self, data: np.ndarray, frequencies: List[float]
+        self, tf: TimeFrequencyTensor, frequencies: List[float]
     ) -> Dict[str, np.ndarray]:
         """Compute cross-frequency coupling features.
 
+        Phase and amplitude are taken from the Morlet coefficients of the
+        lower and higher frequency of each pair.
+
         Args:
-            data: Signal data (channels x samples)
+            tf: Morlet coefficients of the window at frequencies
             frequencies: List of frequencies
 
         Returns:
             Dictionary of CFC features
         """
         features = {}
-        n_channels = data.shape[0]
 
         # Phase-amplitude coupling between frequency pairs
-        freq_pairs = [
-            (frequencies[i], frequencies[j])
+        index_pairs = [
+            (i, j)
             for i in range(len(frequencies))
             for j in range(i + 1, len(frequencies))
         ]
 
-        for low_freq, high_freq in freq_pairs[:3]:  # Limit to first 3 pairs
-            pac_values = np.zeros(n_channels)
-
-            for ch in range(n_channels):
-                # Extract phase of low frequency
-                low_sos = signal.butter(
-                    4,
-                    [low_freq - 1, low_freq + 1],
-                    btype="band",
-                    fs=self.sampling_rate,
-                    output="sos",
-                )
-                low_filtered = signal.sosfiltfilt(low_sos, data[ch, :])
-                low_phase = np.angle(signal.hilbert(low_filtered))
-
-                # Extract amplitude of high frequency
-                high_sos = signal.butter(
-                    4,
-                    [high_freq - 2, high_freq + 2],
-                    btype="band",
-                    fs=self.sampling_rate,
-                    output="sos",
-                )
-                high_filtered = signal.sosfiltfilt(high_sos, data[ch, :])
-                high_amp = np.abs(signal.hilbert(high_filtered))
-
-                # Compute PAC using mean vector length
-                n_bins = 18
-                phase_bins = np.linspace(-np.pi, np.pi, n_bins + 1)
-
-                amp_by_phase = []
-                for i in range(n_bins):
-                    mask = (low_phase >= phase_bins[i]) & (
-                        low_phase < phase_bins[i + 1]
-                    )
-                    if np.any(mask):
-                        amp_by_phase.append(np.mean(high_amp[mask]))
-                    else:
-                        amp_by_phase.append(0)
-
-                # Normalize and compute PAC
-                amp_by_phase = np.array(amp_by_phase)
-                if np.std(amp_by_phase) > 0:
-                    pac_values[ch] = np.abs(
-                        np.mean(
-                            amp_by_phase
-                            * np.exp(1j * (phase_bins[:-1] + np.diff(phase_bins) / 2))
-                        )
-                    ) / np.mean(amp_by_phase)
-
-            features[f"pac_{int(low_freq)}_{int(high_freq)}hz"] = pac_values
+        for i, j in index_pairs[:3]:  # Limit to first 3 pairs
+            low_freq, high_freq = frequencies[i], frequencies[j]
+            # Compute PAC using mean vector length
+            features[f"pac_{int(low_freq)}_{int(high_freq)}hz"] = (
+                tf.phase_amplitude_coupling(i, j, n_bins=18)
+            )
 
         return features
 
@@ -566,70 +514,56 @@ class TimeFrequencyFeatures:
         return features
 
     async def _stockwell_transform(
-        self, signal_data: np.ndarray
-    ) -> Optional[np.ndarray]:
-        """Compute S-transform of a signal.
+        self,
+        data: np.ndarray,
+        low_freq: float = 0.0,
+        high_freq: Optional[float] = None,
+    ) -> Optional[TimeFrequencyTensor]:
+        """Compute S-transform of all channels.
+
+        The S-transform's Gaussian window at frequency f has a standard
+        deviation of f / (2 pi) in frequency, so its magnitude equals a unit-gain
+        Morlet transform with omega0 = 2 pi at the positive FFT frequencies.
 
         Args:
-            signal_data: 1D signal data
+            data: Signal data (channels x samples)
+            low_freq: Lowest frequency computed (Hz)
+            high_freq: Highest frequency computed (Hz, Nyquist if None)
 
         Returns:
-            S-transform matrix or None
+            S-transform coefficients (channels x frequencies x samples) or None
         """
         try:
-            n = len(signal_data)
-
-            # FFT of signal
-            fft_signal = np.fft.fft(signal_data)
-
-            # Initialize S-transform matrix
-            st_matrix = np.zeros((n // 2, n), dtype=complex)
-
-            # Compute S-transform for each frequency
-            for k in range(1, n // 2):  # Skip DC
-                # Gaussian window width
-                sigma = k / (2 * np.pi)
-
-                # Generate Gaussian window
-                gaussian = np.exp(-0.5 * (np.arange(n) - n // 2) ** 2 / sigma**2)
-                gaussian = np.roll(gaussian, n // 2)
+            n = data.shape[-1]
 
-                # Apply window in frequency domain
-                windowed_fft = fft_signal * np.fft.fft(gaussian)
+            # Positive FFT frequencies in range, skipping DC
+            freqs = np.arange(1, n // 2) * self.sampling_rate / n
+            freqs = freqs[freqs >= low_freq]
+            if high_freq is not None:
+                freqs = freqs[freqs <= high_freq]
 
-                # Inverse FFT to get S-transform
-                st_matrix[k, :] = np.fft.ifft(windowed_fft)
-
-            return st_matrix
+            return compute_wavelet_transform(
+                data, self.sampling_rate, freqs, omega0=2 * np.pi, unit_gain=True
+            )
 
         except Exception as e:
             logger.error(f"Error in S-transform: {str(e)}")
             return None
 
-    async def _compute_tf_entropy(self, tf_matrix: np.ndarray) -> float:
-        """Compute time-frequency entropy.
+    def _tf_entropy(self, tf_power: np.ndarray) -> np.ndarray:
+        """Compute time-frequency entropy of each channel.
 
         Args:
-            tf_matrix: Time-frequency representation
+            tf_power: Time-frequency power (channels x frequencies x samples)
 
         Returns:
-            TF entropy value
+            TF entropy per channel
         """
-        # Normalize to probability distribution
-        tf_power = np.abs(tf_matrix) ** 2
-        total_power = np.sum(tf_power)
-
-        if total_power == 0:
-            return 0
-
-        p = tf_power / total_power
-        p = p.flatten()
-        p = p[p > 0]
-
-        # Compute entropy
-        entropy = -np.sum(p * np.log(p))
-
-        return entropy
+        p = tf_power.reshape(tf_power.shape[0], -1)
+        total_power = p.sum(axis=1, keepdims=True)
+        p = np.divide(p, total_power, out=np.zeros_like(p), where=total_power > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -np.sum(np.where(p > 0, p * np.log(p), 0.0), axis=1)
 
     def _freq_to_scale(self, freq: float, wavelet: str) -> float:
         """Convert frequency to wavelet scale.
@@ -5,17 +5,21 @@ and spatial filtering capabilities for neural signals.
 """
 
 from .preprocessing_pipeline import PreprocessingPipeline
-from .artifact_removal import ArtifactRemover
-from .filtering import AdvancedFilters
+from .artifact_removal import ArtifactRemover, SessionICA
+from .filtering import AdvancedFilters, StreamingFilterBank
 from .channel_repair import ChannelRepair
 from .spatial_filtering import SpatialFilters
+from .spherical_spline import SplineMatrixCache
 from .quality_assessment import QualityAssessment
 
 __all__ = [
     "PreprocessingPipeline",
     "ArtifactRemover",
+    "SessionICA",
     "AdvancedFilters",
+    "StreamingFilterBank",
     "ChannelRepair",
     "SpatialFilters",
+    "SplineMatrixCache",
     "QualityAssessment",
 ]
@@ -1,13 +1,21 @@
 """Artifact Removal - EOG, EMG, and motion artifact detection and removal.
 
 This module implements various artifact removal techniques including
-Independent Component Analysis (ICA) and regression-based methods.
+Independent Component Analysis (ICA) and regression-based methods. For live
+streams, ``SessionICA`` fits the decomposition once per session and cleans
+each window with a single cached projection; ``ArtifactRemover`` keeps one
+per session id.
 """
 
+import asyncio
+import concurrent.futures
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import numpy as np
 from scipy import signal, stats
+from scipy.optimize import linear_sum_assignment
 from sklearn.decomposition import FastICA
 from sklearn.linear_model import LinearRegression
 import warnings
@@ -15,6 +23,303 @@ import warnings
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ICAModel:
+    """A fitted session ICA decomposition and its cleaning projection."""
+
+    unmixing: np.ndarray  # components x channels (includes whitening)
+    mixing: np.ndarray  # channels x components
+    mean: np.ndarray  # channels
+    artifact_components: List[int] = field(default_factory=list)
+    variance_explained: float = 0.0
+    version: int = 0
+    projection: np.ndarray = field(init=False, repr=False)
+    offset: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the projection applied to every window."""
+        n_channels = self.mixing.shape[0]
+        art = self.artifact_components
+        # x_clean = x - A[:, art] @ W[art] @ (x - mean) = P @ x + (I - P) @ mean
+        self.projection = np.eye(n_channels) - self.mixing[:, art] @ self.unmixing[art]
+        self.offset = (self.mean - self.projection @ self.mean)[:, np.newaxis]
+
+
+class SessionICA:
+    """ICA artifact removal fitted once per session and applied per window.
+
+    Windows are appended to a rolling buffer. Once ``calibration_samples``
+    are buffered (or ``fit`` is called on a calibration segment), FastICA is
+    fitted and the artifact components are folded into one
+    ``channels x channels`` projection, so cleaning a window is a single
+    matrix multiply. Every ``refit_interval_samples`` the model is refitted
+    on the buffer in a background thread while windows keep being cleaned
+    with the previous model. Refitted components are matched to the previous
+    ones by their spatial maps and sign-aligned, so component indices stay
+    stable across refits.
+
+    Overlapping windows only contribute their new samples to the buffer. The
+    buffer is guarded by a lock because background refits snapshot it while
+    the stream keeps adding windows.
+    """
+
+    def __init__(
+        self,
+        classify_components: Callable[[np.ndarray], List[int]],
+        n_components: Optional[int] = None,
+        calibration_samples: int = 7500,
+        buffer_samples: int = 15000,
+        refit_interval_samples: Optional[int] = 75000,
+        max_iter: int = 500,
+        random_state: int = 42,
+    ):
+        """Initialize session ICA.
+
+        Args:
+            classify_components: Returns artifact component indices for
+                sources (components x samples)
+            n_components: Number of ICA components (min(channels, 20) if None)
+            calibration_samples: Samples buffered before the first fit
+            buffer_samples: Length of the rolling buffer refits use
+            refit_interval_samples: Samples between refits (None to never refit)
+            max_iter: FastICA iteration limit
+            random_state: FastICA seed
+        """
+        self.classify_components = classify_components
+        self.n_components = n_components
+        self.calibration_samples = calibration_samples
+        self.buffer_samples = max(buffer_samples, calibration_samples)
+        self.refit_interval_samples = refit_interval_samples
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+        self.model: Optional[ICAModel] = None
+        self._buffer: Optional[np.ndarray] = None
+        self._buffered = 0
+        self._write_pos = 0
+        self._samples_since_fit = 0
+        self._fit_lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
+        self._refit_task: Optional[asyncio.Future] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether a model is available for cleaning."""
+        return self.model is not None
+
+    def add(self, data: np.ndarray, new_samples: Optional[int] = None) -> None:
+        """Append the new samples of a window to the rolling buffer.
+
+        Args:
+            data: Signal data (channels x samples)
+            new_samples: Number of trailing samples not in a previous window
+                (all samples if None)
+        """
+        n_channels, n_samples = data.shape
+        if new_samples is not None:
+            n_samples = max(0, min(new_samples, n_samples))
+            data = data[:, data.shape[1] - n_samples :]
+
+        with self._buffer_lock:
+            if self._buffer is None or self._buffer.shape[0] != n_channels:
+                # Keep a model calibrated on a segment with the same channels
+                model = self.model
+                if model is not None and model.projection.shape[0] != n_channels:
+                    logger.warning(
+                        f"Channel count changed to {n_channels}, discarding ICA model"
+                    )
+                    self.model = None
+                    self._samples_since_fit = 0
+                self._buffer = np.empty((n_channels, self.buffer_samples))
+                self._buffered = 0
+                self._write_pos = 0
+
+            # Only the newest buffer_samples can be kept
+            data = data[:, max(0, n_samples - self.buffer_samples) :]
+            n_new = data.shape[1]
+            end = self._write_pos + n_new
+            if end <= self.buffer_samples:
+                self._buffer[:, self._write_pos : end] = data
+            else:
+                split = self.buffer_samples - self._write_pos
+                self._buffer[:, self._write_pos :] = data[:, :split]
+                self._buffer[:, : n_new - split] = data[:, split:]
+            self._write_pos = end % self.buffer_samples
+            self._buffered = min(self._buffered + n_new, self.buffer_samples)
+            self._samples_since_fit += n_samples
+
+    def buffered(self) -> np.ndarray:
+        """Buffered samples in chronological order (channels x samples)."""
+        with self._buffer_lock:
+            if self._buffer is None:
+                return np.empty((0, 0))
+            if self._buffered < self.buffer_samples:
+                return self._buffer[:, : self._buffered].copy()
+            return np.roll(self._buffer, -self._write_pos, axis=1)
+
+    def needs_fit(self) -> bool:
+        """Whether enough data arrived for a first fit or a refit."""
+        if self.model is None:
+            return self._buffered >= self.calibration_samples
+        return (
+            self.refit_interval_samples is not None
+            and self._samples_since_fit >= self.refit_interval_samples
+        )
+
+    def fit(
+        self, data: np.ndarray, artifact_components: Optional[List[int]] = None
+    ) -> ICAModel:
+        """Fit the model on a segment and install it.
+
+        Args:
+            data: Calibration segment (channels x samples)
+            artifact_components: Components to remove (classified if None)
+
+        Returns:
+            The fitted model
+        """
+        with self._fit_lock:
+            n_components = self.n_components or min(data.shape[0], 20)
+            ica = FastICA(
+                n_components=n_components,
+                algorithm="parallel",
+                whiten="unit-variance",
+                max_iter=self.max_iter,
+                random_state=self.random_state,
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                sources = ica.fit_transform(data.T).T
+
+            unmixing = ica.components_
+            mixing = ica.mixing_
+            previous = self.model
+            if previous is not None and previous.mixing.shape == mixing.shape:
+                order, signs = self._match_components(previous.mixing, mixing)
+                unmixing = unmixing[order] * signs[:, np.newaxis]
+                mixing = mixing[:, order] * signs
+                sources = sources[order] * signs[:, np.newaxis]
+
+            if artifact_components is None:
+                artifact_components = self.classify_components(sources)
+
+            variance_explained = 0.0
+            if artifact_components:
+                variances = np.var(sources, axis=1)
+                variance_explained = float(
+                    variances[artifact_components].sum() / variances.sum()
+                )
+
+            model = ICAModel(
+                unmixing=unmixing,
+                mixing=mixing,
+                mean=ica.mean_,
+                artifact_components=list(artifact_components),
+                variance_explained=variance_explained,
+                version=previous.version + 1 if previous is not None else 1,
+            )
+            # A single attribute swap, so concurrent apply() sees either model
+            self.model = model
+            with self._buffer_lock:
+                self._samples_since_fit = 0
+
+        logger.info(
+            f"Session ICA fitted (version {model.version}): removing "
+            f"{len(model.artifact_components)} components, "
+            f"variance explained: {model.variance_explained:.2%}"
+        )
+        return model
+
+    @staticmethod
+    def _match_components(
+        reference: np.ndarray, mixing: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Match refitted components to the previous ones.
+
+        Args:
+            reference: Previous mixing matrix (channels x components)
+            mixing: Refitted mixing matrix (channels x components)
+
+        Returns:
+            Tuple of (order, signs): refitted component order[i] and its sign
+            correspond to previous component i
+        """
+        ref = reference / np.linalg.norm(reference, axis=0)
+        new = mixing / np.linalg.norm(mixing, axis=0)
+        similarity = ref.T @ new
+        rows, cols = linear_sum_assignment(-np.abs(similarity))
+        order = cols[np.argsort(rows)]
+        signs = np.sign(similarity[np.arange(len(order)), order])
+        signs[signs == 0] = 1.0
+        return order, signs
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Clean a window with the current model.
+
+        Args:
+            data: Signal data (channels x samples)
+
+        Returns:
+            Cleaned data (the input if no model is fitted yet)
+        """
+        model = self.model
+        if model is None or model.projection.shape[0] != data.shape[0]:
+            return data
+        return model.projection @ data + model.offset
+
+    async def refit_async(self) -> None:
+        """Refit on the buffered data in a background thread.
+
+        Returns immediately if a refit is already running.
+        """
+        if self._refit_task is not None and not self._refit_task.done():
+            return
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="session-ica"
+            )
+        snapshot = self.buffered()
+        with self._buffer_lock:
+            self._samples_since_fit = 0
+        loop = asyncio.get_running_loop()
+        self._refit_task = loop.run_in_executor(self._executor, self.fit, snapshot)
+        self._refit_task.add_done_callback(self._log_refit_error)
+
+    @staticmethod
+    def _log_refit_error(task: asyncio.Future) -> None:
+        """Log a failed background refit."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error refitting session ICA: {task.exception()}")
+
+    async def wait_for_refit(self) -> None:
+        """Wait for a running background refit to finish."""
+        if self._refit_task is not None:
+            await asyncio.gather(self._refit_task, return_exceptions=True)
+
+    def reset(self) -> None:
+        """Discard the model and the buffered data."""
+        with self._buffer_lock:
+            self._reset_locked()
+
+    def _reset_locked(self) -> None:
+        """Discard the model and the buffered data, holding the buffer lock."""
+        self.model = None
+        self._buffer = None
+        self._buffered = 0
+        self._write_pos = 0
+        self._samples_since_fit = 0
+
+    def close(self) -> None:
+        """Discard all state and stop the refit thread."""
+        self.reset()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._refit_task = None
+
+
 class ArtifactRemover:
     """Artifact detection and removal for neural signals."""
 
@@ -31,6 +336,10 @@ class ArtifactRemover:
         self.mixing_matrix = None
         self.unmixing_matrix = None
 
+        # Session ICA models by session id (None for callers without one)
+        self.session_icas: Dict[Optional[str], SessionICA] = {}
+        self._session_ica_lock = threading.Lock()
+
         # Artifact detection thresholds
         self.eog_threshold = 100.0  # microvolts
         self.emg_threshold = 50.0  # microvolts RMS in high frequencies
@@ -49,12 +358,64 @@ class ArtifactRemover:
             self.ica_model = FastICA(
                 n_components=self.config.ica_components,
                 algorithm="parallel",
-                whiten=True,
+                whiten="unit-variance",
                 max_iter=500,
                 random_state=42,
             )
         logger.info("Artifact remover initialization complete")
 
+    def get_session_ica(self, session_id: Optional[str] = None) -> SessionICA:
+        """Get the session ICA model of a session, creating it if needed.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The session's SessionICA
+        """
+        with self._session_ica_lock:
+            session_ica = self.session_icas.get(session_id)
+            if session_ica is None:
+                session_ica = self._create_session_ica()
+                self.session_icas[session_id] = session_ica
+            return session_ica
+
+    def release_session_ica(self, session_id: Optional[str]) -> bool:
+        """Discard the session ICA model of a finished session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session had a model
+        """
+        with self._session_ica_lock:
+            session_ica = self.session_icas.pop(session_id, None)
+        if session_ica is None:
+            return False
+        session_ica.close()
+        return True
+
+    def _close_session_icas(self) -> None:
+        """Discard the session ICA models of all sessions."""
+        with self._session_ica_lock:
+            session_icas = list(self.session_icas.values())
+            self.session_icas.clear()
+        for session_ica in session_icas:
+            session_ica.close()
+
+    def _create_session_ica(self) -> SessionICA:
+        """Create the session ICA model from the configuration."""
+        fs = self.config.sampling_rate
+        refit_s = self.config.ica_refit_interval_s
+        return SessionICA(
+            classify_components=self._classify_components,
+            n_components=self.config.ica_components,
+            calibration_samples=int(self.config.ica_calibration_s * fs),
+            buffer_samples=int(self.config.ica_buffer_s * fs),
+            refit_interval_samples=int(refit_s * fs) if refit_s else None,
+        )
+
     async def detect_eog_artifacts(
         self, eeg_data: np.ndarray, eog_channels: Optional[List[int]] = None
     ) -> Dict[str, Any]:
@@ -230,7 +591,7 @@ class ArtifactRemover:
                 self.ica_model = FastICA(
                     n_components=n_components or min(data.shape[0], 20),
                     algorithm="parallel",
-                    whiten=True,
+                    whiten="unit-variance",
                     max_iter=500,
                     random_state=42,
                 )
@@ -241,7 +602,7 @@ class ArtifactRemover:
                 sources = self.ica_model.fit_transform(data.T).T
 
             # Store mixing matrices
-            self.mixing_matrix = self.ica_model.mixing_.T
+            self.mixing_matrix = self.ica_model.mixing_
             self.unmixing_matrix = self.ica_model.components_
 
             # Identify artifact components if not provided
@@ -255,8 +616,8 @@ class ArtifactRemover:
             for comp_idx in artifact_components:
                 cleaned_sources[comp_idx, :] = 0
 
-            # Reconstruct signal
-            cleaned_data = self.mixing_matrix @ cleaned_sources
+            # Reconstruct signal (adds back the channel means removed by ICA)
+            cleaned_data = self.ica_model.inverse_transform(cleaned_sources.T).T
 
             # Calculate variance explained by removed components
             if artifact_components:
@@ -280,6 +641,90 @@ class ArtifactRemover:
             # Return original data on error
             return data, ica_info
 
+    async def calibrate_ica(
+        self,
+        data: np.ndarray,
+        artifact_components: Optional[List[int]] = None,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fit a session's ICA model on a calibration segment.
+
+        The fit runs in a worker thread; afterwards every window of the
+        session passed to ``remove_artifacts_session_ica`` is cleaned with
+        this model.
+
+        Args:
+            data: Calibration segment (channels x samples)
+            artifact_components: Indices of components to remove (if known)
+            session_id: Session identifier
+
+        Returns:
+            Dictionary with the fitted model's information
+        """
+        session_ica = self.get_session_ica(session_id)
+
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, session_ica.fit, data, artifact_components)
+        except Exception as e:
+            logger.error(f"Error calibrating session ICA: {str(e)}")
+
+        return self._session_ica_info(session_ica)
+
+    async def remove_artifacts_session_ica(
+        self,
+        data: np.ndarray,
+        session_id: Optional[str] = None,
+        new_samples: Optional[int] = None,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Remove artifacts with the session-level ICA model.
+
+        The window's new samples are added to the session model's rolling
+        buffer and the window is cleaned with the cached projection. Until
+        the model is calibrated (explicitly or from the buffer) windows are
+        returned unchanged; fits and periodic refits run in the background.
+
+        Args:
+            data: Signal data (channels x samples)
+            session_id: Session identifier
+            new_samples: Number of trailing samples not in a previous window
+                of the session (all samples if None)
+
+        Returns:
+            Tuple of (cleaned_data, ica_info)
+        """
+        session_ica = self.get_session_ica(session_id)
+
+        try:
+            session_ica.add(data, new_samples)
+            if session_ica.needs_fit():
+                await session_ica.refit_async()
+            cleaned_data = session_ica.apply(data)
+        except Exception as e:
+            logger.error(f"Error in session ICA artifact removal: {str(e)}")
+            cleaned_data = data
+
+        return cleaned_data, self._session_ica_info(session_ica)
+
+    def _session_ica_info(self, session_ica: SessionICA) -> Dict[str, Any]:
+        """Information on a session ICA model."""
+        model = session_ica.model
+        if model is None:
+            return {
+                "n_components": 0,
+                "removed_components": [],
+                "variance_explained": 0.0,
+                "model_version": 0,
+                "calibrated": False,
+            }
+        return {
+            "n_components": model.unmixing.shape[0],
+            "removed_components": list(model.artifact_components),
+            "variance_explained": model.variance_explained,
+            "model_version": model.version,
+            "calibrated": True,
+        }
+
     async def remove_eog_regression(
         self, eeg_data: np.ndarray, eog_channels: List[int]
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
@@ -353,37 +798,35 @@ class ArtifactRemover:
         Returns:
             List of artifact component indices
         """
-        artifact_components = []
+        return self._classify_components(sources)
 
-        try:
-            for comp_idx in range(sources.shape[0]):
-                component = sources[comp_idx, :]
+    def _classify_components(self, sources: np.ndarray) -> List[int]:
+        """Identify artifact components from their spectra and kurtosis.
 
-                # Check for EOG-like characteristics
-                # 1. High amplitude in low frequencies
-                low_freq_power = await self._calculate_band_power(component, 0.1, 4.0)
-                total_power = np.var(component)
+        All components are filtered together, so this also runs off the event
+        loop during background refits.
 
-                if low_freq_power / total_power > 0.8:  # >80% power in low frequencies
-                    artifact_components.append(comp_idx)
-                    continue
-
-                # 2. Check for EMG-like characteristics
-                # High frequency noise
-                high_freq_power = await self._calculate_band_power(component, 20, 100)
-
-                if (
-                    high_freq_power / total_power > 0.7
-                ):  # >70% power in high frequencies
-                    artifact_components.append(comp_idx)
-                    continue
-
-                # 3. Check for abnormal kurtosis (spiky artifacts)
-                kurt = stats.kurtosis(component)
-                if abs(kurt) > 10:  # Very high kurtosis
-                    artifact_components.append(comp_idx)
+        Args:
+            sources: ICA source signals (components x samples)
 
-            return artifact_components
+        Returns:
+            List of artifact component indices
+        """
+        try:
+            total_power = np.var(sources, axis=1)
+            # >80% power in low frequencies (EOG-like)
+            low_freq_power = np.var(self._bandpass(sources, 0.1, 4.0), axis=1)
+            # >70% power in high frequencies (EMG-like)
+            high_freq_power = np.var(self._bandpass(sources, 20, 100), axis=1)
+            # Very high kurtosis (spiky artifacts)
+            kurt = stats.kurtosis(sources, axis=1)
+
+            is_artifact = (
+                (low_freq_power / total_power > 0.8)
+                | (high_freq_power / total_power > 0.7)
+                | (np.abs(kurt) > 10)
+            )
+            return [int(i) for i in np.flatnonzero(is_artifact)]
 
         except Exception as e:
             logger.error(f"Error identifying artifact components: {str(e)}")
@@ -399,6 +842,21 @@ class ArtifactRemover:
             low_freq: Low cutoff frequency (Hz)
             high_freq: High cutoff frequency (Hz)
 
+        Returns:
+            Filtered signal
+        """
+        return self._bandpass(signal_data, low_freq, high_freq)
+
+    def _bandpass(
+        self, signal_data: np.ndarray, low_freq: float, high_freq: float
+    ) -> np.ndarray:
+        """Apply bandpass filter along the last axis.
+
+        Args:
+            signal_data: Signal data (... x samples)
+            low_freq: Low cutoff frequency (Hz)
+            high_freq: High cutoff frequency (Hz)
+
         Returns:
             Filtered signal
         """
@@ -410,7 +868,7 @@ class ArtifactRemover:
         b, a = signal.butter(4, [low, high], btype="band")
 
         # Apply filter (forward-backward to preserve phase)
-        filtered = signal.filtfilt(b, a, signal_data)
+        filtered = signal.filtfilt(b, a, signal_data, axis=-1)
 
         return filtered
 
@@ -507,6 +965,8 @@ class ArtifactRemover:
             self.config.artifact_methods = params["artifact_methods"]
         if "ica_components" in params:
             self.config.ica_components = params["ica_components"]
+            # Components are fixed per model, so recalibrate
+            self._close_session_icas()
         if "eog_channels" in params:
             self.config.eog_channels = params["eog_channels"]
 
@@ -515,4 +975,5 @@ class ArtifactRemover:
         self.ica_model = None
         self.mixing_matrix = None
         self.unmixing_matrix = None
+        self._close_session_icas()
         logger.info("Artifact remover cleanup complete")
@@ -8,9 +8,13 @@ import logging
 from typing import Dict, List, Optional, Any
 import numpy as np
 from scipy.spatial.distance import cdist
-from scipy.interpolate import griddata
 from sklearn.covariance import EllipticEnvelope
 
+from .spherical_spline import (
+    SplineMatrixCache,
+    spherical_spline_interpolation_matrix,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +39,9 @@ class ChannelRepair:
         self.channel_locations = None
         self.neighbor_matrix = None
 
+        # Interpolation matrices per (montage, bad channel set)
+        self.interpolation_cache = SplineMatrixCache(maxsize=32)
+
         # Detection methods
         self.detection_methods = [
             "variance",
@@ -374,6 +381,9 @@ class ChannelRepair:
     ) -> np.ndarray:
         """Spherical spline interpolation for bad channels.
 
+        The (good -> bad) interpolation matrix depends only on the montage and
+        the bad channel set, so it is cached and each window costs one matmul.
+
         Args:
             data: Signal data (channels x samples)
             bad_channels: Indices of bad channels
@@ -385,27 +395,25 @@ class ChannelRepair:
             logger.warning("No channel locations available for spherical interpolation")
             return await self._interpolate_linear(data, bad_channels)
 
+        bad_channels = sorted(set(bad_channels))
         good_channels = [i for i in range(data.shape[0]) if i not in bad_channels]
+        if not good_channels:
+            return data
 
-        # Interpolate each time point
-        for t in range(data.shape[1]):
-            # Get values at good channels
-            good_values = data[good_channels, t]
-            good_locs = self.channel_locations[good_channels]
-
-            # Interpolate values at bad channels
-            bad_locs = self.channel_locations[bad_channels]
-
-            # Use scipy griddata for interpolation
-            interp_values = griddata(
-                good_locs[:, :2],  # Use 2D projection for simplicity
-                good_values,
-                bad_locs[:, :2],
-                method="cubic",
-                fill_value=np.mean(good_values),
-            )
-
-            data[bad_channels, t] = interp_values
+        locations = self.channel_locations
+        key = (
+            SplineMatrixCache.montage_key(locations),
+            tuple(bad_channels),
+            data.shape[0],
+        )
+        matrix = self.interpolation_cache.get_or_compute(
+            key,
+            lambda: spherical_spline_interpolation_matrix(
+                locations[good_channels], locations[bad_channels]
+            ),
+        )
+
+        data[bad_channels, :] = matrix @ data[good_channels, :]
 
         return data
 
@@ -559,4 +567,5 @@ class ChannelRepair:
         """Cleanup channel repair resources."""
         self.channel_locations = None
         self.neighbor_matrix = None
+        self.interpolation_cache.clear()
         logger.info("Channel repair cleanup complete")
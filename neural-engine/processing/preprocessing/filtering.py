@@ -1,15 +1,19 @@
 """Advanced Filtering - Signal filtering algorithms for neural data.
 
 This module implements various filtering techniques including adaptive filters,
-notch filters, and advanced digital filter designs.
+notch filters, and advanced digital filter designs. Offline methods use
+zero-phase ``filtfilt``; ``StreamingFilterBank`` provides the causal,
+stateful counterpart for filtering live streams chunk by chunk.
 """
 
 import logging
-from typing import Dict, List, Any, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import numpy as np
 from scipy import signal
 from scipy.signal import butter, ellip, cheby1, cheby2, bessel, filtfilt
 
+from common.streaming_filter import StreamingFilterBank
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,12 +123,10 @@ class AdvancedFilters:
                 b, a = signal.iirnotch(w0, quality_factor)
                 self._filter_cache[cache_key] = (b, a)
 
-            # Apply filter to each channel
-            filtered = np.zeros_like(signal_data)
-            for ch in range(signal_data.shape[0]):
-                filtered[ch, :] = filtfilt(b, a, signal_data[ch, :])
-
-            return filtered
+            # Zero-phase filter all channels at once
+            return filtfilt(b, a, signal_data, axis=1).astype(
+                signal_data.dtype, copy=False
+            )
 
         except Exception as e:
             logger.error(f"Error in notch filtering: {str(e)}")
@@ -194,17 +196,102 @@ class AdvancedFilters:
                 b, a = butter(order, [low, high], btype="band")
                 self._filter_cache[cache_key] = (b, a)
 
-            # Apply filter
-            filtered = np.zeros_like(signal_data)
-            for ch in range(signal_data.shape[0]):
-                filtered[ch, :] = filtfilt(b, a, signal_data[ch, :])
-
-            return filtered
+            # Zero-phase filter all channels at once
+            return filtfilt(b, a, signal_data, axis=1).astype(
+                signal_data.dtype, copy=False
+            )
 
         except Exception as e:
             logger.error(f"Error in Butterworth filtering: {str(e)}")
             return signal_data
 
+    def design_notch_sos(
+        self, frequency: float, sampling_rate: float, quality_factor: float = 30
+    ) -> np.ndarray:
+        """Design a notch filter as second-order sections.
+
+        Args:
+            frequency: Frequency to remove (Hz)
+            sampling_rate: Sampling rate (Hz)
+            quality_factor: Q factor (bandwidth = frequency / Q)
+
+        Returns:
+            Second-order sections (1 x 6)
+        """
+        cache_key = f"sos_notch_{frequency}_{sampling_rate}_{quality_factor}"
+        if cache_key not in self._filter_cache:
+            w0 = frequency / (sampling_rate / 2)  # Normalized frequency
+            b, a = signal.iirnotch(w0, quality_factor)
+            self._filter_cache[cache_key] = signal.tf2sos(b, a)
+        return self._filter_cache[cache_key]
+
+    def design_bandpass_sos(
+        self, low_freq: float, high_freq: float, sampling_rate: float, order: int = 4
+    ) -> np.ndarray:
+        """Design a Butterworth bandpass filter as second-order sections.
+
+        Args:
+            low_freq: Low cutoff frequency (Hz)
+            high_freq: High cutoff frequency (Hz)
+            sampling_rate: Sampling rate (Hz)
+            order: Filter order
+
+        Returns:
+            Second-order sections (order x 6)
+        """
+        cache_key = f"sos_butter_bp_{low_freq}_{high_freq}_{sampling_rate}_{order}"
+        if cache_key not in self._filter_cache:
+            nyquist = sampling_rate / 2
+            low = low_freq / nyquist
+            high = high_freq / nyquist
+
+            if low <= 0 or high >= 1:
+                raise ValueError("Cutoff frequencies must be between 0 and Nyquist")
+
+            self._filter_cache[cache_key] = butter(
+                order, [low, high], btype="band", output="sos"
+            )
+        return self._filter_cache[cache_key]
+
+    def create_streaming_filter_bank(
+        self,
+        n_channels: int,
+        sampling_rate: float,
+        notch_frequencies: Optional[List[float]] = None,
+        bandpass: Optional[Tuple[float, float]] = None,
+        order: int = 4,
+        quality_factor: float = 30,
+    ) -> StreamingFilterBank:
+        """Create a causal filter bank for a streaming session.
+
+        Notch frequencies at or above Nyquist are skipped.
+
+        Args:
+            n_channels: Number of channels in the stream
+            sampling_rate: Sampling rate (Hz)
+            notch_frequencies: Frequencies to remove (Hz)
+            bandpass: Optional (low, high) Butterworth passband (Hz)
+            order: Bandpass filter order
+            quality_factor: Q factor for all notch filters
+
+        Returns:
+            StreamingFilterBank with the combined cascade
+        """
+        sections = [
+            self.design_notch_sos(freq, sampling_rate, quality_factor)
+            for freq in (notch_frequencies or [])
+            if 0 < freq < sampling_rate / 2
+        ]
+        if bandpass is not None:
+            sections.append(
+                self.design_bandpass_sos(bandpass[0], bandpass[1], sampling_rate, order)
+            )
+
+        if not sections:
+            raise ValueError("Streaming filter bank needs at least one stage")
+
+        return StreamingFilterBank(np.vstack(sections), n_channels)
+
     async def elliptic_filter(
         self, signal_data: np.ndarray, filter_params: Dict[str, Any]
     ) -> np.ndarray:
@@ -10,7 +10,7 @@ import numpy as np
 import time
 
 from .artifact_removal import ArtifactRemover
-from .filtering import AdvancedFilters
+from .filtering import AdvancedFilters, StreamingFilterBank
 from .channel_repair import ChannelRepair
 from .spatial_filtering import SpatialFilters
 from .quality_assessment import QualityAssessment
@@ -54,14 +54,58 @@ class PreprocessingPipeline:
         self.is_initialized = True
         logger.info("Preprocessing pipeline initialization complete")
 
+    def create_streaming_filter_bank(
+        self, n_channels: int, sampling_rate: Optional[float] = None
+    ) -> Optional[StreamingFilterBank]:
+        """Create the causal equivalent of the notch and bandpass stages.
+
+        Args:
+            n_channels: Number of channels in the stream
+            sampling_rate: Stream sampling rate (defaults to config)
+
+        Returns:
+            StreamingFilterBank, or None if neither stage is enabled
+        """
+        steps = self.config.preprocessing_steps
+        notch_frequencies = (
+            self.config.notch_frequencies if "notch_filter" in steps else []
+        )
+        bandpass = (
+            (self.config.bandpass_low, self.config.bandpass_high)
+            if "bandpass_filter" in steps
+            else None
+        )
+        if not notch_frequencies and bandpass is None:
+            return None
+
+        return self.filters.create_streaming_filter_bank(
+            n_channels,
+            sampling_rate or self.config.sampling_rate,
+            notch_frequencies=notch_frequencies,
+            bandpass=bandpass,
+            order=self.config.filter_order,
+            quality_factor=30,
+        )
+
     async def process(  # noqa: C901
-        self, signal_data: np.ndarray, quality_metrics: Optional[Any] = None
+        self,
+        signal_data: np.ndarray,
+        quality_metrics: Optional[Any] = None,
+        prefiltered: bool = False,
+        session_id: Optional[str] = None,
+        new_samples: Optional[int] = None,
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Process signal through preprocessing pipeline.
 
         Args:
             signal_data: Raw signal data (channels x samples)
             quality_metrics: Optional quality metrics from initial assessment
+            prefiltered: Data already passed through the streaming filter
+                bank, so the notch and bandpass stages are skipped
+            session_id: Stream session the data belongs to, selecting its
+                session ICA model
+            new_samples: Number of trailing samples not in a previous window
+                of the session (all samples if None)
 
         Returns:
             Tuple of (preprocessed_data, preprocessing_info)
@@ -84,7 +128,11 @@ class PreprocessingPipeline:
 
         try:
             # Step 1: Notch filtering (remove power line noise)
-            if "notch_filter" in self.config.preprocessing_steps:
+            if prefiltered:
+                processing_info["filters_applied"].append("streaming_filter_bank")
+                stages_applied.append("streaming_filter")
+
+            if "notch_filter" in self.config.preprocessing_steps and not prefiltered:
                 stage_start = time.perf_counter()
 
                 for freq in self.config.notch_frequencies:
@@ -100,7 +148,7 @@ class PreprocessingPipeline:
                 )
 
             # Step 2: Bandpass filtering
-            if "bandpass_filter" in self.config.preprocessing_steps:
+            if "bandpass_filter" in self.config.preprocessing_steps and not prefiltered:
                 stage_start = time.perf_counter()
 
                 data = await self._apply_bandpass_filter(
@@ -122,7 +170,9 @@ class PreprocessingPipeline:
             if "artifact_removal" in self.config.preprocessing_steps:
                 stage_start = time.perf_counter()
 
-                data, artifacts_info = await self._remove_artifacts(data)
+                data, artifacts_info = await self._remove_artifacts(
+                    data, session_id, new_samples
+                )
                 processing_info["artifacts_removed"] = artifacts_info
 
                 processing_info["timing"]["artifact_removal"] = (
@@ -234,12 +284,18 @@ class PreprocessingPipeline:
         )
 
     async def _remove_artifacts(
-        self, data: np.ndarray
+        self,
+        data: np.ndarray,
+        session_id: Optional[str] = None,
+        new_samples: Optional[int] = None,
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Remove artifacts from signal.
 
         Args:
             data: Signal data
+            session_id: Stream session the data belongs to (None for
+                offline data, which is cleaned with a per-call ICA fit)
+            new_samples: Number of trailing samples not in a previous window
 
         Returns:
             Tuple of (cleaned_data, artifacts_info)
@@ -249,11 +305,18 @@ class PreprocessingPipeline:
 
         # Apply artifact removal methods
         for method in self.config.artifact_methods:
-            if method == "ica":
-                # ICA-based artifact removal
+            if method == "ica" and session_id is None:
+                # Offline data is cleaned with ICA fitted on the call's data
+                cleaned_data, ica_info = (
+                    await self.artifact_remover.remove_artifacts_ica(cleaned_data)
+                )
+                artifacts_info["ica"] = ica_info
+
+            elif method == "ica":
+                # Stream sessions share one model across their windows
                 cleaned_data, ica_info = (
-                    await self.artifact_remover.remove_artifacts_ica(
-                        cleaned_data, n_components=self.config.ica_components
+                    await self.artifact_remover.remove_artifacts_session_ica(
+                        cleaned_data, session_id, new_samples
                     )
                 )
                 artifacts_info["ica"] = ica_info
@@ -269,6 +332,14 @@ class PreprocessingPipeline:
 
         return cleaned_data, artifacts_info
 
+    def release_session(self, session_id: str) -> None:
+        """Discard the per-session state of a finished stream session.
+
+        Args:
+            session_id: Session identifier
+        """
+        self.artifact_remover.release_session_ica(session_id)
+
     def update_config(self, params: Dict[str, Any]) -> None:
         """Update preprocessing configuration.
 
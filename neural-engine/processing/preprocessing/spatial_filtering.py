@@ -8,8 +8,13 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 from scipy.spatial.distance import cdist
-from scipy.sparse import csr_matrix, eye
-from scipy.sparse.linalg import spsolve
+
+from .spherical_spline import (
+    SplineMatrixCache,
+    spline_g,
+    spline_h,
+    surface_laplacian_matrix,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +38,9 @@ class SpatialFilters:
         self.channel_locations = None
         self.laplacian_matrix = None
 
+        # Surface Laplacian matrices per (montage, regularization)
+        self.spline_cache = SplineMatrixCache(maxsize=8)
+
         # Bipolar montage pairs (if specified)
         self.bipolar_pairs = []
 
@@ -126,6 +134,8 @@ class SpatialFilters:
 
         This is a more sophisticated Laplacian that uses spherical splines
         to estimate the second spatial derivative of the potential field.
+        The Laplacian matrix depends only on the electrode positions, so it
+        is computed once per montage and applied as a single matmul.
 
         Args:
             data: Signal data (channels x samples)
@@ -140,21 +150,15 @@ class SpatialFilters:
                 # Generate default positions if not provided
                 electrode_positions = self._generate_default_positions(data.shape[0])
 
-            # Compute spline Laplacian matrix
-            G = await self._compute_spline_matrix(electrode_positions)
-            H = await self._compute_laplacian_spline_matrix(electrode_positions)
-
-            # Regularized solution
-            n_channels = data.shape[0]
-            C = G + lambda_reg * eye(n_channels)
-
-            # Solve for spline coefficients
-            coefficients = spsolve(C.tocsr(), data.T).T
-
-            # Apply Laplacian
-            laplacian_data = H @ coefficients
+            key = (SplineMatrixCache.montage_key(electrode_positions), lambda_reg)
+            L = self.spline_cache.get_or_compute(
+                key,
+                lambda: surface_laplacian_matrix(
+                    electrode_positions, regularization=lambda_reg
+                ),
+            )
 
-            return laplacian_data
+            return L @ data
 
         except Exception as e:
             logger.error(f"Error in surface Laplacian: {str(e)}")
@@ -373,8 +377,8 @@ class SpatialFilters:
             logger.error(f"Error computing Laplacian matrix: {str(e)}")
             return None
 
-    async def _compute_spline_matrix(self, positions: np.ndarray) -> csr_matrix:
-        """Compute spline interpolation matrix.
+    async def _compute_spline_matrix(self, positions: np.ndarray) -> np.ndarray:
+        """Compute spherical spline interpolation matrix.
 
         Args:
             positions: Electrode positions (n_channels x 3)
@@ -382,16 +386,7 @@ class SpatialFilters:
         Returns:
             Spline matrix G
         """
-        n = positions.shape[0]
-        G = np.zeros((n, n))
-
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    r = np.linalg.norm(positions[i] - positions[j])
-                    G[i, j] = r * np.log(r + 1e-10)  # g(r) = r * log(r)
-
-        return csr_matrix(G)
+        return spline_g(positions, positions)
 
     async def _compute_laplacian_spline_matrix(
         self, positions: np.ndarray
@@ -404,21 +399,7 @@ class SpatialFilters:
         Returns:
             Laplacian spline matrix H
         """
-        n = positions.shape[0]
-        H = np.zeros((n, n))
-
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    r = np.linalg.norm(positions[i] - positions[j])
-                    # Laplacian of g(r) = r * log(r) is proportional to 1 / r
-                    H[i, j] = 1.0 / (r + 1e-10)
-
-        # Normalize rows
-        row_sums = np.sum(np.abs(H), axis=1)
-        H = H / row_sums[:, np.newaxis]
-
-        return H
+        return spline_h(positions, positions)
 
     def _generate_default_positions(self, n_channels: int) -> np.ndarray:
         """Generate default electrode positions on a spherical cap.
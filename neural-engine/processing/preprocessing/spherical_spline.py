@@ -0,0 +1,249 @@
+"""Spherical Splines - Perrin spherical-spline interpolation and Laplacian.
+
+Spherical splines (Perrin et al., 1989) interpolate a potential field from
+electrodes on a sphere. Both the interpolation to new positions and the
+surface Laplacian are linear in the electrode values, so each reduces to a
+matrix that depends only on the montage. ``SplineMatrixCache`` keeps the
+most recently used matrices, so a window is processed with one matmul.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+from numpy.polynomial import legendre
+
+logger = logging.getLogger(__name__)
+
+
+def _unit_sphere(positions: np.ndarray) -> np.ndarray:
+    """Project positions onto the unit sphere around the origin.
+
+    Args:
+        positions: Electrode positions (n x 3)
+
+    Returns:
+        Unit vectors (n x 3)
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    return positions / np.linalg.norm(positions, axis=1, keepdims=True)
+
+
+def _legendre_series(cos_angles: np.ndarray, exponent: int, n_terms: int) -> np.ndarray:
+    """Evaluate sum_n (2n + 1) / (n (n + 1))^exponent P_n(x) / 4pi.
+
+    Args:
+        cos_angles: Cosines of the angles between positions
+        exponent: Power of n (n + 1) in the denominator
+        n_terms: Number of Legendre terms
+
+    Returns:
+        Series evaluated element-wise
+    """
+    n = np.arange(1, n_terms + 1, dtype=np.float64)
+    coefficients = (2 * n + 1) / (n * (n + 1)) ** exponent / (4 * np.pi)
+    return legendre.legval(np.clip(cos_angles, -1.0, 1.0), np.r_[0.0, coefficients])
+
+
+def spline_g(
+    from_positions: np.ndarray,
+    to_positions: np.ndarray,
+    stiffness: int = 4,
+    n_terms: int = 7,
+) -> np.ndarray:
+    """Spherical-spline basis g between two sets of positions.
+
+    Args:
+        from_positions: Positions on the sphere (n x 3), columns of G
+        to_positions: Positions on the sphere (k x 3), rows of G
+        stiffness: Spline order m
+        n_terms: Number of Legendre terms
+
+    Returns:
+        Basis matrix G (k x n)
+    """
+    cos_angles = _unit_sphere(to_positions) @ _unit_sphere(from_positions).T
+    return _legendre_series(cos_angles, stiffness, n_terms)
+
+
+def spline_h(
+    from_positions: np.ndarray,
+    to_positions: np.ndarray,
+    stiffness: int = 4,
+    n_terms: int = 50,
+) -> np.ndarray:
+    """Surface Laplacian of the spherical-spline basis (unit sphere).
+
+    Args:
+        from_positions: Positions on the sphere (n x 3), columns of H
+        to_positions: Positions on the sphere (k x 3), rows of H
+        stiffness: Spline order m
+        n_terms: Number of Legendre terms
+
+    Returns:
+        Laplacian basis matrix H (k x n)
+    """
+    cos_angles = _unit_sphere(to_positions) @ _unit_sphere(from_positions).T
+    # The Laplacian scales the degree-n spherical harmonic by -n (n + 1)
+    return -_legendre_series(cos_angles, stiffness - 1, n_terms)
+
+
+def _spline_coefficient_operator(
+    positions: np.ndarray, stiffness: int, n_terms: int, regularization: float
+) -> np.ndarray:
+    """Map electrode values to spline coefficients and constant term.
+
+    Solves [[G + lambda I, 1], [1^T, 0]] [c; c0] = [v; 0] for any v.
+
+    Args:
+        positions: Electrode positions (n x 3)
+        stiffness: Spline order m
+        n_terms: Number of Legendre terms for G
+        regularization: Ridge term lambda added to G's diagonal
+
+    Returns:
+        Operator ((n + 1) x n) with [c; c0] = operator @ v
+    """
+    n = positions.shape[0]
+    system = np.ones((n + 1, n + 1))
+    system[:n, :n] = spline_g(positions, positions, stiffness, n_terms)
+    system[:n, :n] += regularization * np.eye(n)
+    system[n, n] = 0.0
+    return np.linalg.pinv(system)[:, :n]
+
+
+def spherical_spline_interpolation_matrix(
+    from_positions: np.ndarray,
+    to_positions: np.ndarray,
+    stiffness: int = 4,
+    n_terms: int = 7,
+    regularization: float = 1e-5,
+) -> np.ndarray:
+    """Matrix interpolating values at from_positions to to_positions.
+
+    Args:
+        from_positions: Positions with known values, e.g. good channels (n x 3)
+        to_positions: Positions to interpolate, e.g. bad channels (k x 3)
+        stiffness: Spline order m
+        n_terms: Number of Legendre terms
+        regularization: Ridge term added to G's diagonal
+
+    Returns:
+        Interpolation matrix (k x n)
+    """
+    operator = _spline_coefficient_operator(
+        from_positions, stiffness, n_terms, regularization
+    )
+    g_to = spline_g(from_positions, to_positions, stiffness, n_terms)
+    return np.hstack([g_to, np.ones((g_to.shape[0], 1))]) @ operator
+
+
+def surface_laplacian_matrix(
+    positions: np.ndarray,
+    stiffness: int = 4,
+    n_terms: int = 50,
+    regularization: float = 1e-5,
+) -> np.ndarray:
+    """Matrix computing the spherical-spline surface Laplacian.
+
+    The result is the Laplacian on the unit sphere; divide by the squared
+    head radius for physical units.
+
+    Args:
+        positions: Electrode positions (n x 3)
+        stiffness: Spline order m
+        n_terms: Number of Legendre terms
+        regularization: Ridge term added to G's diagonal
+
+    Returns:
+        Laplacian matrix (n x n)
+    """
+    operator = _spline_coefficient_operator(
+        positions, stiffness, n_terms, regularization
+    )
+    # The constant term has zero Laplacian
+    return spline_h(positions, positions, stiffness, n_terms) @ operator[:-1]
+
+
+class SplineMatrixCache:
+    """Least-recently-used cache of montage-dependent spline matrices.
+
+    The cache is safe to share between threads. Matrices are computed outside
+    the lock, so concurrent misses on one key may compute it more than once.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached matrices
+        """
+        self.maxsize = maxsize
+        self._matrices: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def montage_key(positions: np.ndarray) -> Tuple[Any, ...]:
+        """Hashable key identifying a set of electrode positions.
+
+        Args:
+            positions: Electrode positions (n x 3)
+
+        Returns:
+            Key for the positions
+        """
+        positions = np.ascontiguousarray(positions, dtype=np.float64)
+        return positions.shape, positions.tobytes()
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """Return the cached matrix for a key, computing it if missing.
+
+        Args:
+            key: Cache key
+            compute: Builds the matrix on a miss
+
+        Returns:
+            The matrix
+        """
+        with self._lock:
+            matrix = self._matrices.get(key)
+            if matrix is not None:
+                self._matrices.move_to_end(key)
+                self.hits += 1
+                return matrix
+            self.misses += 1
+
+        matrix = compute()
+        with self._lock:
+            self._matrices[key] = matrix
+            while len(self._matrices) > self.maxsize:
+                self._matrices.popitem(last=False)
+        return matrix
+
+    def clear(self) -> None:
+        """Drop all cached matrices."""
+        with self._lock:
+            self._matrices.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache statistics.
+
+        Returns:
+            Dictionary with hits, misses and cached entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._matrices),
+            }
+
+    def __len__(self) -> int:
+        """Number of cached matrices."""
+        return len(self._matrices)
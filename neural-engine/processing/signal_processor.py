@@ -6,6 +6,7 @@ feature extraction, and real-time processing for BCI neural signals.
 
 import asyncio
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -15,7 +16,7 @@ import time
 
 from .preprocessing import PreprocessingPipeline
 from .features import FeatureExtractor
-from .streaming import StreamProcessor, BufferManager, RealTimeQualityMonitor
+from .features.feature_extractor import EXECUTOR_BACKENDS
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,10 @@ class ProcessingConfig:
     feature_types: List[str] = field(
         default_factory=lambda: ["time_domain", "frequency_domain", "time_frequency"]
     )
+    # Executor backend per feature category: "inline", "thread" or "process"
+    feature_executors: Dict[str, str] = field(default_factory=dict)
+    default_feature_executor: str = "thread"
+    feature_workers: Optional[int] = None  # None = one per feature category
 
     # Quality parameters
     quality_threshold: float = 0.7  # 0-1 scale
@@ -76,6 +81,9 @@ class ProcessingConfig:
     # Artifact removal parameters
     artifact_methods: List[str] = field(default_factory=lambda: ["ica", "regression"])
     ica_components: Optional[int] = None
+    ica_calibration_s: float = 30.0  # data buffered before the first ICA fit
+    ica_buffer_s: float = 60.0  # rolling buffer used for ICA refits
+    ica_refit_interval_s: Optional[float] = 300.0  # None = never refit
     eog_channels: List[int] = field(default_factory=list)
 
     # Spatial filtering
@@ -94,6 +102,9 @@ class ProcessingConfig:
             raise ValueError("Window size must be positive")
         if not 0 <= self.quality_threshold <= 1:
             raise ValueError("Quality threshold must be between 0 and 1")
+        executors = [self.default_feature_executor, *self.feature_executors.values()]
+        if any(e not in EXECUTOR_BACKENDS for e in executors):
+            raise ValueError(f"Feature executors must be one of {EXECUTOR_BACKENDS}")
         return True
 
 
@@ -204,8 +215,28 @@ class StreamProcessingResult:
         }
 
 
+@dataclass
+class _RealTimeSession:
+    """Per-session state of the real-time pipeline."""
+
+    session_id: str
+    stream_info: Dict[str, Any] = field(default_factory=dict)
+    chunks_processed: int = 0
+    samples_processed: int = 0
+    last_latency_ms: float = 0.0
+    latest_features: Dict[str, np.ndarray] = field(default_factory=dict)
+
+
 class AdvancedSignalProcessor:
-    """Main signal processing orchestrator for BCI neural signals."""
+    """Main signal processing orchestrator for BCI neural signals.
+
+    One processor is shared by all worker threads of a StreamProcessor, each
+    running its own event loop. Sessions are pinned to a worker, so the state
+    of a session is only touched from one thread; the session registry and
+    the global statistics are guarded by a lock, and the shared preprocessing
+    and feature components guard their own caches. ``initialize``,
+    ``setup_real_time_pipeline`` and ``cleanup`` run on the caller's loop.
+    """
 
     def __init__(self, config: ProcessingConfig):
         """Initialize signal processor with configuration.
@@ -220,11 +251,9 @@ class AdvancedSignalProcessor:
         # Initialize components
         self.preprocessor = PreprocessingPipeline(config)
         self.feature_extractor = FeatureExtractor(config)
-        self.quality_monitor = RealTimeQualityMonitor(config)
 
-        # Stream processing
-        self.stream_processors: Dict[str, StreamProcessor] = {}
-        self.buffer_managers: Dict[str, BufferManager] = {}
+        # Real-time sessions; windowing and buffering live in StreamProcessor
+        self.sessions: Dict[str, _RealTimeSession] = {}
 
         # Performance tracking
         self.processing_stats = {
@@ -239,6 +268,9 @@ class AdvancedSignalProcessor:
         self.is_initialized = False
         self._lock = asyncio.Lock()
 
+        # Guards sessions and processing_stats across worker threads
+        self._state_lock = threading.Lock()
+
         logger.info(
             f"AdvancedSignalProcessor initialized with {config.num_channels} channels "
             f"at {config.sampling_rate}Hz"
@@ -256,9 +288,6 @@ class AdvancedSignalProcessor:
             # Initialize feature extractor
             await self.feature_extractor.initialize()
 
-            # Initialize quality monitor
-            await self.quality_monitor.initialize()
-
             self.is_initialized = True
             logger.info("Signal processor initialization complete")
 
@@ -295,7 +324,7 @@ class AdvancedSignalProcessor:
         try:
             # Step 1: Quality assessment on raw signal
             logger.debug("Assessing raw signal quality...")
-            raw_quality = await self.quality_monitor.assess_signal_quality(signal_data)
+            raw_quality = await self._assess_quality(signal_data)
             processing_stages.append("quality_assessment_raw")
 
             # Step 2: Preprocessing
@@ -307,9 +336,7 @@ class AdvancedSignalProcessor:
 
             # Step 3: Post-preprocessing quality assessment
             logger.debug("Assessing preprocessed signal quality...")
-            processed_quality = await self.quality_monitor.assess_signal_quality(
-                preprocessed_data
-            )
+            processed_quality = await self._assess_quality(preprocessed_data)
             processing_stages.append("quality_assessment_processed")
 
             # Step 4: Feature extraction
@@ -371,33 +398,11 @@ class AdvancedSignalProcessor:
             await self.initialize()
 
         try:
-            # Calculate buffer size in samples
-            window_samples = int(self.config.window_size * self.config.sampling_rate)
-            overlap_samples = int(window_samples * self.config.overlap)
-
-            # Create buffer manager
-            buffer_manager = BufferManager(
-                window_size=window_samples,
-                overlap=overlap_samples,
-                num_channels=self.config.num_channels,
-            )
-
-            # Create stream processor
-            stream_processor = StreamProcessor(
-                config=self.config,
-                preprocessor=self.preprocessor,
-                feature_extractor=self.feature_extractor,
-                quality_monitor=self.quality_monitor,
-                buffer_manager=buffer_manager,
+            session = _RealTimeSession(
+                session_id=session_id, stream_info=dict(stream_info or {})
             )
-
-            # Initialize stream processor
-            await stream_processor.initialize()
-
-            # Store in active sessions
-            async with self._lock:
-                self.stream_processors[session_id] = stream_processor
-                self.buffer_managers[session_id] = buffer_manager
+            with self._state_lock:
+                self.sessions[session_id] = session
 
             logger.info(f"Real-time pipeline setup complete for session {session_id}")
             return True
@@ -407,34 +412,116 @@ class AdvancedSignalProcessor:
             return False
 
     async def process_stream_chunk(
-        self, chunk: np.ndarray, session_id: str
+        self,
+        chunk: np.ndarray,
+        session_id: str,
+        prefiltered: bool = False,
+        new_samples: Optional[int] = None,
     ) -> StreamProcessingResult:
         """Process a chunk of streaming data in real-time.
 
         Args:
             chunk: Data chunk (channels x samples)
             session_id: Session identifier
+            prefiltered: Chunk was already notch and bandpass filtered
+                causally as it entered the stream buffer, so the pipeline
+                skips those stages
+            new_samples: Number of trailing samples not in a previous chunk
+                of the session, e.g. the step of overlapping windows (all
+                samples if None)
 
         Returns:
             StreamProcessingResult with processed chunk and features
         """
-        # Get stream processor
-        stream_processor = self.stream_processors.get(session_id)
-        if not stream_processor:
-            raise ValueError(f"No active stream processor for session {session_id}")
+        with self._state_lock:
+            session = self.sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"No real-time pipeline for session {session_id}")
 
-        # Process chunk
-        result = await stream_processor.process_chunk(chunk, session_id)
+        start_time = time.perf_counter()
+
+        preprocessed_data, _ = await self.preprocessor.process(
+            chunk,
+            prefiltered=prefiltered,
+            session_id=session_id,
+            new_samples=new_samples,
+        )
+        quality = await self._assess_quality(preprocessed_data)
+        features = await self.feature_extractor.extract_features(
+            preprocessed_data, quality_score=quality.overall_quality
+        )
+
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
+        quality.processing_time_ms = processing_time_ms
+
+        result = StreamProcessingResult(
+            chunk_id=session.chunks_processed,
+            session_id=session_id,
+            timestamp=datetime.utcnow(),
+            processed_chunk=preprocessed_data,
+            chunk_features=features,
+            chunk_quality=quality,
+            latency_ms=processing_time_ms,
+            processing_time_ms=processing_time_ms,
+            samples_processed=chunk.shape[1],
+            samples_dropped=0,
+        )
+
+        session.chunks_processed += 1
+        session.samples_processed += chunk.shape[1]
+        session.last_latency_ms = processing_time_ms
+        session.latest_features = features
 
         # Update global stats
         self._update_processing_stats(
-            chunk.shape[1],
-            result.processing_time_ms,
-            result.chunk_quality.overall_quality,
+            chunk.shape[1], processing_time_ms, quality.overall_quality
         )
 
         return result
 
+    async def get_cached_features(
+        self, session_id: str, feature_types: Optional[List[str]] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Get the features of the latest processed chunk of a session.
+
+        Args:
+            session_id: Session identifier
+            feature_types: Optional feature names to return (all if None)
+
+        Returns:
+            Dictionary of feature_name -> feature_array, or None
+        """
+        with self._state_lock:
+            session = self.sessions.get(session_id)
+        if session is None or not session.latest_features:
+            return None
+
+        if feature_types is None:
+            return dict(session.latest_features)
+        return {
+            name: value
+            for name, value in session.latest_features.items()
+            if name in feature_types
+        }
+
+    async def cleanup_session(self, session_id: str) -> bool:
+        """Release the real-time state of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session existed
+        """
+        with self._state_lock:
+            session = self.sessions.pop(session_id, None)
+        self.preprocessor.release_session(session_id)
+        if session is None:
+            return False
+
+        logger.info(f"Real-time pipeline teardown complete for session {session_id}")
+        return True
+
     async def teardown_real_time_pipeline(self, session_id: str) -> bool:
         """Teardown real-time processing pipeline.
 
@@ -445,24 +532,7 @@ class AdvancedSignalProcessor:
             True if teardown successful
         """
         try:
-            async with self._lock:
-                # Get processors
-                stream_processor = self.stream_processors.get(session_id)
-                buffer_manager = self.buffer_managers.get(session_id)
-
-                if stream_processor:
-                    # Cleanup stream processor
-                    await stream_processor.cleanup()
-                    del self.stream_processors[session_id]
-
-                if buffer_manager:
-                    # Cleanup buffer manager
-                    buffer_manager.reset()
-                    del self.buffer_managers[session_id]
-
-            logger.info(
-                f"Real-time pipeline teardown complete for session {session_id}"
-            )
+            await self.cleanup_session(session_id)
             return True
 
         except Exception as e:
@@ -476,7 +546,7 @@ class AdvancedSignalProcessor:
 
         Args:
             params: Parameters to update
-            session_id: Optional session ID for stream-specific updates
+            session_id: Unused; parameters apply to all sessions
 
         Returns:
             True if update successful
@@ -490,11 +560,6 @@ class AdvancedSignalProcessor:
             # Update component configurations
             self.preprocessor.update_config(params)
             self.feature_extractor.update_config(params)
-            self.quality_monitor.update_config(params)
-
-            # Update stream processor if session specified
-            if session_id and session_id in self.stream_processors:
-                self.stream_processors[session_id].update_parameters(params)
 
             logger.info(f"Processing parameters updated: {list(params.keys())}")
             return True
@@ -509,11 +574,13 @@ class AdvancedSignalProcessor:
         Returns:
             Dictionary of performance metrics
         """
-        stats = self.processing_stats.copy()
+        with self._state_lock:
+            stats = self.processing_stats.copy()
+            stats["quality_scores"] = list(stats["quality_scores"])
 
-        # Add active session info
-        stats["active_sessions"] = len(self.stream_processors)
-        stats["active_session_ids"] = list(self.stream_processors.keys())
+            # Add active session info
+            stats["active_sessions"] = len(self.sessions)
+            stats["active_session_ids"] = list(self.sessions.keys())
 
         # Calculate quality statistics
         if stats["quality_scores"]:
@@ -533,10 +600,12 @@ class AdvancedSignalProcessor:
         Returns:
             Latency in milliseconds
         """
-        if session_id and session_id in self.stream_processors:
-            return self.stream_processors[session_id].get_latency()
+        with self._state_lock:
+            session = self.sessions.get(session_id) if session_id else None
+            if session is not None:
+                return session.last_latency_ms
 
-        return self.processing_stats["average_latency_ms"]
+            return self.processing_stats["average_latency_ms"]
 
     def _update_processing_stats(
         self, samples: int, processing_time_ms: float, quality_score: float
@@ -548,37 +617,68 @@ class AdvancedSignalProcessor:
             processing_time_ms: Processing time in milliseconds
             quality_score: Signal quality score (0-1)
         """
-        self.processing_stats["total_samples_processed"] += samples
-        self.processing_stats["total_processing_time_ms"] += processing_time_ms
+        with self._state_lock:
+            self.processing_stats["total_samples_processed"] += samples
+            self.processing_stats["total_processing_time_ms"] += processing_time_ms
+
+            # Update average latency
+            total_samples = self.processing_stats["total_samples_processed"]
+            if total_samples > 0:
+                self.processing_stats["average_latency_ms"] = self.processing_stats[
+                    "total_processing_time_ms"
+                ] / (total_samples / self.config.sampling_rate / 1000)
+
+            # Update max latency
+            if processing_time_ms > self.processing_stats["max_latency_ms"]:
+                self.processing_stats["max_latency_ms"] = processing_time_ms
+
+            # Store quality scores (keep last 1000)
+            self.processing_stats["quality_scores"].append(quality_score)
+            if len(self.processing_stats["quality_scores"]) > 1000:
+                self.processing_stats["quality_scores"].pop(0)
+
+    async def _assess_quality(self, data: np.ndarray) -> SignalQualityMetrics:
+        """Assess signal quality with the preprocessing quality assessment.
 
-        # Update average latency
-        total_samples = self.processing_stats["total_samples_processed"]
-        if total_samples > 0:
-            self.processing_stats["average_latency_ms"] = self.processing_stats[
-                "total_processing_time_ms"
-            ] / (total_samples / self.config.sampling_rate / 1000)
+        Args:
+            data: Signal data (channels x samples)
 
-        # Update max latency
-        if processing_time_ms > self.processing_stats["max_latency_ms"]:
-            self.processing_stats["max_latency_ms"] = processing_time_ms
+        Returns:
+            SignalQualityMetrics summary of the detailed assessment
+        """
+        start_time = time.perf_counter()
+        metrics = await self.preprocessor.quality_assessment.calculate_signal_quality(
+            data, self.config.sampling_rate
+        )
 
-        # Store quality scores (keep last 1000)
-        self.processing_stats["quality_scores"].append(quality_score)
-        if len(self.processing_stats["quality_scores"]) > 1000:
-            self.processing_stats["quality_scores"].pop(0)
+        bad_channels = sorted(
+            set(metrics.flatline_channels)
+            | set(metrics.clipping_channels)
+            | set(metrics.high_impedance_channels)
+        )
+        return SignalQualityMetrics(
+            overall_quality=float(metrics.overall_score),
+            channel_quality=[float(score) for score in metrics.channel_scores],
+            noise_level=float(metrics.noise_level_rms),
+            snr_db=float(metrics.snr_db),
+            artifact_presence=dict(metrics.artifacts_detected),
+            bad_channels=bad_channels,
+            recommendations=list(metrics.recommendations),
+            processing_time_ms=(time.perf_counter() - start_time) * 1000,
+        )
 
     async def cleanup(self) -> None:
         """Cleanup all resources."""
         try:
             # Teardown all active sessions
-            session_ids = list(self.stream_processors.keys())
+            with self._state_lock:
+                session_ids = list(self.sessions.keys())
             for session_id in session_ids:
                 await self.teardown_real_time_pipeline(session_id)
 
             # Cleanup components
             await self.preprocessor.cleanup()
             await self.feature_extractor.cleanup()
-            await self.quality_monitor.cleanup()
 
             self.is_initialized = False
             logger.info("Signal processor cleanup complete")
@@ -592,7 +692,7 @@ class AdvancedSignalProcessor:
         return (
             f"AdvancedSignalProcessor(channels={self.config.num_channels}, "
             f"sampling_rate={self.config.sampling_rate}Hz, "
-            f"active_sessions={len(self.stream_processors)})"
+            f"active_sessions={len(self.sessions)})"
         )
 
     def __repr__(self) -> str:
@@ -600,5 +700,5 @@ class AdvancedSignalProcessor:
         return (
             f"AdvancedSignalProcessor(config={self.config}, "
             f"initialized={self.is_initialized}, "
-            f"active_sessions={list(self.stream_processors.keys())})"
+            f"active_sessions={list(self.sessions.keys())})"
         )
@@ -1,11 +1,16 @@
 """Stream Processor - Real-time signal processing with sliding windows.
 
 This module implements real-time stream processing with buffering,
-sliding windows, and continuous feature extraction.
+sliding windows, and continuous feature extraction. A single processor
+serves many concurrent sessions: one scheduler collects ready windows from
+the shared BufferManager and dispatches them to a bounded pool of worker
+threads with round-robin fairness across sessions.
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import os
 from typing import Dict, List, Optional, Any, Callable
 import numpy as np
 from collections import deque
@@ -33,13 +38,19 @@ class StreamConfig:
     process_interval_ms: int = 100  # Process every 100ms
     min_samples_to_process: int = 256
 
+    # Filter notch/bandpass causally as samples enter the buffer; the
+    # processor pipeline should then run with prefiltered windows
+    causal_filtering: bool = False
+
     # Quality monitoring
     quality_check_interval: float = 1.0  # seconds
     min_quality_score: float = 0.5
 
     # Performance settings
-    max_processing_queue: int = 5
+    max_processing_queue: int = 5  # Pending windows per session
     drop_on_overflow: bool = True
+    max_workers: int = field(default_factory=lambda: min(8, os.cpu_count() or 1))
+    max_in_flight_per_session: int = 1  # >1 allows out-of-order windows
 
     # Callbacks
     on_processed: Optional[Callable] = None
@@ -59,6 +70,12 @@ class StreamMetrics:
     avg_processing_time_ms: float = 0.0
     max_processing_time_ms: float = 0.0
 
+    # Window ready -> result available, including queueing
+    avg_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    avg_queue_wait_ms: float = 0.0
+
     current_buffer_fill: float = 0.0  # percentage
     buffer_overflows: int = 0
 
@@ -69,8 +86,83 @@ class StreamMetrics:
     last_update: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass
+class SessionStream:
+    """Scheduling state for a single streaming session."""
+
+    session_id: str
+    window_size: int
+    window_step: int
+    max_samples: int
+
+    # Buffer filters samples on entry, so windows skip notch and bandpass
+    prefiltered: bool = False
+
+    # Stream sample index up to which windows have been collected
+    windowed_until: int = 0
+
+    # Windows waiting for a worker: (data, info, ready_time)
+    pending: deque = field(default_factory=deque)
+    in_flight: int = 0
+
+    metrics: StreamMetrics = field(default_factory=StreamMetrics)
+    processing_times: deque = field(default_factory=lambda: deque(maxlen=100))
+    latencies: deque = field(default_factory=lambda: deque(maxlen=100))
+    queue_waits: deque = field(default_factory=lambda: deque(maxlen=100))
+
+
+class _WorkerPool:
+    """Fixed set of worker threads, each running a persistent event loop.
+
+    Processing coroutines are CPU-bound NumPy/SciPy code, so running them on
+    separate threads lets GIL-releasing kernels use several cores while the
+    number of threads stays independent of the number of sessions.
+    """
+
+    def __init__(self, n_workers: int):
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._threads: List[threading.Thread] = []
+
+        for i in range(max(1, n_workers)):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop,),
+                name=f"stream-worker-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self._loops.append(loop)
+            self._threads.append(thread)
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def submit(self, coro: Any, key: str) -> concurrent.futures.Future:
+        """Run a coroutine on the worker owning ``key``.
+
+        Sessions are pinned to a worker so per-session state is only ever
+        touched from one thread.
+        """
+        loop = self._loops[hash(key) % len(self._loops)]
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        for loop in self._loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        for loop in self._loops:
+            if not loop.is_running():
+                loop.close()
+        self._loops.clear()
+        self._threads.clear()
+
+
 class StreamProcessor:
-    """Real-time stream processor for neural signals."""
+    """Real-time stream processor for many concurrent neural signal sessions."""
 
     def __init__(self, signal_processor: AdvancedSignalProcessor, config: StreamConfig):
         """Initialize stream processor.
@@ -82,7 +174,7 @@ class StreamProcessor:
         self.processor = signal_processor
         self.config = config
 
-        # Buffer manager
+        # Buffer manager shared by all sessions
         self.buffer_manager = BufferManager(
             max_duration=config.buffer_size_seconds,
             sampling_rate=signal_processor.config.sampling_rate,
@@ -90,28 +182,49 @@ class StreamProcessor:
 
         # Processing state
         self.is_running = False
-        self.processing_thread = None
-        self.processing_queue = asyncio.Queue(maxsize=config.max_processing_queue)
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._quality_task: Optional[asyncio.Task] = None
+        self._work_available: Optional[asyncio.Event] = None
+        self._worker_pool: Optional[_WorkerPool] = None
+        self._in_flight = 0
 
-        # Sliding window
+        # Default sliding window (sessions may override via stream_info)
         self.window_size = int(
             config.window_size_seconds * signal_processor.config.sampling_rate
         )
         self.window_step = int(self.window_size * (1 - config.window_overlap))
 
-        # Metrics
-        self.metrics = StreamMetrics()
-        self._processing_times = deque(maxlen=100)
+        # Sessions in round-robin dispatch order
+        self.sessions: Dict[str, SessionStream] = {}
+        self._session_order: deque = deque()
 
         # Locks
-        self._buffer_lock = threading.Lock()
+        # Held across buffer coroutines on the scheduler's event loop
+        self._buffer_lock = asyncio.Lock()
         self._metrics_lock = threading.Lock()
 
-        # Session management
+        # Most recently started session, used when no session is given
         self.current_session_id = None
 
         logger.info("StreamProcessor initialized")
 
+    @property
+    def metrics(self) -> StreamMetrics:
+        """Metrics of the current session (empty if none)."""
+        session = self.sessions.get(self.current_session_id)
+        return session.metrics if session else StreamMetrics()
+
+    def has_session(self, session_id: str) -> bool:
+        """Check whether a session is being processed.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session is active
+        """
+        return session_id in self.sessions
+
     async def start_stream(self, session_id: str, stream_info: Dict[str, Any]) -> bool:
         """Start processing a new stream.
 
@@ -123,12 +236,22 @@ class StreamProcessor:
             Success status
         """
         try:
-            # Initialize session
-            self.current_session_id = session_id
+            if session_id in self.sessions:
+                logger.warning(f"Session {session_id} is already streaming")
+                return False
+
+            # Create stream buffer, optionally filtering on entry
+            filter_bank = None
+            if self.config.causal_filtering:
+                filter_bank = self.processor.preprocessor.create_streaming_filter_bank(
+                    stream_info.get("n_channels", 1),
+                    stream_info.get(
+                        "sampling_rate", self.processor.config.sampling_rate
+                    ),
+                )
 
-            # Create stream buffer
             buffer_created = await self.buffer_manager.create_stream_buffer(
-                session_id, stream_info
+                session_id, stream_info, filter_bank=filter_bank
             )
 
             if not buffer_created:
@@ -142,22 +265,32 @@ class StreamProcessor:
 
             if not processor_ready:
                 logger.error(f"Failed to setup processor for session {session_id}")
+                await self.buffer_manager.remove_stream_buffer(session_id)
                 return False
 
-            # Reset metrics
-            self.metrics = StreamMetrics()
-
-            # Start processing thread
-            self.is_running = True
-            self.processing_thread = threading.Thread(
-                target=self._run_processing_loop, daemon=True
+            # Register session with the scheduler
+            sampling_rate = stream_info.get(
+                "sampling_rate", self.processor.config.sampling_rate
             )
-            self.processing_thread.start()
+            window_size = int(self.config.window_size_seconds * sampling_rate)
+            self.sessions[session_id] = SessionStream(
+                session_id=session_id,
+                window_size=window_size,
+                window_step=max(1, int(window_size * (1 - self.config.window_overlap))),
+                max_samples=int(self.config.buffer_size_seconds * sampling_rate),
+                prefiltered=filter_bank is not None,
+            )
+            self._session_order.append(session_id)
+            self.current_session_id = session_id
 
-            logger.info(f"Stream processing started for session {session_id}")
+            # Start the shared scheduler on first session
+            if not self.is_running:
+                self._start_scheduler()
 
-            # Start quality monitoring
-            asyncio.create_task(self._monitor_quality())
+            logger.info(
+                f"Stream processing started for session {session_id} "
+                f"({len(self.sessions)} active)"
+            )
 
             return True
 
@@ -166,34 +299,50 @@ class StreamProcessor:
             return False
 
     async def process_chunk(
-        self, chunk: np.ndarray, timestamp: Optional[float] = None
+        self,
+        chunk: np.ndarray,
+        timestamp: Optional[float] = None,
+        session_id: Optional[str] = None,
     ) -> bool:
         """Process incoming data chunk.
 
         Args:
             chunk: Signal data chunk (channels x samples)
             timestamp: Optional timestamp for synchronization
+            session_id: Target session (defaults to the current session)
 
         Returns:
             Success status
         """
-        if not self.is_running or self.current_session_id is None:
+        session_id = session_id or self.current_session_id
+        session = self.sessions.get(session_id)
+        if not self.is_running or session is None:
             logger.warning("Stream processor not running")
             return False
 
         try:
+            # Backpressure: refuse input while the session's queue is full
+            if (
+                not self.config.drop_on_overflow
+                and len(session.pending) >= self.config.max_processing_queue
+            ):
+                with self._metrics_lock:
+                    session.metrics.buffer_overflows += 1
+                logger.error("Processing queue full, rejecting new samples")
+                return False
+
             # Add to buffer
-            with self._buffer_lock:
+            async with self._buffer_lock:
                 success = await self.buffer_manager.add_samples(
-                    self.current_session_id, chunk, timestamp
+                    session_id, chunk, timestamp
                 )
 
             if not success:
                 with self._metrics_lock:
-                    self.metrics.buffer_overflows += 1
+                    session.metrics.buffer_overflows += 1
 
                 if self.config.on_buffer_overflow:
-                    await self.config.on_buffer_overflow(self.current_session_id)
+                    await self.config.on_buffer_overflow(session_id)
 
                 if self.config.drop_on_overflow:
                     logger.warning("Buffer overflow, dropping oldest samples")
@@ -203,11 +352,11 @@ class StreamProcessor:
 
             # Update metrics
             with self._metrics_lock:
-                self.metrics.samples_received += chunk.shape[1]
-                self.metrics.last_update = datetime.utcnow()
+                session.metrics.samples_received += chunk.shape[1]
+                session.metrics.last_update = datetime.utcnow()
 
             # Check if we have enough samples to process
-            buffer = self.buffer_manager.get_stream_buffer(self.current_session_id)
+            buffer = self.buffer_manager.get_stream_buffer(session_id)
             if buffer and buffer.sample_count >= self.config.min_samples_to_process:
                 # Trigger processing
                 await self._trigger_processing()
@@ -218,262 +367,471 @@ class StreamProcessor:
             logger.error(f"Error processing chunk: {str(e)}")
             return False
 
+    async def process_block(self, block: Any, session_id: Optional[str] = None) -> bool:
+        """Process an incoming device data block.
+
+        Args:
+            block: Data block with ``data`` (channels x samples) and
+                per-sample ``timestamps``
+            session_id: Target session (defaults to the current session)
+
+        Returns:
+            Success status
+        """
+        timestamp = float(block.timestamps[-1]) if block.n_samples else None
+        return await self.process_chunk(block.data, timestamp, session_id)
+
     async def get_latest_features(
-        self, feature_types: Optional[List[str]] = None
+        self,
+        feature_types: Optional[List[str]] = None,
+        session_id: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get the latest extracted features.
 
         Args:
             feature_types: Specific feature types to retrieve
+            session_id: Session to query (defaults to the current session)
 
         Returns:
             Dictionary of latest features or None
         """
-        if self.current_session_id is None:
+        session_id = session_id or self.current_session_id
+        if session_id is None:
             return None
 
         # Get from processor's cache
-        return await self.processor.get_cached_features(
-            self.current_session_id, feature_types
-        )
+        return await self.processor.get_cached_features(session_id, feature_types)
+
+    async def stop_stream(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Stop stream processing for a session and return final metrics.
 
-    async def stop_stream(self) -> Dict[str, Any]:
-        """Stop stream processing and return final metrics.
+        Args:
+            session_id: Session to stop (defaults to the current session)
 
         Returns:
             Final processing metrics
         """
-        logger.info(f"Stopping stream processing for session {self.current_session_id}")
-
-        # Stop processing
-        self.is_running = False
+        session_id = session_id or self.current_session_id
+        logger.info(f"Stopping stream processing for session {session_id}")
+
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return {"session_id": session_id}
+
+        if session_id in self._session_order:
+            self._session_order.remove(session_id)
+        if self.current_session_id == session_id:
+            self.current_session_id = (
+                self._session_order[-1] if self._session_order else None
+            )
 
-        # Wait for processing thread to finish
-        if self.processing_thread:
-            self.processing_thread.join(timeout=5.0)
+        # Wait for in-flight windows of this session to finish
+        deadline = time.monotonic() + 5.0
+        while session.in_flight > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
 
         # Process any remaining data
-        if self.current_session_id:
-            await self._process_remaining_data()
+        await self._process_remaining_data(session)
 
         # Get final metrics
-        with self._metrics_lock:
-            metrics_dict = {
-                "session_id": self.current_session_id,
-                "duration_seconds": (
-                    self.metrics.last_update - self.metrics.start_time
-                ).total_seconds(),
-                "samples_received": self.metrics.samples_received,
-                "samples_processed": self.metrics.samples_processed,
-                "chunks_processed": self.metrics.chunks_processed,
-                "chunks_dropped": self.metrics.chunks_dropped,
-                "avg_processing_time_ms": self.metrics.avg_processing_time_ms,
-                "max_processing_time_ms": self.metrics.max_processing_time_ms,
-                "buffer_overflows": self.metrics.buffer_overflows,
-                "quality_alerts": self.metrics.quality_alerts,
-            }
+        metrics_dict = self._session_metrics_dict(session)
+        metrics_dict["duration_seconds"] = (
+            session.metrics.last_update - session.metrics.start_time
+        ).total_seconds()
 
         # Cleanup
-        if self.current_session_id:
-            await self.buffer_manager.remove_stream_buffer(self.current_session_id)
-            await self.processor.cleanup_session(self.current_session_id)
+        await self.buffer_manager.remove_stream_buffer(session_id)
+        await self.processor.cleanup_session(session_id)
 
-        self.current_session_id = None
+        # Stop the scheduler once the last session is gone
+        if not self.sessions:
+            await self._stop_scheduler()
 
         return metrics_dict
 
-    def _run_processing_loop(self) -> None:
-        """Main processing loop (runs in separate thread)."""
-        asyncio.set_event_loop(asyncio.new_event_loop())
-        loop = asyncio.get_event_loop()
+    async def stop_all_streams(self) -> Dict[str, Dict[str, Any]]:
+        """Stop all active sessions.
+
+        Returns:
+            Final metrics keyed by session ID
+        """
+        results = {}
+        for session_id in list(self.sessions.keys()):
+            results[session_id] = await self.stop_stream(session_id)
+        return results
+
+    def _start_scheduler(self) -> None:
+        """Start the shared scheduler and worker pool."""
+        self.is_running = True
+        self._work_available = asyncio.Event()
+        self._worker_pool = _WorkerPool(self.config.max_workers)
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
+        # Start quality monitoring
+        self._quality_task = asyncio.create_task(self._monitor_quality())
+
+        logger.info(f"Stream scheduler started with {self.config.max_workers} workers")
+
+    async def _stop_scheduler(self) -> None:
+        """Stop the shared scheduler and worker pool."""
+        self.is_running = False
+
+        for task in (self._scheduler_task, self._quality_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        if self._worker_pool:
+            self._worker_pool.shutdown()
+
+        self._scheduler_task = None
+        self._quality_task = None
+        self._worker_pool = None
+        logger.info("Stream scheduler stopped")
+
+    async def _scheduler_loop(self) -> None:
+        """Collect ready windows from all sessions and dispatch them."""
         while self.is_running:
             try:
-                # Process at regular intervals
-                loop.run_until_complete(self._process_windows())
-                time.sleep(self.config.process_interval_ms / 1000.0)
+                # Wake on new data, completed work, or the polling interval
+                try:
+                    await asyncio.wait_for(
+                        self._work_available.wait(),
+                        timeout=self.config.process_interval_ms / 1000.0,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._work_available.clear()
 
+                await self._collect_windows()
+                self._dispatch_windows()
+
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Error in processing loop: {str(e)}")
 
     async def _trigger_processing(self) -> None:
         """Trigger immediate processing of available data."""
-        try:
-            # Add processing request to queue
-            if not self.processing_queue.full():
-                await self.processing_queue.put(time.time())
-        except Exception:
-            pass
-
-    async def _process_windows(self) -> None:
-        """Process available windows from buffer."""
-        if self.current_session_id is None:
-            return
+        if self._work_available is not None:
+            self._work_available.set()
 
-        buffer = self.buffer_manager.get_stream_buffer(self.current_session_id)
-        if not buffer:
-            return
+    async def _collect_windows(self) -> None:
+        """Move newly available windows from the buffers into session queues."""
+        ready_time = time.perf_counter()
 
-        # Get available windows
-        with self._buffer_lock:
-            windows = await self.buffer_manager.get_windows(
-                self.current_session_id, self.window_size, self.window_step
-            )
-
-        if not windows:
-            return
+        for session in list(self.sessions.values()):
+            async with self._buffer_lock:
+                windows = await self.buffer_manager.get_windows(
+                    session.session_id, session.window_size, session.window_step
+                )
+                buffer = self.buffer_manager.get_stream_buffer(session.session_id)
+                # Stream index of the oldest buffered sample
+                offset = (
+                    buffer.total_samples_written - buffer.sample_count if buffer else 0
+                )
 
-        # Process each window
-        for window_data, window_info in windows:
-            start_time = time.perf_counter()
+            for window_data, window_info in windows:
+                # Samples not covered by an earlier window of the session
+                start = offset + window_info["start_sample"]
+                end = offset + window_info["end_sample"]
+                window_info["new_samples"] = end - max(start, session.windowed_until)
+                session.windowed_until = end
+                session.pending.append((window_data, window_info, ready_time))
+
+            # Bound the queue; oldest windows are the least useful in real
+            # time. Without dropping, process_chunk rejects input instead.
+            if not self.config.drop_on_overflow:
+                continue
+
+            dropped = 0
+            while len(session.pending) > self.config.max_processing_queue:
+                session.pending.popleft()
+                dropped += 1
+
+            if dropped:
+                with self._metrics_lock:
+                    session.metrics.chunks_dropped += dropped
+                logger.warning(
+                    f"Session {session.session_id} falling behind, "
+                    f"dropped {dropped} windows"
+                )
 
-            try:
-                # Process window
-                result = await self.processor.process_stream_chunk(
-                    window_data, self.current_session_id
+    def _dispatch_windows(self) -> None:
+        """Dispatch pending windows round-robin until all workers are busy."""
+        while self._in_flight < self.config.max_workers:
+            dispatched = False
+
+            for _ in range(len(self._session_order)):
+                session_id = self._session_order[0]
+                self._session_order.rotate(-1)
+
+                session = self.sessions.get(session_id)
+                if (
+                    session is None
+                    or not session.pending
+                    or session.in_flight >= self.config.max_in_flight_per_session
+                ):
+                    continue
+
+                window_data, window_info, ready_time = session.pending.popleft()
+                session.in_flight += 1
+                self._in_flight += 1
+                asyncio.create_task(
+                    self._run_window(session, window_data, window_info, ready_time)
                 )
+                dispatched = True
 
-                if result and result.success:
-                    # Update metrics
-                    processing_time = (time.perf_counter() - start_time) * 1000
-                    self._update_processing_metrics(
-                        window_data.shape[1], processing_time, result.quality_score
-                    )
+                if self._in_flight >= self.config.max_workers:
+                    return
 
-                    # Callback with results
-                    if self.config.on_processed:
-                        await self.config.on_processed(
-                            self.current_session_id, result, window_info
-                        )
-                else:
-                    with self._metrics_lock:
-                        self.metrics.chunks_dropped += 1
+            if not dispatched:
+                return
 
-            except Exception as e:
-                logger.error(f"Error processing window: {str(e)}")
+    async def _run_window(
+        self,
+        session: SessionStream,
+        window_data: np.ndarray,
+        window_info: Dict[str, Any],
+        ready_time: float,
+    ) -> None:
+        """Process a single window on the worker pool."""
+        start_time = time.perf_counter()
+
+        try:
+            future = self._worker_pool.submit(
+                self.processor.process_stream_chunk(
+                    window_data,
+                    session.session_id,
+                    prefiltered=session.prefiltered,
+                    new_samples=window_info.get("new_samples"),
+                ),
+                session.session_id,
+            )
+            result = await asyncio.wrap_future(future)
+
+            if result is not None:
+                end_time = time.perf_counter()
+                self._update_processing_metrics(
+                    session,
+                    window_data.shape[1],
+                    (end_time - start_time) * 1000,
+                    result.chunk_quality.overall_quality,
+                    latency_ms=(end_time - ready_time) * 1000,
+                    queue_wait_ms=(start_time - ready_time) * 1000,
+                )
+
+                # Callback with results
+                if self.config.on_processed:
+                    await self.config.on_processed(
+                        session.session_id, result, window_info
+                    )
+            else:
                 with self._metrics_lock:
-                    self.metrics.chunks_dropped += 1
+                    session.metrics.chunks_dropped += 1
 
-    async def _process_remaining_data(self) -> None:
-        """Process any remaining data in buffer."""
-        if self.current_session_id is None:
-            return
+        except Exception as e:
+            logger.error(f"Error processing window: {str(e)}")
+            with self._metrics_lock:
+                session.metrics.chunks_dropped += 1
+
+        finally:
+            session.in_flight -= 1
+            self._in_flight -= 1
+            await self._trigger_processing()
 
-        buffer = self.buffer_manager.get_stream_buffer(self.current_session_id)
+    async def _process_remaining_data(self, session: SessionStream) -> None:
+        """Process any remaining data in a session's buffer."""
+        buffer = self.buffer_manager.get_stream_buffer(session.session_id)
         if not buffer or buffer.sample_count == 0:
             return
 
         # Get all remaining data
-        with self._buffer_lock:
+        async with self._buffer_lock:
             remaining_data = await self.buffer_manager.get_samples(
-                self.current_session_id, buffer.sample_count
+                session.session_id, buffer.sample_count
             )
+            new_samples = buffer.total_samples_written - session.windowed_until
 
         if remaining_data is not None and remaining_data.shape[1] > 0:
             try:
                 # Process as final batch
                 result = await self.processor.process_stream_chunk(
-                    remaining_data, self.current_session_id
+                    remaining_data,
+                    session.session_id,
+                    prefiltered=session.prefiltered,
+                    new_samples=new_samples,
                 )
 
-                if result and result.success:
+                if result is not None:
                     self._update_processing_metrics(
+                        session,
                         remaining_data.shape[1],
                         0,  # Don't track time for final batch
-                        result.quality_score,
+                        result.chunk_quality.overall_quality,
                     )
 
             except Exception as e:
                 logger.error(f"Error processing remaining data: {str(e)}")
 
     async def _monitor_quality(self) -> None:
-        """Monitor signal quality periodically."""
+        """Monitor signal quality of all sessions periodically."""
         while self.is_running:
             try:
                 await asyncio.sleep(self.config.quality_check_interval)
 
-                if self.current_session_id:
+                for session in list(self.sessions.values()):
                     # Get recent quality score
                     with self._metrics_lock:
-                        quality_score = self.metrics.last_quality_score
+                        quality_score = session.metrics.last_quality_score
 
                     # Check quality threshold
                     if quality_score < self.config.min_quality_score:
                         with self._metrics_lock:
-                            self.metrics.quality_alerts += 1
+                            session.metrics.quality_alerts += 1
 
                         if self.config.on_quality_alert:
                             await self.config.on_quality_alert(
-                                self.current_session_id, quality_score
+                                session.session_id, quality_score
                             )
 
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Error in quality monitoring: {str(e)}")
 
     def _update_processing_metrics(
-        self, samples_processed: int, processing_time_ms: float, quality_score: float
+        self,
+        session: SessionStream,
+        samples_processed: int,
+        processing_time_ms: float,
+        quality_score: float,
+        latency_ms: Optional[float] = None,
+        queue_wait_ms: Optional[float] = None,
     ) -> None:
-        """Update processing metrics.
+        """Update processing metrics for a session.
 
         Args:
+            session: Session the window belonged to
             samples_processed: Number of samples processed
             processing_time_ms: Processing time in milliseconds
             quality_score: Signal quality score
+            latency_ms: Window ready to result latency in milliseconds
+            queue_wait_ms: Time the window waited for a worker
         """
         with self._metrics_lock:
-            self.metrics.samples_processed += samples_processed
-            self.metrics.chunks_processed += 1
-            self.metrics.last_quality_score = quality_score
+            metrics = session.metrics
+            metrics.samples_processed += samples_processed
+            metrics.chunks_processed += 1
+            metrics.last_quality_score = quality_score
 
             # Update processing time statistics
-            self._processing_times.append(processing_time_ms)
-            self.metrics.avg_processing_time_ms = np.mean(self._processing_times)
-            self.metrics.max_processing_time_ms = max(
-                self.metrics.max_processing_time_ms, processing_time_ms
+            session.processing_times.append(processing_time_ms)
+            metrics.avg_processing_time_ms = float(np.mean(session.processing_times))
+            metrics.max_processing_time_ms = max(
+                metrics.max_processing_time_ms, processing_time_ms
             )
 
+            # Update end-to-end latency statistics
+            if latency_ms is not None:
+                session.latencies.append(latency_ms)
+                session.queue_waits.append(queue_wait_ms or 0.0)
+                latencies = np.fromiter(session.latencies, dtype=float)
+                metrics.avg_latency_ms = float(latencies.mean())
+                metrics.p95_latency_ms = float(np.percentile(latencies, 95))
+                metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+                metrics.avg_queue_wait_ms = float(np.mean(session.queue_waits))
+
             # Update buffer fill
-            if self.current_session_id:
-                buffer = self.buffer_manager.get_stream_buffer(self.current_session_id)
-                if buffer:
-                    max_samples = int(
-                        self.config.buffer_size_seconds
-                        * self.processor.config.sampling_rate
-                    )
-                    self.metrics.current_buffer_fill = (
-                        buffer.sample_count / max_samples * 100
-                    )
+            buffer = self.buffer_manager.get_stream_buffer(session.session_id)
+            if buffer:
+                metrics.current_buffer_fill = (
+                    buffer.sample_count / session.max_samples * 100
+                )
+
+    def _session_metrics_dict(self, session: SessionStream) -> Dict[str, Any]:
+        """Build the metrics dictionary for a session."""
+        with self._metrics_lock:
+            metrics = session.metrics
+            return {
+                "session_id": session.session_id,
+                "samples_received": metrics.samples_received,
+                "samples_processed": metrics.samples_processed,
+                "chunks_processed": metrics.chunks_processed,
+                "chunks_dropped": metrics.chunks_dropped,
+                "windows_pending": len(session.pending),
+                "avg_processing_time_ms": round(metrics.avg_processing_time_ms, 2),
+                "max_processing_time_ms": round(metrics.max_processing_time_ms, 2),
+                "avg_latency_ms": round(metrics.avg_latency_ms, 2),
+                "p95_latency_ms": round(metrics.p95_latency_ms, 2),
+                "max_latency_ms": round(metrics.max_latency_ms, 2),
+                "avg_queue_wait_ms": round(metrics.avg_queue_wait_ms, 2),
+                "buffer_fill_percent": round(metrics.current_buffer_fill, 1),
+                "buffer_overflows": metrics.buffer_overflows,
+                "quality_score": round(metrics.last_quality_score, 3),
+                "quality_alerts": metrics.quality_alerts,
+            }
 
-    def get_stream_metrics(self) -> Dict[str, Any]:
+    def get_stream_metrics(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Get current stream processing metrics.
 
+        Args:
+            session_id: Session to report (defaults to the current session)
+
         Returns:
             Dictionary of current metrics
         """
+        session_id = session_id or self.current_session_id
+        session = self.sessions.get(session_id)
+        if session is None:
+            return {"is_running": False, "session_id": session_id}
+
+        metrics_dict = self._session_metrics_dict(session)
+        metrics_dict["is_running"] = self.is_running
+        metrics_dict["uptime_seconds"] = (
+            datetime.utcnow() - session.metrics.start_time
+        ).total_seconds()
+        return metrics_dict
+
+    def get_session_latencies(self) -> Dict[str, Dict[str, float]]:
+        """Get end-to-end latency statistics for every active session.
+
+        Returns:
+            Mapping of session ID to latency statistics in milliseconds
+        """
         with self._metrics_lock:
             return {
-                "is_running": self.is_running,
-                "session_id": self.current_session_id,
-                "samples_received": self.metrics.samples_received,
-                "samples_processed": self.metrics.samples_processed,
-                "chunks_processed": self.metrics.chunks_processed,
-                "chunks_dropped": self.metrics.chunks_dropped,
-                "avg_processing_time_ms": round(self.metrics.avg_processing_time_ms, 2),
-                "max_processing_time_ms": round(self.metrics.max_processing_time_ms, 2),
-                "buffer_fill_percent": round(self.metrics.current_buffer_fill, 1),
-                "buffer_overflows": self.metrics.buffer_overflows,
-                "quality_score": round(self.metrics.last_quality_score, 3),
-                "quality_alerts": self.metrics.quality_alerts,
-                "uptime_seconds": (
-                    (datetime.utcnow() - self.metrics.start_time).total_seconds()
-                    if self.is_running
-                    else 0
-                ),
+                session_id: {
+                    "avg_latency_ms": session.metrics.avg_latency_ms,
+                    "p95_latency_ms": session.metrics.p95_latency_ms,
+                    "max_latency_ms": session.metrics.max_latency_ms,
+                    "avg_queue_wait_ms": session.metrics.avg_queue_wait_ms,
+                }
+                for session_id, session in self.sessions.items()
             }
 
+    def get_scheduler_status(self) -> Dict[str, Any]:
+        """Get shared scheduler status.
+
+        Returns:
+            Dictionary with worker and queue utilisation
+        """
+        return {
+            "is_running": self.is_running,
+            "active_sessions": len(self.sessions),
+            "max_workers": self.config.max_workers,
+            "windows_in_flight": self._in_flight,
+            "windows_pending": sum(len(s.pending) for s in self.sessions.values()),
+        }
+
     def update_config(self, params: Dict[str, Any]) -> None:
         """Update stream processor configuration.
 
+        Window changes apply to sessions started afterwards.
+
         Args:
             params: Parameters to update
         """
@@ -495,3 +853,6 @@ class StreamProcessor:
 
         if "min_quality_score" in params:
             self.config.min_quality_score = params["min_quality_score"]
+
+        if "max_processing_queue" in params:
+            self.config.max_processing_queue = params["max_processing_queue"]
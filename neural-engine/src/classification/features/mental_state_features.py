@@ -3,12 +3,13 @@ Feature extraction for mental state classification
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 import numpy as np
 from scipy import signal
 
 from ..interfaces import BaseFeatureExtractor
 from ..types import FeatureVector, NeuralData
+from ..utils.feature_cache import FeatureWindow, get_feature_window
 
 logger = logging.getLogger(__name__)
 
@@ -98,9 +99,12 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
         """
         try:
             features = {}
+            window = get_feature_window(data)
 
             # Calculate power spectral density
-            psd_features = self._calculate_psd_features(data.data, data.sampling_rate)
+            psd_features = self._calculate_psd_features(
+                data.data, data.sampling_rate, window
+            )
             features.update(psd_features)
 
             # Calculate band ratios
@@ -109,13 +113,13 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
 
             # Calculate spatial features
             spatial_features = self._calculate_spatial_features(
-                data.data, data.channels, data.sampling_rate
+                data.data, data.channels, data.sampling_rate, window
             )
             features.update(spatial_features)
 
             # Calculate complexity measures
             complexity_features = self._calculate_complexity_features(
-                data.data, data.sampling_rate
+                data.data, data.sampling_rate, window
             )
             features.update(complexity_features)
 
@@ -138,34 +142,20 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
             raise
 
     def _calculate_psd_features(
-        self, eeg_data: np.ndarray, fs: float
+        self, eeg_data: np.ndarray, fs: float, window: Optional[FeatureWindow] = None
     ) -> Dict[str, np.ndarray]:
         """Calculate power spectral density features"""
         features = {}
 
-        # Calculate PSD for each channel
-        n_channels = eeg_data.shape[0]
+        if window is None:
+            window = FeatureWindow(eeg_data, fs)
+        nperseg = min(256, eeg_data.shape[1] // 4)
 
+        # Band power of each channel from the shared Welch PSD
         for band_name, (low_freq, high_freq) in self.bands.items():
-            band_powers = []
-
-            for ch in range(n_channels):
-                # Compute PSD using Welch's method
-                freqs, psd = signal.welch(
-                    eeg_data[ch, :],
-                    fs=fs,
-                    nperseg=min(256, eeg_data.shape[1] // 4),
-                    noverlap=None,
-                    nfft=None,
-                    detrend="constant",
-                )
-
-                # Extract band power
-                band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                band_power = np.trapz(psd[band_mask], freqs[band_mask])
-                band_powers.append(band_power)
-
-            features[f"{band_name}_power"] = np.array(band_powers)
+            features[f"{band_name}_power"] = window.band_power(
+                low_freq, high_freq, nperseg
+            )
 
         return features
 
@@ -196,11 +186,19 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
         return features
 
     def _calculate_spatial_features(
-        self, eeg_data: np.ndarray, channel_names: List[str], fs: float
+        self,
+        eeg_data: np.ndarray,
+        channel_names: List[str],
+        fs: float,
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Calculate spatial features based on channel locations"""
         features = {}
 
+        if window is None:
+            window = FeatureWindow(eeg_data, fs)
+        nperseg = min(256, eeg_data.shape[1] // 4)
+
         # Create channel index mapping
         ch_indices = {ch: i for i, ch in enumerate(channel_names)}
 
@@ -210,35 +208,18 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
         ]
         if frontal_channels:
             frontal_idx = [ch_indices[ch] for ch in frontal_channels]
-            frontal_data = eeg_data[frontal_idx, :]
 
-            # Calculate frontal theta power
-            freqs, psd = signal.welch(
-                frontal_data.mean(axis=0),  # Average across frontal channels
-                fs=fs,
-                nperseg=min(256, eeg_data.shape[1] // 4),
-            )
-            theta_mask = (freqs >= 4) & (freqs <= 8)
-            frontal_theta = np.trapz(psd[theta_mask], freqs[theta_mask])
-            features["frontal_theta"] = np.array([frontal_theta])
+            # Calculate theta power of the average across frontal channels
+            frontal_theta = window.channel_mean(frontal_idx).band_power(4, 8, nperseg)
+            features["frontal_theta"] = frontal_theta
 
         # Frontal alpha asymmetry (emotional valence)
         if "F3" in ch_indices and "F4" in ch_indices:
-            f3_idx = ch_indices["F3"]
-            f4_idx = ch_indices["F4"]
-
             # Calculate alpha power for each hemisphere
-            freqs_f3, psd_f3 = signal.welch(
-                eeg_data[f3_idx, :], fs=fs, nperseg=min(256, eeg_data.shape[1] // 4)
-            )
-            freqs_f4, psd_f4 = signal.welch(
-                eeg_data[f4_idx, :], fs=fs, nperseg=min(256, eeg_data.shape[1] // 4)
+            alpha_f3, alpha_f4 = window.band_power(
+                8, 13, nperseg, rows=[ch_indices["F3"], ch_indices["F4"]]
             )
 
-            alpha_mask = (freqs_f3 >= 8) & (freqs_f3 <= 13)
-            alpha_f3 = np.trapz(psd_f3[alpha_mask], freqs_f3[alpha_mask])
-            alpha_f4 = np.trapz(psd_f4[alpha_mask], freqs_f4[alpha_mask])
-
             # Asymmetry: ln(right) - ln(left)
             features["frontal_alpha_asymmetry"] = np.array(
                 [np.log(alpha_f4 + 1e-10) - np.log(alpha_f3 + 1e-10)]
@@ -246,27 +227,25 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
 
         # General alpha asymmetry
         features["alpha_asymmetry"] = self._calculate_hemispheric_asymmetry(
-            eeg_data, channel_names, fs, "alpha"
+            eeg_data, channel_names, fs, "alpha", window
         )
 
         # Frontal beta (stress/anxiety indicator)
         if frontal_channels:
-            frontal_beta = []
-            for ch in frontal_channels:
-                idx = ch_indices[ch]
-                freqs, psd = signal.welch(
-                    eeg_data[idx, :], fs=fs, nperseg=min(256, eeg_data.shape[1] // 4)
-                )
-                beta_mask = (freqs >= 13) & (freqs <= 30)
-                beta_power = np.trapz(psd[beta_mask], freqs[beta_mask])
-                frontal_beta.append(beta_power)
-
+            frontal_beta = window.band_power(
+                13, 30, nperseg, rows=[ch_indices[ch] for ch in frontal_channels]
+            )
             features["frontal_beta"] = np.array([np.mean(frontal_beta)])
 
         return features
 
     def _calculate_hemispheric_asymmetry(
-        self, eeg_data: np.ndarray, channel_names: List[str], fs: float, band: str
+        self,
+        eeg_data: np.ndarray,
+        channel_names: List[str],
+        fs: float,
+        band: str,
+        window: Optional[FeatureWindow] = None,
     ) -> np.ndarray:
         """Calculate hemispheric asymmetry for a given frequency band"""
         # Define hemisphere pairs
@@ -278,32 +257,23 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
             ("O1", "O2"),
         ]
 
+        if window is None:
+            window = FeatureWindow(eeg_data, fs)
+        nperseg = min(256, eeg_data.shape[1] // 4)
+        low_freq, high_freq = self.bands[band]
+
         ch_indices = {ch: i for i, ch in enumerate(channel_names)}
         asymmetries = []
 
         for left, right in hemisphere_pairs:
             if left in ch_indices and right in ch_indices:
-                left_idx = ch_indices[left]
-                right_idx = ch_indices[right]
-
                 # Calculate band power for each hemisphere
-                freqs_l, psd_l = signal.welch(
-                    eeg_data[left_idx, :],
-                    fs=fs,
-                    nperseg=min(256, eeg_data.shape[1] // 4),
+                power_l, power_r = window.band_power(
+                    low_freq,
+                    high_freq,
+                    nperseg,
+                    rows=[ch_indices[left], ch_indices[right]],
                 )
-                freqs_r, psd_r = signal.welch(
-                    eeg_data[right_idx, :],
-                    fs=fs,
-                    nperseg=min(256, eeg_data.shape[1] // 4),
-                )
-
-                # Get band frequencies
-                low_freq, high_freq = self.bands[band]
-                band_mask = (freqs_l >= low_freq) & (freqs_l <= high_freq)
-
-                power_l = np.trapz(psd_l[band_mask], freqs_l[band_mask])
-                power_r = np.trapz(psd_r[band_mask], freqs_r[band_mask])
 
                 # Calculate asymmetry
                 asymmetry = (power_r - power_l) / (power_r + power_l + 1e-10)
@@ -312,27 +282,24 @@ class MentalStateFeatureExtractor(BaseFeatureExtractor):
         return np.array([np.mean(asymmetries)]) if asymmetries else np.array([0.0])
 
     def _calculate_complexity_features(
-        self, eeg_data: np.ndarray, fs: float
+        self, eeg_data: np.ndarray, fs: float, window: Optional[FeatureWindow] = None
     ) -> Dict[str, np.ndarray]:
         """Calculate signal complexity features"""
         features = {}
 
-        # Spectral entropy (measure of signal complexity)
-        spectral_entropies = []
-
-        for ch in range(eeg_data.shape[0]):
-            freqs, psd = signal.welch(
-                eeg_data[ch, :], fs=fs, nperseg=min(256, eeg_data.shape[1] // 4)
-            )
+        if window is None:
+            window = FeatureWindow(eeg_data, fs)
 
-            # Normalize PSD to get probability distribution
-            psd_norm = psd / (np.sum(psd) + 1e-10)
+        # Spectral entropy (measure of signal complexity)
+        _, psd = window.psd(min(256, eeg_data.shape[1] // 4))
 
-            # Calculate Shannon entropy
-            spectral_entropy = -np.sum(psd_norm * np.log2(psd_norm + 1e-10))
-            spectral_entropies.append(spectral_entropy)
+        # Normalize PSD to get probability distribution
+        psd_norm = psd / (np.sum(psd, axis=1, keepdims=True) + 1e-10)
 
-        features["spectral_entropy"] = np.array(spectral_entropies)
+        # Calculate Shannon entropy
+        features["spectral_entropy"] = -np.sum(
+            psd_norm * np.log2(psd_norm + 1e-10), axis=1
+        )
 
         # Attention index (theta + beta) / (alpha)
         if hasattr(self, "_last_psd_features"):
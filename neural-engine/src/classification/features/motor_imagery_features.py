@@ -5,10 +5,11 @@ Feature extraction for motor imagery classification
 import logging
 from typing import Dict, List, Optional
 import numpy as np
-from scipy import signal, linalg
+from scipy import linalg
 
 from ..interfaces import BaseFeatureExtractor
 from ..types import NeuralData, FeatureVector
+from ..utils.feature_cache import FeatureWindow, get_feature_window
 
 logger = logging.getLogger(__name__)
 
@@ -75,16 +76,17 @@ class MotorImageryFeatureExtractor(BaseFeatureExtractor):
             signal_data = data.data
             sampling_rate = data.sampling_rate
             channels = data.channels
+            window = get_feature_window(data)
 
             # Extract band power features
             band_features = await self._extract_band_power(
-                signal_data, sampling_rate, channels
+                signal_data, sampling_rate, channels, window
             )
             features.update(band_features)
 
             # Extract hemisphere-specific features
             hemisphere_features = await self._extract_hemisphere_features(
-                signal_data, sampling_rate, channels
+                signal_data, sampling_rate, channels, window
             )
             features.update(hemisphere_features)
 
@@ -123,26 +125,23 @@ class MotorImageryFeatureExtractor(BaseFeatureExtractor):
             raise
 
     async def _extract_band_power(
-        self, data: np.ndarray, sampling_rate: float, channels: List[str]
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        channels: List[str],
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Extract band power features"""
         features = {}
 
-        for band_name, (low_freq, high_freq) in self.freq_bands.items():
-            band_powers = []
-
-            for channel_data in data:
-                # Compute power spectral density
-                freqs, psd = signal.welch(
-                    channel_data, fs=sampling_rate, nperseg=min(256, len(channel_data))
-                )
+        if window is None:
+            window = FeatureWindow(data, sampling_rate)
 
-                # Extract band power
-                band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                band_power = np.trapz(psd[band_mask], freqs[band_mask])
-                band_powers.append(band_power)
-
-            features[f"{band_name}_power"] = np.array(band_powers)
+        for band_name, (low_freq, high_freq) in self.freq_bands.items():
+            # Band power of each channel from the shared Welch PSD
+            features[f"{band_name}_power"] = window.band_power(
+                low_freq, high_freq, nperseg=min(256, data.shape[1])
+            )
 
         # Calculate band power ratios
         if "beta_power" in features and "alpha_power" in features:
@@ -158,11 +157,18 @@ class MotorImageryFeatureExtractor(BaseFeatureExtractor):
         return features
 
     async def _extract_hemisphere_features(
-        self, data: np.ndarray, sampling_rate: float, channels: List[str]
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        channels: List[str],
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Extract hemisphere-specific features"""
         features = {}
 
+        if window is None:
+            window = FeatureWindow(data, sampling_rate)
+
         # Create channel index mapping
         channel_indices = {ch: i for i, ch in enumerate(channels)}
 
@@ -177,26 +183,14 @@ class MotorImageryFeatureExtractor(BaseFeatureExtractor):
             if not indices:
                 continue
 
-            # Extract hemisphere-specific data
-            hemisphere_data = data[indices]
-
             # Compute mu and beta power for this hemisphere
             for band_name, (low_freq, high_freq) in [
                 ("mu", (8, 12)),
                 ("beta", (13, 30)),
             ]:
-                powers = []
-
-                for channel_data in hemisphere_data:
-                    freqs, psd = signal.welch(
-                        channel_data,
-                        fs=sampling_rate,
-                        nperseg=min(256, len(channel_data)),
-                    )
-
-                    band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                    band_power = np.trapz(psd[band_mask], freqs[band_mask])
-                    powers.append(band_power)
+                powers = window.band_power(
+                    low_freq, high_freq, nperseg=min(256, data.shape[1]), rows=indices
+                )
 
                 # Average power across hemisphere
                 features[f"{hemisphere}_hemisphere_{band_name}_power"] = np.array(
@@ -389,3 +383,7 @@ class MotorImageryFeatureExtractor(BaseFeatureExtractor):
             "spatial_complexity",
             "spatial_focus",
         ]
+
+    def get_required_window_size(self) -> float:
+        """Get required window size in milliseconds"""
+        return self.window_size_ms
@@ -6,11 +6,13 @@ import logging
 from typing import Dict, List, Optional
 import numpy as np
 from scipy import signal
-from scipy.signal import hilbert
 import pywt
 
+from common.entropy import approximate_entropy, sample_entropy
+
 from ..interfaces import BaseFeatureExtractor
 from ..types import NeuralData, FeatureVector
+from ..utils.feature_cache import FeatureWindow, get_feature_window
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +31,16 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
     - Spike detection
     """
 
-    def __init__(self, window_size_ms: float = 1000.0):
+    def __init__(
+        self, window_size_ms: float = 1000.0, entropy_max_error: Optional[float] = None
+    ):
         """
         Initialize seizure feature extractor
 
         Args:
             window_size_ms: Window size in milliseconds
+            entropy_max_error: Error bound of the sample entropy match
+                probability for long windows, or None to compute it exactly
         """
         self.window_size_ms = window_size_ms
 
@@ -56,6 +62,11 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
         self.spike_threshold = 3.5  # Standard deviations
         self.spike_min_distance_ms = 20
 
+        # Entropy parameters
+        self.entropy_m = 2  # Pattern length
+        self.entropy_tolerance = 0.2  # Standard deviations
+        self.entropy_max_error = entropy_max_error
+
         # Initialize previous features for velocity calculation
         self._previous_features: Optional[Dict[str, np.ndarray]] = None
 
@@ -75,16 +86,17 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
             # Convert to numpy array
             signal_data = data.data
             sampling_rate = data.sampling_rate
+            window = get_feature_window(data)
 
             # Extract spectral features
             spectral_features = await self._extract_spectral_features(
-                signal_data, sampling_rate
+                signal_data, sampling_rate, window
             )
             features.update(spectral_features)
 
             # Extract temporal features
             temporal_features = await self._extract_temporal_features(
-                signal_data, sampling_rate
+                signal_data, sampling_rate, window
             )
             features.update(temporal_features)
 
@@ -96,7 +108,7 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
 
             # Extract synchronization features
             sync_features = await self._extract_synchronization_features(
-                signal_data, sampling_rate
+                signal_data, sampling_rate, window
             )
             features.update(sync_features)
 
@@ -130,51 +142,49 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
             raise
 
     async def _extract_spectral_features(
-        self, data: np.ndarray, sampling_rate: float
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Extract spectral features"""
         features = {}
 
-        # Spectral edge frequency (95th percentile)
-        sef_values = []
-        for channel in data:
-            freqs, psd = signal.welch(channel, fs=sampling_rate, nperseg=256)
-            cumsum_psd = np.cumsum(psd)
-            total_power = cumsum_psd[-1]
-            sef_idx = np.where(cumsum_psd >= 0.95 * total_power)[0][0]
-            sef_values.append(freqs[sef_idx])
+        if window is None:
+            window = FeatureWindow(data, sampling_rate)
+        freqs, psd = window.psd(nperseg=256)
 
-        features["spectral_edge_frequency"] = np.array(sef_values)
+        # Spectral edge frequency (95th percentile)
+        cumsum_psd = np.cumsum(psd, axis=1)
+        sef_idx = np.argmax(cumsum_psd >= 0.95 * cumsum_psd[:, -1:], axis=1)
+        features["spectral_edge_frequency"] = freqs[sef_idx]
 
         # Band power ratios
         for band_name, (low_freq, high_freq) in self.freq_bands.items():
-            band_powers = []
-            for channel in data:
-                freqs, psd = signal.welch(channel, fs=sampling_rate, nperseg=256)
-                band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-                band_power = np.trapz(psd[band_mask], freqs[band_mask])
-                band_powers.append(band_power)
-
-            features[f"{band_name}_power"] = np.array(band_powers)
+            features[f"{band_name}_power"] = window.band_power(
+                low_freq, high_freq, nperseg=256
+            )
 
         # Spectral entropy
-        spectral_entropy = []
-        for channel in data:
-            freqs, psd = signal.welch(channel, fs=sampling_rate, nperseg=256)
-            psd_norm = psd / psd.sum()
-            entropy_val = -np.sum(psd_norm * np.log2(psd_norm + 1e-15))
-            spectral_entropy.append(entropy_val)
-
-        features["spectral_entropy"] = np.array(spectral_entropy)
+        psd_norm = psd / psd.sum(axis=1, keepdims=True)
+        features["spectral_entropy"] = -np.sum(
+            psd_norm * np.log2(psd_norm + 1e-15), axis=1
+        )
 
         return features
 
     async def _extract_temporal_features(
-        self, data: np.ndarray, sampling_rate: float
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Extract temporal features"""
         features = {}
 
+        if window is None:
+            window = FeatureWindow(data, sampling_rate)
+
         # Line length
         line_lengths = []
         for channel in data:
@@ -184,39 +194,10 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
         features["line_length"] = np.array(line_lengths)
 
         # Hjorth parameters
-        activity = []
-        mobility = []
-        complexity = []
-
-        for channel in data:
-            # Activity (variance)
-            act = np.var(channel)
-            activity.append(act)
-
-            # First derivative
-            first_deriv = np.diff(channel)
-
-            # Mobility
-            mob = np.sqrt(np.var(first_deriv) / act) if act > 0 else 0
-            mobility.append(mob)
-
-            # Second derivative
-            second_deriv = np.diff(first_deriv)
-
-            # Complexity
-            if np.var(first_deriv) > 0:
-                comp = (
-                    np.sqrt(np.var(second_deriv) / np.var(first_deriv)) / mob
-                    if mob > 0
-                    else 0
-                )
-            else:
-                comp = 0
-            complexity.append(comp)
-
-        features["hjorth_activity"] = np.array(activity)
-        features["hjorth_mobility"] = np.array(mobility)
-        features["hjorth_complexity"] = np.array(complexity)
+        hjorth = window.hjorth()
+        features["hjorth_activity"] = hjorth[:, 0]
+        features["hjorth_mobility"] = hjorth[:, 1]
+        features["hjorth_complexity"] = hjorth[:, 2]
 
         # Non-linear energy
         nle = []
@@ -269,115 +250,70 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
         return features
 
     async def _extract_synchronization_features(
-        self, data: np.ndarray, sampling_rate: float
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        window: Optional[FeatureWindow] = None,
     ) -> Dict[str, np.ndarray]:
         """Extract phase synchronization features"""
         features = {}
 
+        if window is None:
+            window = FeatureWindow(data, sampling_rate)
         n_channels = data.shape[0]
 
-        # Phase synchronization between channel pairs
+        # Instantaneous phase and auto-spectra are computed once per channel
+        phases = np.angle(window.analytic_signal())
+        freqs, auto_psd = window.psd(nperseg=128)
+        beta_mask = (freqs >= 12) & (freqs <= 30)
+
+        # Phase synchronization between channel pairs (i, j > i)
         sync_values = []
         coherence_values = []
 
-        for i in range(n_channels):
-            for j in range(i + 1, n_channels):
-                # Hilbert transform for instantaneous phase
-                analytic1 = hilbert(data[i])
-                analytic2 = hilbert(data[j])
-
-                phase1 = np.angle(analytic1)
-                phase2 = np.angle(analytic2)
-
-                # Phase locking value (PLV)
-                phase_diff = phase1 - phase2
-                plv = np.abs(np.mean(np.exp(1j * phase_diff)))
-                sync_values.append(plv)
+        for i in range(n_channels - 1):
+            # Phase locking value (PLV)
+            phase_diff = phases[i] - phases[i + 1 :]
+            plv = np.abs(np.mean(np.exp(1j * phase_diff), axis=1))
+            sync_values.append(plv)
 
-                # Coherence in specific bands
-                freqs, coherence = signal.coherence(
-                    data[i], data[j], fs=sampling_rate, nperseg=128
-                )
+            # Coherence as in signal.coherence, reusing the auto-spectra
+            _, cross_psd = signal.csd(
+                data[i], data[i + 1 :], fs=sampling_rate, nperseg=128, axis=-1
+            )
+            coherence = np.abs(cross_psd) ** 2 / auto_psd[i] / auto_psd[i + 1 :]
 
-                # Average coherence in beta band (important for seizures)
-                beta_mask = (freqs >= 12) & (freqs <= 30)
-                beta_coherence = np.mean(coherence[beta_mask])
-                coherence_values.append(beta_coherence)
+            # Average coherence in beta band (important for seizures)
+            coherence_values.append(np.mean(coherence[:, beta_mask], axis=1))
 
-        features["phase_synchronization"] = np.array(sync_values)
-        features["channel_coherence"] = np.array(coherence_values)
+        features["phase_synchronization"] = (
+            np.concatenate(sync_values) if sync_values else np.array([])
+        )
+        features["channel_coherence"] = (
+            np.concatenate(coherence_values) if coherence_values else np.array([])
+        )
 
         return features
 
-    async def _extract_entropy_features(  # noqa: C901
+    async def _extract_entropy_features(
         self, data: np.ndarray
     ) -> Dict[str, np.ndarray]:
         """Extract entropy-based features"""
         features = {}
 
-        # Sample entropy
-        sample_entropies = []
-
-        for channel in data:
-            # Simplified sample entropy calculation
-            m = 2  # Pattern length
-            r = 0.2 * np.std(channel)  # Tolerance
-
-            N = len(channel)
-            patterns = np.array([channel[i : i + m] for i in range(N - m + 1)])
-
-            # Count pattern matches
-            matches = 0
-            for i in range(len(patterns)):
-                for j in range(i + 1, len(patterns)):
-                    if np.max(np.abs(patterns[i] - patterns[j])) <= r:
-                        matches += 1
-
-            if len(patterns) > 1:
-                phi_m = matches / (len(patterns) * (len(patterns) - 1) / 2)
-                sample_entropy = -np.log(phi_m + 1e-15)
-            else:
-                sample_entropy = 0
-
-            sample_entropies.append(sample_entropy)
-
-        features["sample_entropy"] = np.array(sample_entropies)
+        # Sample entropy, as -log of the length-m match probability
+        features["sample_entropy"] = sample_entropy(
+            data,
+            m=self.entropy_m,
+            r=self.entropy_tolerance,
+            definition="match_probability",
+            max_error=self.entropy_max_error,
+        )
 
         # Approximate entropy
-        approx_entropies = []
-
-        for channel in data:
-            # Simplified approximate entropy
-            N = len(channel)
-            m = 2
-            r = 0.2 * np.std(channel)
-
-            def _maxdist(xi: np.ndarray, xj: np.ndarray, m: int) -> float:
-                return max([abs(float(xi[k]) - float(xj[k])) for k in range(m)])
-
-            def _phi(m: int) -> float:
-                patterns = np.array([channel[i : i + m] for i in range(N - m + 1)])
-                C = np.zeros(N - m + 1)
-
-                for i in range(N - m + 1):
-                    matching_patterns = 0
-                    for j in range(N - m + 1):
-                        if _maxdist(patterns[i], patterns[j], m) <= r:
-                            matching_patterns += 1
-
-                    C[i] = matching_patterns / (N - m + 1)
-
-                phi = (N - m + 1) ** (-1) * sum(np.log(C))
-                return phi
-
-            try:
-                approx_entropy = _phi(m) - _phi(m + 1)
-            except Exception:
-                approx_entropy = 0
-
-            approx_entropies.append(approx_entropy)
-
-        features["approximate_entropy"] = np.array(approx_entropies)
+        features["approximate_entropy"] = approximate_entropy(
+            data, m=self.entropy_m, r=self.entropy_tolerance
+        )
 
         return features
 
@@ -425,10 +361,11 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
         # Feature velocity (rate of change)
         if hasattr(self, "_previous_features"):
             # Calculate how fast features are changing
+            previous = self._previous_features or {}
             velocity = []
             for key in ["spectral_edge_frequency", "line_length", "spike_rate"]:
-                if key in features and key in self._previous_features:
-                    change = np.abs(features[key] - self._previous_features[key])
+                if key in features and key in previous:
+                    change = np.abs(features[key] - previous[key])
                     velocity.extend(change)
 
             features["feature_velocity"] = (
@@ -467,3 +404,7 @@ class SeizureFeatureExtractor(BaseFeatureExtractor):
             "channel_spike_rate",
             "feature_velocity",
         ]
+
+    def get_required_window_size(self) -> float:
+        """Get required window size in milliseconds"""
+        return self.window_size_ms
@@ -3,12 +3,14 @@ Feature extraction for sleep stage classification
 """
 
 import logging
-from typing import Dict, List, Optional
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from scipy import signal
 
 from ..interfaces import BaseFeatureExtractor
 from ..types import FeatureVector, NeuralData
+from ..utils.feature_cache import FeatureWindow, get_feature_window
 
 logger = logging.getLogger(__name__)
 
@@ -96,56 +98,113 @@ class SleepFeatureExtractor(BaseFeatureExtractor):
             Extracted feature vector
         """
         try:
-            features = {}
             channel_indices = self._get_channel_indices(data.channels)
+            window = get_feature_window(data)
 
-            # Extract EEG features
+            eeg = eog = emg = None
             if channel_indices["eeg"]:
-                eeg_features = self._extract_eeg_features(
-                    data.data[channel_indices["eeg"], :], data.sampling_rate
-                )
-                features.update(eeg_features)
-
-            # Extract EOG features
+                # Average across EEG channels
+                eeg = window.channel_mean(channel_indices["eeg"])
             if channel_indices["eog"]:
-                eog_features = self._extract_eog_features(
-                    data.data[channel_indices["eog"], :], data.sampling_rate
-                )
-                features.update(eog_features)
-
-            # Extract EMG features
+                # Difference between left and right EOG (if available)
+                eog_idx = channel_indices["eog"]
+                if len(eog_idx) >= 2:
+                    eog = window.channel_difference(eog_idx[0], eog_idx[1])
+                else:
+                    eog = window.channel_mean(eog_idx[:1])
             if channel_indices["emg"]:
-                emg_features = self._extract_emg_features(
-                    data.data[channel_indices["emg"], :], data.sampling_rate
-                )
-                features.update(emg_features)
+                emg = data.data[channel_indices["emg"], :].mean(axis=0)[np.newaxis]
 
-            # Cross-modal features
-            if channel_indices["eeg"] and channel_indices["emg"]:
-                cross_features = self._extract_cross_modal_features(
-                    data.data, channel_indices, data.sampling_rate
-                )
-                features.update(cross_features)
+            features = self._extract_epoch_features(eeg, eog, emg)
 
             return FeatureVector(
                 features=features,
                 timestamp=data.timestamp,
                 window_size_ms=self.window_size_ms,
-                metadata={
-                    "epoch_duration_s": self.window_size_ms / 1000,
-                    "n_samples": data.data.shape[1],
-                    "channels_used": {
-                        "eeg": len(channel_indices["eeg"]),
-                        "eog": len(channel_indices["eog"]),
-                        "emg": len(channel_indices["emg"]),
-                    },
-                },
+                metadata=self._epoch_metadata(data.data.shape[1], channel_indices),
             )
 
         except Exception as e:
             logger.error(f"Sleep feature extraction error: {e}")
             raise
 
+    async def extract_night_features(self, data: NeuralData) -> List[FeatureVector]:
+        """
+        Extract features of every epoch of a long recording in one pass
+
+        The epochs are processed together as rows of one array, so a whole
+        night costs a handful of vectorized operations instead of one
+        feature extraction per epoch. Each epoch is filtered on its own, so
+        the results equal calling extract_features() epoch by epoch. A
+        trailing partial epoch is ignored.
+
+        Args:
+            data: Neural data containing EEG, EOG, and EMG signals
+
+        Returns:
+            One feature vector per epoch
+        """
+        try:
+            channel_indices = self._get_channel_indices(data.channels)
+            fs = data.sampling_rate
+            epoch_samples = int((self.window_size_ms / 1000.0) * fs)
+            n_epochs = data.data.shape[1] // epoch_samples
+            if n_epochs == 0:
+                return []
+
+            def _epochs(channel: np.ndarray) -> np.ndarray:
+                return channel[: n_epochs * epoch_samples].reshape(
+                    n_epochs, epoch_samples
+                )
+
+            eeg = eog = emg = None
+            if channel_indices["eeg"]:
+                eeg_avg = data.data[channel_indices["eeg"], :].mean(axis=0)
+                eeg = FeatureWindow(_epochs(eeg_avg), fs)
+            if channel_indices["eog"]:
+                eog_idx = channel_indices["eog"]
+                eog_diff = data.data[eog_idx[0], :]
+                if len(eog_idx) >= 2:
+                    eog_diff = eog_diff - data.data[eog_idx[1], :]
+                eog = FeatureWindow(_epochs(eog_diff), fs)
+            if channel_indices["emg"]:
+                emg = _epochs(data.data[channel_indices["emg"], :].mean(axis=0))
+
+            features = self._extract_epoch_features(eeg, eog, emg)
+            metadata = self._epoch_metadata(epoch_samples, channel_indices)
+
+            return [
+                FeatureVector(
+                    features={
+                        name: values[epoch : epoch + 1]
+                        for name, values in features.items()
+                    },
+                    timestamp=data.timestamp
+                    + timedelta(milliseconds=epoch * self.window_size_ms),
+                    window_size_ms=self.window_size_ms,
+                    metadata={**metadata, "epoch_index": epoch},
+                )
+                for epoch in range(n_epochs)
+            ]
+
+        except Exception as e:
+            logger.error(f"Sleep feature extraction error: {e}")
+            raise
+
+    def _epoch_metadata(
+        self, n_samples: int, channel_indices: Dict[str, List[int]]
+    ) -> Dict[str, Any]:
+        """Build feature vector metadata for an epoch"""
+        return {
+            "epoch_duration_s": self.window_size_ms / 1000,
+            "n_samples": n_samples,
+            "channels_used": {
+                "eeg": len(channel_indices["eeg"]),
+                "eog": len(channel_indices["eog"]),
+                "emg": len(channel_indices["emg"]),
+            },
+        }
+
     def _get_channel_indices(self, channels: List[str]) -> Dict[str, List[int]]:
         """Map channel names to indices"""
         indices: Dict[str, List[int]] = {"eeg": [], "eog": [], "emg": []}
@@ -165,352 +224,318 @@ class SleepFeatureExtractor(BaseFeatureExtractor):
 
         return indices
 
-    def _extract_eeg_features(
-        self, eeg_data: np.ndarray, fs: float
+    def _extract_epoch_features(
+        self,
+        eeg: Optional[FeatureWindow],
+        eog: Optional[FeatureWindow],
+        emg: Optional[np.ndarray],
     ) -> Dict[str, np.ndarray]:
-        """Extract EEG-specific sleep features"""
+        """
+        Extract features of one or more epochs
+
+        Args:
+            eeg: Average EEG with one row per epoch, if available
+            eog: EOG difference with one row per epoch, if available
+            emg: Average EMG (epochs x samples), if available
+
+        Returns:
+            Features with one value per epoch
+        """
         features = {}
 
-        # Average across EEG channels
-        eeg_avg = eeg_data.mean(axis=0)
+        # Extract EEG features
+        if eeg is not None:
+            features.update(self._extract_eeg_features(eeg))
+
+        # Extract EOG features
+        if eog is not None:
+            features.update(self._extract_eog_features(eog))
+
+        # Extract EMG features
+        if emg is not None:
+            features.update(self._extract_emg_features(emg))
+
+        # Cross-modal features
+        if eeg is not None and emg is not None:
+            features.update(
+                self._extract_cross_modal_features(eeg.data, emg, eeg.sampling_rate)
+            )
+
+        return features
+
+    def _extract_eeg_features(self, eeg: FeatureWindow) -> Dict[str, np.ndarray]:
+        """Extract EEG-specific sleep features (one row per epoch)"""
+        features = {}
+        epoch_duration_s = eeg.n_samples / eeg.sampling_rate
 
         # 1. Spectral features
-        freqs, psd = signal.welch(eeg_avg, fs=fs, nperseg=min(512, len(eeg_avg) // 4))
-        total_power = np.trapz(psd, freqs)
+        nperseg = min(512, eeg.n_samples // 4)
+        freqs, psd = eeg.psd(nperseg)
+        total_power = eeg.band_power(0.0, np.inf, nperseg)
 
         for band_name, (low_freq, high_freq) in self.bands.items():
-            band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-            band_power = np.trapz(psd[band_mask], freqs[band_mask])
+            band_power = eeg.band_power(low_freq, high_freq, nperseg)
 
-            features[f"{band_name}_power"] = np.array([band_power])
-            features[f"{band_name}_relative_power"] = np.array(
-                [band_power / (total_power + 1e-10)]
-            )
+            features[f"{band_name}_power"] = band_power
+            features[f"{band_name}_relative_power"] = band_power / (total_power + 1e-10)
 
         # 2. Sleep spindle detection (11-15 Hz)
-        spindles = self._detect_sleep_spindles(eeg_avg, fs)
-        features["spindle_density"] = np.array([spindles["density"]])
+        spindles = self._detect_sleep_spindles(eeg)
+        features["spindle_density"] = spindles["density"]
 
         # 3. K-complex detection
-        k_complexes = self._detect_k_complexes(eeg_avg, fs)
-        features["k_complex_presence"] = np.array(
-            [k_complexes["count"] / (len(eeg_avg) / fs)]
-        )
+        k_complexes = self._detect_k_complexes(eeg)
+        features["k_complex_presence"] = k_complexes["count"] / epoch_duration_s
 
         # 4. Slow wave detection
-        slow_waves = self._detect_slow_waves(eeg_avg, fs)
-        features["slow_wave_amplitude"] = np.array([slow_waves["mean_amplitude"]])
+        slow_waves = self._detect_slow_waves(eeg)
+        features["slow_wave_amplitude"] = slow_waves["mean_amplitude"]
 
         # 5. Delta percentage (for N3 detection)
-        delta_mask = (freqs >= 0.5) & (freqs <= 4)
-        delta_power = np.trapz(psd[delta_mask], freqs[delta_mask])
-        low_freq_mask = (freqs >= 0.5) & (freqs <= 30)
-        low_freq_power = np.trapz(psd[low_freq_mask], freqs[low_freq_mask])
-        features["delta_percentage"] = np.array(
-            [delta_power / (low_freq_power + 1e-10)]
-        )
+        delta_power = eeg.band_power(0.5, 4, nperseg)
+        low_freq_power = eeg.band_power(0.5, 30, nperseg)
+        features["delta_percentage"] = delta_power / (low_freq_power + 1e-10)
 
         # 6. Vertex waves (for N1)
-        vertex_waves = self._detect_vertex_waves(eeg_avg, fs)
-        features["vertex_waves"] = np.array(
-            [vertex_waves["count"] / (len(eeg_avg) / fs)]
-        )
+        vertex_waves = self._detect_vertex_waves(eeg)
+        features["vertex_waves"] = vertex_waves["count"] / epoch_duration_s
 
         # 7. Spectral edge frequency (95% of power)
-        cumsum_psd = np.cumsum(psd)
-        sef_idx = np.where(cumsum_psd >= 0.95 * cumsum_psd[-1])[0]
-        sef = freqs[sef_idx[0]] if len(sef_idx) > 0 else freqs[-1]
-        features["spectral_edge_frequency"] = np.array([sef])
+        cumsum_psd = np.cumsum(psd, axis=1)
+        reached = cumsum_psd >= 0.95 * cumsum_psd[:, -1:]
+        features["spectral_edge_frequency"] = np.where(
+            reached.any(axis=1), freqs[np.argmax(reached, axis=1)], freqs[-1]
+        )
 
         # 8. Spectral entropy
-        psd_norm = psd / (np.sum(psd) + 1e-10)
-        spectral_entropy = -np.sum(psd_norm * np.log2(psd_norm + 1e-10))
-        features["spectral_entropy"] = np.array([spectral_entropy])
+        psd_norm = psd / (np.sum(psd, axis=1, keepdims=True) + 1e-10)
+        features["spectral_entropy"] = -np.sum(
+            psd_norm * np.log2(psd_norm + 1e-10), axis=1
+        )
 
         # 9. Hjorth parameters
-        hjorth_params = self._calculate_hjorth_parameters(eeg_avg)
-        features["hjorth_mobility"] = np.array([hjorth_params["mobility"]])
-        features["hjorth_complexity"] = np.array([hjorth_params["complexity"]])
+        hjorth_params = self._calculate_hjorth_parameters(eeg.data)
+        features["hjorth_mobility"] = hjorth_params["mobility"]
+        features["hjorth_complexity"] = hjorth_params["complexity"]
 
         return features
 
-    def _extract_eog_features(
-        self, eog_data: np.ndarray, fs: float
-    ) -> Dict[str, np.ndarray]:
-        """Extract EOG-specific features for REM detection"""
+    def _extract_eog_features(self, eog: FeatureWindow) -> Dict[str, np.ndarray]:
+        """Extract EOG-specific features for REM detection (one row per epoch)"""
         features = {}
 
-        # Difference between left and right EOG (if available)
-        if eog_data.shape[0] >= 2:
-            eog_diff = eog_data[0, :] - eog_data[1, :]
-        else:
-            eog_diff = eog_data[0, :]
-
         # 1. Eye movement detection
-        eye_movements = self._detect_eye_movements(eog_diff, fs)
-        features["eye_movements"] = np.array([eye_movements["rate"]])
+        eye_movements = self._detect_eye_movements(eog)
+        features["eye_movements"] = eye_movements["rate"]
 
         # 2. REM density (rapid eye movements per minute)
-        rem_events = self._detect_rem_events(eog_diff, fs)
-        features["rem_density"] = np.array([rem_events["density"]])
+        rem_events = self._detect_rem_events(eog)
+        features["rem_density"] = rem_events["density"]
 
         return features
 
-    def _extract_emg_features(
-        self, emg_data: np.ndarray, fs: float
-    ) -> Dict[str, np.ndarray]:
-        """Extract EMG features for muscle tone assessment"""
+    def _extract_emg_features(self, emg_avg: np.ndarray) -> Dict[str, np.ndarray]:
+        """Extract EMG features for muscle tone assessment (one row per epoch)"""
         features = {}
 
-        # Average EMG channels
-        emg_avg = emg_data.mean(axis=0)
-
         # 1. EMG power (muscle tone indicator)
-        emg_power = np.mean(emg_avg**2)
-        features["emg_power"] = np.array([emg_power])
+        features["emg_power"] = np.mean(emg_avg**2, axis=1)
 
         # 2. EMG variance
-        emg_variance = np.var(emg_avg)
-        features["emg_variance"] = np.array([emg_variance])
+        features["emg_variance"] = np.var(emg_avg, axis=1)
 
         return features
 
     def _extract_cross_modal_features(
-        self, data: np.ndarray, indices: Dict[str, List[int]], fs: float
+        self, eeg_avg: np.ndarray, emg_avg: np.ndarray, fs: float
     ) -> Dict[str, np.ndarray]:
         """Extract features combining multiple signal types"""
         features = {}
 
         # EEG-EMG coupling (for REM detection)
-        if indices["eeg"] and indices["emg"]:
-            eeg_avg = data[indices["eeg"], :].mean(axis=0)
-            emg_avg = data[indices["emg"], :].mean(axis=0)
-
-            # Coherence between EEG and EMG
-            f, Cxy = signal.coherence(
-                eeg_avg, emg_avg, fs=fs, nperseg=min(256, len(eeg_avg) // 4)
-            )
+        f, Cxy = signal.coherence(
+            eeg_avg,
+            emg_avg,
+            fs=fs,
+            nperseg=min(256, eeg_avg.shape[1] // 4),
+            axis=-1,
+        )
 
-            # Low frequency coherence (should be low in REM)
-            low_freq_mask = f < 10
-            low_freq_coherence = np.mean(Cxy[low_freq_mask])
-            features["eeg_emg_coherence"] = np.array([low_freq_coherence])
+        # Low frequency coherence (should be low in REM)
+        low_freq_mask = f < 10
+        features["eeg_emg_coherence"] = np.mean(Cxy[:, low_freq_mask], axis=1)
 
         return features
 
-    def _detect_sleep_spindles(
-        self, eeg_signal: np.ndarray, fs: float
-    ) -> Dict[str, float]:
+    def _detect_sleep_spindles(self, eeg: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect sleep spindles (11-15 Hz bursts lasting 0.5-2s)"""
-        # Bandpass filter for spindle frequency
-        nyquist = fs / 2
-        low = 11 / nyquist
-        high = 15 / nyquist
-        b, a = signal.butter(4, [low, high], btype="band")
-        spindle_filtered = signal.filtfilt(b, a, eeg_signal)
+        fs = eeg.sampling_rate
 
-        # Calculate envelope using Hilbert transform
-        analytic = signal.hilbert(spindle_filtered)
-        envelope = np.abs(analytic)
+        # Envelope of the spindle band using the Hilbert transform
+        envelope = eeg.envelope(11, 15)
 
         # Threshold for spindle detection
-        threshold = np.percentile(envelope, 85)
-
-        # Find spindle events
-        above_threshold = envelope > threshold
-
-        # Group consecutive samples above threshold
-        spindle_events = []
-        in_spindle = False
-        start_idx = 0
-
-        for i, above in enumerate(above_threshold):
-            if above and not in_spindle:
-                start_idx = i
-                in_spindle = True
-            elif not above and in_spindle:
-                duration = (i - start_idx) / fs
-                # Spindles last 0.5-2 seconds
-                if 0.5 <= duration <= 2.0:
-                    spindle_events.append(
-                        {
-                            "start": start_idx / fs,
-                            "duration": duration,
-                            "amplitude": np.max(envelope[start_idx:i]),
-                        }
-                    )
-                in_spindle = False
+        threshold = np.percentile(envelope, 85, axis=1, keepdims=True)
+
+        # Group consecutive samples above threshold; bursts still running
+        # at the end of the epoch are not counted
+        rows, starts, ends = _above_threshold_runs(envelope > threshold)
+        durations = (ends - starts) / fs
+        is_spindle = (ends < eeg.n_samples) & (durations >= 0.5) & (durations <= 2.0)
+
+        count = np.bincount(rows[is_spindle], minlength=eeg.n_channels)
+        total_duration = np.bincount(
+            rows[is_spindle], weights=durations[is_spindle], minlength=eeg.n_channels
+        )
 
         # Calculate spindle density (spindles per minute)
-        epoch_duration_min = len(eeg_signal) / fs / 60
+        epoch_duration_min = eeg.n_samples / fs / 60
         density = (
-            len(spindle_events) / epoch_duration_min if epoch_duration_min > 0 else 0
+            count / epoch_duration_min
+            if epoch_duration_min > 0
+            else np.zeros(eeg.n_channels)
         )
 
         return {
-            "count": len(spindle_events),
+            "count": count,
             "density": density,
-            "mean_duration": (
-                np.mean([s["duration"] for s in spindle_events])
-                if spindle_events
-                else 0
+            "mean_duration": np.divide(
+                total_duration,
+                count,
+                out=np.zeros(eeg.n_channels),
+                where=count > 0,
             ),
         }
 
-    def _detect_k_complexes(
-        self, eeg_signal: np.ndarray, fs: float
-    ) -> Dict[str, float]:
+    def _detect_k_complexes(self, eeg: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect K-complexes (large biphasic waves)"""
+        fs = eeg.sampling_rate
+
         # Low-pass filter for K-complex detection
-        nyquist = fs / 2
-        cutoff = 10 / nyquist
-        b, a = signal.butter(4, cutoff, btype="low")
-        filtered = signal.filtfilt(b, a, eeg_signal)
+        filtered = eeg.bandpass(None, 10, sos=True)
 
         # Find large amplitude deflections
-        amplitude_threshold = 2.5 * np.std(filtered)
-
-        # Detect negative peaks followed by positive peaks
-        k_complex_count = 0
-        min_separation = int(0.5 * fs)  # 0.5 seconds minimum between K-complexes
-
-        i = 0
-        while i < len(filtered) - int(0.5 * fs):
-            # Look for negative peak
-            if filtered[i] < -amplitude_threshold:
-                # Check for following positive peak within 0.5s
-                window_end = min(i + int(0.5 * fs), len(filtered))
-                window = filtered[i:window_end]
-
-                if np.any(window > amplitude_threshold):
-                    k_complex_count += 1
-                    i += min_separation
-                else:
-                    i += 1
-            else:
-                i += 1
+        amplitude_threshold = 2.5 * np.std(filtered, axis=1, keepdims=True)
+
+        # Negative peaks followed by a positive peak within 0.5s
+        search_samples = int(0.5 * fs)
+        sample_idx = np.arange(eeg.n_samples)
+        next_positive = np.where(
+            filtered > amplitude_threshold, sample_idx, eeg.n_samples
+        )
+        next_positive = np.minimum.accumulate(next_positive[:, ::-1], axis=1)[:, ::-1]
+        candidates = (filtered < -amplitude_threshold) & (
+            next_positive < sample_idx + search_samples
+        )
+        candidates[:, max(0, eeg.n_samples - search_samples) :] = False
+
+        # 0.5 seconds minimum between K-complexes
+        k_complex_count = _count_separated(candidates, int(0.5 * fs))
 
         return {"count": k_complex_count}
 
-    def _detect_slow_waves(self, eeg_signal: np.ndarray, fs: float) -> Dict[str, float]:
+    def _detect_slow_waves(self, eeg: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect slow waves (0.5-2 Hz, >75μV amplitude)"""
+        fs = eeg.sampling_rate
+
         # Bandpass filter for slow waves
-        nyquist = fs / 2
-        low = 0.5 / nyquist
-        high = 2.0 / nyquist
-        b, a = signal.butter(4, [low, high], btype="band")
-        slow_filtered = signal.filtfilt(b, a, eeg_signal)
-
-        # Peak detection
-        peaks, properties = signal.find_peaks(
-            np.abs(slow_filtered),
-            height=75,  # 75 μV threshold
-            distance=int(0.5 * fs),  # Minimum 0.5s between peaks
-        )
+        slow_filtered = np.abs(eeg.bandpass(0.5, 2.0, sos=True))
+
+        count = np.zeros(eeg.n_channels, dtype=int)
+        mean_amplitude = np.zeros(eeg.n_channels)
+        for epoch, epoch_filtered in enumerate(slow_filtered):
+            # Peak detection
+            peaks, properties = signal.find_peaks(
+                epoch_filtered,
+                height=75,  # 75 μV threshold
+                distance=int(0.5 * fs),  # Minimum 0.5s between peaks
+            )
 
-        if len(peaks) > 0:
-            mean_amplitude = np.mean(properties["peak_heights"])
-            count = len(peaks)
-        else:
-            mean_amplitude = 0
-            count = 0
+            if len(peaks) > 0:
+                mean_amplitude[epoch] = np.mean(properties["peak_heights"])
+                count[epoch] = len(peaks)
 
         return {
             "count": count,
             "mean_amplitude": mean_amplitude,
-            "density": count / (len(eeg_signal) / fs / 60),  # per minute
+            "density": count / (eeg.n_samples / fs / 60),  # per minute
         }
 
-    def _detect_vertex_waves(self, eeg_signal: np.ndarray, fs: float) -> Dict[str, int]:
+    def _detect_vertex_waves(self, eeg: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect vertex waves (sharp waves in N1)"""
+        fs = eeg.sampling_rate
+
         # Bandpass filter for vertex waves
-        nyquist = fs / 2
-        low = 2 / nyquist
-        high = 8 / nyquist
-        b, a = signal.butter(4, [low, high], btype="band")
-        filtered = signal.filtfilt(b, a, eeg_signal)
+        filtered = eeg.bandpass(2, 8, sos=True)
 
         # Detect sharp negative deflections
-        diff = np.diff(filtered)
-        sharpness_threshold = 3 * np.std(diff)
-
-        vertex_count = 0
-        min_separation = int(0.3 * fs)  # 300ms minimum between vertex waves
+        diff = np.diff(filtered, axis=1)
+        sharpness_threshold = 3 * np.std(diff, axis=1, keepdims=True)
+        candidates = (diff[:, :-1] < -sharpness_threshold) & (
+            diff[:, 1:] > sharpness_threshold
+        )
 
-        i = 0
-        while i < len(diff) - 1:
-            if diff[i] < -sharpness_threshold and diff[i + 1] > sharpness_threshold:
-                vertex_count += 1
-                i += min_separation
-            else:
-                i += 1
+        # 300ms minimum between vertex waves
+        vertex_count = _count_separated(candidates, int(0.3 * fs))
 
         return {"count": vertex_count}
 
-    def _detect_eye_movements(
-        self, eog_signal: np.ndarray, fs: float
-    ) -> Dict[str, float]:
+    def _detect_eye_movements(self, eog: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect eye movements from EOG"""
+        fs = eog.sampling_rate
+
         # Bandpass filter for eye movements
-        nyquist = fs / 2
-        low = 0.3 / nyquist
-        high = 10 / nyquist
-        b, a = signal.butter(4, [low, high], btype="band")
-        filtered = signal.filtfilt(b, a, eog_signal)
+        filtered = eog.bandpass(0.3, 10, sos=True)
 
         # Detect movements by threshold crossings
-        threshold = 2 * np.std(filtered)
-        crossings = np.where(np.abs(filtered) > threshold)[0]
+        threshold = 2 * np.std(filtered, axis=1, keepdims=True)
+        rows, crossings = np.nonzero(np.abs(filtered) > threshold)
 
-        # Group crossings into events
-        if len(crossings) > 0:
-            events = 1
-            for i in range(1, len(crossings)):
-                if crossings[i] - crossings[i - 1] > fs * 0.2:  # 200ms gap
-                    events += 1
+        # Group crossings into events separated by more than 200ms
+        new_event = np.ones(len(crossings), dtype=bool)
+        new_event[1:] = (rows[1:] != rows[:-1]) | (np.diff(crossings) > fs * 0.2)
+        events = np.bincount(rows[new_event], minlength=eog.n_channels)
 
-            rate = events / (len(eog_signal) / fs / 60)  # per minute
-        else:
-            rate = 0
+        rate = events / (eog.n_samples / fs / 60)  # per minute
 
         return {"rate": rate}
 
-    def _detect_rem_events(self, eog_signal: np.ndarray, fs: float) -> Dict[str, float]:
+    def _detect_rem_events(self, eog: FeatureWindow) -> Dict[str, np.ndarray]:
         """Detect rapid eye movements"""
         # Higher frequency components for REM
-        nyquist = fs / 2
-        low = 0.5 / nyquist
-        high = 5 / nyquist
-        b, a = signal.butter(4, [low, high], btype="band")
-        filtered = signal.filtfilt(b, a, eog_signal)
+        filtered = eog.bandpass(0.5, 5, sos=True)
 
         # Calculate signal derivative for rapid changes
-        derivative = np.diff(filtered)
+        derivative = np.diff(filtered, axis=1)
 
         # REM events have high derivative
-        threshold = 3 * np.std(derivative)
+        threshold = 3 * np.std(derivative, axis=1, keepdims=True)
         rem_samples = np.abs(derivative) > threshold
 
         # Calculate REM density
-        rem_density = np.sum(rem_samples) / len(derivative) * 100
+        rem_density = np.sum(rem_samples, axis=1) / derivative.shape[1] * 100
 
         return {"density": rem_density}
 
-    def _calculate_hjorth_parameters(self, signal_data: np.ndarray) -> Dict[str, float]:
+    def _calculate_hjorth_parameters(
+        self, signal_data: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """Calculate Hjorth parameters (activity, mobility, complexity)"""
         # Activity (variance)
-        activity = np.var(signal_data)
+        activity = np.var(signal_data, axis=-1)
 
         # First derivative
-        d1 = np.diff(signal_data)
+        d1 = np.diff(signal_data, axis=-1)
         # Second derivative
-        d2 = np.diff(d1)
+        d2 = np.diff(d1, axis=-1)
 
         # Mobility
-        mobility = np.sqrt(np.var(d1) / (activity + 1e-10))
+        mobility = np.sqrt(np.var(d1, axis=-1) / (activity + 1e-10))
 
         # Complexity
-        complexity = np.sqrt(np.var(d2) / (np.var(d1) + 1e-10)) / (mobility + 1e-10)
+        complexity = np.sqrt(np.var(d2, axis=-1) / (np.var(d1, axis=-1) + 1e-10)) / (
+            mobility + 1e-10
+        )
 
         return {"activity": activity, "mobility": mobility, "complexity": complexity}
 
@@ -521,3 +546,69 @@ class SleepFeatureExtractor(BaseFeatureExtractor):
     def get_required_window_size(self) -> float:
         """Get required window size in milliseconds"""
         return self.window_size_ms
+
+
+def _above_threshold_runs(
+    above: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find runs of consecutive True samples in each row
+
+    Args:
+        above: Boolean mask (rows x samples)
+
+    Returns:
+        Tuple of (row, start, end) per run; end is exclusive and equals the
+        number of samples for runs still open at the end of the row
+    """
+    padded = np.zeros((above.shape[0], above.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = above
+    edges = np.diff(padded, axis=1)
+
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+def _count_separated(candidates: np.ndarray, min_separation: int) -> np.ndarray:
+    """
+    Count events per row, skipping min_separation samples after each event
+
+    This is the count of a left-to-right scan that accepts the first
+    candidate and then the first candidate at least min_separation samples
+    after the last accepted one. The scan is evaluated for all rows at once
+    by pointer doubling over the candidates' next-acceptable successors.
+
+    Args:
+        candidates: Boolean mask of candidate samples (rows x samples)
+        min_separation: Minimum distance between accepted events in samples
+
+    Returns:
+        Number of accepted events per row
+    """
+    counts = np.zeros(candidates.shape[0], dtype=int)
+    rows, cols = np.nonzero(candidates)
+    n_candidates = len(cols)
+    if n_candidates == 0:
+        return counts
+
+    min_separation = max(1, min_separation)
+    positions = rows * (candidates.shape[1] + min_separation) + cols
+
+    # First candidate of the same row that the scan can accept after each one
+    successor = np.searchsorted(positions, positions + min_separation)
+    same_row = successor < n_candidates
+    same_row[same_row] = rows[successor[same_row]] == rows[same_row]
+    successor[~same_row] = n_candidates
+
+    # Length of the chain of accepted events starting at each candidate
+    pointer = np.append(successor, n_candidates)
+    length = np.append(np.ones(n_candidates, dtype=int), 0)
+    while np.any(pointer[:-1] < n_candidates):
+        length = length + length[pointer]
+        pointer = pointer[pointer]
+
+    # The scan accepts the first candidate of every row
+    first_rows, first_idx = np.unique(rows, return_index=True)
+    counts[first_rows] = length[first_idx]
+    return counts
@@ -13,6 +13,7 @@ import numpy as np
 from .interfaces import BaseClassifier, BaseFeatureExtractor, BaseStreamProcessor
 from .types import ClassificationResult, NeuralData, StreamMetadata
 from .utils.buffer import CircularBuffer
+from .utils.feature_cache import WindowFeatureCache
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,9 @@ class StreamProcessor(BaseStreamProcessor):
         self.classification_count = 0
         self.error_count = 0
 
+        # Primitives (PSDs, filtered signals, ...) shared by all extractors
+        self.feature_cache = WindowFeatureCache()
+
         # Stream configuration
         self.stream_configs: Dict[str, StreamMetadata] = {}
 
@@ -94,6 +98,7 @@ class StreamProcessor(BaseStreamProcessor):
                                     self.feature_extractors[name],
                                     buffer,
                                     name,
+                                    stream_id,
                                 )
                                 classification_tasks.append(task)
 
@@ -121,6 +126,7 @@ class StreamProcessor(BaseStreamProcessor):
                 self.active_streams.discard(stream_id)
                 if stream_id in self.buffers:
                     del self.buffers[stream_id]
+                self.feature_cache.discard(stream_id)
                 logger.info(f"Stopped processing stream {stream_id}")
 
     async def add_classifier(
@@ -176,6 +182,7 @@ class StreamProcessor(BaseStreamProcessor):
         feature_extractor: BaseFeatureExtractor,
         buffer: CircularBuffer,
         classifier_name: str,
+        stream_id: Optional[str] = None,
     ) -> ClassificationResult:
         """Run classification with timing information"""
         start_time = time.time()
@@ -189,6 +196,14 @@ class StreamProcessor(BaseStreamProcessor):
             if neural_data is None:
                 raise ValueError(f"Insufficient data for {classifier_name}")
 
+            # Share primitives with the other classifiers on the same window
+            window_id = (
+                stream_id or id(buffer),
+                buffer.samples_written,
+                neural_data.data.shape[1],
+            )
+            feature_window = self.feature_cache.attach(neural_data, window_id)
+
             # Extract features
             feature_start = time.time()
             features = await feature_extractor.extract_features(neural_data)
@@ -207,6 +222,12 @@ class StreamProcessor(BaseStreamProcessor):
                 result.metadata["feature_extraction_ms"] = feature_time
                 result.metadata["classification_ms"] = classify_time
                 result.metadata["classifier_name"] = classifier_name
+                result.metadata["feature_cache_hit_rate"] = (
+                    feature_window.stats.hit_rate
+                )
+                result.metadata["feature_cache_saved_ms"] = (
+                    feature_window.stats.saved_ms
+                )
 
             # Track latency
             self.latency_buffer.append(total_time)
@@ -227,9 +248,12 @@ class StreamProcessor(BaseStreamProcessor):
                 "p99_latency_ms": 0,
                 "classification_rate_hz": 0,
                 "error_rate": 0,
+                "feature_cache_hit_rate": 0,
+                "feature_cache_saved_ms_per_window": 0,
             }
 
         latencies = np.array(self.latency_buffer)
+        cache_stats = self.feature_cache.get_stats()
 
         return {
             "avg_latency_ms": float(np.mean(latencies)),
@@ -239,8 +263,14 @@ class StreamProcessor(BaseStreamProcessor):
             "classification_rate_hz": self.classification_count / max(1, time.time()),
             "error_rate": self.error_count
             / max(1, self.classification_count + self.error_count),
+            "feature_cache_hit_rate": cache_stats["hit_rate"],
+            "feature_cache_saved_ms_per_window": cache_stats["saved_ms_per_window"],
         }
 
+    def get_feature_cache_stats(self) -> Dict[str, float]:
+        """Get hit rates and time saved by the shared feature cache"""
+        return self.feature_cache.get_stats()
+
     async def shutdown(self) -> None:
         """Gracefully shutdown the processor"""
         logger.info("Shutting down stream processor")
@@ -251,6 +281,7 @@ class StreamProcessor(BaseStreamProcessor):
 
         self.buffers.clear()
         self.active_streams.clear()
+        self.feature_cache.clear()
 
         logger.info("Stream processor shutdown complete")
 
@@ -275,3 +306,4 @@ class StreamProcessor(BaseStreamProcessor):
         if stream_id in self.buffers:
             del self.buffers[stream_id]
         self.active_streams.discard(stream_id)
+        self.feature_cache.discard(stream_id)
@@ -0,0 +1,617 @@
+"""
+Shared per-window cache of signal processing primitives
+
+Every classifier in the stream processor extracts features from the same
+buffer window, and most feature extractors start from the same primitives:
+Welch PSDs, band powers, band-pass filtered signals, Hilbert transforms and
+Hjorth parameters. A FeatureWindow memoizes these primitives keyed by
+(window id, primitive, params), so each one is computed once per window and
+reused by every extractor. Per-channel primitives are cached row by row, so
+an extractor asking for a subset of channels only computes the missing rows.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import signal
+
+from ..types import NeuralData
+
+logger = logging.getLogger(__name__)
+
+# NeuralData.metadata key under which the stream processor attaches a window
+FEATURE_WINDOW_KEY = "feature_window"
+
+Rows = Optional[Sequence[int]]
+
+# np.trapz was renamed to np.trapezoid in NumPy 2.0
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+@lru_cache(maxsize=128)
+def butter_design(
+    order: int,
+    low_freq: Optional[float],
+    high_freq: Optional[float],
+    sampling_rate: float,
+    output: str = "ba",
+) -> Any:
+    """
+    Design a Butterworth filter once per setting
+
+    Args:
+        order: Filter order
+        low_freq: Lower cutoff in Hz, or None for a low-pass filter
+        high_freq: Upper cutoff in Hz, or None for a high-pass filter
+        sampling_rate: Sampling rate in Hz
+        output: "ba" for transfer-function coefficients or "sos" for
+            second-order sections
+
+    Returns:
+        (b, a) or second-order sections, shared between callers and not to be
+        modified
+    """
+    if low_freq is None:
+        btype, cutoff = "low", high_freq
+    elif high_freq is None:
+        btype, cutoff = "high", low_freq
+    else:
+        btype, cutoff = "band", [low_freq, high_freq]
+    return signal.butter(order, cutoff, btype=btype, fs=sampling_rate, output=output)
+
+
+@dataclass
+class CacheStats:
+    """Hit / miss counters and timing of a feature cache"""
+
+    hits: int = 0
+    misses: int = 0
+    compute_ms: float = 0.0  # Time spent computing primitives
+    saved_ms: float = 0.0  # Compute time avoided by cache hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of primitive requests served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def merge(self, other: "CacheStats") -> None:
+        """Add the counters of another stats object to this one"""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.compute_ms += other.compute_ms
+        self.saved_ms += other.saved_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "compute_ms": self.compute_ms,
+            "saved_ms": self.saved_ms,
+        }
+
+
+class _RowEntry:
+    """Per-channel values of one primitive, filled in lazily"""
+
+    __slots__ = ("values", "computed", "row_ms")
+
+    def __init__(self, n_rows: int):
+        self.values: Optional[np.ndarray] = None
+        self.computed = np.zeros(n_rows, dtype=bool)
+        self.row_ms = np.zeros(n_rows)
+
+    def store(self, rows: np.ndarray, values: np.ndarray, row_ms: float) -> None:
+        """Store freshly computed values for the given rows"""
+        if self.values is None:
+            shape = (len(self.computed),) + values.shape[1:]
+            self.values = np.empty(shape, dtype=values.dtype)
+        self.values[rows] = values
+        self.computed[rows] = True
+        self.row_ms[rows] = row_ms
+
+
+class _WindowState:
+    """Storage and accounting shared by a window and its derived signals"""
+
+    def __init__(self):
+        self.store: Dict[Tuple, Any] = {}
+        self.stats = CacheStats()
+        # Time spent in primitives nested inside the running computation
+        self.nested_ms = 0.0
+
+    def timed(self, compute: Callable[[], Any]) -> Tuple[Any, float]:
+        """Run a computation and return its value and exclusive time in ms.
+
+        Time spent in nested primitives is excluded, so it is not counted
+        twice in the compute time or in the time saved by later hits.
+        """
+        outer_nested = self.nested_ms
+        self.nested_ms = 0.0
+        start = time.perf_counter()
+        try:
+            value = compute()
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            own_ms = elapsed - self.nested_ms
+            self.nested_ms = outer_nested + elapsed
+        self.stats.misses += 1
+        self.stats.compute_ms += own_ms
+        return value, own_ms
+
+
+class FeatureWindow:
+    """
+    Memoized signal processing primitives for one window of neural data.
+
+    Per-channel primitives take an optional ``rows`` argument selecting
+    channels and return one row per selected channel.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        window_id: Optional[Hashable] = None,
+        _state: Optional[_WindowState] = None,
+        _prefix: Tuple = (),
+    ):
+        """
+        Initialize a feature window
+
+        Args:
+            data: Window data (channels x samples)
+            sampling_rate: Sampling rate in Hz
+            window_id: Identifier of the window in its stream
+        """
+        self.data = np.atleast_2d(data)
+        self.sampling_rate = sampling_rate
+        self.window_id = window_id
+        self._state = _state or _WindowState()
+        self._prefix = _prefix
+
+    @property
+    def n_channels(self) -> int:
+        """Number of channels in the window"""
+        return self.data.shape[0]
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples in the window"""
+        return self.data.shape[1]
+
+    @property
+    def stats(self) -> CacheStats:
+        """Cache statistics of this window, including derived signals"""
+        return self._state.stats
+
+    def get(self, primitive: str, params: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get a primitive from the cache, computing it on a miss
+
+        Args:
+            primitive: Name of the primitive
+            params: Hashable parameters of the primitive
+            compute: Function computing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        key = self._prefix + (primitive, params)
+        cached = self._state.store.get(key)
+        if cached is not None:
+            value, compute_ms = cached
+            self._state.stats.hits += 1
+            self._state.stats.saved_ms += compute_ms
+            return value
+
+        value, compute_ms = self._state.timed(compute)
+        self._state.store[key] = (value, compute_ms)
+        return value
+
+    def _get_rows(
+        self,
+        primitive: str,
+        params: Hashable,
+        rows: Rows,
+        compute: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """Get a per-channel primitive, computing only the missing rows"""
+        if rows is None:
+            row_index = np.arange(self.n_channels)
+        else:
+            row_index = np.asarray(rows, dtype=int).reshape(-1)
+
+        key = self._prefix + (primitive, params)
+        entry = self._state.store.get(key)
+        if entry is None:
+            entry = _RowEntry(self.n_channels)
+            self._state.store[key] = entry
+
+        cached = entry.computed[row_index]
+        if cached.all():
+            self._state.stats.hits += 1
+        else:
+            missing = np.unique(row_index[~cached])
+            values, compute_ms = self._state.timed(lambda: compute(missing))
+            entry.store(missing, values, compute_ms / len(missing))
+        self._state.stats.saved_ms += float(entry.row_ms[row_index[cached]].sum())
+
+        return entry.values[row_index]
+
+    def _effective_nperseg(self, nperseg: int) -> int:
+        """Welch segment length, shortened to the window like scipy does"""
+        return min(int(nperseg), self.n_samples)
+
+    def frequencies(self, nperseg: int) -> np.ndarray:
+        """
+        Get the frequency bins of a Welch PSD
+
+        Args:
+            nperseg: Welch segment length in samples
+
+        Returns:
+            Frequency bins in Hz
+        """
+        nperseg = self._effective_nperseg(nperseg)
+        return self.get(
+            "frequencies",
+            (nperseg,),
+            lambda: np.fft.rfftfreq(nperseg, 1 / self.sampling_rate),
+        )
+
+    def psd(
+        self, nperseg: int = 256, rows: Rows = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the Welch power spectral density of each channel
+
+        Args:
+            nperseg: Welch segment length in samples
+            rows: Channel indices, or None for all channels
+
+        Returns:
+            Tuple of (frequencies, PSD with one row per channel)
+        """
+        nperseg = self._effective_nperseg(nperseg)
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            return signal.welch(
+                self.data[missing], fs=self.sampling_rate, nperseg=nperseg, axis=-1
+            )[1]
+
+        psd = self._get_rows("psd", (nperseg,), rows, compute)
+        return self.frequencies(nperseg), psd
+
+    def band_power(
+        self, low_freq: float, high_freq: float, nperseg: int = 256, rows: Rows = None
+    ) -> np.ndarray:
+        """
+        Get the power of each channel in a frequency band
+
+        Args:
+            low_freq: Lower band edge in Hz (inclusive)
+            high_freq: Upper band edge in Hz (inclusive)
+            nperseg: Welch segment length in samples
+            rows: Channel indices, or None for all channels
+
+        Returns:
+            Band power per channel
+        """
+        nperseg = self._effective_nperseg(nperseg)
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            freqs, psd = self.psd(nperseg, rows=missing)
+            band_mask = (freqs >= low_freq) & (freqs <= high_freq)
+            return _trapezoid(psd[:, band_mask], freqs[band_mask], axis=-1)
+
+        return self._get_rows(
+            "band_power", (nperseg, low_freq, high_freq), rows, compute
+        )
+
+    def bandpass(
+        self,
+        low_freq: Optional[float],
+        high_freq: Optional[float],
+        order: int = 4,
+        rows: Rows = None,
+        sos: bool = False,
+    ) -> np.ndarray:
+        """
+        Get the zero-phase Butterworth filtered signal of each channel
+
+        Args:
+            low_freq: Lower cutoff in Hz, or None for a low-pass filter
+            high_freq: Upper cutoff in Hz, or None for a high-pass filter
+            order: Filter order
+            rows: Channel indices, or None for all channels
+            sos: Filter with second-order sections (sosfiltfilt) instead of
+                transfer-function filtfilt. More stable for narrow and
+                low-frequency bands, but the values differ slightly, so it is
+                opt-in per detector
+
+        Returns:
+            Filtered signals (channels x samples)
+        """
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            if sos:
+                sections = butter_design(
+                    order, low_freq, high_freq, self.sampling_rate, "sos"
+                )
+                return signal.sosfiltfilt(sections, self.data[missing], axis=-1)
+            b, a = butter_design(order, low_freq, high_freq, self.sampling_rate, "ba")
+            return signal.filtfilt(b, a, self.data[missing], axis=-1)
+
+        return self._get_rows(
+            "bandpass", (low_freq, high_freq, order, sos), rows, compute
+        )
+
+    def analytic_signal(
+        self,
+        band: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        order: int = 4,
+        rows: Rows = None,
+    ) -> np.ndarray:
+        """
+        Get the Hilbert analytic signal of each channel
+
+        Args:
+            band: (low, high) cutoffs to band-pass filter first, or None
+            order: Filter order used with band
+            rows: Channel indices, or None for all channels
+
+        Returns:
+            Complex analytic signals (channels x samples)
+        """
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            if band is None:
+                source = self.data[missing]
+            else:
+                source = self.bandpass(band[0], band[1], order, rows=missing)
+            return signal.hilbert(source, axis=-1)
+
+        params = (None, None) if band is None else (tuple(band), order)
+        return self._get_rows("analytic", params, rows, compute)
+
+    def envelope(
+        self,
+        low_freq: Optional[float],
+        high_freq: Optional[float],
+        order: int = 4,
+        rows: Rows = None,
+    ) -> np.ndarray:
+        """
+        Get the Hilbert amplitude envelope of a band of each channel
+
+        Args:
+            low_freq: Lower cutoff in Hz, or None for a low-pass filter
+            high_freq: Upper cutoff in Hz, or None for a high-pass filter
+            order: Filter order
+            rows: Channel indices, or None for all channels
+
+        Returns:
+            Band envelopes (channels x samples)
+        """
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            return np.abs(
+                self.analytic_signal((low_freq, high_freq), order, rows=missing)
+            )
+
+        return self._get_rows("envelope", (low_freq, high_freq, order), rows, compute)
+
+    def hjorth(self, rows: Rows = None) -> np.ndarray:
+        """
+        Get the Hjorth parameters of each channel
+
+        Mobility and complexity are 0 where they are undefined.
+
+        Args:
+            rows: Channel indices, or None for all channels
+
+        Returns:
+            Array (channels x 3) of activity, mobility and complexity
+        """
+
+        def compute(missing: np.ndarray) -> np.ndarray:
+            data = self.data[missing]
+            first_deriv = np.diff(data, axis=-1)
+            second_deriv = np.diff(first_deriv, axis=-1)
+
+            activity = np.var(data, axis=-1)
+            var_d1 = np.var(first_deriv, axis=-1)
+            var_d2 = np.var(second_deriv, axis=-1)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mobility = np.where(activity > 0, np.sqrt(var_d1 / activity), 0)
+                complexity = np.where(
+                    (var_d1 > 0) & (mobility > 0),
+                    np.sqrt(var_d2 / var_d1) / mobility,
+                    0,
+                )
+            return np.column_stack([activity, mobility, complexity])
+
+        return self._get_rows("hjorth", None, rows, compute)
+
+    def channel_mean(self, rows: Sequence[int]) -> "FeatureWindow":
+        """
+        Get the average of some channels as a single-channel window
+
+        Primitives of the returned window share this window's cache.
+
+        Args:
+            rows: Channel indices to average
+
+        Returns:
+            Window with one channel holding the average
+        """
+        rows = tuple(int(row) for row in rows)
+        mean = self.get(
+            "channel_mean", rows, lambda: self.data[list(rows)].mean(axis=0)
+        )
+        return self._derived(("channel_mean", rows), mean)
+
+    def channel_difference(self, first: int, second: int) -> "FeatureWindow":
+        """
+        Get the difference of two channels as a single-channel window
+
+        Args:
+            first: Index of the minuend channel
+            second: Index of the subtrahend channel
+
+        Returns:
+            Window with one channel holding first - second
+        """
+        rows = (int(first), int(second))
+        difference = self.get(
+            "channel_difference",
+            rows,
+            lambda: self.data[rows[0]] - self.data[rows[1]],
+        )
+        return self._derived(("channel_difference", rows), difference)
+
+    def _derived(self, name: Tuple, data: np.ndarray) -> "FeatureWindow":
+        """Create a derived window sharing this window's cache"""
+        return FeatureWindow(
+            data[np.newaxis, :],
+            self.sampling_rate,
+            window_id=self.window_id,
+            _state=self._state,
+            _prefix=self._prefix + (name,),
+        )
+
+
+class WindowFeatureCache:
+    """
+    Cache of FeatureWindows for the most recent windows of all streams.
+
+    Window ids are tuples whose first element identifies the stream, e.g.
+    ``(stream_id, samples_written, n_samples)``.
+    """
+
+    def __init__(self, max_windows: int = 16):
+        """
+        Initialize the cache
+
+        Args:
+            max_windows: Number of recent windows to keep
+        """
+        self.max_windows = max_windows
+        self._windows: "OrderedDict[Hashable, FeatureWindow]" = OrderedDict()
+        self._retired = CacheStats()
+        self.windows_created = 0
+
+    def get_window(
+        self, window_id: Hashable, data: np.ndarray, sampling_rate: float
+    ) -> FeatureWindow:
+        """
+        Get the feature window for a window id, creating it if needed
+
+        Args:
+            window_id: Identifier of the window
+            data: Window data (channels x samples)
+            sampling_rate: Sampling rate in Hz
+
+        Returns:
+            Feature window shared by all callers with this window id
+        """
+        window = self._windows.get(window_id)
+        if window is not None and window.data.shape == np.shape(data):
+            self._windows.move_to_end(window_id)
+            return window
+
+        if window is not None:
+            self._retire(window_id)
+
+        window = FeatureWindow(data, sampling_rate, window_id=window_id)
+        self._windows[window_id] = window
+        self.windows_created += 1
+
+        while len(self._windows) > self.max_windows:
+            self._retire(next(iter(self._windows)))
+
+        return window
+
+    def attach(self, data: NeuralData, window_id: Hashable) -> FeatureWindow:
+        """
+        Attach the shared feature window to neural data
+
+        Feature extractors pick it up with get_feature_window().
+
+        Args:
+            data: Neural data window
+            window_id: Identifier of the window
+
+        Returns:
+            Attached feature window
+        """
+        window = self.get_window(window_id, data.data, data.sampling_rate)
+        if data.metadata is None:
+            data.metadata = {}
+        data.metadata[FEATURE_WINDOW_KEY] = window
+        return window
+
+    def discard(self, stream_id: Hashable) -> None:
+        """Drop the cached windows of a stream"""
+        for window_id in list(self._windows):
+            if isinstance(window_id, tuple) and window_id[0] == stream_id:
+                self._retire(window_id)
+
+    def clear(self) -> None:
+        """Drop all cached windows"""
+        for window_id in list(self._windows):
+            self._retire(window_id)
+
+    def _retire(self, window_id: Hashable) -> None:
+        """Remove a window, keeping its statistics"""
+        window = self._windows.pop(window_id)
+        self._retired.merge(window.stats)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics over all windows seen so far
+
+        Returns:
+            Hit counts, hit rate, compute time and time saved in total and
+            per window
+        """
+        stats = CacheStats()
+        stats.merge(self._retired)
+        for window in self._windows.values():
+            stats.merge(window.stats)
+
+        n_windows = max(1, self.windows_created)
+        result = stats.to_dict()
+        result["windows"] = self.windows_created
+        result["compute_ms_per_window"] = stats.compute_ms / n_windows
+        result["saved_ms_per_window"] = stats.saved_ms / n_windows
+        return result
+
+
+def get_feature_window(data: NeuralData) -> FeatureWindow:
+    """
+    Get the shared feature window attached to neural data
+
+    Falls back to a private window when none is attached, so extractors
+    still share primitives between their own features.
+
+    Args:
+        data: Neural data window
+
+    Returns:
+        Feature window for the data
+    """
+    if data.metadata:
+        window = data.metadata.get(FEATURE_WINDOW_KEY)
+        if isinstance(window, FeatureWindow) and window.data.shape == data.data.shape:
+            return window
+    return FeatureWindow(data.data, data.sampling_rate)
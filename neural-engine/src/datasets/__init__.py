@@ -1,6 +1,7 @@
 """Dataset management system for NeuraScale Neural Engine."""
 
 from .base_dataset import BaseDataset, DatasetConfig
+from .epoch_store import ShardedArray, ShardedEpochStore
 from .physionet_loader import PhysioNetLoader, PhysioNetDataset, PhysioNetConfig
 from .data_quality import DataQualityValidator, QualityMetrics, QualityLevel
 from .custom_dataset import CustomDatasetLoader, CustomDatasetConfig, DataFormat
@@ -9,6 +10,8 @@ from .dataset_converter import DatasetConverter
 __all__ = [
     "BaseDataset",
     "DatasetConfig",
+    "ShardedArray",
+    "ShardedEpochStore",
     "PhysioNetLoader",
     "PhysioNetDataset",
     "PhysioNetConfig",
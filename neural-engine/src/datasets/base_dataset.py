@@ -1,12 +1,18 @@
 """Base dataset interface for neural data."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, Tuple, Generator
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Dict, List, Optional, Any, Tuple, Generator, Union
 import numpy as np
 from pathlib import Path
+import hashlib
+import json
 import logging
 
+from common.batch_loader import BatchLoader
+from .epoch_store import ShardedArray, ShardedEpochStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +29,8 @@ class DatasetConfig:
     test_split: float = 0.1
     random_seed: int = 42
     batch_size: int = 32
+    prefetch_batches: int = 2  # Batches prepared ahead on background threads
+    loader_workers: int = 1
     lazy_loading: bool = True
     max_cache_size_gb: float = 10.0
 
@@ -30,6 +38,22 @@ class DatasetConfig:
 class BaseDataset(ABC):
     """Abstract base class for neural datasets."""
 
+    # Settings that do not change the cached epochs
+    CACHE_NEUTRAL_FIELDS = frozenset(
+        {
+            "cache_dir",
+            "download_if_missing",
+            "validation_split",
+            "test_split",
+            "random_seed",
+            "batch_size",
+            "prefetch_batches",
+            "loader_workers",
+            "lazy_loading",
+            "max_cache_size_gb",
+        }
+    )
+
     def __init__(self, config: DatasetConfig):
         """
         Initialize dataset.
@@ -44,6 +68,7 @@ class BaseDataset(ABC):
         self._metadata: Dict[str, Any] = {}
         self._is_loaded = False
         self._cached_data: Optional[Dict[str, np.ndarray]] = None
+        self._epoch_store: Optional[ShardedEpochStore] = None
 
     @abstractmethod
     def download(self) -> None:
@@ -90,7 +115,9 @@ class BaseDataset(ABC):
         """Get dataset metadata."""
         return self._metadata
 
-    def split_data(self, data: np.ndarray, labels: np.ndarray) -> Tuple[
+    def split_data(
+        self, data: Union[np.ndarray, ShardedArray], labels: np.ndarray
+    ) -> Tuple[
         Tuple[np.ndarray, np.ndarray],
         Tuple[np.ndarray, np.ndarray],
         Tuple[np.ndarray, np.ndarray],
@@ -119,10 +146,10 @@ class BaseDataset(ABC):
         val_idx = indices[train_size : train_size + val_size]
         test_idx = indices[train_size + val_size :]
 
-        # Split data and labels
-        train_data = (data[train_idx], labels[train_idx])
-        val_data = (data[val_idx], labels[val_idx])
-        test_data = (data[test_idx], labels[test_idx])
+        # Split data and labels; cached epochs stay on disk
+        train_data = (_take(data, train_idx), labels[train_idx])
+        val_data = (_take(data, val_idx), labels[val_idx])
+        test_data = (_take(data, test_idx), labels[test_idx])
 
         logger.info(
             f"Data split - Train: {len(train_idx)}, Val: {len(val_idx)}, Test: {len(test_idx)}"
@@ -131,69 +158,171 @@ class BaseDataset(ABC):
         return train_data, val_data, test_data
 
     def get_batch_iterator(
-        self, data: np.ndarray, labels: np.ndarray, shuffle: bool = True
+        self,
+        data: Union[np.ndarray, ShardedArray],
+        labels: np.ndarray,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        epoch: int = 0,
+        num_shards: int = 1,
+        shard_index: int = 0,
     ) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
         """
         Create batch iterator for data.
 
+        Batches are gathered into preallocated buffers while the previous
+        batch is being consumed; for cached (memory-mapped) data each batch
+        reads only its own epochs from disk. A batch is only valid until the
+        next one is requested, copy it to keep it.
+
         Args:
             data: Data array
             labels: Labels array
             shuffle: Whether to shuffle data
+            seed: Shuffle seed (drawn from NumPy's global RNG if None)
+            epoch: Epoch number, selects the shuffled order for a given seed
+            num_shards: Number of training workers splitting the data
+            shard_index: Worker whose part of the data is iterated
 
         Yields:
             Batches of (data, labels)
         """
-        n_samples = len(data)
-        indices = np.arange(n_samples)
+        loader = BatchLoader(
+            data,
+            labels,
+            batch_size=self.config.batch_size,
+            shuffle=shuffle,
+            prefetch=self.config.prefetch_batches,
+            num_workers=self.config.loader_workers,
+            seed=seed,
+            num_shards=num_shards,
+            shard_index=shard_index,
+        )
+        loader.set_epoch(epoch)
+        yield from loader
+
+    def _cache_fingerprint(self) -> str:
+        """Fingerprint of the settings that determine the cached epochs."""
+
+        def _default(value: Any) -> str:
+            if isinstance(value, Enum):
+                return str(value.value)
+            if callable(value):
+                return f"{value.__module__}.{getattr(value, '__qualname__', value)}"
+            return str(value)
+
+        settings = {
+            f.name: getattr(self.config, f.name)
+            for f in fields(self.config)
+            if f.name not in self.CACHE_NEUTRAL_FIELDS
+        }
+        key_data = json.dumps(
+            {"class": type(self).__name__, "config": settings},
+            sort_keys=True,
+            default=_default,
+        )
+        return hashlib.md5(key_data.encode()).hexdigest()
 
-        if shuffle:
-            np.random.shuffle(indices)
+    @property
+    def epoch_store(self) -> ShardedEpochStore:
+        """Sharded on-disk epoch cache of this dataset."""
+        if self._epoch_store is None:
+            self._epoch_store = ShardedEpochStore(
+                self.cache_dir / "epochs", self._cache_fingerprint()
+            )
+        return self._epoch_store
 
-        for start_idx in range(0, n_samples, self.config.batch_size):
-            end_idx = min(start_idx + self.config.batch_size, n_samples)
-            batch_idx = indices[start_idx:end_idx]
+    def cache_exists(self) -> bool:
+        """Check if a complete, up-to-date cache exists."""
+        return self.epoch_store.is_complete()
 
-            yield data[batch_idx], labels[batch_idx]
+    def has_cached_shard(self, shard_id: str, source: Optional[Path] = None) -> bool:
+        """
+        Check if the epochs of one subject or recording are cached.
 
-    def cache_exists(self) -> bool:
-        """Check if cached data exists."""
-        cache_file = self.cache_dir / "data.npz"
-        metadata_file = self.cache_dir / "metadata.json"
-        return cache_file.exists() and metadata_file.exists()
+        Args:
+            shard_id: Shard identifier
+            source: Source file the shard was built from
+
+        Returns:
+            True if the shard exists and its source has not changed
+        """
+        return self.epoch_store.has_shard(shard_id, [source] if source else [])
+
+    def cache_shard(
+        self,
+        shard_id: str,
+        data: np.ndarray,
+        labels: Any,
+        source: Optional[Path] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Write the epochs of one subject or recording to the cache.
+
+        Args:
+            shard_id: Shard identifier
+            data: Epochs of the shard
+            labels: Labels of the epochs
+            source: Source file, used to invalidate the shard when it changes
+            attrs: JSON-serializable per-shard attributes
+        """
+        sources = [source] if source else []
+        self.epoch_store.write_shard(shard_id, data, labels, sources, attrs)
 
     def save_cache(
-        self, data: np.ndarray, labels: np.ndarray, metadata: Dict[str, Any]
+        self,
+        data: np.ndarray,
+        labels: np.ndarray,
+        metadata: Dict[str, Any],
+        shard_ids: Optional[List[str]] = None,
     ) -> None:
-        """Save data to cache."""
-        import json
+        """
+        Save data to cache.
 
-        # Save data
-        cache_file = self.cache_dir / "data.npz"
-        np.savez_compressed(cache_file, data=data, labels=labels)
+        Without shard_ids, data and labels are written as a single shard.
+        With shard_ids, the shards already written with cache_shard() make
+        up the dataset and data and labels are not written again.
 
-        # Save metadata
-        metadata_file = self.cache_dir / "metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        Args:
+            data: Epochs
+            labels: Labels of the epochs
+            metadata: Dataset metadata
+            shard_ids: Shards of the dataset, in order
+        """
+        store = self.epoch_store
+        if shard_ids is None:
+            store.write_shard("all", data, labels)
+            shard_ids = ["all"]
+        store.complete(metadata, shard_ids)
 
-        logger.info(f"Saved cache to {self.cache_dir}")
+        logger.info(f"Saved cache to {store.root} ({len(shard_ids)} shards)")
+
+    def load_cache(self) -> Tuple[ShardedArray, np.ndarray, Dict[str, Any]]:
+        """
+        Load data from cache.
+
+        Epochs are memory-mapped rather than read; indexing the returned
+        array reads only the selected epochs.
+
+        Returns:
+            Tuple of (data, labels, metadata)
+        """
+        store = self.epoch_store
+        data, labels = store.open()
 
-    def load_cache(self) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
-        """Load data from cache."""
-        import json
+        logger.info(f"Loaded cache from {store.root} ({len(data)} epochs)")
 
-        # Load data
-        cache_file = self.cache_dir / "data.npz"
-        with np.load(cache_file) as npz:
-            data = npz["data"]
-            labels = npz["labels"]
+        return data, labels, store.metadata
 
-        # Load metadata
-        metadata_file = self.cache_dir / "metadata.json"
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
+    def invalidate_cache(self) -> None:
+        """Delete the cached epochs."""
+        self.epoch_store.invalidate()
+        logger.info(f"Invalidated cache at {self.epoch_store.root}")
 
-        logger.info(f"Loaded cache from {self.cache_dir}")
 
-        return data, labels, metadata
+def _take(data: Union[np.ndarray, ShardedArray], indices: np.ndarray) -> Any:
+    """Select epochs, lazily for cached data."""
+    if isinstance(data, ShardedArray):
+        return data.subset(indices)
+    return data[indices]
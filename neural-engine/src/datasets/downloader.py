@@ -0,0 +1,310 @@
+"""Parallel, resumable file downloader with checksum verification."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_SUFFIX = ".part"
+
+
+class ChecksumError(ValueError):
+    """Downloaded file does not match its expected checksum."""
+
+
+@dataclass
+class DownloadTask:
+    """A file to download."""
+
+    url: str
+    path: Path
+    sha256: Optional[str] = None
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a download task."""
+
+    url: str
+    path: Path
+    bytes_downloaded: int = 0
+    resumed: bool = False
+    skipped: bool = False
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file is present and verified."""
+        return self.error is None
+
+
+def parse_sha256sums(path: Path) -> Dict[str, str]:
+    """
+    Parse a SHA256SUMS file as published with PhysioNet projects.
+
+    Args:
+        path: File with one "<sha256> <relative path>" entry per line
+
+    Returns:
+        Mapping of relative path to checksum
+    """
+    checksums: Dict[str, str] = {}
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.strip().split(None, 1)
+            if len(parts) == 2:
+                checksums[parts[1].lstrip("*")] = parts[0].lower()
+    return checksums
+
+
+class ParallelDownloader:
+    """
+    Download files with bounded concurrency.
+
+    Interrupted transfers are kept as ``<name>.part`` and continued with an
+    HTTP Range request, both on retries within one run and on the next run.
+    Completed files are verified against their SHA-256 checksum when one is
+    given and recorded in a JSON manifest, so later runs skip them without
+    touching the network or re-hashing them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        manifest_path: Optional[Path] = None,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+        retry_backoff: float = 1.0,
+    ):
+        """
+        Initialize downloader.
+
+        Args:
+            max_workers: Maximum number of concurrent downloads
+            manifest_path: JSON manifest of completed downloads
+            max_retries: Retries per file after the first attempt
+            timeout: Connect/read timeout in seconds
+            chunk_size: Bytes read per chunk
+            retry_backoff: Base delay between retries in seconds
+        """
+        self.max_workers = max_workers
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.retry_backoff = retry_backoff
+
+        self._lock = threading.Lock()
+        self._manifest: Dict[str, Dict[str, Any]] = self._read_manifest()
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest of completed downloads."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading download manifest: {e}")
+            return {}
+
+    def _record(self, task: DownloadTask, sha256: str) -> None:
+        """Add a completed download to the manifest."""
+        with self._lock:
+            self._manifest[str(task.path)] = {
+                "url": task.url,
+                "size": task.path.stat().st_size,
+                "sha256": sha256,
+                "completed_at": datetime.utcnow().isoformat(),
+            }
+            if self.manifest_path is None:
+                return
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self._manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+
+    def is_complete(self, task: DownloadTask) -> bool:
+        """Check a file was downloaded and verified and is unchanged."""
+        entry = self._manifest.get(str(task.path))
+        if entry is None or not task.path.exists():
+            return False
+        if task.sha256 and entry["sha256"] != task.sha256.lower():
+            return False
+        return task.path.stat().st_size == entry["size"]
+
+    def download(self, tasks: List[DownloadTask]) -> List[DownloadResult]:
+        """
+        Download files concurrently.
+
+        Errors are reported per file in the results rather than raised.
+
+        Args:
+            tasks: Files to download
+
+        Returns:
+            One result per task, in task order
+        """
+        if not tasks:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._download_task, tasks))
+
+        failed = [r for r in results if not r.ok]
+        downloaded = sum(r.bytes_downloaded for r in results)
+        logger.info(
+            f"Downloaded {len(results) - len(failed)}/{len(results)} files "
+            f"({downloaded / 1e6:.1f} MB, "
+            f"{sum(r.skipped for r in results)} already present)"
+        )
+        return results
+
+    def download_file(self, task: DownloadTask) -> DownloadResult:
+        """
+        Download a single file, raising on failure.
+
+        Args:
+            task: File to download
+
+        Returns:
+            Download result
+        """
+        result = self._download_task(task)
+        if not result.ok:
+            raise RuntimeError(f"Error downloading {task.url}: {result.error}")
+        return result
+
+    def _download_task(self, task: DownloadTask) -> DownloadResult:
+        """Download one file with retries."""
+        result = DownloadResult(url=task.url, path=task.path)
+        if self.is_complete(task):
+            result.skipped = True
+            result.sha256 = self._manifest[str(task.path)]["sha256"]
+            return result
+
+        if task.path.exists() and self._adopt(task, result):
+            return result
+
+        task.path.parent.mkdir(parents=True, exist_ok=True)
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._fetch(task, result)
+                result.error = None
+                return result
+            except (requests.RequestException, ChecksumError, OSError) as e:
+                result.error = str(e)
+                if not _is_retryable(e):
+                    break
+                if attempt < self.max_retries:
+                    logger.warning(
+                        f"Download of {task.url} failed ({e}); "
+                        f"retry {attempt + 1}/{self.max_retries}"
+                    )
+                    time.sleep(self.retry_backoff * 2**attempt)
+
+        logger.error(f"Error downloading {task.url}: {result.error}")
+        return result
+
+    def _adopt(self, task: DownloadTask, result: DownloadResult) -> bool:
+        """Record a file downloaded before the manifest existed, if valid.
+
+        Earlier versions wrote straight to the target path, so without a
+        checksum the file is only adopted if its size matches the server's.
+        """
+        if not task.sha256:
+            size = self._remote_size(task)
+            if size != task.path.stat().st_size:
+                logger.warning(
+                    f"Size of {task.path.name} does not match the server "
+                    f"({size}); downloading"
+                )
+                return False
+
+        sha256 = _file_sha256(task.path)
+        if task.sha256 and sha256 != task.sha256.lower():
+            logger.warning(f"Checksum mismatch for {task.path.name}; downloading")
+            return False
+
+        self._record(task, sha256)
+        result.skipped = True
+        result.sha256 = sha256
+        return True
+
+    def _remote_size(self, task: DownloadTask) -> Optional[int]:
+        """Content-Length of a file on the server, or None if unknown."""
+        try:
+            with requests.head(
+                task.url, allow_redirects=True, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                length = response.headers.get("Content-Length")
+        except requests.RequestException as e:
+            logger.warning(f"Could not get the size of {task.url}: {e}")
+            return None
+        return int(length) if length is not None else None
+
+    def _fetch(self, task: DownloadTask, result: DownloadResult) -> None:
+        """Fetch a file, continuing a partial download if there is one."""
+        partial_path = task.path.with_name(task.path.name + PARTIAL_SUFFIX)
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with requests.get(
+            task.url, stream=True, headers=headers, timeout=self.timeout
+        ) as response:
+            # 416: the partial file already holds the whole resource
+            if not (offset and response.status_code == 416):
+                response.raise_for_status()
+                resumed = bool(offset) and response.status_code == 206
+                if not resumed:
+                    offset = 0
+                result.resumed = result.resumed or resumed
+
+                with open(partial_path, "ab" if resumed else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        f.write(chunk)
+                        result.bytes_downloaded += len(chunk)
+
+        sha256 = _file_sha256(partial_path)
+        if task.sha256 and sha256 != task.sha256.lower():
+            partial_path.unlink()
+            raise ChecksumError(
+                f"Checksum mismatch for {task.path.name}: "
+                f"expected {task.sha256}, got {sha256}"
+            )
+
+        os.replace(partial_path, task.path)
+        result.sha256 = sha256
+        self._record(task, sha256)
+        logger.debug(f"Downloaded: {task.path.name}")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed download may succeed when tried again."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status >= 500 or status in (408, 429)
+    return True
+
+
+def _file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,559 @@
+"""Memory-mapped, sharded on-disk store for epoched datasets."""
+
+import json
+import logging
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Bytes copied per chunk when writing a shard
+_WRITE_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def file_fingerprint(*paths: Union[str, Path]) -> str:
+    """
+    Fingerprint source files by size and modification time.
+
+    Args:
+        paths: Source files
+
+    Returns:
+        Fingerprint string; missing files contribute an empty entry
+    """
+    fingerprints = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            fingerprints.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            fingerprints.append("")
+    return ";".join(fingerprints)
+
+
+@dataclass
+class ShardInfo:
+    """Manifest entry of one shard (usually one subject or recording)."""
+
+    shard_id: str
+    file_stem: str
+    n_epochs: int
+    epoch_shape: Tuple[int, ...]
+    dtype: str
+    label_dtype: str
+    sources: List[str] = field(default_factory=list)
+    source_fingerprint: str = ""
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "shard_id": self.shard_id,
+            "file_stem": self.file_stem,
+            "n_epochs": self.n_epochs,
+            "epoch_shape": list(self.epoch_shape),
+            "dtype": self.dtype,
+            "label_dtype": self.label_dtype,
+            "sources": self.sources,
+            "source_fingerprint": self.source_fingerprint,
+            "attrs": self.attrs,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ShardInfo":
+        """Create from dictionary representation."""
+        data = dict(data)
+        data["epoch_shape"] = tuple(data["epoch_shape"])
+        return cls(**data)
+
+
+class ShardedArray:
+    """
+    Read-only array of epochs spread over memory-mapped shards.
+
+    Indexing along the first axis reads only the selected epochs from disk;
+    the rows of each shard are read in ascending order. ``subset`` selects
+    epochs without reading them, so splits of a large dataset stay on disk
+    until a batch is requested.
+    """
+
+    def __init__(
+        self,
+        arrays: Sequence[np.ndarray],
+        rows: Optional[np.ndarray] = None,
+        epoch_shape: Tuple[int, ...] = (),
+        dtype: Any = np.float64,
+    ):
+        """
+        Initialize sharded array.
+
+        Args:
+            arrays: Per-shard arrays (usually memory maps) with equal row shape
+            rows: Selected global rows, or None for all rows of all shards
+            epoch_shape: Row shape used when there are no shards
+            dtype: Data type used when there are no shards
+        """
+        self._arrays = list(arrays)
+        lengths = [len(array) for array in self._arrays]
+        self._offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        self._rows = None if rows is None else np.asarray(rows, dtype=np.int64)
+
+        if self._arrays:
+            epoch_shape = self._arrays[0].shape[1:]
+            dtype = self._arrays[0].dtype
+            for array in self._arrays[1:]:
+                if array.shape[1:] != epoch_shape or array.dtype != dtype:
+                    raise ValueError(
+                        f"Shard shape {array.shape[1:]}/{array.dtype} does not "
+                        f"match {epoch_shape}/{dtype}"
+                    )
+        self._epoch_shape = tuple(epoch_shape)
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Array shape; the first axis indexes epochs."""
+        return (len(self),) + self._epoch_shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the selected epochs in bytes."""
+        return len(self) * int(np.prod(self._epoch_shape)) * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        """Number of epochs."""
+        if self._rows is not None:
+            return len(self._rows)
+        return int(self._offsets[-1])
+
+    def _normalize(self, indices: np.ndarray) -> np.ndarray:
+        """Validate and wrap negative indices into [0, len)."""
+        n = len(self)
+        if indices.dtype == bool:
+            if indices.shape != (n,):
+                raise IndexError("Boolean index must match the number of epochs")
+            return np.flatnonzero(indices)
+        indices = indices.astype(np.int64, copy=False)
+        if indices.size and (indices.min() < -n or indices.max() >= n):
+            raise IndexError(f"Index out of range for {n} epochs")
+        return np.where(indices < 0, indices + n, indices)
+
+    def _global_rows(self, indices: np.ndarray) -> np.ndarray:
+        """Map indices of this view to rows of the concatenated shards."""
+        return indices if self._rows is None else self._rows[indices]
+
+    def _read(
+        self, global_rows: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Read global rows into a contiguous array (new unless out is given)."""
+        if out is None:
+            out = np.empty((len(global_rows),) + self._epoch_shape, dtype=self.dtype)
+        if len(global_rows) == 0:
+            return out
+
+        order = np.argsort(global_rows, kind="stable")
+        sorted_rows = global_rows[order]
+        shard_of = np.searchsorted(self._offsets, sorted_rows, side="right") - 1
+        boundaries = np.flatnonzero(np.diff(shard_of)) + 1
+
+        for group in np.split(np.arange(len(order)), boundaries):
+            shard = shard_of[group[0]]
+            local = sorted_rows[group] - self._offsets[shard]
+            out[order[group]] = self._arrays[shard][local]
+        return out
+
+    def take(self, indices: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read epochs by index, optionally into an existing array.
+
+        Args:
+            indices: Integer indices
+            out: Array of shape (len(indices),) + epoch shape to fill
+
+        Returns:
+            The selected epochs (out if given)
+        """
+        indices = self._normalize(np.asarray(indices))
+        return self._read(self._global_rows(indices), out)
+
+    def subset(self, indices: Any) -> "ShardedArray":
+        """
+        Select epochs without reading them.
+
+        Args:
+            indices: Integer indices, boolean mask or slice
+
+        Returns:
+            Lazy view of the selected epochs
+        """
+        if isinstance(indices, slice):
+            indices = np.arange(len(self))[indices]
+        indices = self._normalize(np.asarray(indices))
+        return ShardedArray(
+            self._arrays,
+            rows=self._global_rows(indices),
+            epoch_shape=self._epoch_shape,
+            dtype=self.dtype,
+        )
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        """Read the selected epochs (and sub-indices of each epoch)."""
+        rest: Tuple[Any, ...] = ()
+        if isinstance(key, tuple):
+            key, rest = key[0], key[1:]
+
+        if isinstance(key, (int, np.integer)):
+            index = self._normalize(np.asarray([key]))
+            result = self._read(self._global_rows(index))[0]
+        else:
+            if isinstance(key, slice):
+                indices = np.arange(len(self))[key]
+            else:
+                indices = self._normalize(np.asarray(key))
+            result = self._read(self._global_rows(indices))
+            if rest:
+                rest = (slice(None),) + rest
+
+        return result[rest] if rest else result
+
+    def __iter__(self):
+        """Iterate over epochs, reading one at a time."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        """Read all selected epochs into memory."""
+        result = self._read(self._global_rows(np.arange(len(self))))
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ShardedArray(shape={self.shape}, dtype={self.dtype}, "
+            f"shards={len(self._arrays)})"
+        )
+
+
+class ShardedEpochStore:
+    """
+    On-disk epoch cache sharded by subject or recording.
+
+    Each shard holds the epochs and labels of one source as uncompressed
+    ``.npy`` files that are opened as memory maps, so loading a cache of
+    any size costs no more memory than the epochs actually read. A JSON
+    manifest lists the shards with their source files and fingerprints of
+    those files and of the configuration that produced them. A
+    configuration change invalidates the whole store, a changed source file
+    only its shard.
+    """
+
+    def __init__(self, root: Path, config_fingerprint: str = ""):
+        """
+        Initialize store.
+
+        Args:
+            root: Store directory
+            config_fingerprint: Fingerprint of the settings that produced
+                the cached epochs
+        """
+        self.root = Path(root)
+        self.shard_dir = self.root / "shards"
+        self.config_fingerprint = config_fingerprint
+        self._manifest = self._read_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest file."""
+        return self.root / MANIFEST_NAME
+
+    def _empty_manifest(self) -> Dict[str, Any]:
+        """Manifest of an empty store."""
+        return {
+            "format_version": STORE_FORMAT_VERSION,
+            "config_fingerprint": self.config_fingerprint,
+            "complete": False,
+            "metadata": {},
+            "shards": {},
+        }
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Read the manifest, discarding stores built with other settings."""
+        if not self.manifest_path.exists():
+            return self._empty_manifest()
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading cache manifest {self.manifest_path}: {e}")
+            return self._empty_manifest()
+
+        if (
+            manifest.get("format_version") != STORE_FORMAT_VERSION
+            or manifest.get("config_fingerprint") != self.config_fingerprint
+        ):
+            logger.info(f"Cache at {self.root} is stale; invalidating")
+            self.invalidate()
+            return self._empty_manifest()
+
+        return manifest
+
+    def _write_manifest(self) -> None:
+        """Atomically replace the manifest."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._manifest, f, indent=2, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _shard_paths(self, file_stem: str) -> Tuple[Path, Path]:
+        """Data and label file of a shard."""
+        return (
+            self.shard_dir / f"{file_stem}.data.npy",
+            self.shard_dir / f"{file_stem}.labels.npy",
+        )
+
+    @property
+    def shards(self) -> List[ShardInfo]:
+        """Shards in insertion order."""
+        return [ShardInfo.from_dict(s) for s in self._manifest["shards"].values()]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Dataset metadata recorded when the store was completed."""
+        return self._manifest["metadata"]
+
+    def _is_current(self, shard: ShardInfo) -> bool:
+        """Check a shard's files exist and its sources have not changed."""
+        data_path, labels_path = self._shard_paths(shard.file_stem)
+        if not (data_path.exists() and labels_path.exists()):
+            return False
+        return file_fingerprint(*shard.sources) == shard.source_fingerprint
+
+    def is_complete(self) -> bool:
+        """Check the store was completed and all shards are up to date."""
+        if not self._manifest["complete"]:
+            return False
+        return all(self._is_current(shard) for shard in self.shards)
+
+    def has_shard(
+        self, shard_id: str, sources: Sequence[Union[str, Path]] = ()
+    ) -> bool:
+        """
+        Check a shard is cached and was built from the same sources.
+
+        Args:
+            shard_id: Shard identifier
+            sources: Source files the shard is built from
+
+        Returns:
+            True if the cached shard is up to date
+        """
+        shard = self.get_shard(shard_id)
+        if shard is None or shard.sources != [str(path) for path in sources]:
+            return False
+        return self._is_current(shard)
+
+    def get_shard(self, shard_id: str) -> Optional[ShardInfo]:
+        """Get the manifest entry of a shard."""
+        entry = self._manifest["shards"].get(shard_id)
+        return ShardInfo.from_dict(entry) if entry else None
+
+    def write_shard_files(
+        self,
+        shard_id: str,
+        data: Any,
+        labels: Any,
+        sources: Sequence[Union[str, Path]] = (),
+        attrs: Optional[Dict[str, Any]] = None,
+    ) -> ShardInfo:
+        """
+        Write the files of a shard without adding it to the manifest.
+
+        This is safe to call from worker processes; the process owning the
+        store then records the shard with add_shard().
+
+        Args:
+            shard_id: Shard identifier, e.g. subject or recording name
+            data: Epochs (n_epochs x ...), copied to disk in chunks
+            labels: One label per epoch
+            sources: Source files; the shard is stale once they change
+            attrs: JSON-serializable per-shard attributes
+
+        Returns:
+            Manifest entry for add_shard()
+        """
+        labels = np.asarray(labels)
+        if labels.dtype == object:
+            labels = labels.astype(str)
+        if len(labels) != len(data):
+            raise ValueError(f"{len(labels)} labels for {len(data)} epochs")
+
+        file_stem = re.sub(r"[^\w.-]", "_", shard_id)
+        data_path, labels_path = self._shard_paths(file_stem)
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+
+        dtype = np.dtype(data.dtype)
+        shape = tuple(data.shape)
+        tmp_path = data_path.with_suffix(".tmp")
+        out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=shape)
+        row_bytes = max(1, int(np.prod(shape[1:])) * dtype.itemsize)
+        chunk = max(1, _WRITE_CHUNK_BYTES // row_bytes)
+        for start in range(0, shape[0], chunk):
+            out[start : start + chunk] = data[start : start + chunk]
+        out.flush()
+        del out
+        os.replace(tmp_path, data_path)
+
+        tmp_path = labels_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, labels, allow_pickle=False)
+        os.replace(tmp_path, labels_path)
+
+        return ShardInfo(
+            shard_id=shard_id,
+            file_stem=file_stem,
+            n_epochs=shape[0],
+            epoch_shape=shape[1:],
+            dtype=dtype.str,
+            label_dtype=labels.dtype.str,
+            sources=[str(path) for path in sources],
+            source_fingerprint=file_fingerprint(*sources),
+            attrs=attrs or {},
+        )
+
+    def add_shard(self, shard: ShardInfo) -> None:
+        """
+        Record a shard written with write_shard_files() in the manifest.
+
+        Args:
+            shard: Manifest entry of the shard
+        """
+        self._manifest["shards"][shard.shard_id] = shard.to_dict()
+        self._manifest["complete"] = False
+        self._write_manifest()
+
+        logger.debug(f"Cached shard {shard.shard_id} ({shard.n_epochs} epochs)")
+
+    def write_shard(
+        self,
+        shard_id: str,
+        data: Any,
+        labels: Any,
+        sources: Sequence[Union[str, Path]] = (),
+        attrs: Optional[Dict[str, Any]] = None,
+    ) -> ShardInfo:
+        """
+        Write (or replace) the epochs of one shard.
+
+        Args:
+            shard_id: Shard identifier, e.g. subject or recording name
+            data: Epochs (n_epochs x ...), copied to disk in chunks
+            labels: One label per epoch
+            sources: Source files; the shard is stale once they change
+            attrs: JSON-serializable per-shard attributes
+
+        Returns:
+            Manifest entry of the shard
+        """
+        shard = self.write_shard_files(shard_id, data, labels, sources, attrs)
+        self.add_shard(shard)
+        return shard
+
+    def complete(
+        self,
+        metadata: Dict[str, Any],
+        shard_ids: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Mark the store complete.
+
+        Args:
+            metadata: Dataset metadata to keep in the manifest
+            shard_ids: Shards belonging to the dataset, in order; other
+                shards are removed. None keeps all shards.
+        """
+        if shard_ids is not None:
+            keep = set(shard_ids)
+            for shard in self.shards:
+                if shard.shard_id not in keep:
+                    self.remove_shard(shard.shard_id)
+            self._manifest["shards"] = {
+                shard_id: self._manifest["shards"][shard_id]
+                for shard_id in shard_ids
+                if shard_id in self._manifest["shards"]
+            }
+
+        self._manifest["metadata"] = metadata
+        self._manifest["complete"] = True
+        self._write_manifest()
+
+    def remove_shard(self, shard_id: str) -> None:
+        """Delete a shard and its manifest entry."""
+        entry = self._manifest["shards"].pop(shard_id, None)
+        if entry is None:
+            return
+        for path in self._shard_paths(entry["file_stem"]):
+            path.unlink(missing_ok=True)
+        self._manifest["complete"] = False
+        self._write_manifest()
+
+    def invalidate(self) -> None:
+        """Delete all shards and the manifest."""
+        shutil.rmtree(self.shard_dir, ignore_errors=True)
+        self.manifest_path.unlink(missing_ok=True)
+        self._manifest = self._empty_manifest()
+
+    def open(
+        self, shard_ids: Optional[Sequence[str]] = None
+    ) -> Tuple[ShardedArray, np.ndarray]:
+        """
+        Open the cached epochs.
+
+        Args:
+            shard_ids: Shards to open, in order; None opens all shards
+
+        Returns:
+            Tuple of (memory-mapped epochs, labels); labels are small and
+            read into memory
+        """
+        arrays = []
+        labels = []
+        epoch_shape: Tuple[int, ...] = ()
+        dtype: Any = np.float64
+        if shard_ids is None:
+            shards = self.shards
+        else:
+            shards = [self.get_shard(shard_id) for shard_id in shard_ids]
+            missing = [sid for sid, shard in zip(shard_ids, shards) if shard is None]
+            if missing:
+                raise KeyError(f"Shards not in cache: {missing}")
+
+        for shard in shards:
+            if shard.n_epochs == 0:
+                continue
+            data_path, labels_path = self._shard_paths(shard.file_stem)
+            arrays.append(np.load(data_path, mmap_mode="r"))
+            labels.append(np.load(labels_path, allow_pickle=False))
+            epoch_shape, dtype = shard.epoch_shape, shard.dtype
+
+        data = ShardedArray(arrays, epoch_shape=epoch_shape, dtype=dtype)
+        label_array = np.concatenate(labels) if labels else np.array([])
+        return data, label_array
@@ -1,19 +1,30 @@
 """PhysioNet dataset loader for EEG and ECG datasets."""
 
 import logging
-import requests
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import mne
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 
 from .base_dataset import BaseDataset, DatasetConfig
+from .downloader import (
+    PARTIAL_SUFFIX,
+    DownloadResult,
+    DownloadTask,
+    ParallelDownloader,
+    parse_sha256sums,
+)
+from .epoch_store import ShardInfo
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_MANIFEST = "download_manifest.json"
+CHECKSUM_FILE = "SHA256SUMS.txt"
+
 
 class PhysioNetDataset(Enum):
     """Available PhysioNet datasets."""
@@ -50,6 +61,37 @@ class PhysioNetConfig(DatasetConfig):
     bandpass_freq: Tuple[float, float] = (0.5, 50.0)  # Bandpass filter frequencies
     notch_freq: Optional[float] = 60.0  # Notch filter frequency (50 or 60 Hz)
     reference: str = "average"  # Reference type: "average", "linked-ears", etc.
+    base_url: Optional[str] = None  # Mirror to download from instead of PhysioNet
+    download_workers: int = 8  # Concurrent downloads
+    decode_workers: Optional[int] = None  # EDF decoding processes (None: all CPUs)
+
+
+@dataclass
+class RecordingJob:
+    """One EDF recording to decode into epochs."""
+
+    shard_id: str
+    path: Path
+    label: Any = None  # Task label of all epochs (EEGMMIDB)
+    seizures: List[Tuple[float, float]] = field(default_factory=list)  # CHB-MIT
+    hypnogram: Optional[Path] = None  # Sleep stage annotations (Sleep-EDF)
+
+    @property
+    def sources(self) -> List[Path]:
+        """Files the recording's epochs are decoded from."""
+        return [self.path] + ([self.hypnogram] if self.hypnogram else [])
+
+
+@dataclass
+class RecordingResult:
+    """Epochs of a decoded recording, or their cache shard."""
+
+    shard_id: str
+    sfreq: float
+    channel_names: List[str]
+    shard: Optional[ShardInfo] = None
+    data: Optional[np.ndarray] = None
+    labels: Optional[List[Any]] = None
 
 
 class PhysioNetLoader(BaseDataset):
@@ -64,6 +106,22 @@ class PhysioNetLoader(BaseDataset):
         PhysioNetDataset.PTB_DIAGNOSTIC: "https://physionet.org/files/ptbdb/1.0.0/",
     }
 
+    # Sleep stage mapping
+    SLEEP_STAGES = {
+        "W": 0,  # Wake
+        "N1": 1,  # NREM stage 1
+        "N2": 2,  # NREM stage 2
+        "N3": 3,  # NREM stage 3
+        "REM": 4,  # REM sleep
+    }
+
+    # Settings that do not change the decoded epochs
+    CACHE_NEUTRAL_FIELDS = BaseDataset.CACHE_NEUTRAL_FIELDS | {
+        "base_url",
+        "download_workers",
+        "decode_workers",
+    }
+
     def __init__(self, config: PhysioNetConfig):
         """Initialize PhysioNet loader."""
         super().__init__(config)
@@ -75,6 +133,7 @@ class PhysioNetLoader(BaseDataset):
         self._subject_data: Dict[str, Any] = {}
         self._channel_names: List[str] = []
         self._original_sampling_rate: float = 0.0
+        self._shard_ids: List[str] = []
 
     def download(self) -> None:
         """Download PhysioNet dataset if not present."""
@@ -89,10 +148,55 @@ class PhysioNetLoader(BaseDataset):
                 f"Download not implemented for {self.config.dataset_type}"
             )
 
+    def _base_url(self) -> str:
+        """Base URL of the dataset, or of the configured mirror."""
+        base_url = self.config.base_url or self.BASE_URLS[self.config.dataset_type]
+        return base_url if base_url.endswith("/") else f"{base_url}/"
+
+    def _downloader(self) -> ParallelDownloader:
+        """Downloader keeping its manifest in the dataset directory."""
+        return ParallelDownloader(
+            max_workers=self.config.download_workers,
+            manifest_path=self.dataset_dir / DOWNLOAD_MANIFEST,
+        )
+
+    def _fetch_checksums(self) -> Dict[str, str]:
+        """Fetch the SHA-256 checksums published with the dataset."""
+        sums_file = self.dataset_dir / CHECKSUM_FILE
+        if not sums_file.exists():
+            try:
+                self._download_file(f"{self._base_url()}{CHECKSUM_FILE}", sums_file)
+            except Exception:
+                logger.warning(
+                    f"No {CHECKSUM_FILE} available; downloads are not verified"
+                )
+                return {}
+        return parse_sha256sums(sums_file)
+
+    def _download_files(self, relative_paths: List[str]) -> List[DownloadResult]:
+        """
+        Download dataset files concurrently, verifying their checksums.
+
+        Args:
+            relative_paths: File paths relative to the dataset root
+
+        Returns:
+            Download results in the order of relative_paths
+        """
+        base_url = self._base_url()
+        checksums = self._fetch_checksums()
+        tasks = [
+            DownloadTask(
+                url=f"{base_url}{path}",
+                path=self.dataset_dir / path,
+                sha256=checksums.get(path),
+            )
+            for path in relative_paths
+        ]
+        return self._downloader().download(tasks)
+
     def _download_eegmmidb(self) -> None:
         """Download EEG Motor Movement/Imagery Database."""
-        base_url = self.BASE_URLS[PhysioNetDataset.EEGMMIDB]
-
         # Get list of subjects
         subjects = self.config.subjects
         if subjects is None:
@@ -101,47 +205,17 @@ class PhysioNetLoader(BaseDataset):
 
         logger.info(f"Downloading EEGMMIDB dataset for {len(subjects)} subjects...")
 
-        # Download subjects in parallel
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for subject in subjects:
-                subject_dir = self.dataset_dir / subject
-                if not subject_dir.exists():
-                    subject_dir.mkdir(parents=True, exist_ok=True)
-                    futures.append(
-                        executor.submit(
-                            self._download_subject_eegmmidb, subject, base_url
-                        )
-                    )
-
-            # Wait for downloads to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error downloading subject: {e}")
-
-    def _download_subject_eegmmidb(self, subject: str, base_url: str) -> None:
-        """Download single subject from EEGMMIDB."""
-        subject_dir = self.dataset_dir / subject
-
         # Each subject has 14 runs
-        runs = []
-        for i in range(1, 15):
-            runs.append(f"{subject}R{i:02d}.edf")
-
-        for run_file in runs:
-            file_path = subject_dir / run_file
-            if not file_path.exists():
-                url = f"{base_url}{subject}/{run_file}"
-                self._download_file(url, file_path)
-
-        logger.info(f"Downloaded subject {subject}")
+        self._download_files(
+            [
+                f"{subject}/{subject}R{run:02d}.edf"
+                for subject in subjects
+                for run in range(1, 15)
+            ]
+        )
 
     def _download_chbmit(self) -> None:
         """Download CHB-MIT Scalp EEG Database."""
-        base_url = self.BASE_URLS[PhysioNetDataset.CHB_MIT]
-
         # Get list of subjects (chb01 to chb24)
         subjects = self.config.subjects
         if subjects is None:
@@ -149,80 +223,49 @@ class PhysioNetLoader(BaseDataset):
 
         logger.info(f"Downloading CHB-MIT dataset for {len(subjects)} subjects...")
 
-        for subject in subjects:
-            subject_dir = self.dataset_dir / subject
-            if not subject_dir.exists():
-                subject_dir.mkdir(parents=True, exist_ok=True)
+        # Summary files list the EDF files of each subject
+        self._download_files(
+            [f"{subject}/{subject}-summary.txt" for subject in subjects]
+        )
 
-            # Download summary file
-            summary_file = subject_dir / f"{subject}-summary.txt"
+        edf_files = []
+        for subject in subjects:
+            summary_file = self.dataset_dir / subject / f"{subject}-summary.txt"
             if not summary_file.exists():
-                url = f"{base_url}{subject}/{subject}-summary.txt"
-                self._download_file(url, summary_file)
-
-            # Parse summary to get EDF files
-            if summary_file.exists():
-                with open(summary_file, "r") as f:
-                    content = f.read()
-
-                # Extract EDF filenames
-                edf_files = []
-                for line in content.split("\n"):
-                    if line.endswith(".edf"):
-                        edf_files.append(line.strip())
-
-                # Download EDF files
-                for edf_file in edf_files:
-                    file_path = subject_dir / edf_file
-                    if not file_path.exists():
-                        url = f"{base_url}{subject}/{edf_file}"
-                        self._download_file(url, file_path)
+                continue
+
+            with open(summary_file, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("File Name:") and line.endswith(".edf"):
+                        edf_name = line.split(":", 1)[1].strip()
+                        edf_files.append(f"{subject}/{edf_name}")
+
+        self._download_files(edf_files)
 
         logger.info("CHB-MIT download complete")
 
     def _download_sleep_edf(self) -> None:
         """Download Sleep-EDF Database."""
-        base_url = self.BASE_URLS[PhysioNetDataset.SLEEP_EDF]
-
         # Sleep-EDF has specific structure
         logger.info("Downloading Sleep-EDF dataset...")
 
         # Download RECORDS file first
         records_file = self.dataset_dir / "RECORDS"
         if not records_file.exists():
-            self._download_file(f"{base_url}RECORDS", records_file)
+            self._download_file(f"{self._base_url()}RECORDS", records_file)
 
         # Parse RECORDS to get file list
-        if records_file.exists():
-            with open(records_file, "r") as f:
-                files = [line.strip() for line in f.readlines()]
-
-            # Download each file
-            for file_name in files:
-                file_path = self.dataset_dir / file_name
-                if not file_path.exists():
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                    url = f"{base_url}{file_name}"
-                    self._download_file(url, file_path)
+        with open(records_file, "r") as f:
+            files = [line.strip() for line in f if line.strip()]
+
+        self._download_files(files)
 
         logger.info("Sleep-EDF download complete")
 
     def _download_file(self, url: str, file_path: Path) -> None:
-        """Download a single file."""
-        try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-
-            # Write to file
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            logger.debug(f"Downloaded: {file_path.name}")
-
-        except Exception as e:
-            logger.error(f"Error downloading {url}: {e}")
-            raise
+        """Download a single file, resuming a partial download."""
+        self._downloader().download_file(DownloadTask(url=url, path=file_path))
 
     def load(self) -> Tuple[np.ndarray, np.ndarray]:
         """Load PhysioNet dataset."""
@@ -248,14 +291,18 @@ class PhysioNetLoader(BaseDataset):
                 f"Loading not implemented for {self.config.dataset_type}"
             )
 
-        # Cache the loaded data
+        # Complete the cache; recordings were cached while loading
         if self.config.lazy_loading:
-            self.save_cache(data, labels, self._metadata)
+            self.save_cache(data, labels, self._metadata, shard_ids=self._shard_ids)
 
         return data, labels
 
     def _check_dataset_exists(self) -> bool:
         """Check if dataset files exist locally."""
+        # An interrupted download is resumed
+        if any(self.dataset_dir.rglob(f"*{PARTIAL_SUFFIX}")):
+            return False
+
         if self.config.dataset_type == PhysioNetDataset.EEGMMIDB:
             # Check for at least one subject
             subjects = self.config.subjects or ["S001"]
@@ -263,15 +310,12 @@ class PhysioNetLoader(BaseDataset):
             return subject_dir.exists() and any(subject_dir.glob("*.edf"))
         return self.dataset_dir.exists() and any(self.dataset_dir.rglob("*.edf"))
 
-    def _load_eegmmidb(self) -> Tuple[np.ndarray, np.ndarray]:  # noqa: C901
+    def _load_eegmmidb(self) -> Tuple[np.ndarray, np.ndarray]:
         """Load EEG Motor Movement/Imagery Database."""
         subjects = self.config.subjects
         if subjects is None:
             subjects = [f"S{i:03d}" for i in range(1, 110)]
 
-        all_data = []
-        all_labels = []
-
         # Task mapping for EEGMMIDB
         task_mapping = {
             1: "rest",  # Baseline, eyes open
@@ -292,8 +336,8 @@ class PhysioNetLoader(BaseDataset):
                 k: v for k, v in task_mapping.items() if v in self.config.tasks
             }
 
+        jobs = []
         for subject in subjects:
-            logger.info(f"Loading subject {subject}")
             subject_dir = self.dataset_dir / subject
 
             # Load all runs for the subject
@@ -314,32 +358,11 @@ class PhysioNetLoader(BaseDataset):
                 if self.config.tasks and task not in self.config.tasks:
                     continue
 
-                # Load EDF file
-                try:
-                    raw = mne.io.read_raw_edf(
-                        str(run_file), preload=True, verbose=False
-                    )
-
-                    # Store original sampling rate
-                    if self._original_sampling_rate == 0:
-                        self._original_sampling_rate = raw.info["sfreq"]
-
-                    # Apply preprocessing
-                    raw = self._preprocess_raw(raw)
-
-                    # Extract epochs
-                    epochs_data, epochs_labels = self._extract_epochs(raw, task)
-
-                    all_data.append(epochs_data)
-                    all_labels.extend(epochs_labels)
-
-                except Exception as e:
-                    logger.error(f"Error loading {run_file}: {e}")
-                    continue
+                jobs.append(
+                    RecordingJob(f"{subject}/{run_file.stem}", run_file, label=task)
+                )
 
-        # Concatenate all data
-        data = np.concatenate(all_data, axis=0)
-        labels = np.array(all_labels)
+        data, labels = self._decode_recordings(jobs)
 
         # Store metadata
         self._metadata = {
@@ -349,7 +372,7 @@ class PhysioNetLoader(BaseDataset):
             "n_channels": data.shape[1],
             "sampling_rate": self.config.sampling_rate or self._original_sampling_rate,
             "channel_names": self._channel_names,
-            "tasks": list(set(labels)),
+            "tasks": [str(task) for task in set(labels)],
         }
 
         logger.info(f"Loaded {len(data)} epochs from {len(subjects)} subjects")
@@ -362,51 +385,24 @@ class PhysioNetLoader(BaseDataset):
         if subjects is None:
             subjects = [f"chb{i:02d}" for i in range(1, 25)]
 
-        all_data = []
-        all_labels = []
-
+        jobs = []
         for subject in subjects:
-            logger.info(f"Loading subject {subject}")
             subject_dir = self.dataset_dir / subject
 
             # Read summary file to get seizure annotations
             summary_file = subject_dir / f"{subject}-summary.txt"
             seizure_info = self._parse_chbmit_summary(summary_file)
 
-            # Load EDF files
             for edf_file in sorted(subject_dir.glob("*.edf")):
-                if edf_file.name == f"{subject}-summary.txt":
-                    continue
-
-                try:
-                    raw = mne.io.read_raw_edf(
-                        str(edf_file), preload=True, verbose=False
-                    )
-
-                    if self._original_sampling_rate == 0:
-                        self._original_sampling_rate = raw.info["sfreq"]
-
-                    # Apply preprocessing
-                    raw = self._preprocess_raw(raw)
-
-                    # Get seizure periods for this file
-                    file_seizures = seizure_info.get(edf_file.name, [])
-
-                    # Extract epochs with labels
-                    epochs_data, epochs_labels = self._extract_seizure_epochs(
-                        raw, file_seizures
+                jobs.append(
+                    RecordingJob(
+                        f"{subject}/{edf_file.stem}",
+                        edf_file,
+                        seizures=seizure_info.get(edf_file.name, []),
                     )
+                )
 
-                    all_data.append(epochs_data)
-                    all_labels.extend(epochs_labels)
-
-                except Exception as e:
-                    logger.error(f"Error loading {edf_file}: {e}")
-                    continue
-
-        # Concatenate all data
-        data = np.concatenate(all_data, axis=0)
-        labels = np.array(all_labels)
+        data, labels = self._decode_recordings(jobs)
 
         # Store metadata
         self._metadata = {
@@ -416,8 +412,8 @@ class PhysioNetLoader(BaseDataset):
             "n_channels": data.shape[1],
             "sampling_rate": self.config.sampling_rate or self._original_sampling_rate,
             "channel_names": self._channel_names,
-            "n_seizure": np.sum(labels == 1),
-            "n_normal": np.sum(labels == 0),
+            "n_seizure": int(np.sum(labels == 1)),
+            "n_normal": int(np.sum(labels == 0)),
         }
 
         logger.info(
@@ -429,21 +425,10 @@ class PhysioNetLoader(BaseDataset):
 
     def _load_sleep_edf(self) -> Tuple[np.ndarray, np.ndarray]:
         """Load Sleep-EDF Database."""
-        all_data = []
-        all_labels = []
-
-        # Sleep stage mapping
-        sleep_stages = {
-            "W": 0,  # Wake
-            "N1": 1,  # NREM stage 1
-            "N2": 2,  # NREM stage 2
-            "N3": 3,  # NREM stage 3
-            "REM": 4,  # REM sleep
-        }
-
         # Find all PSG files (polysomnography)
-        psg_files = list(self.dataset_dir.glob("*PSG.edf"))
+        psg_files = sorted(self.dataset_dir.glob("*PSG.edf"))
 
+        jobs = []
         for psg_file in psg_files:
             # Find corresponding hypnogram file
             hypno_file = psg_file.parent / psg_file.name.replace(
@@ -454,51 +439,9 @@ class PhysioNetLoader(BaseDataset):
                 logger.warning(f"No hypnogram found for {psg_file}")
                 continue
 
-            try:
-                # Load PSG data
-                raw = mne.io.read_raw_edf(str(psg_file), preload=True, verbose=False)
+            jobs.append(RecordingJob(psg_file.stem, psg_file, hypnogram=hypno_file))
 
-                if self._original_sampling_rate == 0:
-                    self._original_sampling_rate = raw.info["sfreq"]
-
-                # Load annotations from hypnogram
-                annotations = mne.read_annotations(str(hypno_file))
-                raw.set_annotations(annotations)
-
-                # Apply preprocessing
-                raw = self._preprocess_raw(raw)
-
-                # Extract epochs based on sleep stages
-                events, event_id = mne.events_from_annotations(
-                    raw, event_id=sleep_stages
-                )
-
-                # Create epochs (30-second windows for sleep staging)
-                epochs = mne.Epochs(
-                    raw,
-                    events,
-                    event_id,
-                    tmin=0,
-                    tmax=30,  # 30-second epochs
-                    baseline=None,
-                    preload=True,
-                    verbose=False,
-                )
-
-                # Get data and labels
-                epochs_data = epochs.get_data()
-                epochs_labels = events[:, 2]
-
-                all_data.append(epochs_data)
-                all_labels.extend(epochs_labels)
-
-            except Exception as e:
-                logger.error(f"Error loading {psg_file}: {e}")
-                continue
-
-        # Concatenate all data
-        data = np.concatenate(all_data, axis=0) if all_data else np.array([])
-        labels = np.array(all_labels)
+        data, labels = self._decode_recordings(jobs)
 
         # Store metadata
         self._metadata = {
@@ -508,13 +451,141 @@ class PhysioNetLoader(BaseDataset):
             "n_channels": data.shape[1] if len(data) > 0 else 0,
             "sampling_rate": self.config.sampling_rate or self._original_sampling_rate,
             "channel_names": self._channel_names,
-            "sleep_stages": sleep_stages,
+            "sleep_stages": self.SLEEP_STAGES,
         }
 
         logger.info(f"Loaded {len(data)} sleep epochs")
 
         return data, labels
 
+    def _apply_recording_attrs(self, sfreq: float, channel_names: List[str]) -> None:
+        """Take over sampling rate and channel names of a decoded recording."""
+        if self._original_sampling_rate == 0:
+            self._original_sampling_rate = sfreq
+        if channel_names:
+            self._channel_names = channel_names
+
+    def _decode_recordings(self, jobs: List["RecordingJob"]) -> Tuple[Any, np.ndarray]:
+        """
+        Decode, preprocess and epoch recordings in a process pool.
+
+        Recordings already in the cache are not decoded again. With
+        lazy_loading, each worker writes its recording's epochs straight
+        into the cache and only the shard entry is sent back.
+
+        Args:
+            jobs: Recordings in dataset order
+
+        Returns:
+            Tuple of (data, labels) of all recordings
+        """
+        done = set()
+        pending = []
+        for job in jobs:
+            if self.config.lazy_loading and self.epoch_store.has_shard(
+                job.shard_id, job.sources
+            ):
+                attrs = self.epoch_store.get_shard(job.shard_id).attrs
+                self._apply_recording_attrs(
+                    attrs.get("sfreq", 0.0), attrs.get("channel_names", [])
+                )
+                done.add(job.shard_id)
+            else:
+                pending.append(job)
+
+        if done:
+            logger.info(f"Using cached epochs of {len(done)} recordings")
+
+        workers = min(self.config.decode_workers or os.cpu_count() or 1, len(pending))
+        if workers > 1:
+            logger.info(f"Decoding {len(pending)} recordings with {workers} processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._decode_recording, pending))
+        else:
+            results = [self._decode_recording(job) for job in pending]
+
+        all_data: List[np.ndarray] = []
+        all_labels: List[Any] = []
+        for result in results:
+            if result is None:
+                continue
+            self._apply_recording_attrs(result.sfreq, result.channel_names)
+            if result.shard is not None:
+                self.epoch_store.add_shard(result.shard)
+            else:
+                all_data.append(result.data)
+                all_labels.extend(result.labels)
+            done.add(result.shard_id)
+
+        shard_ids = [job.shard_id for job in jobs if job.shard_id in done]
+        return self._collect_recordings(shard_ids, all_data, all_labels)
+
+    def _decode_recording(self, job: "RecordingJob") -> Optional["RecordingResult"]:
+        """
+        Decode, preprocess and epoch one recording.
+
+        Runs in a worker process. Errors are logged and the recording is
+        skipped, as for serial loading.
+
+        Args:
+            job: Recording to decode
+
+        Returns:
+            Decoded recording, or None on error
+        """
+        try:
+            raw = mne.io.read_raw_edf(str(job.path), preload=True, verbose=False)
+            sfreq = raw.info["sfreq"]
+
+            # Load annotations from hypnogram
+            if job.hypnogram is not None:
+                raw.set_annotations(mne.read_annotations(str(job.hypnogram)))
+
+            # Apply preprocessing
+            raw = self._preprocess_raw(raw)
+
+            # Extract epochs
+            if self.config.dataset_type == PhysioNetDataset.CHB_MIT:
+                epochs_data, epochs_labels = self._extract_seizure_epochs(
+                    raw, job.seizures
+                )
+            elif self.config.dataset_type == PhysioNetDataset.SLEEP_EDF:
+                epochs_data, epochs_labels = self._extract_sleep_epochs(raw)
+            else:
+                epochs_data, epochs_labels = self._extract_epochs(raw, job.label)
+
+            result = RecordingResult(job.shard_id, sfreq, list(raw.ch_names))
+            if self.config.lazy_loading:
+                result.shard = self.epoch_store.write_shard_files(
+                    job.shard_id,
+                    epochs_data,
+                    epochs_labels,
+                    sources=job.sources,
+                    attrs={"sfreq": sfreq, "channel_names": result.channel_names},
+                )
+            else:
+                result.data = epochs_data
+                result.labels = list(epochs_labels)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error loading {job.path}: {e}")
+            return None
+
+    def _collect_recordings(
+        self,
+        shard_ids: List[str],
+        all_data: List[np.ndarray],
+        all_labels: List[Any],
+    ) -> Tuple[Any, np.ndarray]:
+        """Assemble the dataset from cached shards or in-memory epochs."""
+        self._shard_ids = shard_ids
+        if self.config.lazy_loading:
+            return self.epoch_store.open(shard_ids)
+
+        data = np.concatenate(all_data, axis=0) if all_data else np.array([])
+        return data, np.array(all_labels)
+
     def _preprocess_raw(self, raw: mne.io.Raw) -> mne.io.Raw:
         """Apply preprocessing to raw data."""
         # Select channels if specified
@@ -628,6 +699,28 @@ class PhysioNetLoader(BaseDataset):
 
         return epochs_data, labels_array.tolist()
 
+    def _extract_sleep_epochs(self, raw: mne.io.Raw) -> Tuple[np.ndarray, List[int]]:
+        """Extract 30-second epochs labelled with the annotated sleep stage."""
+        events, event_id = mne.events_from_annotations(
+            raw, event_id=self.SLEEP_STAGES, verbose=False
+        )
+
+        # Create epochs (30-second windows for sleep staging)
+        epochs = mne.Epochs(
+            raw,
+            events,
+            event_id,
+            tmin=0,
+            tmax=30,  # 30-second epochs
+            baseline=None,
+            preload=True,
+            verbose=False,
+        )
+
+        # Get data and labels
+        epochs_data = epochs.get_data()
+        return epochs_data, events[epochs.selection, 2].tolist()
+
     def _parse_chbmit_summary(
         self, summary_file: Path
     ) -> Dict[str, List[Tuple[float, float]]]:
@@ -7,6 +7,12 @@ from .data_types import (
     NeuralDataPacket,
     ValidationResult,
 )
+from common.wire_format import (
+    DecodedPacket,
+    decode_message,
+    decode_packet,
+    encode_packet,
+)
 
 __all__ = [
     "NeuralDataIngestion",
@@ -14,4 +20,8 @@ __all__ = [
     "DataSource",
     "NeuralDataPacket",
     "ValidationResult",
+    "DecodedPacket",
+    "encode_packet",
+    "decode_packet",
+    "decode_message",
 ]
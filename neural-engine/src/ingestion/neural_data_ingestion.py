@@ -18,6 +18,19 @@ except ImportError:
     bigtable = None
     row_filters = None
 
+from common.bigtable_writer import (
+    BatchWriterConfig,
+    BigtableBackend,
+    BigtableBatchWriter,
+    CloudBigtableBackend,
+    RowMutation,
+)
+from common.wire_format import (
+    CONTENT_TYPE_BINARY,
+    CONTENT_TYPE_JSON,
+    encode_packet,
+    packet_metadata,
+)
 from .data_types import (
     NeuralDataPacket,
     NeuralSignalType,
@@ -27,7 +40,6 @@ from .data_types import (
 from .validators import DataValidator
 from .anonymizer import DataAnonymizer
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +58,10 @@ class NeuralDataIngestion:
         table_id: str = "time - series",
         enable_pubsub: bool = True,
         enable_bigtable: bool = True,
+        wire_format: str = "binary",
+        wire_compression: bool = False,
+        bigtable_backend: Optional[BigtableBackend] = None,
+        bigtable_writer_config: Optional[BatchWriterConfig] = None,
     ):
         """
         Initialize the neural data ingestion system.
@@ -56,12 +72,25 @@ class NeuralDataIngestion:
             table_id: Bigtable table ID
             enable_pubsub: Whether to publish to Pub / Sub
             enable_bigtable: Whether to store in Bigtable
+            wire_format: Pub / Sub payload format, 'binary' or 'json'
+            wire_compression: Whether to compress binary payloads
+            bigtable_backend: Storage backend for the batch writer, defaults
+                to Cloud Bigtable
+            bigtable_writer_config: Batch writer configuration
         """
+        if wire_format not in ("binary", "json"):
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
         self.project_id = project_id
         self.instance_id = instance_id
         self.table_id = table_id
         self.enable_pubsub = enable_pubsub
         self.enable_bigtable = enable_bigtable
+        self.wire_format = wire_format
+        self.wire_compression = wire_compression
+        self.bigtable_backend = bigtable_backend
+        self.bigtable_writer_config = bigtable_writer_config
+        self.bt_writer: Optional[BigtableBatchWriter] = None
 
         # Initialize components
         self.validator = DataValidator()
@@ -102,16 +131,22 @@ class NeuralDataIngestion:
                 }
 
         if self.enable_bigtable:
-            if not GOOGLE_CLOUD_AVAILABLE:
-                logger.warning(
-                    "Google Cloud Bigtable not available - "
-                    "install google-cloud-bigtable"
-                )
-                self.enable_bigtable = False
-            else:
+            if self.bigtable_backend is None:
+                if not GOOGLE_CLOUD_AVAILABLE:
+                    logger.warning(
+                        "Google Cloud Bigtable not available - "
+                        "install google-cloud-bigtable"
+                    )
+                    self.enable_bigtable = False
+                    return
                 self.bt_client = bigtable.Client(project=self.project_id, admin=True)
-                self.bt_instance = self.bt_client.instance(self.instance_id)
-                self.bt_table = self.bt_instance.table(self.table_id)
+                self.bigtable_backend = CloudBigtableBackend(
+                    self.bt_client, self.instance_id
+                )
+
+            self.bt_writer = BigtableBatchWriter(
+                self.bigtable_backend, self.bigtable_writer_config
+            )
 
     async def ingest_packet(self, packet: NeuralDataPacket) -> bool:
         """
@@ -190,6 +225,9 @@ class NeuralDataIngestion:
             source=packet.source.value,
             session_id=packet.session_id,
             timestamp=packet.timestamp.isoformat(),
+            content_type=(
+                CONTENT_TYPE_JSON if self.wire_format == "json" else CONTENT_TYPE_BINARY
+            ),
         )
 
         # Wait for publish to complete
@@ -198,12 +236,17 @@ class NeuralDataIngestion:
         logger.debug(f"Published packet to {topic_path}: {message_id}")
 
     async def _store_in_bigtable(self, packet: NeuralDataPacket) -> None:
-        """Store packet in Bigtable for time - series analysis."""
+        """Queue packet for batched storage in Bigtable.
+
+        The row is committed by the batch writer; rows that still fail after
+        its retries are counted as storage errors.
+        """
         # Create row key: session_id#timestamp#channel
         row_key = f"{packet.session_id}#{packet.timestamp.timestamp()}"
 
         # Store each channel as a separate column
-        row = self.bt_table.direct_row(row_key.encode())
+        row = RowMutation(self.table_id, row_key.encode())
+        timestamp = datetime.utcnow()
 
         # Store metadata
         metadata = {
@@ -218,7 +261,7 @@ class NeuralDataIngestion:
             "metadata",
             "info",
             json.dumps(metadata).encode(),
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
         )
 
         # Store channel data
@@ -230,34 +273,47 @@ class NeuralDataIngestion:
                 "data",
                 column_name,
                 channel_data,
-                timestamp=datetime.utcnow(),
+                timestamp=timestamp,
             )
 
-        # Commit row
-        await asyncio.get_event_loop().run_in_executor(None, row.commit)
+        # Queue row; waits only when the writer applies backpressure
+        commit = await self.bt_writer.write(row)
+        commit.add_done_callback(self._on_bigtable_commit)
+
+        logger.debug(f"Queued packet for Bigtable: {row_key}")
 
-        logger.debug(f"Stored packet in Bigtable: {row_key}")
+    def _on_bigtable_commit(self, commit: asyncio.Future) -> None:
+        """Record the outcome of a batched Bigtable write."""
+        if commit.cancelled():
+            return
+        error = commit.exception()
+        if error is not None:
+            self.metrics["storage_errors"] += 1
+            logger.error(f"Bigtable write failed: {error}")
 
     def _serialize_packet(self, packet: NeuralDataPacket) -> bytes:
-        """Serialize packet for transmission."""
-        # Convert numpy array to list for JSON serialization
-        data_dict = {
-            "timestamp": packet.timestamp.isoformat(),
-            "signal_type": packet.signal_type.value,
-            "source": packet.source.value,
-            "session_id": packet.session_id,
-            "subject_id": packet.subject_id,
-            "device_info": {
-                "device_id": packet.device_info.device_id,
-                "device_type": packet.device_info.device_type,
-            },
-            "sampling_rate": packet.sampling_rate,
-            "data_quality": packet.data_quality,
-            "shape": packet.data.shape,
-            "data": packet.data.tolist(),  # Convert to list for JSON
-        }
+        """Serialize packet for transmission in the configured wire format."""
+        if self.wire_format == "json":
+            # Convert numpy array to list for JSON serialization
+            data_dict = {
+                **packet_metadata(packet),
+                "shape": packet.data.shape,
+                "data": packet.data.tolist(),
+            }
+            return json.dumps(data_dict).encode()
+
+        # ADC data with a known scale travels as delta-encoded int16 counts
+        adc_scale = (packet.metadata or {}).get("adc_scale")
+        if adc_scale:
+            return encode_packet(
+                packet,
+                dtype="int16",
+                scale=adc_scale,
+                delta=True,
+                compress=self.wire_compression,
+            )
 
-        return json.dumps(data_dict).encode()
+        return encode_packet(packet, compress=self.wire_compression)
 
     def register_source_handler(
         self,
@@ -384,6 +440,10 @@ class NeuralDataIngestion:
         for stream_id in stream_ids:
             await self.stop_stream(stream_id)
 
+        # Flush queued Bigtable rows
+        if self.bt_writer is not None:
+            await self.bt_writer.close()
+
         # Close Google Cloud clients
         if hasattr(self, "publisher"):
             self.publisher.transport.close()
@@ -1,14 +1,26 @@
 """Heatmap generator for neural activity visualization."""
 
+import hashlib
 import logging
 from typing import Dict, Tuple, Optional
 import numpy as np
 from scipy.interpolate import griddata
 from scipy.ndimage import gaussian_filter
+from scipy.sparse import csr_matrix, diags
 
 logger = logging.getLogger(__name__)
 
 
+def _array_key(*arrays: np.ndarray) -> str:
+    """Build a cache key from array contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
 class HeatmapGenerator:
     """Generates heatmaps for neural activity visualization.
 
@@ -37,6 +49,15 @@ class HeatmapGenerator:
         # Cache
         self.heatmap_cache: Dict[str, np.ndarray] = {}
 
+        # Per (mesh, montage) interpolation weights and per mesh smoothing
+        # operators, reused across frames
+        self.max_cached_operators = 8
+        self.weight_cache: Dict[str, np.ndarray] = {}
+        self.smoothing_cache: Dict[str, csr_matrix] = {}
+
+        # Grid points per chunk for volume interpolation
+        self.volume_chunk_size = 32768
+
         logger.info("HeatmapGenerator initialized")
 
     async def generate_surface_heatmap(
@@ -305,26 +326,50 @@ class HeatmapGenerator:
         Returns:
             Interpolated vertex values
         """
-        # Use inverse distance weighting
-        vertex_values = np.zeros(len(vertices))
+        weights = self._get_vertex_weights(positions, vertices)
+        return weights @ values
 
-        for i, vertex in enumerate(vertices):
-            # Calculate distances to all electrodes
-            distances = np.linalg.norm(positions - vertex, axis=1)
+    def _get_vertex_weights(
+        self, positions: np.ndarray, vertices: np.ndarray
+    ) -> np.ndarray:
+        """Get the inverse distance weight matrix for a mesh and montage.
 
-            # Inverse distance weighting
-            weights = 1.0 / (distances + 1e-6)
-            weights /= np.sum(weights)
+        Args:
+            positions: Electrode positions
+            vertices: Mesh vertices
 
-            vertex_values[i] = np.sum(weights * values)
+        Returns:
+            Row-normalized weights (vertices x electrodes)
+        """
+        key = _array_key(positions, vertices)
+        weights = self.weight_cache.get(key)
+        if weights is not None:
+            return weights
+
+        weights = np.empty((len(vertices), len(positions)))
+        for start in range(0, len(vertices), self.volume_chunk_size):
+            chunk = vertices[start : start + self.volume_chunk_size]
+            distances = np.linalg.norm(
+                chunk[:, np.newaxis, :] - positions[np.newaxis, :, :], axis=2
+            )
 
-        return vertex_values
+            # Inverse distance weighting
+            block = 1.0 / (distances + 1e-6)
+            block /= np.sum(block, axis=1, keepdims=True)
+            weights[start : start + len(chunk)] = block
+
+        self._store_cached(self.weight_cache, key, weights)
+        return weights
 
     def _smooth_on_surface(
         self, values: np.ndarray, vertices: np.ndarray, faces: np.ndarray
     ) -> np.ndarray:
         """Apply smoothing on mesh surface.
 
+        Each iteration moves vertices 30% of the way towards the mean of
+        their neighbours, i.e. applies ``I - 0.3 * L`` with the random-walk
+        mesh Laplacian ``L = I - D^-1 A``.
+
         Args:
             values: Vertex values
             vertices: Mesh vertices
@@ -333,29 +378,59 @@ class HeatmapGenerator:
         Returns:
             Smoothed values
         """
-        # Build vertex adjacency
-        adjacency = {i: set() for i in range(len(vertices))}
-
-        for face in faces:
-            for i in range(3):
-                for j in range(3):
-                    if i != j:
-                        adjacency[face[i]].add(face[j])
+        operator = self._get_smoothing_operator(len(vertices), faces)
 
         # Apply smoothing iterations
-        smoothed = values.copy()
-
+        smoothed = values
         for _ in range(int(self.smoothing_sigma * 2)):
-            new_values = smoothed.copy()
+            smoothed = operator @ smoothed
 
-            for i, neighbors in adjacency.items():
-                if neighbors:
-                    neighbor_values = [smoothed[n] for n in neighbors]
-                    new_values[i] = 0.7 * smoothed[i] + 0.3 * np.mean(neighbor_values)
+        return smoothed
 
-            smoothed = new_values
+    def _get_smoothing_operator(self, n_vertices: int, faces: np.ndarray) -> csr_matrix:
+        """Get the sparse smoothing operator for a mesh.
 
-        return smoothed
+        Args:
+            n_vertices: Number of mesh vertices
+            faces: Mesh faces
+
+        Returns:
+            Sparse operator (vertices x vertices)
+        """
+        faces = np.asarray(faces, dtype=np.int64)
+        key = _array_key(np.array([n_vertices]), faces)
+        operator = self.smoothing_cache.get(key)
+        if operator is not None:
+            return operator
+
+        # Vertex adjacency from every ordered pair of corners in each face
+        rows = faces[:, [0, 0, 1, 1, 2, 2]].ravel()
+        cols = faces[:, [1, 2, 0, 2, 0, 1]].ravel()
+        adjacency = csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(n_vertices, n_vertices)
+        )
+        adjacency.sum_duplicates()
+        adjacency.data[:] = 1.0
+
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        has_neighbors = degree > 0
+        inverse_degree = np.zeros(n_vertices)
+        inverse_degree[has_neighbors] = 1.0 / degree[has_neighbors]
+
+        # Isolated vertices keep their value
+        self_weight = np.where(has_neighbors, 0.7, 1.0)
+        operator = (
+            diags(self_weight) + 0.3 * diags(inverse_degree) @ adjacency
+        ).tocsr()
+
+        self._store_cached(self.smoothing_cache, key, operator)
+        return operator
+
+    def _store_cached(self, cache: Dict, key: str, value) -> None:
+        """Store an operator, evicting the oldest beyond the cache limit."""
+        cache[key] = value
+        while len(cache) > self.max_cached_operators:
+            cache.pop(next(iter(cache)))
 
     def _apply_colormap(self, values: np.ndarray) -> np.ndarray:
         """Apply colormap to values.
@@ -401,68 +476,51 @@ class HeatmapGenerator:
 
     def _apply_viridis_colormap(self, values: np.ndarray) -> np.ndarray:
         """Apply viridis colormap to values."""
-        n = len(values)
-        colors = np.zeros((n, 4))
-
-        for i, v in enumerate(values):
-            if v < 0.25:
-                t = v * 4
-                colors[i] = [0.267, 0.005, 0.329 + t * 0.129, 1.0]
-            elif v < 0.5:
-                t = (v - 0.25) * 4
-                colors[i] = [
-                    0.267 - t * 0.06,
-                    0.005 + t * 0.462,
-                    0.458 + t * 0.1,
-                    1.0,
-                ]
-            elif v < 0.75:
-                t = (v - 0.5) * 4
-                colors[i] = [
-                    0.207 - t * 0.079,
-                    0.467 + t * 0.354,
-                    0.558 - t * 0.117,
-                    1.0,
-                ]
-            else:
-                t = (v - 0.75) * 4
-                colors[i] = [
-                    0.128 + t * 0.865,
-                    0.821 + t * 0.085,
-                    0.441 - t * 0.297,
-                    1.0,
-                ]
+        values = np.asarray(values, dtype=float)
+        colors = np.ones((len(values), 4))
+
+        # Piecewise linear segments: (start, base RGB, RGB slope per unit t)
+        segments = [
+            (0.0, (0.267, 0.005, 0.329), (0.0, 0.0, 0.129)),
+            (0.25, (0.267, 0.005, 0.458), (-0.06, 0.462, 0.1)),
+            (0.5, (0.207, 0.467, 0.558), (-0.079, 0.354, -0.117)),
+            (0.75, (0.128, 0.821, 0.441), (0.865, 0.085, -0.297)),
+        ]
+        index = np.searchsorted([0.25, 0.5, 0.75], values, "right")
+        for i, (start, base, slope) in enumerate(segments):
+            mask = index == i
+            t = (values[mask] - start) * 4
+            colors[mask, :3] = np.asarray(base) + t[:, np.newaxis] * np.asarray(slope)
         return colors
 
     def _apply_jet_colormap(self, values: np.ndarray) -> np.ndarray:
         """Apply jet colormap to values."""
-        n = len(values)
-        colors = np.zeros((n, 4))
-
-        for i, v in enumerate(values):
-            if v < 0.125:
-                colors[i] = [0, 0, 0.5 + v * 4, 1.0]
-            elif v < 0.375:
-                t = (v - 0.125) / 0.25
-                colors[i] = [0, t, 1.0, 1.0]
-            elif v < 0.625:
-                t = (v - 0.375) / 0.25
-                colors[i] = [t, 1.0, 1.0 - t, 1.0]
-            elif v < 0.875:
-                t = (v - 0.625) / 0.25
-                colors[i] = [1.0, 1.0 - t, 0, 1.0]
-            else:
-                t = (v - 0.875) / 0.125
-                colors[i] = [1.0 - t * 0.5, 0, 0, 1.0]
+        values = np.asarray(values, dtype=float)
+        colors = np.zeros((len(values), 4))
+        colors[:, 3] = 1.0
+
+        index = np.searchsorted([0.125, 0.375, 0.625, 0.875], values, "right")
+        segments = [index == i for i in range(4)]
+        zeros = np.zeros_like(values)
+        ones = np.ones_like(values)
+        t_rise = (values - 0.125) / 0.25
+        t_mid = (values - 0.375) / 0.25
+        t_fall = (values - 0.625) / 0.25
+        t_last = (values - 0.875) / 0.125
+
+        red = np.select(segments, [zeros, zeros, t_mid, ones], 1.0 - t_last * 0.5)
+        green = np.select(segments, [zeros, t_rise, ones, 1.0 - t_fall], zeros)
+        blue = np.select(segments, [0.5 + values * 4, ones, 1.0 - t_mid, zeros], zeros)
+        colors[:, 0] = red
+        colors[:, 1] = green
+        colors[:, 2] = blue
         return colors
 
     def _apply_grayscale_colormap(self, values: np.ndarray) -> np.ndarray:
         """Apply grayscale colormap to values."""
-        n = len(values)
-        colors = np.zeros((n, 4))
-
-        for i, v in enumerate(values):
-            colors[i] = [v, v, v, 1.0]
+        values = np.asarray(values, dtype=float)
+        colors = np.ones((len(values), 4))
+        colors[:, :3] = values[:, np.newaxis]
         return colors
 
     def _project_to_2d(
@@ -522,24 +580,26 @@ class HeatmapGenerator:
             Interpolated volume
         """
         xv, yv, zv = grid
-        volume = np.zeros(xv.shape)
-
-        # Simple inverse distance weighting
-        for i in range(xv.shape[0]):
-            for j in range(xv.shape[1]):
-                for k in range(xv.shape[2]):
-                    point = np.array([xv[i, j, k], yv[i, j, k], zv[i, j, k]])
-
-                    # Calculate distances
-                    distances = np.linalg.norm(positions - point, axis=1)
-
-                    # Inverse distance weighting
-                    weights = np.exp(-(distances**2) / 0.1)  # Gaussian kernel
-                    weights /= np.sum(weights)
+        points = np.stack([xv.ravel(), yv.ravel(), zv.ravel()], axis=1)
+        volume = np.empty(len(points))
+        squared_norms = np.sum(positions**2, axis=1)
+
+        # Gaussian kernel weighting, evaluated over chunks of grid points
+        for start in range(0, len(points), self.volume_chunk_size):
+            chunk = points[start : start + self.volume_chunk_size]
+            squared_distances = (
+                np.sum(chunk**2, axis=1)[:, np.newaxis]
+                - 2.0 * chunk @ positions.T
+                + squared_norms[np.newaxis, :]
+            )
+            np.maximum(squared_distances, 0.0, out=squared_distances)
 
-                    volume[i, j, k] = np.sum(weights * values)
+            weights = np.exp(-squared_distances / 0.1)
+            volume[start : start + len(chunk)] = (weights @ values) / np.sum(
+                weights, axis=1
+            )
 
-        return volume
+        return volume.reshape(xv.shape)
 
     def set_colormap(self, colormap: str) -> None:
         """Set colormap for heatmap visualization.
@@ -561,6 +621,8 @@ class HeatmapGenerator:
             logger.info(f"Interpolation method set to: {method}")
 
     def clear_cache(self) -> None:
-        """Clear heatmap cache."""
+        """Clear heatmap cache and cached interpolation operators."""
         self.heatmap_cache.clear()
+        self.weight_cache.clear()
+        self.smoothing_cache.clear()
         logger.info("Heatmap cache cleared")
@@ -257,6 +257,17 @@ data "archive_file" "function_source" {
     content  = file("${path.module}/../../src/ingestion/anonymizer.py")
     filename = "src/ingestion/anonymizer.py"
   }
+
+  # Include the shared wire format codec
+  source {
+    content  = file("${path.module}/../../common/__init__.py")
+    filename = "common/__init__.py"
+  }
+
+  source {
+    content  = file("${path.module}/../../common/wire_format.py")
+    filename = "common/wire_format.py"
+  }
 }
 
 # Cloud Function for stream processing
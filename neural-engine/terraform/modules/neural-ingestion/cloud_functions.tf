@@ -3,16 +3,40 @@
 # Local variables for function configuration
 locals {
   function_source_dir = "${path.module}/../../../functions"
+  common_source_dir   = "${path.module}/../../../common"
   function_types      = toset(["eeg", "ecog", "lfp", "spikes", "emg", "accelerometer"])
 }
 
-# ZIP the function source code for each signal type
+# ZIP the function source code for each signal type, together with the base
+# processor and the shared wire format codec it imports
 data "archive_file" "function_source" {
   for_each = var.enable_cloud_functions ? local.function_types : toset([])
 
   type        = "zip"
-  source_dir  = "${local.function_source_dir}/${each.key}"
   output_path = "${path.module}/tmp/function-${each.key}.zip"
+
+  dynamic "source" {
+    for_each = fileset("${local.function_source_dir}/${each.key}", "**")
+    content {
+      content  = file("${local.function_source_dir}/${each.key}/${source.value}")
+      filename = source.value
+    }
+  }
+
+  source {
+    content  = file("${local.function_source_dir}/base_processor.py")
+    filename = "base_processor.py"
+  }
+
+  source {
+    content  = file("${local.common_source_dir}/__init__.py")
+    filename = "common/__init__.py"
+  }
+
+  source {
+    content  = file("${local.common_source_dir}/wire_format.py")
+    filename = "common/wire_format.py"
+  }
 }
 
 # Upload function source to GCS
@@ -0,0 +1,49 @@
+"""
+Benchmark seizure entropy features for 128 channels at 256 Hz
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.classification.features import SeizureFeatureExtractor
+from common.entropy import sample_entropy
+
+SAMPLING_RATE = 256
+N_CHANNELS = 128
+
+
+class TestSeizureEntropyLatency:
+    """Measure entropy feature time per seizure window"""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_one_second_window(self):
+        """Entropy features for a 1 s window should fit the latency budget"""
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((N_CHANNELS, SAMPLING_RATE)).astype(np.float32)
+        extractor = SeizureFeatureExtractor()
+
+        start = time.perf_counter()
+        features = await extractor._extract_entropy_features(data)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"entropy features: {elapsed_ms:.1f} ms ({N_CHANNELS} ch, 1 s)")
+
+        assert features["sample_entropy"].shape == (N_CHANNELS,)
+        assert elapsed_ms < 1000
+
+    @pytest.mark.performance
+    def test_approximate_mode_on_long_windows(self):
+        """Sampled pairs should make long windows cheap"""
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((4, SAMPLING_RATE * 600))
+
+        start = time.perf_counter()
+        sample_entropy(data, definition="match_probability", max_error=0.01, seed=0)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"approximate sample entropy: {elapsed_ms:.1f} ms (4 ch, 10 min)")
+
+        assert elapsed_ms < 500
@@ -0,0 +1,47 @@
+"""
+Benchmark whole-night sleep feature extraction
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.classification.features import SleepFeatureExtractor
+from src.classification.types import NeuralData
+
+SAMPLING_RATE = 128.0
+NIGHT_HOURS = 8
+CHANNELS = ["C3", "C4", "O1", "O2", "LOC", "ROC", "EMG"]
+
+
+class TestSleepNightThroughput:
+    """Measure feature extraction time for a full night"""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_eight_hour_night(self):
+        """All 960 epochs of an 8 h night should take seconds, not minutes"""
+        rng = np.random.default_rng(0)
+        n_samples = int(NIGHT_HOURS * 3600 * SAMPLING_RATE)
+        data = NeuralData(
+            data=rng.standard_normal((len(CHANNELS), n_samples)) * 20,
+            sampling_rate=SAMPLING_RATE,
+            channels=CHANNELS,
+            timestamp=datetime.now(),
+            device_id="benchmark",
+        )
+        extractor = SleepFeatureExtractor()
+
+        start = time.perf_counter()
+        features = await extractor.extract_night_features(data)
+        elapsed_s = time.perf_counter() - start
+
+        print(
+            f"night features: {elapsed_s:.2f} s for {len(features)} epochs "
+            f"({elapsed_s / len(features) * 1000:.2f} ms/epoch)"
+        )
+
+        assert len(features) == NIGHT_HOURS * 120
+        assert elapsed_s < 30
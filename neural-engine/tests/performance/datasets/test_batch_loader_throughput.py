@@ -0,0 +1,66 @@
+"""
+Benchmark batch loading from the memory-mapped dataset cache
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.datasets.epoch_store import ShardedEpochStore
+from common.batch_loader import BatchLoader
+
+N_EPOCHS = 4096
+N_CHANNELS = 64
+N_SAMPLES = 640  # 4 s at 160 Hz
+BATCH_SIZE = 64
+STEP_S = 0.004  # Simulated training step
+
+
+def _samples_per_sec(batches, n_samples: int) -> float:
+    """Consume batches with a simulated training step."""
+    start = time.perf_counter()
+    for batch_data, _ in batches:
+        batch_data.sum()
+        time.sleep(STEP_S)
+    return n_samples / (time.perf_counter() - start)
+
+
+class TestBatchLoaderThroughput:
+    """Measure samples/sec of shuffled batches from a sharded cache"""
+
+    @pytest.mark.performance
+    def test_prefetch_overlaps_loading_with_training(self):
+        """Prefetching should hide most of the read time behind the step"""
+        rng = np.random.default_rng(0)
+        store = ShardedEpochStore(Path(tempfile.mkdtemp()))
+        for shard in range(16):
+            n = N_EPOCHS // 16
+            store.write_shard(
+                f"recording-{shard}",
+                rng.standard_normal((n, N_CHANNELS, N_SAMPLES)).astype(np.float32),
+                rng.integers(0, 4, size=n),
+            )
+        data, labels = store.open()
+
+        order = np.random.default_rng(1).permutation(N_EPOCHS)
+        fancy_index = (
+            (data[order[i : i + BATCH_SIZE]], labels[order[i : i + BATCH_SIZE]])
+            for i in range(0, N_EPOCHS, BATCH_SIZE)
+        )
+        baseline = _samples_per_sec(fancy_index, N_EPOCHS)
+
+        loader = BatchLoader(
+            data, labels, batch_size=BATCH_SIZE, prefetch=4, num_workers=2, seed=1
+        )
+        prefetched = _samples_per_sec(loader, N_EPOCHS)
+
+        print(
+            f"batch loading: {baseline:.0f} samples/s per-batch indexing, "
+            f"{prefetched:.0f} samples/s prefetched ({prefetched / baseline:.2f}x)"
+        )
+
+        # Never slower than reading each batch on demand
+        assert prefetched > 0.9 * baseline
@@ -0,0 +1,93 @@
+"""
+Benchmark block-wise BrainFlow acquisition on the synthetic board
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from devices.adapters.brainflow_adapter import BrainFlowAdapter
+from devices.base import ConnectionType, DataBlock, DeviceInfo, DeviceType
+
+N_BOARDS = 2
+DURATION_SECONDS = 3.0
+BLOCK_DURATION_MS = 20.0
+
+
+def _make_adapter(index: int) -> BrainFlowAdapter:
+    """Create a filtering adapter for one BrainFlow synthetic board"""
+    device_info = DeviceInfo(
+        device_id=f"bench_brainflow_{index}",
+        device_type=DeviceType.BRAINFLOW_SYNTHETIC,
+        model="BrainFlow Synthetic",
+        firmware_version="BrainFlow",
+        connection_type=ConnectionType.SYNTHETIC,
+        connection_params={
+            "enable_filtering": True,
+            "block_duration_ms": BLOCK_DURATION_MS,
+            "buffer_size": 45000,
+            # BrainFlow allows one session per board id and parameter set
+            "other_info": f"bench_{index}",
+        },
+    )
+    return BrainFlowAdapter(device_info)
+
+
+class _LatencySink:
+    """Records the delay from the newest sample's timestamp to delivery"""
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.samples = 0
+
+    def on_block(self, block: DataBlock) -> None:
+        self.latencies_ms.append((time.time() - block.timestamps[-1]) * 1000)
+        self.samples += block.n_samples
+
+
+class TestBrainFlowBlockLatency:
+    """Measure end-to-end latency and CPU per synthetic board"""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_synthetic_board_latency_and_cpu(self):
+        """Blocks should arrive promptly with little CPU per board"""
+        adapters = [_make_adapter(i) for i in range(N_BOARDS)]
+        sinks = [_LatencySink() for _ in adapters]
+        for adapter, sink in zip(adapters, sinks):
+            adapter.add_block_callback(sink.on_block)
+            assert await adapter.connect()
+
+        try:
+            for adapter in adapters:
+                assert await adapter.start_streaming()
+
+            cpu_start = time.process_time()
+            await asyncio.sleep(DURATION_SECONDS)
+            cpu_time = time.process_time() - cpu_start
+
+            for adapter in adapters:
+                await adapter.stop_streaming()
+        finally:
+            for adapter in adapters:
+                await adapter.disconnect()
+
+        latencies = np.concatenate([sink.latencies_ms for sink in sinks])
+        # Includes BrainFlow's own synthetic data generation threads
+        cpu_per_board = cpu_time / DURATION_SECONDS / N_BOARDS
+        sampling_rate = adapters[0].device_info.sampling_rate
+
+        print(
+            f"latency p50 {np.percentile(latencies, 50):.1f} ms, "
+            f"p99 {np.percentile(latencies, 99):.1f} ms, "
+            f"{cpu_per_board * 100:.2f}% CPU per board "
+            f"({len(adapters[0].eeg_channels)} ch @ {sampling_rate:.0f} Hz, "
+            f"{BLOCK_DURATION_MS:.0f} ms blocks)"
+        )
+
+        for sink in sinks:
+            assert sink.samples >= 0.8 * sampling_rate * DURATION_SECONDS
+        assert np.percentile(latencies, 99) < BLOCK_DURATION_MS + 50.0
+        assert cpu_per_board < 0.2
@@ -0,0 +1,232 @@
+"""
+Benchmark per-sample vs block-oriented device data paths
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from devices.base import (
+    DataBlock,
+    DataSample,
+    DeviceInfo,
+    DeviceType,
+    ConnectionType,
+)
+from devices.device_manager import DeviceManager
+from devices.adapters.synthetic_adapter import SyntheticAdapter
+
+SAMPLING_RATE = 1000.0
+N_CHANNELS = 64
+DURATION_SECONDS = 5.0
+BLOCK_DURATION_MS = 20.0
+
+
+def _make_adapter() -> SyntheticAdapter:
+    """Create a synthetic adapter without simulated artifacts or packet loss"""
+    device_info = DeviceInfo(
+        device_id="bench_device",
+        device_type=DeviceType.SYNTHETIC,
+        model="Synthetic Benchmark",
+        firmware_version="1.0.0",
+        channel_count=N_CHANNELS,
+        sampling_rate=SAMPLING_RATE,
+        connection_type=ConnectionType.SYNTHETIC,
+        connection_params={
+            "simulate_artifacts": False,
+            "simulate_issues": False,
+            "block_duration_ms": BLOCK_DURATION_MS,
+        },
+    )
+    return SyntheticAdapter(device_info)
+
+
+class _BufferSink:
+    """Consumer writing into a preallocated channels x samples buffer"""
+
+    def __init__(self, n_samples: int):
+        self.buffer = np.zeros((N_CHANNELS, n_samples), dtype=np.float32)
+        self.write_pos = 0
+
+    def on_sample(self, sample: DataSample) -> None:
+        self.buffer[:, self.write_pos] = sample.channel_data
+        self.write_pos += 1
+
+    def on_block(self, block: DataBlock) -> None:
+        self.buffer[:, self.write_pos : self.write_pos + block.n_samples] = block.data
+        self.write_pos += block.n_samples
+
+
+def _run_per_sample_path(n_samples: int) -> dict:
+    """Legacy path: one DataSample and one callback chain per time point
+
+    Mirrors the pre-block wiring, where the manager's per-sample handler is
+    a plain data callback and no block is ever built.
+    """
+    adapter = _make_adapter()
+    manager = DeviceManager()
+    sink = _BufferSink(n_samples)
+    adapter.add_data_callback(manager._handle_device_data)
+    manager.add_data_callback(sink.on_sample)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(n_samples):
+        sample_number = adapter.sample_counter
+        data = adapter._generate_sample_data()
+        adapter._emit_data(
+            DataSample(
+                timestamp=time.time(),
+                channel_data=data,
+                sample_number=sample_number,
+                sampling_rate=SAMPLING_RATE,
+            )
+        )
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    assert sink.write_pos == n_samples
+    return {"wall_time": wall_time, "cpu_time": cpu_time}
+
+
+def _run_block_path(n_samples: int) -> dict:
+    """Block path: one contiguous DataBlock per block interval"""
+    adapter = _make_adapter()
+    manager = DeviceManager()
+    sink = _BufferSink(n_samples)
+    adapter.add_block_callback(manager._handle_device_block)
+    manager.add_block_callback(sink.on_block)
+    block_size = int(SAMPLING_RATE * BLOCK_DURATION_MS / 1000.0)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(n_samples // block_size):
+        first_sample = adapter.sample_counter
+        data = adapter._generate_block_data(block_size)
+        adapter._emit_block(
+            DataBlock(
+                data=data,
+                timestamps=time.time() + np.arange(block_size) / SAMPLING_RATE,
+                first_sample_number=first_sample,
+                sampling_rate=SAMPLING_RATE,
+            )
+        )
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    assert sink.write_pos == n_samples
+    return {"wall_time": wall_time, "cpu_time": cpu_time}
+
+
+class TestDataBlockThroughput:
+    """Compare samples/sec and CPU per device for both data paths"""
+
+    @pytest.mark.performance
+    def test_block_path_outperforms_per_sample_path(self):
+        """Block emission should be substantially cheaper per device"""
+        n_samples = int(SAMPLING_RATE * DURATION_SECONDS)
+
+        per_sample = _run_per_sample_path(n_samples)
+        block = _run_block_path(n_samples)
+
+        results = {}
+        for name, result in (("per_sample", per_sample), ("block", block)):
+            results[name] = {
+                "samples_per_sec": n_samples / result["wall_time"],
+                # CPU seconds spent per second of device data
+                "cpu_per_device": result["cpu_time"] / DURATION_SECONDS,
+            }
+            print(
+                f"{name}: {results[name]['samples_per_sec']:.0f} samples/sec, "
+                f"{results[name]['cpu_per_device'] * 100:.2f}% CPU per device "
+                f"({N_CHANNELS} ch @ {SAMPLING_RATE:.0f} Hz)"
+            )
+
+        assert (
+            results["block"]["samples_per_sec"]
+            > 3 * results["per_sample"]["samples_per_sec"]
+        )
+        assert results["block"]["cpu_per_device"] < 0.05
+
+    def test_block_round_trips_through_sample_shim(self):
+        """Per-sample consumers should see identical data from block emission"""
+        adapter = _make_adapter()
+        received = []
+        adapter.add_data_callback(received.append)
+
+        data = adapter._generate_block_data(10)
+        adapter._emit_block(
+            DataBlock(
+                data=data,
+                timestamps=np.arange(10, dtype=np.float64),
+                first_sample_number=0,
+                sampling_rate=SAMPLING_RATE,
+            )
+        )
+
+        assert len(received) == 10
+        assert [s.sample_number for s in received] == list(range(10))
+        np.testing.assert_allclose(
+            np.stack([s.channel_data for s in received], axis=1),
+            data.astype(np.float32),
+        )
+        assert all(s.device_id == "bench_device" for s in received)
+
+    def test_manager_receives_samples_without_block_wrapping(self, monkeypatch):
+        """Per-sample adapters should reach manager data callbacks directly"""
+        adapter = _make_adapter()
+        manager = DeviceManager()
+        adapter.add_stream_handler(
+            manager._handle_device_data, manager._handle_device_block
+        )
+        received = []
+        manager.add_data_callback(received.append)
+
+        def fail_from_sample(sample):
+            raise AssertionError("sample was wrapped in a block")
+
+        monkeypatch.setattr(DataBlock, "from_sample", staticmethod(fail_from_sample))
+        for sample_number in range(5):
+            adapter._emit_data(
+                DataSample(
+                    timestamp=float(sample_number),
+                    channel_data=adapter._generate_sample_data(),
+                    sample_number=sample_number,
+                    sampling_rate=SAMPLING_RATE,
+                )
+            )
+
+        assert [s.sample_number for s in received] == list(range(5))
+        assert manager.stats.data_samples_processed == 5
+        assert manager.stats.data_blocks_processed == 0
+
+    def test_stream_handler_receives_emitted_form(self):
+        """Stream handlers should get samples and blocks without conversion"""
+        adapter = _make_adapter()
+        samples, blocks = [], []
+        adapter.add_stream_handler(samples.append, blocks.append)
+
+        adapter._emit_data(
+            DataSample(
+                timestamp=0.0,
+                channel_data=adapter._generate_sample_data(),
+                sample_number=0,
+                sampling_rate=SAMPLING_RATE,
+            )
+        )
+        adapter._emit_block(
+            DataBlock(
+                data=adapter._generate_block_data(10),
+                timestamps=np.arange(10, dtype=np.float64),
+                first_sample_number=1,
+                sampling_rate=SAMPLING_RATE,
+            )
+        )
+
+        assert len(samples) == 1 and len(blocks) == 1
+        assert blocks[0].n_samples == 10
+
+        adapter.remove_stream_handler(samples.append, blocks.append)
+        adapter._emit_block(blocks[0])
+        assert len(blocks) == 1
@@ -0,0 +1,108 @@
+"""
+Benchmark Cyton stream decoding for a Cyton + Daisy at 16 ch / 1 kHz
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from devices.adapters.openbci_adapter import (
+    CytonStreamDecoder,
+    OpenBCIAdapter,
+    OpenBCIPacketParser,
+)
+from devices.base import ConnectionType, DeviceInfo, DeviceType
+
+SAMPLING_RATE = 1000.0
+N_CHANNELS = 16
+DURATION_SECONDS = 10.0
+READ_INTERVAL_MS = 1.0  # Serial read thread polling interval
+
+
+def _make_daisy_stream(n_samples: int) -> bytes:
+    """Build interleaved Daisy / Cyton frames for n_samples 16-channel samples"""
+    rng = np.random.default_rng(0)
+    counts = rng.integers(-(2**23), 2**23, size=(2 * n_samples, 8))
+    frames = []
+    for i, row in enumerate(counts):
+        frame = bytearray([OpenBCIPacketParser.START_BYTE, i % 256])
+        for value in row:
+            frame += int(value).to_bytes(3, "big", signed=True)
+        frame += bytes(6)
+        frame.append(OpenBCIPacketParser.STOP_BYTE)
+        frames.append(bytes(frame))
+    return b"".join(frames)
+
+
+def _make_adapter() -> OpenBCIAdapter:
+    """Create a streaming Cyton + Daisy adapter without a serial port"""
+    device_info = DeviceInfo(
+        device_id="bench_cyton_daisy",
+        device_type=DeviceType.OPENBCI_CYTON,
+        model="Cyton + Daisy",
+        firmware_version="3.1.2",
+        channel_count=N_CHANNELS,
+        sampling_rate=SAMPLING_RATE,
+        connection_type=ConnectionType.SERIAL,
+    )
+    adapter = OpenBCIAdapter(device_info)
+    adapter.is_streaming = True
+    return adapter
+
+
+class TestOpenBCIDecoderThroughput:
+    """Measure CPU spent decoding one device's serial stream"""
+
+    @pytest.mark.performance
+    def test_block_decoding_outperforms_per_packet_parsing(self):
+        """Decoding a block at once should beat parsing frame by frame"""
+        n_samples = int(SAMPLING_RATE * DURATION_SECONDS)
+        stream = _make_daisy_stream(n_samples)
+        block_bytes = _make_adapter().block_bytes
+        frame_size = OpenBCIPacketParser.PACKET_SIZE_CYTON
+
+        decoder = CytonStreamDecoder(daisy=True)
+        decoded = 0
+        cpu_start = time.process_time()
+        for i in range(0, len(stream), block_bytes):
+            decoded += decoder.decode(stream[i : i + block_bytes]).n_samples
+        decoder_cpu = (time.process_time() - cpu_start) / DURATION_SECONDS
+
+        cpu_start = time.process_time()
+        for i in range(0, len(stream), frame_size):
+            OpenBCIPacketParser.parse_cyton_packet(stream[i : i + frame_size])
+        parser_cpu = (time.process_time() - cpu_start) / DURATION_SECONDS
+
+        print(
+            f"block decoder: {decoder_cpu * 100:.2f}% CPU, "
+            f"per-packet parser: {parser_cpu * 100:.2f}% CPU "
+            f"({N_CHANNELS} ch @ {SAMPLING_RATE:.0f} Hz)"
+        )
+
+        assert decoded == n_samples
+        assert decoder_cpu * 2 < parser_cpu
+
+    @pytest.mark.performance
+    def test_adapter_cpu_per_device(self):
+        """The adapter should handle 1 ms serial reads with little CPU"""
+        n_samples = int(SAMPLING_RATE * DURATION_SECONDS)
+        stream = _make_daisy_stream(n_samples)
+        read_size = int(len(stream) / DURATION_SECONDS * READ_INTERVAL_MS / 1000)
+
+        adapter = _make_adapter()
+        received = []
+        adapter.add_block_callback(lambda block: received.append(block.n_samples))
+
+        cpu_start = time.process_time()
+        for i in range(0, len(stream), read_size):
+            adapter._handle_serial_data(stream[i : i + read_size])
+        cpu_per_device = (time.process_time() - cpu_start) / DURATION_SECONDS
+
+        print(
+            f"adapter: {cpu_per_device * 100:.2f}% CPU per device "
+            f"({N_CHANNELS} ch @ {SAMPLING_RATE:.0f} Hz, {read_size} byte reads)"
+        )
+
+        assert sum(received) == n_samples
+        assert cpu_per_device < 0.05
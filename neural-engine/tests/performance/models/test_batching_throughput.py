@@ -0,0 +1,63 @@
+"""
+Benchmark adaptive request batching against one model call per request
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from models.dynamic_batching import BatchingConfig, ModelBatcher
+
+N_CLIENTS = 64
+REQUESTS_PER_CLIENT = 20
+CALL_OVERHEAD_S = 0.003  # Fixed cost of one model call
+PER_EXAMPLE_S = 0.00005
+
+
+async def _simulated_model(data: np.ndarray) -> np.ndarray:
+    """Model call whose cost is dominated by a fixed per-call overhead."""
+    await asyncio.sleep(CALL_OVERHEAD_S + PER_EXAMPLE_S * len(data))
+    return data.reshape(len(data), -1).mean(axis=1)
+
+
+async def _throughput(config: BatchingConfig) -> tuple:
+    """Requests per second and p99 latency with concurrent clients."""
+    batcher = ModelBatcher("bench:v1", _simulated_model, config)
+    example = np.zeros((250, 8), dtype=np.float32)
+
+    async def client():
+        for _ in range(REQUESTS_PER_CLIENT):
+            await batcher.submit(example)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(client() for _ in range(N_CLIENTS)))
+    finally:
+        await batcher.close()
+    elapsed = time.perf_counter() - start
+
+    return N_CLIENTS * REQUESTS_PER_CLIENT / elapsed, batcher.p99_latency_ms()
+
+
+class TestBatchingThroughput:
+    """Measure requests per second with many concurrent clients"""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_batching_beats_one_call_per_request(self):
+        """Adaptive batches should serve several times more requests"""
+        unbatched, _ = await _throughput(
+            BatchingConfig(max_batch_size=1, initial_batch_size=1)
+        )
+        batched, p99_ms = await _throughput(
+            BatchingConfig(max_batch_size=64, batch_timeout_ms=5, latency_target_ms=100)
+        )
+
+        print(
+            f"unbatched: {unbatched:.0f} req/s, batched: {batched:.0f} req/s "
+            f"(p99 {p99_ms:.1f} ms, {N_CLIENTS} clients)"
+        )
+
+        assert batched > 5 * unbatched
@@ -0,0 +1,133 @@
+"""
+Benchmark evaluating a large alert rule set
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from monitoring.alerting.alert_manager import (
+    AlertManager,
+    AlertRule,
+    AlertSeverity,
+    RuleCondition,
+)
+
+N_RULES = 10_000
+N_METRICS = 500
+N_ROUNDS = 20
+
+CONDITIONS = [
+    RuleCondition.GREATER_THAN,
+    RuleCondition.LESS_THAN,
+    RuleCondition.GREATER_EQUAL,
+    RuleCondition.LESS_EQUAL,
+]
+
+
+def _evaluate_per_rule(rules, states, metrics, now):
+    """Rule-at-a-time evaluation with dictionary state, for comparison"""
+    fired = 0
+    for rule in rules:
+        value = metrics.get(rule.metric_name)
+        if value is None or not rule.enabled:
+            continue
+
+        condition = rule.condition
+        if condition == RuleCondition.GREATER_THAN:
+            met = value > rule.threshold
+        elif condition == RuleCondition.LESS_THAN:
+            met = value < rule.threshold
+        elif condition == RuleCondition.GREATER_EQUAL:
+            met = value >= rule.threshold
+        else:
+            met = value <= rule.threshold
+
+        state = states[rule.id]
+        state["last_value"] = value
+        if met:
+            if state["condition_start"] is None:
+                state["condition_start"] = now
+            elif now - state["condition_start"] >= rule.for_duration:
+                if not state["firing"]:
+                    state["firing"] = True
+                    fired += 1
+        elif state["condition_start"] is not None:
+            state["condition_start"] = None
+            state["firing"] = False
+    return fired
+
+
+class TestAlertRuleEvaluation:
+    """Measure evaluation latency of 10k rules against 500 metrics"""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_compiled_rule_evaluation(self):
+        """Compiled evaluation should beat the per-rule loop and agree with it"""
+        rng = np.random.default_rng(0)
+        rules = [
+            AlertRule(
+                id=f"rule_{i}",
+                name=f"Rule {i}",
+                description=f"Rule {i}",
+                metric_name=f"metric_{i % N_METRICS}",
+                condition=CONDITIONS[i % len(CONDITIONS)],
+                threshold=float(rng.uniform(0.0, 100.0)),
+                severity=AlertSeverity.WARNING,
+                for_duration=0,
+            )
+            for i in range(N_RULES)
+        ]
+        rounds = [
+            {f"metric_{m}": float(v) for m, v in enumerate(values)}
+            for values in rng.uniform(0.0, 100.0, (N_ROUNDS, N_METRICS))
+        ]
+
+        states = {
+            rule.id: {"condition_start": None, "firing": False, "last_value": None}
+            for rule in rules
+        }
+        start = time.perf_counter()
+        loop_fired = sum(
+            _evaluate_per_rule(rules, states, metrics, float(n))
+            for n, metrics in enumerate(rounds)
+        )
+        loop_s = (time.perf_counter() - start) / N_ROUNDS
+
+        manager = AlertManager(config=None)
+        for rule_id in list(manager.rules):
+            manager.unregister_rule(rule_id)
+        for rule in rules:
+            manager.register_rule(rule)
+        manager._compiled()
+
+        # Vector-level evaluation, excluding alert construction
+        compiled = manager.compiled_rules
+        vectors = [compiled.metric_vector(metrics) for metrics in rounds]
+        state = compiled.condition_start.copy(), compiled.firing.copy()
+        start = time.perf_counter()
+        vector_fired = sum(
+            len(compiled.evaluate(values, float(n)).fired)
+            for n, values in enumerate(vectors)
+        )
+        vector_s = (time.perf_counter() - start) / N_ROUNDS
+        compiled.condition_start[:], compiled.firing[:] = state
+
+        # Full manager evaluation, including alert fan-out on transitions
+        start = time.perf_counter()
+        manager_fired = 0
+        for metrics in rounds:
+            manager_fired += await manager.evaluate_all_rules(metrics)
+        manager_s = (time.perf_counter() - start) / N_ROUNDS
+
+        print(
+            f"{N_RULES} rules: per-rule loop {loop_s * 1e3:.2f} ms, "
+            f"compiled {vector_s * 1e3:.3f} ms, "
+            f"manager with alerts {manager_s * 1e3:.2f} ms per evaluation"
+        )
+
+        assert vector_fired == loop_fired
+        assert manager_fired > 0
+        assert vector_s < loop_s
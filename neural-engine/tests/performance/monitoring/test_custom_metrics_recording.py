@@ -0,0 +1,64 @@
+"""
+Benchmark recording and summarizing custom histogram metrics
+"""
+
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from monitoring.metrics.custom_metrics import (
+    CustomMetricsCollector,
+    MetricEvent,
+    MetricType,
+)
+
+N_OBSERVATIONS = 100_000
+
+
+class TestCustomMetricsRecording:
+    """Measure per-observation cost and summary latency of histograms"""
+
+    @pytest.mark.performance
+    def test_sketch_recording_and_summary(self):
+        """Sketch-backed series should record and summarize faster than events"""
+        values = np.random.default_rng(0).lognormal(-4.0, 1.0, N_OBSERVATIONS)
+        values = values.tolist()
+
+        # Event-per-observation history with a scan per summary
+        history: deque = deque(maxlen=N_OBSERVATIONS)
+        start = time.perf_counter()
+        for value in values:
+            history.append(MetricEvent("latency", value, datetime.utcnow()))
+        event_record_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cutoff = datetime.utcnow() - timedelta(minutes=60)
+        recent = [event.value for event in history if event.timestamp >= cutoff]
+        statistics.median(recent)
+        statistics.stdev(recent)
+        event_summary_s = time.perf_counter() - start
+
+        collector = CustomMetricsCollector(config=None)
+        collector.register_metric("latency", MetricType.HISTOGRAM, "Latency", "s")
+        start = time.perf_counter()
+        for value in values:
+            collector.record_histogram("latency", value)
+        sketch_record_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = collector.get_metric_summary("latency")
+        sketch_summary_s = time.perf_counter() - start
+
+        print(
+            f"record: {event_record_s / N_OBSERVATIONS * 1e6:.2f} us/event vs "
+            f"{sketch_record_s / N_OBSERVATIONS * 1e6:.2f} us/sketch; "
+            f"summary: {event_summary_s * 1e3:.1f} ms vs "
+            f"{sketch_summary_s * 1e3:.1f} ms"
+        )
+
+        assert summary["events_count"] == N_OBSERVATIONS
+        assert sketch_summary_s < event_summary_s
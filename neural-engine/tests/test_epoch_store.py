@@ -0,0 +1,213 @@
+"""Unit tests for the sharded, memory-mapped epoch cache."""
+
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from src.datasets import BaseDataset, DatasetConfig
+from src.datasets.epoch_store import ShardedArray, ShardedEpochStore
+
+
+@dataclass
+class _SyntheticConfig(DatasetConfig):
+    """Configuration with a preprocessing setting."""
+
+    bandpass_freq: Tuple[float, float] = (0.5, 50.0)
+
+
+class _SyntheticDataset(BaseDataset):
+    """Minimal dataset for exercising the cache."""
+
+    def download(self) -> None:
+        pass
+
+    def load(self) -> Tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def preprocess(self, data: np.ndarray) -> np.ndarray:
+        return data
+
+    def validate(self, data: np.ndarray) -> bool:
+        return True
+
+
+def _shards(n_shards: int = 3, seed: int = 0):
+    """Epochs (epochs x samples x channels) and labels per recording."""
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            f"S{i:03d}/S{i:03d}R01",
+            rng.standard_normal((10 + i, 64, 3)).astype(np.float32),
+            rng.choice(["left", "right"], size=10 + i),
+        )
+        for i in range(n_shards)
+    ]
+
+
+@pytest.fixture
+def store_dir():
+    """Temporary store directory."""
+    return Path(tempfile.mkdtemp())
+
+
+class TestShardedEpochStore:
+    """Test ShardedEpochStore."""
+
+    def test_round_trip(self, store_dir):
+        """Test shards are concatenated in order and memory-mapped."""
+        store = ShardedEpochStore(store_dir, "config")
+        shards = _shards()
+        for shard_id, data, labels in shards:
+            store.write_shard(shard_id, data, labels)
+        store.complete({"n_subjects": 3})
+
+        reopened = ShardedEpochStore(store_dir, "config")
+        data, labels = reopened.open()
+
+        assert reopened.is_complete()
+        assert reopened.metadata == {"n_subjects": 3}
+        assert isinstance(data, ShardedArray)
+        assert data.shape == (33, 64, 3)
+        np.testing.assert_array_equal(data, np.concatenate([s[1] for s in shards]))
+        np.testing.assert_array_equal(labels, np.concatenate([s[2] for s in shards]))
+
+    def test_indexing_reads_selected_epochs(self, store_dir):
+        """Test integer, slice, mask and lazy subset indexing."""
+        store = ShardedEpochStore(store_dir)
+        shards = _shards()
+        for shard_id, data, labels in shards:
+            store.write_shard(shard_id, data, labels)
+        data, _ = store.open()
+        expected = np.concatenate([s[1] for s in shards])
+
+        indices = np.array([32, 0, 11, 10, -1, 5])
+        np.testing.assert_array_equal(data[indices], expected[indices])
+        np.testing.assert_array_equal(data[3], expected[3])
+        np.testing.assert_array_equal(data[5:25:4], expected[5:25:4])
+        np.testing.assert_array_equal(data[indices, :, 1], expected[indices, :, 1])
+        mask = np.arange(33) % 3 == 0
+        np.testing.assert_array_equal(data[mask], expected[mask])
+
+        subset = data.subset(indices)
+        assert isinstance(subset, ShardedArray)
+        np.testing.assert_array_equal(subset[[1, 2]], expected[[0, 11]])
+
+        with pytest.raises(IndexError):
+            data[33]
+
+    def test_changed_source_invalidates_only_its_shard(self, store_dir):
+        """Test source files are tracked per shard."""
+        store = ShardedEpochStore(store_dir, "config")
+        sources = []
+        for shard_id, data, labels in _shards(2):
+            source = store_dir / f"{shard_id.replace('/', '_')}.edf"
+            source.write_bytes(b"edf")
+            sources.append(source)
+            store.write_shard(shard_id, data, labels, sources=[source])
+        store.complete({})
+
+        assert store.has_shard("S000/S000R01", [sources[0]])
+        assert not store.has_shard("S000/S000R01", [sources[1]])
+        assert not store.has_shard("S999/S999R01", [sources[0]])
+        assert store.is_complete()
+
+        sources[1].write_bytes(b"edf, re-exported")
+        assert store.has_shard("S000/S000R01", [sources[0]])
+        assert not store.has_shard("S001/S001R01", [sources[1]])
+        assert not store.is_complete()
+
+    def test_changed_config_invalidates_store(self, store_dir):
+        """Test a store built with other settings is discarded."""
+        store = ShardedEpochStore(store_dir, "config-a")
+        for shard_id, data, labels in _shards(1):
+            store.write_shard(shard_id, data, labels)
+        store.complete({})
+
+        assert ShardedEpochStore(store_dir, "config-a").is_complete()
+        store = ShardedEpochStore(store_dir, "config-b")
+        assert not store.is_complete()
+        assert store.shards == []
+        assert not any((store_dir / "shards").glob("*.npy"))
+
+    def test_complete_prunes_unlisted_shards(self, store_dir):
+        """Test shards not belonging to the dataset are removed."""
+        store = ShardedEpochStore(store_dir)
+        shards = _shards()
+        for shard_id, data, labels in shards:
+            store.write_shard(shard_id, data, labels)
+
+        store.complete({}, [shards[2][0], shards[0][0]])
+        data, labels = store.open()
+
+        np.testing.assert_array_equal(
+            data, np.concatenate([shards[2][1], shards[0][1]])
+        )
+        assert len(list((store_dir / "shards").glob("*.data.npy"))) == 2
+
+    def test_incomplete_store_is_not_reported(self, store_dir):
+        """Test an interrupted build is not mistaken for a cache."""
+        store = ShardedEpochStore(store_dir)
+        shard_id, data, labels = _shards(1)[0]
+        store.write_shard(shard_id, data, labels)
+
+        assert not ShardedEpochStore(store_dir).is_complete()
+        assert ShardedEpochStore(store_dir).has_shard(shard_id)
+
+
+class TestBaseDatasetCache:
+    """Test BaseDataset caching on top of the store."""
+
+    def test_save_and_load_cache(self, store_dir):
+        """Test the cache round trip returns memory-mapped epochs."""
+        dataset = _SyntheticDataset(
+            _SyntheticConfig(name="synthetic", cache_dir=store_dir)
+        )
+        data = np.random.randn(100, 3, 320)
+        labels = np.random.choice(["left", "right"], size=100)
+
+        dataset.save_cache(data, labels, {"channels": ["C3", "C4", "Cz"]})
+        loaded_data, loaded_labels, metadata = dataset.load_cache()
+
+        assert dataset.cache_exists()
+        assert isinstance(loaded_data, ShardedArray)
+        np.testing.assert_array_equal(loaded_data, data)
+        np.testing.assert_array_equal(loaded_labels, labels)
+        assert metadata == {"channels": ["C3", "C4", "Cz"]}
+
+        # Splits and batches select epochs without loading the whole cache
+        train, val, test = dataset.split_data(loaded_data, loaded_labels)
+        assert isinstance(train[0], ShardedArray)
+        batch_data, batch_labels = next(
+            dataset.get_batch_iterator(*train, shuffle=False)
+        )
+        assert batch_data.shape == (dataset.config.batch_size, 3, 320)
+        np.testing.assert_array_equal(batch_data, np.asarray(train[0])[:32])
+
+    def test_config_change_invalidates_cache(self, store_dir):
+        """Test preprocessing settings are part of the cache key."""
+        config = _SyntheticConfig(name="synthetic", cache_dir=store_dir)
+        _SyntheticDataset(config).save_cache(np.zeros((4, 2)), np.zeros(4), {})
+
+        config.batch_size = 64
+        assert _SyntheticDataset(config).cache_exists()
+
+        config.bandpass_freq = (1.0, 40.0)
+        assert not _SyntheticDataset(config).cache_exists()
+
+    def test_source_file_changes_are_detected(self, store_dir):
+        """Test shards built from a file are rebuilt when it changes."""
+        dataset = _SyntheticDataset(
+            _SyntheticConfig(name="synthetic", cache_dir=store_dir)
+        )
+        source = store_dir / "recording.edf"
+        source.write_bytes(b"edf")
+
+        dataset.cache_shard("recording", np.zeros((2, 4)), [0, 1], source)
+        assert dataset.has_cached_shard("recording", source)
+
+        source.write_bytes(b"edf, re-exported")
+        assert not dataset.has_cached_shard("recording", source)
@@ -63,6 +63,7 @@ class TestEventSchema:
             data_hash="hash-789",
             metadata={"size": 1024},
             event_hash="event-hash",
+            sequence=42,
             signature="signature",
             signing_key_id="key-id",
         )
@@ -76,6 +77,8 @@ class TestEventSchema:
         assert event_dict["data_hash"] == "hash-789"
         assert event_dict["metadata"] == {"size": 1024}
         assert event_dict["event_hash"] == "event-hash"
+        assert event_dict["sequence"] == 42
+        assert NeuralLedgerEvent.from_dict(event_dict).sequence == 42
         assert event_dict["signature"] == "signature"
         assert event_dict["signing_key_id"] == "key-id"
 
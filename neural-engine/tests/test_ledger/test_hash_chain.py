@@ -1,10 +1,10 @@
 """Tests for hash chain integrity system."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 import hashlib
 
-from ledger.hash_chain import HashChain
+from ledger.hash_chain import ChainCheckpoint, HashChain
 from ledger.event_schema import NeuralLedgerEvent, EventType
 
 
@@ -132,6 +132,23 @@ class TestHashChain:
         break_index = HashChain.find_chain_break(events)
         assert break_index == 3
 
+    def test_chain_order_follows_links(self):
+        """Test events are ordered by hash links, not by timestamp."""
+        events = TestChainCheckpoints.make_chain(6)
+        for event in events:
+            event.timestamp = datetime(2025, 1, 1)
+
+        shuffled = [events[i] for i in (3, 0, 5, 1, 4, 2)]
+        assert HashChain.chain_order(shuffled) == events
+
+        # Events the links do not reach follow in input order
+        events[3].previous_hash = "f" * 64
+        assert HashChain.chain_order(shuffled) == events[:3] + [
+            events[3],
+            events[5],
+            events[4],
+        ]
+
     def test_repair_chain(self):
         """Test chain repair functionality."""
         # Create broken chain
@@ -179,3 +196,165 @@ class TestHashChain:
         assert HashChain.verify_chain([]) is True
         assert HashChain.find_chain_break([]) is None
         assert HashChain.compute_merkle_root([]) == "0" * 64
+
+
+class TestChainCheckpoints:
+    """Test suite for Merkle checkpoints and incremental verification."""
+
+    @staticmethod
+    def make_chain(length, previous_hash="0" * 64):
+        """Create a valid chain of events."""
+        events = []
+        for i in range(length):
+            event = NeuralLedgerEvent(
+                event_id=f"event-{i}",
+                event_type=EventType.DATA_INGESTED,
+                timestamp=datetime(2025, 1, 1) + timedelta(seconds=i),
+                metadata={"index": i},
+                previous_hash=previous_hash,
+            )
+            event.event_hash = HashChain.compute_event_hash(event, previous_hash)
+            events.append(event)
+            previous_hash = event.event_hash
+        return events
+
+    def test_build_checkpoints(self):
+        """Test checkpoints cover complete segments only."""
+        events = self.make_chain(250)
+        checkpoints = HashChain.build_checkpoints(events, segment_size=100)
+
+        assert [(c.start_index, c.end_index) for c in checkpoints] == [
+            (0, 100),
+            (100, 200),
+        ]
+        assert checkpoints[0].merkle_root == HashChain.compute_merkle_root(events[:100])
+        assert checkpoints[1].previous_hash == events[99].event_hash
+        assert checkpoints[1].last_hash == events[199].event_hash
+        assert ChainCheckpoint.from_dict(checkpoints[1].to_dict()) == checkpoints[1]
+
+    def test_build_checkpoints_incrementally(self):
+        """Test checkpoints extend from the last trusted one."""
+        events = self.make_chain(300)
+        first = HashChain.build_checkpoints(events[:150], segment_size=100)
+        rest = HashChain.build_checkpoints(events[100:], last_checkpoint=first[-1])
+
+        full = HashChain.build_checkpoints(events, segment_size=100)
+
+        assert [c.chain_root for c in first + rest] == [c.chain_root for c in full]
+        assert [c.start_index for c in rest] == [100, 200]
+
+    def test_build_checkpoints_stops_at_break(self):
+        """Test segments containing a break are not checkpointed."""
+        events = self.make_chain(300)
+        events[150].metadata["tampered"] = True
+
+        checkpoints = HashChain.build_checkpoints(events, segment_size=100)
+        assert len(checkpoints) == 1
+
+    def test_build_checkpoints_reuses_verified_roots(self, monkeypatch):
+        """Test roots from verify_segments are checkpointed without re-hashing."""
+        events = self.make_chain(250)
+        first = HashChain.build_checkpoints(events[:100], segment_size=100)[-1]
+
+        break_index, roots = HashChain.verify_segments(events[100:], first)
+        assert break_index is None
+        assert roots == [HashChain.compute_merkle_root(events[100:200])]
+
+        def fail(*args):
+            raise AssertionError("events re-hashed")
+
+        monkeypatch.setattr(HashChain, "compute_event_hash", fail)
+        monkeypatch.setattr(HashChain, "compute_merkle_root_from_hashes", fail)
+        checkpoints = HashChain.build_checkpoints(events[100:], first, roots=roots)
+
+        assert [(c.start_index, c.end_index) for c in checkpoints] == [(100, 200)]
+        assert checkpoints[0].merkle_root == roots[0]
+        assert checkpoints[0].last_event_id == "event-199"
+
+    def test_verify_segments_stops_at_break(self):
+        """Test only complete segments before a break get roots."""
+        events = self.make_chain(300)
+        events[150].metadata["tampered"] = True
+
+        break_index, roots = HashChain.verify_segments(events, segment_size=100)
+        assert break_index == 150
+        assert roots == [HashChain.compute_merkle_root(events[:100])]
+
+    def test_verify_from_checkpoint(self):
+        """Test verification resumes from the last checkpoint."""
+        events = self.make_chain(250)
+        checkpoint = HashChain.build_checkpoints(events, segment_size=100)[-1]
+
+        assert HashChain.verify_from_checkpoint(events[200:], checkpoint) is True
+
+        events[220].metadata["tampered"] = True
+        assert HashChain.verify_from_checkpoint(events[200:], checkpoint) is False
+
+    def test_locate_chain_break(self):
+        """Test breaks are located with checkpoint roots."""
+        events = self.make_chain(450)
+        checkpoints = HashChain.build_checkpoints(events, segment_size=100)
+        assert HashChain.locate_chain_break(events, checkpoints) is None
+
+        # Overwritten hash inside a checkpointed segment
+        tampered = self.make_chain(450)
+        tampered[250].event_hash = "f" * 64
+        assert HashChain.locate_chain_break(tampered, checkpoints) == 250
+
+        # Consistently rewritten chain is flagged at the first bad segment
+        tampered = self.make_chain(450)
+        tampered[130].metadata["tampered"] = True
+        rewritten = HashChain.repair_chain(tampered)
+        assert HashChain.locate_chain_break(rewritten, checkpoints) == 100
+
+        # Break after the last checkpoint
+        tampered = self.make_chain(450)
+        tampered[420].metadata["tampered"] = True
+        assert HashChain.locate_chain_break(tampered, checkpoints) == 420
+
+    def test_locate_chain_break_in_window(self):
+        """Test a window of the chain is checked against covering checkpoints."""
+        events = self.make_chain(450)
+        checkpoints = HashChain.build_checkpoints(events, segment_size=100)
+        assert HashChain.locate_chain_break(events[150:], checkpoints, 150) is None
+        assert HashChain.locate_chain_break(events[200:], checkpoints, 200) is None
+
+        tampered = self.make_chain(450)
+        tampered[320].event_hash = "f" * 64
+        assert HashChain.locate_chain_break(tampered[150:], checkpoints, 150) == 320
+
+        # The hash entering a window at a segment boundary is checked
+        tampered = self.make_chain(450)
+        tampered[200].previous_hash = "f" * 64
+        assert HashChain.locate_chain_break(tampered[200:], checkpoints, 200) == 200
+
+    def test_locate_chain_break_bisects_segment_roots(self, monkeypatch):
+        """Test an early break is found without computing every segment root."""
+        events = self.make_chain(1000)
+        checkpoints = HashChain.build_checkpoints(events, segment_size=50)
+        events[10].event_hash = "f" * 64
+
+        calls = []
+        compute = HashChain.compute_merkle_root_from_hashes
+
+        def counting(hashes):
+            calls.append(len(hashes))
+            return compute(hashes)
+
+        monkeypatch.setattr(HashChain, "compute_merkle_root_from_hashes", counting)
+
+        assert HashChain.locate_chain_break(events, checkpoints) == 10
+        assert len(calls) <= len(checkpoints) // 2 + 1
+
+    def test_parallel_verification_matches_sequential(self, monkeypatch):
+        """Test segment-parallel verification finds the same break."""
+        monkeypatch.setattr("ledger.hash_chain.PARALLEL_MIN_EVENTS", 100)
+        events = self.make_chain(500)
+
+        assert HashChain.verify_chain(events, segment_size=64, max_workers=2)
+
+        events[333].metadata["tampered"] = True
+        assert HashChain.find_chain_break(events, segment_size=64, max_workers=2) == (
+            HashChain.find_chain_break(events, max_workers=1)
+        )
+        assert HashChain.find_chain_break(events, max_workers=1) == 333
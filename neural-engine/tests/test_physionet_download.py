@@ -0,0 +1,325 @@
+"""Offline tests for parallel, resumable PhysioNet download and decoding."""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.datasets import PhysioNetDataset
+from src.datasets.downloader import DownloadTask, ParallelDownloader
+from src.datasets.physionet_loader import PhysioNetConfig, PhysioNetLoader
+
+SUBJECTS = ["S001", "S002"]
+RUNS = range(1, 15)
+SAMPLING_RATE = 160
+CHANNELS = ["C3..", "C4..", "Cz.."]
+
+
+def _write_edf(path: Path, data: np.ndarray, sfreq: int, ch_names) -> None:
+    """Write a minimal EDF file with one-second data records."""
+    n_channels, n_samples = data.shape
+    n_records = n_samples // sfreq
+    digital = np.clip(np.round(data / 500e-6 * 32767), -32768, 32767).astype("<i2")
+
+    def field(value, width):
+        return str(value).ljust(width)[:width]
+
+    header = (
+        field("0", 8)
+        + field("X X X X", 80)
+        + field("Startdate 01-JAN-2020 X X X", 80)
+        + field("01.01.20", 8)
+        + field("00.00.00", 8)
+        + field(256 * (n_channels + 1), 8)
+        + field("", 44)
+        + field(n_records, 8)
+        + field(1, 8)
+        + field(n_channels, 4)
+    )
+    for width, values in [
+        (16, ch_names),
+        (80, ["AgAgCl electrode"] * n_channels),
+        (8, ["uV"] * n_channels),
+        (8, ["-500"] * n_channels),
+        (8, ["500"] * n_channels),
+        (8, ["-32768"] * n_channels),
+        (8, ["32767"] * n_channels),
+        (80, [""] * n_channels),
+        (8, [sfreq] * n_channels),
+        (32, [""] * n_channels),
+    ]:
+        header += "".join(field(value, width) for value in values)
+
+    records = digital[:, : n_records * sfreq].reshape(n_channels, n_records, sfreq)
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        f.write(records.transpose(1, 0, 2).tobytes())
+
+
+class _RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with Range support and injectable faults."""
+
+    # Paths whose next response is cut off after this many bytes
+    truncate_once: dict = {}
+    requests_seen: list = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = Path(self.translate_path(self.path))
+        range_header = self.headers.get("Range")
+        self.requests_seen.append((self.path, range_header))
+        if not path.is_file():
+            self.send_error(404)
+            return
+
+        content = path.read_bytes()
+        start = 0
+        if range_header:
+            start = int(re.match(r"bytes=(\d+)-", range_header).group(1))
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+
+        body = content[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        cutoff = self.truncate_once.pop(self.path, None)
+        if cutoff is not None:
+            # Announce the full length but drop the connection early
+            self.wfile.write(body[:cutoff])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def physionet_mirror():
+    """Serve a small synthetic EEGMMIDB tree with SHA256SUMS over HTTP."""
+    root = Path(tempfile.mkdtemp())
+    rng = np.random.default_rng(0)
+    t = np.arange(10 * SAMPLING_RATE) / SAMPLING_RATE
+    checksums = []
+    for subject in SUBJECTS:
+        (root / subject).mkdir()
+        for run in RUNS:
+            name = f"{subject}/{subject}R{run:02d}.edf"
+            rhythm = 50e-6 * np.sin(2 * np.pi * (8 + run) * t)
+            data = rhythm + 20e-6 * rng.standard_normal((len(CHANNELS), len(t)))
+            _write_edf(root / name, data, SAMPLING_RATE, CHANNELS)
+            digest = hashlib.sha256((root / name).read_bytes()).hexdigest()
+            checksums.append(f"{digest} {name}")
+    (root / "SHA256SUMS.txt").write_text("\n".join(checksums) + "\n")
+
+    _RangeRequestHandler.truncate_once = {}
+    _RangeRequestHandler.requests_seen = []
+    handler = partial(_RangeRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield root, f"http://127.0.0.1:{server.server_address[1]}/"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _config(base_url: str, **kwargs) -> PhysioNetConfig:
+    """Loader configuration pointing at the local mirror."""
+    defaults = dict(
+        name="test_dataset",
+        dataset_type=PhysioNetDataset.EEGMMIDB,
+        subjects=SUBJECTS,
+        channels=["C3", "C4", "Cz"],
+        window_size=2.0,
+        overlap=0.5,
+        bandpass_freq=(8.0, 30.0),
+        notch_freq=60.0,
+        cache_dir=Path(tempfile.mkdtemp()),
+        base_url=base_url,
+        decode_workers=2,
+    )
+    defaults.update(kwargs)
+    return PhysioNetConfig(**defaults)
+
+
+class TestParallelDownloader:
+    """Test ParallelDownloader against the local mirror."""
+
+    def test_resumes_interrupted_download(self, physionet_mirror):
+        """Test a dropped connection is continued with a Range request."""
+        root, base_url = physionet_mirror
+        name = "S001/S001R01.edf"
+        expected = (root / name).read_bytes()
+        _RangeRequestHandler.truncate_once[f"/{name}"] = 1000
+
+        target = Path(tempfile.mkdtemp()) / name
+        # Small chunks so the bytes received before the drop reach the disk
+        downloader = ParallelDownloader(chunk_size=256, retry_backoff=0.0)
+        result = downloader.download_file(
+            DownloadTask(
+                f"{base_url}{name}", target, hashlib.sha256(expected).hexdigest()
+            )
+        )
+
+        assert result.resumed
+        assert target.read_bytes() == expected
+        assert (f"/{name}", "bytes=768-") in _RangeRequestHandler.requests_seen
+
+    def test_resumes_partial_file_from_previous_run(self, physionet_mirror):
+        """Test a leftover .part file is completed rather than restarted."""
+        root, base_url = physionet_mirror
+        name = "S001/S001R02.edf"
+        expected = (root / name).read_bytes()
+        target = Path(tempfile.mkdtemp()) / name
+        target.parent.mkdir(parents=True)
+        target.with_name(target.name + ".part").write_bytes(expected[:500])
+
+        result = ParallelDownloader().download_file(
+            DownloadTask(f"{base_url}{name}", target)
+        )
+
+        assert result.resumed
+        assert result.bytes_downloaded == len(expected) - 500
+        assert target.read_bytes() == expected
+
+    def test_truncated_file_without_checksum_is_downloaded_again(
+        self, physionet_mirror
+    ):
+        """Test a short file left by an older version is not adopted."""
+        root, base_url = physionet_mirror
+        name = "S001/S001R01.edf"
+        expected = (root / name).read_bytes()
+        target = Path(tempfile.mkdtemp()) / name
+        target.parent.mkdir(parents=True)
+        target.write_bytes(expected[:500])
+
+        result = ParallelDownloader().download_file(
+            DownloadTask(f"{base_url}{name}", target)
+        )
+
+        assert not result.skipped
+        assert target.read_bytes() == expected
+
+    def test_complete_file_without_checksum_is_adopted(self, physionet_mirror):
+        """Test a file matching the server's size is recorded, not fetched."""
+        root, base_url = physionet_mirror
+        name = "S001/S001R02.edf"
+        target = Path(tempfile.mkdtemp()) / name
+        target.parent.mkdir(parents=True)
+        target.write_bytes((root / name).read_bytes())
+
+        result = ParallelDownloader().download_file(
+            DownloadTask(f"{base_url}{name}", target)
+        )
+
+        assert result.skipped
+        assert _RangeRequestHandler.requests_seen == []
+
+    def test_checksum_mismatch_is_reported(self, physionet_mirror):
+        """Test a corrupted download fails and leaves no file behind."""
+        _, base_url = physionet_mirror
+        target = Path(tempfile.mkdtemp()) / "S001R03.edf"
+
+        results = ParallelDownloader(max_retries=1, retry_backoff=0.0).download(
+            [DownloadTask(f"{base_url}S001/S001R03.edf", target, "0" * 64)]
+        )
+
+        assert not results[0].ok
+        assert "Checksum mismatch" in results[0].error
+        assert not target.exists()
+
+    def test_missing_file_is_not_retried(self, physionet_mirror):
+        """Test client errors fail immediately."""
+        _, base_url = physionet_mirror
+        target = Path(tempfile.mkdtemp()) / "missing.edf"
+
+        results = ParallelDownloader(retry_backoff=10.0).download(
+            [DownloadTask(f"{base_url}S001/missing.edf", target)]
+        )
+
+        assert not results[0].ok
+        assert len(_RangeRequestHandler.requests_seen) == 1
+
+
+class TestPhysioNetDownloadAndDecode:
+    """Test the loader end to end against the local mirror."""
+
+    def test_download_is_verified_and_skipped_when_complete(self, physionet_mirror):
+        """Test all runs are fetched once, verified and recorded."""
+        root, base_url = physionet_mirror
+        loader = PhysioNetLoader(_config(base_url))
+
+        loader.download()
+
+        for subject in SUBJECTS:
+            for run in RUNS:
+                name = f"{subject}/{subject}R{run:02d}.edf"
+                assert (loader.dataset_dir / name).read_bytes() == (
+                    root / name
+                ).read_bytes()
+        assert (loader.dataset_dir / "download_manifest.json").exists()
+
+        _RangeRequestHandler.requests_seen.clear()
+        loader.download()
+        assert _RangeRequestHandler.requests_seen == []
+
+    def test_parallel_decoding_matches_serial_decoding(self, physionet_mirror):
+        """Test process-pool decoding into the cache equals in-memory loading."""
+        _, base_url = physionet_mirror
+        parallel = PhysioNetLoader(_config(base_url, decode_workers=2))
+        serial = PhysioNetLoader(
+            _config(base_url, decode_workers=1, lazy_loading=False)
+        )
+
+        data, labels = parallel.load()
+        ref_data, ref_labels = serial.load()
+
+        assert data.shape == ref_data.shape
+        np.testing.assert_allclose(np.asarray(data), ref_data)
+        np.testing.assert_array_equal(labels, ref_labels)
+        assert parallel.cache_exists()
+        assert len(parallel.epoch_store.shards) == len(SUBJECTS) * len(RUNS)
+        assert parallel.get_metadata()["channel_names"] == CHANNELS
+
+    def test_only_changed_recordings_are_decoded_again(self, physionet_mirror):
+        """Test a modified recording invalidates and rebuilds only its shard."""
+        _, base_url = physionet_mirror
+        config = _config(base_url, decode_workers=1)
+        loader = PhysioNetLoader(config)
+        first_data, _ = loader.load()
+        created = {s.shard_id: s.created_at for s in loader.epoch_store.shards}
+
+        changed = loader.dataset_dir / "S002" / "S002R05.edf"
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        reloaded = PhysioNetLoader(config)
+        assert not reloaded.cache_exists()
+        data, _ = reloaded.load()
+
+        rebuilt = {
+            s.shard_id
+            for s in reloaded.epoch_store.shards
+            if s.created_at != created[s.shard_id]
+        }
+        assert rebuilt == {"S002/S002R05"}
+        assert reloaded.cache_exists()
+        np.testing.assert_allclose(np.asarray(data), np.asarray(first_data))
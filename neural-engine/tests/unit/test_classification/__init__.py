@@ -0,0 +1 @@
+"""Unit tests for real-time classification."""
@@ -0,0 +1,142 @@
+"""Golden tests for the neighbour-count entropy measures."""
+
+import numpy as np
+import pytest
+
+from src.classification.features import SeizureFeatureExtractor
+from common.entropy import (
+    approximate_entropy,
+    sample_entropy,
+    pairs_for_error,
+)
+
+# Definition pinned by the seizure detector
+LEGACY = "match_probability"
+
+
+def _reference_sample_entropy(channel: np.ndarray) -> float:
+    """Pairwise definition used by SeizureFeatureExtractor before."""
+    m = 2
+    r = 0.2 * np.std(channel)
+
+    N = len(channel)
+    patterns = np.array([channel[i : i + m] for i in range(N - m + 1)])
+
+    matches = 0
+    for i in range(len(patterns)):
+        for j in range(i + 1, len(patterns)):
+            if np.max(np.abs(patterns[i] - patterns[j])) <= r:
+                matches += 1
+
+    if len(patterns) > 1:
+        phi_m = matches / (len(patterns) * (len(patterns) - 1) / 2)
+        return -np.log(phi_m + 1e-15)
+    return 0
+
+
+def _reference_approximate_entropy(channel: np.ndarray) -> float:
+    """Pairwise definition used by SeizureFeatureExtractor before."""
+    N = len(channel)
+    m = 2
+    r = 0.2 * np.std(channel)
+
+    def _phi(m: int) -> float:
+        patterns = np.array([channel[i : i + m] for i in range(N - m + 1)])
+        C = np.zeros(N - m + 1)
+        for i in range(N - m + 1):
+            distances = np.max(np.abs(patterns.astype(float) - patterns[i]), axis=1)
+            C[i] = np.sum(distances <= r) / (N - m + 1)
+        return (N - m + 1) ** (-1) * sum(np.log(C))
+
+    try:
+        return _phi(m) - _phi(m + 1)
+    except Exception:
+        return 0
+
+
+def _signals(n_samples: int) -> np.ndarray:
+    """Channels with different structure: noise, rhythm, spikes, ADC steps."""
+    rng = np.random.default_rng(42)
+    t = np.arange(n_samples) / 256.0
+    return np.stack(
+        [
+            rng.standard_normal(n_samples) * 30,
+            40 * np.sin(2 * np.pi * 10 * t) + rng.standard_normal(n_samples),
+            np.where(rng.random(n_samples) < 0.05, 200.0, 0.0)
+            + rng.standard_normal(n_samples),
+            # Quantized like raw ADC counts, with many tied distances
+            np.round(rng.standard_normal(n_samples) * 4),
+        ]
+    )
+
+
+class TestSampleEntropy:
+    """Pin sample entropy to the pairwise definition."""
+
+    @pytest.mark.parametrize("n_samples", [3, 50, 256])
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_matches_pairwise_definition(self, n_samples, dtype):
+        """Test exact results for all channel types and dtypes."""
+        data = _signals(n_samples).astype(dtype)
+
+        expected = [_reference_sample_entropy(channel) for channel in data]
+
+        np.testing.assert_allclose(
+            sample_entropy(data, definition=LEGACY), expected, rtol=1e-12
+        )
+
+    def test_degenerate_channels(self):
+        """Test constant and too-short channels."""
+        np.testing.assert_allclose(
+            sample_entropy(np.ones((2, 20)), definition=LEGACY),
+            [_reference_sample_entropy(np.ones(20))] * 2,
+        )
+        np.testing.assert_array_equal(
+            sample_entropy(np.ones((1, 2)), definition=LEGACY), [0.0]
+        )
+
+    def test_approximate_mode_is_within_bound(self):
+        """Test sampled pairs stay within the match probability bound."""
+        data = _signals(4096)
+        max_error = 0.05
+
+        exact = sample_entropy(data, definition=LEGACY)
+        approx = sample_entropy(data, definition=LEGACY, max_error=max_error, seed=0)
+
+        assert pairs_for_error(max_error) < 4095 * 4094 / 2
+        # Translate the bound on the match probability to the entropy
+        phi = np.exp(-exact)
+        assert np.all(np.abs(np.exp(-approx) - phi) <= max_error)
+
+
+class TestApproximateEntropy:
+    """Pin approximate entropy to the pairwise definition."""
+
+    @pytest.mark.parametrize("n_samples", [2, 3, 50, 256])
+    def test_matches_pairwise_definition(self, n_samples):
+        """Test results for all channel types."""
+        data = _signals(n_samples).astype(np.float32)
+
+        expected = [_reference_approximate_entropy(channel) for channel in data]
+
+        np.testing.assert_allclose(
+            approximate_entropy(data), expected, rtol=1e-10, atol=1e-12
+        )
+
+
+class TestSeizureEntropyFeatures:
+    """Test the seizure extractor uses the neighbour-count entropies."""
+
+    @pytest.mark.asyncio
+    async def test_entropy_features(self):
+        """Test extractor features equal the pairwise definition."""
+        data = _signals(256).astype(np.float32)
+
+        features = await SeizureFeatureExtractor()._extract_entropy_features(data)
+
+        np.testing.assert_allclose(
+            features["sample_entropy"],
+            [_reference_sample_entropy(channel) for channel in data],
+            rtol=1e-12,
+        )
+        assert features["approximate_entropy"].shape == (4,)
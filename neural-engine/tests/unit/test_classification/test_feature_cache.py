@@ -0,0 +1,268 @@
+"""Unit tests for the shared per-window feature cache."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from src.classification.features import (
+    MotorImageryFeatureExtractor,
+    SeizureFeatureExtractor,
+)
+from src.classification.interfaces import BaseClassifier
+from src.classification.stream_processor import StreamProcessor
+from src.classification.types import (
+    ClassificationResult,
+    FeatureVector,
+    ModelMetrics,
+    NeuralData,
+)
+from src.classification.utils.feature_cache import (
+    FeatureWindow,
+    WindowFeatureCache,
+    get_feature_window,
+)
+
+SAMPLING_RATE = 250.0
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+def _eeg(n_channels: int = 4, n_samples: int = 500, seed: int = 0) -> np.ndarray:
+    """Generate noisy alpha / beta activity."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_samples) / SAMPLING_RATE
+    rhythm = np.sin(2 * np.pi * 10 * t) + 0.5 * np.sin(2 * np.pi * 20 * t)
+    return (rhythm + rng.standard_normal((n_channels, n_samples))) * 10
+
+
+def _neural_data(data: np.ndarray, channels: List[str]) -> NeuralData:
+    """Wrap an array as neural data."""
+    return NeuralData(
+        data=data,
+        sampling_rate=SAMPLING_RATE,
+        channels=channels,
+        timestamp=datetime.now(),
+        device_id="test_device",
+    )
+
+
+class TestFeatureWindow:
+    """Test FeatureWindow primitives and accounting."""
+
+    def test_psd_and_band_power_match_per_channel_welch(self):
+        """Test cached spectra equal per-channel scipy computations."""
+        data = _eeg()
+        window = FeatureWindow(data, SAMPLING_RATE)
+
+        freqs, psd = window.psd(nperseg=128)
+        alpha = window.band_power(8, 13, nperseg=128)
+
+        for ch in range(data.shape[0]):
+            ref_freqs, ref_psd = signal.welch(data[ch], fs=SAMPLING_RATE, nperseg=128)
+            mask = (ref_freqs >= 8) & (ref_freqs <= 13)
+            np.testing.assert_allclose(freqs, ref_freqs)
+            np.testing.assert_allclose(psd[ch], ref_psd, rtol=1e-12)
+            assert alpha[ch] == pytest.approx(
+                trapezoid(ref_psd[mask], ref_freqs[mask]), rel=1e-12
+            )
+
+    def test_nperseg_is_clamped_like_welch(self):
+        """Test a segment longer than the window shares the clamped entry."""
+        window = FeatureWindow(_eeg(n_samples=200), SAMPLING_RATE)
+
+        freqs_long, psd_long = window.psd(nperseg=256)
+        freqs_short, psd_short = window.psd(nperseg=200)
+
+        assert window.stats.hits >= 1
+        np.testing.assert_array_equal(freqs_long, freqs_short)
+        np.testing.assert_array_equal(psd_long, psd_short)
+
+    def test_rows_are_computed_once(self):
+        """Test channel subsets only compute the rows not yet cached."""
+        window = FeatureWindow(_eeg(), SAMPLING_RATE)
+
+        window.psd(rows=[0, 1])
+        misses = window.stats.misses
+        window.psd(rows=[1, 0])
+        assert window.stats.misses == misses
+
+        window.psd()
+        assert window.stats.misses == misses + 1
+        window.psd(rows=[3])
+        assert window.stats.misses == misses + 1
+        assert window.stats.saved_ms > 0
+
+    def test_filters_and_envelope(self):
+        """Test band-pass, envelope and Hjorth match direct computation."""
+        data = _eeg(n_channels=2, n_samples=1000)
+        window = FeatureWindow(data, SAMPLING_RATE)
+
+        b, a = signal.butter(4, [8 / 125, 13 / 125], btype="band")
+        filtered = signal.filtfilt(b, a, data[1])
+        np.testing.assert_allclose(window.bandpass(8, 13, rows=[1])[0], filtered)
+        np.testing.assert_allclose(
+            window.envelope(8, 13, rows=[1])[0], np.abs(signal.hilbert(filtered))
+        )
+
+        d1 = np.diff(data[0])
+        mobility = np.sqrt(np.var(d1) / np.var(data[0]))
+        complexity = np.sqrt(np.var(np.diff(d1)) / np.var(d1)) / mobility
+        np.testing.assert_allclose(
+            window.hjorth()[0], [np.var(data[0]), mobility, complexity]
+        )
+
+    def test_sos_bandpass_is_opt_in(self):
+        """Test second-order-section filtering is cached apart from filtfilt."""
+        data = _eeg(n_channels=2, n_samples=1000)
+        window = FeatureWindow(data, SAMPLING_RATE)
+
+        sos = signal.butter(4, [0.5, 2], btype="band", fs=SAMPLING_RATE, output="sos")
+        np.testing.assert_allclose(
+            window.bandpass(0.5, 2, sos=True), signal.sosfiltfilt(sos, data)
+        )
+        b, a = signal.butter(4, [0.5 / 125, 2 / 125], btype="band")
+        np.testing.assert_allclose(
+            window.bandpass(0.5, 2), signal.filtfilt(b, a, data, axis=-1)
+        )
+
+    def test_derived_signals_share_the_window_cache(self):
+        """Test channel averages are cached within the parent window."""
+        data = _eeg()
+        window = FeatureWindow(data, SAMPLING_RATE)
+
+        first = window.channel_mean([0, 2]).band_power(0.5, 4)
+        second = window.channel_mean([0, 2]).band_power(0.5, 4)
+
+        ref_freqs, ref_psd = signal.welch(
+            data[[0, 2]].mean(axis=0), fs=SAMPLING_RATE, nperseg=256
+        )
+        mask = (ref_freqs >= 0.5) & (ref_freqs <= 4)
+        assert first[0] == pytest.approx(trapezoid(ref_psd[mask], ref_freqs[mask]))
+        np.testing.assert_array_equal(first, second)
+        assert window.stats.hits >= 2
+
+
+class TestWindowFeatureCache:
+    """Test WindowFeatureCache."""
+
+    def test_attach_shares_window_between_copies(self):
+        """Test separate copies of one window resolve to the same cache."""
+        cache = WindowFeatureCache()
+        data = _eeg()
+        first = _neural_data(data.copy(), ["C3", "C4", "Cz", "Pz"])
+        second = _neural_data(data.copy(), ["C3", "C4", "Cz", "Pz"])
+
+        cache.attach(first, ("stream", 500, 500))
+        cache.attach(second, ("stream", 500, 500))
+
+        assert get_feature_window(first) is get_feature_window(second)
+        assert get_feature_window(_neural_data(data, ["a"] * 4)) is not (
+            get_feature_window(first)
+        )
+
+    def test_eviction_and_stats(self):
+        """Test old windows are evicted while their statistics are kept."""
+        cache = WindowFeatureCache(max_windows=2)
+        for position in range(3):
+            window = cache.get_window(("stream", position, 500), _eeg(), SAMPLING_RATE)
+            window.psd()
+            window.psd()
+
+        stats = cache.get_stats()
+        assert stats["windows"] == 3
+        # PSD rows and frequency bins are computed once and reused per window
+        assert stats["hits"] == 6
+        assert stats["misses"] == 6
+        assert stats["saved_ms_per_window"] > 0
+
+        cache.discard("stream")
+        assert cache.get_stats()["hits"] == 6
+
+
+class _RecordingClassifier(BaseClassifier):
+    """Classifier returning a fixed result and keeping the features."""
+
+    def __init__(self):
+        self.features: List[FeatureVector] = []
+
+    async def classify(self, features: FeatureVector) -> ClassificationResult:
+        self.features.append(features)
+        return ClassificationResult(
+            classification_type="test",
+            timestamp=features.timestamp,
+            confidence=1.0,
+            label="test",
+            probabilities={"test": 1.0},
+            latency_ms=0.0,
+            metadata={},
+        )
+
+    async def load_model(self, model_path: str) -> None:
+        pass
+
+    async def update_model(self, feedback: Dict[str, Any]) -> None:
+        pass
+
+    def get_metrics(self) -> ModelMetrics:
+        return ModelMetrics(
+            model_name="test",
+            accuracy=1.0,
+            precision=1.0,
+            recall=1.0,
+            f1_score=1.0,
+            latency_p50=0.0,
+            latency_p95=0.0,
+            latency_p99=0.0,
+            inference_count=0,
+            error_count=0,
+            last_updated=datetime.now(),
+        )
+
+
+class TestStreamProcessorFeatureCache:
+    """Test primitives are shared by classifiers of one stream."""
+
+    @pytest.mark.asyncio
+    async def test_extractors_share_window_primitives(self):
+        """Test the seizure extractor reuses the motor imagery PSD."""
+        channels = ["C3", "C4", "Cz"]
+        data = _eeg(n_channels=3, n_samples=250)
+        processor = StreamProcessor(buffer_size_ms=2000, classification_interval_ms=100)
+        motor, seizure = _RecordingClassifier(), _RecordingClassifier()
+        await processor.add_classifier(
+            "motor", motor, MotorImageryFeatureExtractor(window_size_ms=1000)
+        )
+        await processor.add_classifier(
+            "seizure", seizure, SeizureFeatureExtractor(window_size_ms=1000)
+        )
+
+        async def stream():
+            yield _neural_data(data, channels)
+
+        results = [result async for result in processor.process_stream(stream())]
+
+        assert len(results) == 2
+        cache_stats = processor.get_feature_cache_stats()
+        assert cache_stats["windows"] == 1
+        assert cache_stats["hits"] > 0
+        assert results[-1].metadata["feature_cache_hit_rate"] > 0
+        assert processor.get_performance_stats()["feature_cache_hit_rate"] > 0
+
+        # Cached features equal those of an extractor without a shared cache
+        reference = await MotorImageryFeatureExtractor(1000).extract_features(
+            _neural_data(data.astype(np.float32), channels)
+        )
+        for name, value in reference.features.items():
+            np.testing.assert_allclose(motor.features[0].features[name], value)
+        ref_freqs, ref_psd = signal.welch(
+            data.astype(np.float32), fs=SAMPLING_RATE, nperseg=250, axis=-1
+        )
+        for band, (low, high) in [("alpha", (8, 12)), ("beta", (12, 30))]:
+            mask = (ref_freqs >= low) & (ref_freqs <= high)
+            np.testing.assert_allclose(
+                seizure.features[0].features[f"{band}_power"],
+                trapezoid(ref_psd[:, mask], ref_freqs[mask], axis=-1),
+                rtol=1e-5,
+            )
@@ -0,0 +1,138 @@
+"""Unit tests for the vectorized sleep feature extraction."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.classification.features import SleepFeatureExtractor
+from src.classification.features.sleep_features import (
+    _above_threshold_runs,
+    _count_separated,
+)
+from src.classification.types import NeuralData
+
+SAMPLING_RATE = 100.0
+EPOCH_SAMPLES = 3000
+CHANNELS = ["C3", "C4", "LOC", "ROC", "EMG"]
+
+
+def _psg(n_epochs: int, seed: int = 0) -> NeuralData:
+    """Synthetic PSG with slow waves, spindle bursts and heavy-tailed noise."""
+    rng = np.random.default_rng(seed)
+    n_samples = n_epochs * EPOCH_SAMPLES
+    t = np.arange(n_samples) / SAMPLING_RATE
+    spindles = 30 * np.sin(2 * np.pi * 13 * t) * (np.sin(2 * np.pi * 0.05 * t) > 0.7)
+    eeg = 60 * np.sin(2 * np.pi * 1 * t) + spindles
+    data = rng.standard_t(2, (len(CHANNELS), n_samples)) * 15
+    data[:2] += eeg
+    return NeuralData(
+        data=data,
+        sampling_rate=SAMPLING_RATE,
+        channels=CHANNELS,
+        timestamp=datetime(2026, 1, 1),
+        device_id="test_device",
+    )
+
+
+def _reference_runs(above: np.ndarray):
+    """Loop over each row collecting (row, start, end) of True runs."""
+    runs = []
+    for row, mask in enumerate(above):
+        start = None
+        for i, value in enumerate(mask):
+            if value and start is None:
+                start = i
+            elif not value and start is not None:
+                runs.append((row, start, i))
+                start = None
+        if start is not None:
+            runs.append((row, start, len(mask)))
+    return runs
+
+
+def _reference_count(mask: np.ndarray, min_separation: int) -> int:
+    """Greedy scan used by the former per-epoch event detectors."""
+    count = 0
+    i = 0
+    while i < len(mask):
+        if mask[i]:
+            count += 1
+            i += min_separation
+        else:
+            i += 1
+    return count
+
+
+class TestEventHelpers:
+    """Pin the vectorized helpers to their loop definitions."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_above_threshold_runs(self, seed):
+        """Test runs for random masks, including runs at the row edges."""
+        above = np.random.default_rng(seed).random((4, 50)) > 0.6
+
+        rows, starts, ends = _above_threshold_runs(above)
+
+        assert list(zip(rows, starts, ends)) == _reference_runs(above)
+
+    @pytest.mark.parametrize("min_separation", [1, 3, 30])
+    @pytest.mark.parametrize("density", [0.02, 0.3, 0.9])
+    def test_count_separated(self, min_separation, density):
+        """Test the pointer-doubling count equals the greedy scan."""
+        candidates = np.random.default_rng(1).random((6, 400)) < density
+        candidates[0] = False
+
+        counts = _count_separated(candidates, min_separation)
+
+        expected = [_reference_count(row, min_separation) for row in candidates]
+        np.testing.assert_array_equal(counts, expected)
+
+
+class TestSleepFeatureExtractor:
+    """Test whole-night extraction."""
+
+    @pytest.mark.asyncio
+    async def test_night_features_equal_epoch_features(self):
+        """Test one pass over a night equals extracting epoch by epoch."""
+        night = _psg(n_epochs=6)
+        extractor = SleepFeatureExtractor()
+
+        night_features = await extractor.extract_night_features(night)
+
+        assert len(night_features) == 6
+        for epoch, vector in enumerate(night_features):
+            span = slice(epoch * EPOCH_SAMPLES, (epoch + 1) * EPOCH_SAMPLES)
+            reference = await extractor.extract_features(
+                NeuralData(
+                    data=night.data[:, span],
+                    sampling_rate=SAMPLING_RATE,
+                    channels=CHANNELS,
+                    timestamp=night.timestamp,
+                    device_id="test_device",
+                )
+            )
+            assert vector.timestamp == night.timestamp + timedelta(seconds=30 * epoch)
+            assert vector.metadata["epoch_index"] == epoch
+            assert vector.features.keys() == reference.features.keys()
+            for name, value in reference.features.items():
+                np.testing.assert_allclose(
+                    vector.features[name], value, rtol=1e-9, atol=1e-12, err_msg=name
+                )
+
+    @pytest.mark.asyncio
+    async def test_events_are_detected(self):
+        """Test the synthetic spindle bursts and slow waves are found."""
+        features = await SleepFeatureExtractor().extract_night_features(_psg(4))
+
+        spindles = [vector.features["spindle_density"][0] for vector in features]
+        assert sum(spindles) > 0
+        assert all(vector.features["slow_wave_amplitude"][0] > 0 for vector in features)
+
+    @pytest.mark.asyncio
+    async def test_short_recording_has_no_epochs(self):
+        """Test a recording shorter than one epoch yields no features."""
+        data = _psg(1)
+        data.data = data.data[:, : EPOCH_SAMPLES // 2]
+
+        assert await SleepFeatureExtractor().extract_night_features(data) == []
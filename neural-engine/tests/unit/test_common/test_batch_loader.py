@@ -0,0 +1,134 @@
+"""Tests for the prefetching batch loader."""
+
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.datasets.epoch_store import ShardedEpochStore
+from common.batch_loader import BatchLoader
+
+
+@dataclass
+class _Sample:
+    """Sample with data and label attributes."""
+
+    data: np.ndarray
+    label: int
+
+
+@pytest.fixture
+def data():
+    """Epochs (epochs x channels x samples) with their index as label."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((103, 4, 16)), np.arange(103)
+
+
+class TestBatchLoader:
+    """Test BatchLoader."""
+
+    @pytest.mark.parametrize("prefetch,num_workers", [(0, 1), (2, 1), (3, 4)])
+    def test_batches_cover_epoch_in_order(self, data, prefetch, num_workers):
+        """Test every sample is yielded once, in the epoch's order."""
+        X, y = data
+        loader = BatchLoader(
+            X, y, batch_size=10, prefetch=prefetch, num_workers=num_workers, seed=1
+        )
+
+        labels = []
+        for batch_X, batch_y in loader:
+            assert batch_X.flags["C_CONTIGUOUS"]
+            np.testing.assert_array_equal(batch_X, X[batch_y])
+            labels.append(batch_y.copy())
+
+        assert len(labels) == len(loader) == 11
+        np.testing.assert_array_equal(np.concatenate(labels), loader.epoch_indices())
+
+    def test_buffers_are_reused(self, data):
+        """Test batches are views of a fixed set of preallocated buffers."""
+        X, y = data
+        loader = BatchLoader(X, y, batch_size=10, prefetch=2)
+
+        buffers = {batch_X.base.ctypes.data for batch_X, _ in loader}
+
+        assert len(buffers) <= 3
+
+    def test_deterministic_shuffle(self, data):
+        """Test the order depends only on seed and epoch."""
+        X, y = data
+        first = BatchLoader(X, y, seed=7)
+        second = BatchLoader(X, y, seed=7)
+
+        np.testing.assert_array_equal(first.epoch_indices(), second.epoch_indices())
+        second.set_epoch(1)
+        assert not np.array_equal(first.epoch_indices(), second.epoch_indices())
+        assert not np.array_equal(
+            first.epoch_indices(), BatchLoader(X, y, seed=8).epoch_indices()
+        )
+
+    def test_shards_split_epoch(self, data):
+        """Test shards are disjoint, equally sized and cover all samples."""
+        X, y = data
+        shards = [
+            BatchLoader(X, y, seed=3, num_shards=4, shard_index=i).epoch_indices(2)
+            for i in range(4)
+        ]
+
+        assert all(len(shard) == 26 for shard in shards)
+        combined = np.concatenate(shards)
+        assert set(combined) == set(range(103))
+        # The single padding sample is the only repetition
+        assert len(combined) - len(set(combined)) == 1
+
+    def test_drop_last_and_dtype(self, data):
+        """Test incomplete batches are dropped and data is converted."""
+        X, y = data
+        loader = BatchLoader(X, y, batch_size=25, drop_last=True, dtype=np.float32)
+
+        batches = [(bx.dtype, len(bx)) for bx, _ in loader]
+
+        assert batches == [(np.float32, 25)] * 4
+
+    def test_sharded_cache_and_samples(self, data):
+        """Test memory-mapped shards and sample sequences as sources."""
+        X, y = data
+        store = ShardedEpochStore(Path(tempfile.mkdtemp()))
+        store.write_shard("a", X[:50], y[:50])
+        store.write_shard("b", X[50:], y[50:])
+        cached, labels = store.open()
+        samples = [_Sample(x, label) for x, label in zip(X, y)]
+
+        for source, source_labels in [(cached, labels), (samples, None)]:
+            loader = BatchLoader(source, source_labels, batch_size=16, seed=0)
+            for batch_X, batch_y in loader:
+                np.testing.assert_array_equal(batch_X, X[batch_y])
+
+    def test_worker_errors_are_raised(self, data):
+        """Test an error while preparing a batch reaches the consumer."""
+
+        class Failing(list):
+            def __getitem__(self, i):
+                if i == 50:
+                    raise IOError("unreadable epoch")
+                return super().__getitem__(i)
+
+        X, _ = data
+        loader = BatchLoader(Failing(X), shuffle=False, batch_size=10)
+
+        with pytest.raises(IOError, match="unreadable epoch"):
+            for _ in loader:
+                pass
+
+    def test_early_exit_stops_workers(self, data):
+        """Test abandoning an iteration does not leave threads running."""
+        X, y = data
+        loader = BatchLoader(X, y, batch_size=5, num_workers=3)
+
+        iterator = iter(loader)
+        next(iterator)
+        iterator.close()
+
+        assert not any(t.name.startswith("batch-loader") for t in threading.enumerate())
@@ -0,0 +1,159 @@
+"""Tests for the batched Bigtable writer."""
+
+import asyncio
+
+import pytest
+
+from common.bigtable_writer import (
+    BatchWriterConfig,
+    BigtableBatchWriter,
+    BigtableWriteError,
+    InMemoryBigtableBackend,
+    RowMutation,
+)
+
+
+def make_row(index: int, table_id: str = "events") -> RowMutation:
+    """Create a single-cell row."""
+    row = RowMutation(table_id, f"row#{index:05d}".encode())
+    row.set_cell("data", "value", str(index))
+    return row
+
+
+class TestBigtableBatchWriter:
+    """Test BigtableBatchWriter with the in-memory backend."""
+
+    @pytest.fixture
+    def backend(self):
+        """Create an in-memory backend."""
+        return InMemoryBigtableBackend()
+
+    def make_writer(self, backend, **overrides):
+        """Create a writer with fast retries."""
+        config = BatchWriterConfig(
+            initial_backoff_ms=1.0, max_backoff_ms=5.0, **overrides
+        )
+        return BigtableBatchWriter(backend, config)
+
+    @pytest.mark.asyncio
+    async def test_size_based_flush(self, backend):
+        """Test full batches are written with one mutate_rows call each."""
+        writer = self.make_writer(backend, max_batch_rows=10, flush_interval_ms=10000)
+
+        futures = [await writer.write(make_row(i)) for i in range(25)]
+        await asyncio.gather(*futures[:20])
+
+        assert backend.calls == [("events", 10), ("events", 10)]
+
+        await writer.close()
+        assert backend.calls[-1] == ("events", 5)
+        assert len(backend.tables["events"]) == 25
+        assert backend.tables["events"][b"row#00007"][("data", "value")] == "7"
+
+    @pytest.mark.asyncio
+    async def test_time_based_flush(self, backend):
+        """Test partial batches are flushed after the flush interval."""
+        writer = self.make_writer(backend, flush_interval_ms=5)
+
+        futures = [await writer.write(make_row(i)) for i in range(3)]
+        await asyncio.wait_for(asyncio.gather(*futures), timeout=1.0)
+
+        assert backend.calls == [("events", 3)]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_per_table(self, backend):
+        """Test rows are batched separately per table."""
+        writer = self.make_writer(backend)
+
+        await writer.write(make_row(0, "a"))
+        await writer.write(make_row(1, "b"))
+        await writer.close()
+
+        assert sorted(backend.calls) == [("a", 1), ("b", 1)]
+
+    @pytest.mark.asyncio
+    async def test_failed_rows_are_retried(self, backend):
+        """Test only failed rows are retried until they succeed."""
+        writer = self.make_writer(backend)
+        backend.fail_next_rows(2)
+
+        futures = [await writer.write(make_row(i)) for i in range(5)]
+        await writer.flush()
+
+        assert all(future.done() and future.exception() is None for future in futures)
+        assert backend.calls == [("events", 5), ("events", 2)]
+        assert len(backend.tables["events"]) == 5
+        assert writer.get_stats()["rows_retried"] == 2
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_call_errors_are_retried(self, backend):
+        """Test rows survive transient mutate_rows errors."""
+        writer = self.make_writer(backend)
+        backend.raise_next_calls(2)
+
+        future = await writer.write(make_row(0))
+        await writer.close()
+
+        assert future.exception() is None
+        assert len(backend.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, backend):
+        """Test rows fail once retries are exhausted."""
+        writer = self.make_writer(backend, max_retries=2)
+        backend.fail_next_rows(3)
+
+        future = await writer.write(make_row(0))
+        await writer.close()
+
+        with pytest.raises(BigtableWriteError):
+            future.result()
+        assert writer.get_stats()["rows_failed"] == 1
+        assert "events" not in backend.tables or not backend.tables["events"]
+
+    @pytest.mark.asyncio
+    async def test_pending_rows_are_bounded(self):
+        """Test writes wait while the pending-row limit is reached."""
+        backend = InMemoryBigtableBackend(latency_ms=20)
+        writer = self.make_writer(
+            backend, max_batch_rows=2, max_pending_rows=4, max_in_flight_batches=1
+        )
+
+        for i in range(4):
+            await writer.write(make_row(i))
+        blocked = asyncio.create_task(writer.write(make_row(4)))
+        await asyncio.sleep(0)
+
+        assert not blocked.done()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await writer.close()
+        assert len(backend.tables["events"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_stats_histograms(self, backend):
+        """Test flush latency and batch size histograms are recorded."""
+        writer = self.make_writer(backend, max_batch_rows=8)
+
+        for i in range(10):
+            await writer.write(make_row(i))
+        await writer.close()
+
+        stats = writer.get_stats()
+        assert stats["rows_written"] == 10
+        assert stats["batches_flushed"] == 2
+        assert stats["batch_size"]["buckets"]["5"] == 1
+        assert stats["batch_size"]["buckets"]["10"] == 1
+        assert stats["batch_size"]["mean"] == 5.0
+        assert stats["flush_latency_ms"]["count"] == 2
+        assert stats["pending_rows"] == 0
+
+    @pytest.mark.asyncio
+    async def test_write_after_close(self, backend):
+        """Test closed writers reject rows."""
+        writer = self.make_writer(backend)
+        await writer.close()
+
+        with pytest.raises(RuntimeError):
+            await writer.write(make_row(0))
@@ -0,0 +1,117 @@
+"""Tests for the sorted-sweep entropy engine against brute-force counts."""
+
+import numpy as np
+import pytest
+
+from common import entropy
+from common.entropy import approximate_entropy, sample_entropy
+
+
+def _brute_force_sample_entropy(channel: np.ndarray, m: int, r: float) -> float:
+    """Richman & Moorman sample entropy from all template pairs."""
+    N = len(channel)
+    tolerance = r * np.std(channel)
+    n_templates = N - m
+
+    B = 0
+    A = 0
+    for i in range(n_templates):
+        for j in range(i + 1, n_templates):
+            if np.max(np.abs(channel[i : i + m] - channel[j : j + m])) <= tolerance:
+                B += 1
+                if abs(channel[i + m] - channel[j + m]) <= tolerance:
+                    A += 1
+
+    if A == 0 or B == 0:
+        return -np.log(2.0 / ((n_templates - 1) * n_templates))
+    return -np.log(A / B)
+
+
+def _brute_force_approximate_entropy(channel: np.ndarray, m: int, r: float) -> float:
+    """Pincus approximate entropy from all template pairs."""
+    N = len(channel)
+    tolerance = r * np.std(channel)
+
+    def _phi(length: int) -> float:
+        n = N - length + 1
+        counts = [
+            sum(
+                np.max(np.abs(channel[i : i + length] - channel[j : j + length]))
+                <= tolerance
+                for j in range(n)
+            )
+            for i in range(n)
+        ]
+        return np.mean(np.log(np.array(counts) / n))
+
+    return _phi(m) - _phi(m + 1)
+
+
+def _signals(n_samples: int) -> np.ndarray:
+    """Noise, a rhythm and quantized channels with many tied distances."""
+    rng = np.random.default_rng(7)
+    t = np.arange(n_samples) / 256.0
+    return np.stack(
+        [
+            rng.standard_normal(n_samples) * 25,
+            30 * np.sin(2 * np.pi * 8 * t) + rng.standard_normal(n_samples),
+            np.round(rng.standard_normal(n_samples) * 3),
+        ]
+    )
+
+
+class TestSampleEntropy:
+    """Test sample entropy against the brute-force count."""
+
+    @pytest.mark.parametrize("m", [1, 2, 3])
+    def test_matches_brute_force(self, m):
+        """Test every channel for several template lengths."""
+        data = _signals(200)
+
+        expected = [_brute_force_sample_entropy(channel, m, 0.2) for channel in data]
+
+        np.testing.assert_allclose(sample_entropy(data, m=m), expected, rtol=1e-12)
+
+    def test_blocks_match_single_sweep(self, monkeypatch):
+        """Test counts do not depend on the sweep block size."""
+        data = _signals(300)
+        expected = sample_entropy(data)
+
+        monkeypatch.setattr(entropy, "_BLOCK_SIZE", 7)
+
+        np.testing.assert_array_equal(sample_entropy(data), expected)
+
+    def test_no_matches_returns_upper_bound(self):
+        """Test the undefined ratio falls back to the upper bound."""
+        channel = np.array([0.0, 10.0, 3.0, 25.0, -7.0, 40.0])
+
+        assert sample_entropy(channel, r=0.01) == pytest.approx(
+            _brute_force_sample_entropy(channel, 2, 0.01)
+        )
+        assert isinstance(sample_entropy(channel), float)
+
+    def test_rejects_unknown_definition(self):
+        """Test invalid definitions and approximate Richman & Moorman."""
+        data = _signals(50)
+
+        with pytest.raises(ValueError):
+            sample_entropy(data, definition="smoothed")
+        with pytest.raises(ValueError):
+            sample_entropy(data, max_error=0.05)
+
+
+class TestApproximateEntropy:
+    """Test approximate entropy against the brute-force count."""
+
+    @pytest.mark.parametrize("m", [1, 2])
+    def test_matches_brute_force(self, m):
+        """Test every channel for several template lengths."""
+        data = _signals(120)
+
+        expected = [
+            _brute_force_approximate_entropy(channel, m, 0.2) for channel in data
+        ]
+
+        np.testing.assert_allclose(
+            approximate_entropy(data, m=m), expected, rtol=1e-12, atol=1e-14
+        )
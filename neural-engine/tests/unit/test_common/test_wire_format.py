@@ -0,0 +1,115 @@
+"""Tests for the binary neural data wire format."""
+
+import json
+
+import pytest
+import numpy as np
+from datetime import datetime, timezone
+
+from src.ingestion.data_types import (
+    NeuralDataPacket,
+    NeuralSignalType,
+    DataSource,
+    DeviceInfo,
+)
+from common.wire_format import (
+    WIRE_FORMAT_VERSION,
+    decode_message,
+    decode_packet,
+    encode_packet,
+    is_binary_packet,
+)
+
+
+class TestWireFormat:
+    """Test packet encoding and decoding."""
+
+    @pytest.fixture
+    def packet(self):
+        """Create a packet holding whole ADC counts scaled to microvolts."""
+        rng = np.random.default_rng(42)
+        counts = rng.integers(-2000, 2000, size=(8, 250))
+        return NeuralDataPacket(
+            timestamp=datetime.now(timezone.utc),
+            data=counts * 0.02235,
+            signal_type=NeuralSignalType.EEG,
+            source=DataSource.OPENBCI,
+            device_info=DeviceInfo(device_id="dev_1", device_type="OpenBCI"),
+            session_id="session_1",
+            sampling_rate=250.0,
+            data_quality=0.9,
+        )
+
+    def test_float32_round_trip_is_zero_copy(self, packet):
+        """Test uncompressed float32 bodies decode as views of the message."""
+        payload = encode_packet(packet)
+
+        assert is_binary_packet(payload)
+        decoded = decode_packet(payload)
+
+        assert decoded.data.dtype == np.float32
+        assert not decoded.data.flags.owndata
+        assert not decoded.data.flags.writeable
+        np.testing.assert_allclose(decoded.data, packet.data, rtol=1e-6)
+        assert decoded.metadata["session_id"] == "session_1"
+        assert decoded.metadata["device_info"]["device_id"] == "dev_1"
+        assert decoded.metadata["sampling_rate"] == 250.0
+
+    @pytest.mark.parametrize("delta", [False, True])
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_int16_round_trip(self, packet, delta, compress):
+        """Test int16 bodies reproduce ADC counts exactly."""
+        payload = encode_packet(
+            packet, dtype="int16", scale=0.02235, delta=delta, compress=compress
+        )
+        decoded = decode_packet(payload)
+
+        assert decoded.data.dtype == np.int16
+        assert decoded.scale == pytest.approx(0.02235)
+        np.testing.assert_array_equal(
+            decoded.data, np.rint(packet.data / 0.02235).astype(np.int16)
+        )
+        np.testing.assert_allclose(decoded.to_physical(), packet.data, atol=1e-4)
+
+    def test_delta_compression_shrinks_payload(self, packet):
+        """Test binary payloads are far smaller than JSON."""
+        json_size = len(json.dumps(packet.data.tolist()))
+        raw = encode_packet(packet, dtype="int16", scale=0.02235)
+        compact = encode_packet(
+            packet, dtype="int16", scale=0.02235, delta=True, compress=True
+        )
+
+        assert len(raw) * 3 < json_size
+        assert len(compact) < len(raw)
+
+    def test_decode_message_accepts_json_fallback(self, packet):
+        """Test JSON messages still decode."""
+        message = json.dumps({"session_id": "s", "data": [[1.0, 2.0]]}).encode()
+
+        assert decode_message(message) == {"session_id": "s", "data": [[1.0, 2.0]]}
+
+    def test_decode_message_binary_matches_json_layout(self, packet):
+        """Test binary messages decode to the JSON dictionary layout."""
+        decoded = decode_message(encode_packet(packet))
+
+        assert decoded["shape"] == [8, 250]
+        assert decoded["signal_type"] == "eeg"
+        assert decoded["source"] == "openbci"
+        assert decoded["data"].shape == (8, 250)
+
+    def test_invalid_options(self, packet):
+        """Test unsupported encoding options are rejected."""
+        with pytest.raises(ValueError):
+            encode_packet(packet, dtype="int16")
+        with pytest.raises(ValueError):
+            encode_packet(packet, delta=True)
+        with pytest.raises(ValueError):
+            encode_packet(packet, dtype="float64")
+
+    def test_rejects_newer_version(self, packet):
+        """Test messages from a newer format version are rejected."""
+        payload = bytearray(encode_packet(packet))
+        payload[4] = WIRE_FORMAT_VERSION + 1
+
+        with pytest.raises(ValueError):
+            decode_packet(bytes(payload))
@@ -0,0 +1,47 @@
+"""Tests for the Dataflow neural processing transforms."""
+
+import numpy as np
+import pytest
+
+from common.entropy import sample_entropy
+from dataflow.neural_processing_pipeline import (
+    ExtractTemporalFeatures,
+    FormatForBigQuery,
+)
+
+
+class TestExtractTemporalFeatures:
+    """Test ExtractTemporalFeatures."""
+
+    @pytest.fixture
+    def element(self):
+        """A decoded multichannel packet."""
+        rng = np.random.default_rng(0)
+        return {"session_id": "s", "data": rng.standard_normal((4, 250))}
+
+    def test_multichannel_sample_entropy(self, element):
+        """Test sample entropy is emitted per channel."""
+        (result,) = ExtractTemporalFeatures().process(element)
+
+        features = result["temporal_features"]
+        np.testing.assert_allclose(
+            features["sample_entropy"], sample_entropy(element["data"])
+        )
+        assert len(features["sample_entropy"]) == 4
+        assert "autocorr_lag_1" in features
+
+    def test_single_channel_is_a_list(self):
+        """Test single-channel data fills the REPEATED column with one value."""
+        data = np.random.default_rng(1).standard_normal(250)
+        (result,) = ExtractTemporalFeatures().process({"data": data})
+
+        assert result["temporal_features"]["sample_entropy"] == pytest.approx(
+            [sample_entropy(data)]
+        )
+
+    def test_formats_repeated_column(self, element):
+        """Test the per-channel values reach the BigQuery row."""
+        (featured,) = ExtractTemporalFeatures().process(element)
+        (row,) = FormatForBigQuery().process(featured)
+
+        assert len(row["temp_sample_entropy"]) == 4
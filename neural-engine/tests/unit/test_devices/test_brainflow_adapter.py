@@ -0,0 +1,127 @@
+"""Unit tests for block-wise BrainFlow acquisition."""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from devices.adapters.brainflow_adapter import BrainFlowAdapter
+from devices.base import ConnectionType, DeviceInfo, DeviceType
+from devices.filters import BlockFilterChain
+
+
+def _make_adapter(**connection_params) -> BrainFlowAdapter:
+    """Create an adapter for the BrainFlow synthetic board."""
+    device_info = DeviceInfo(
+        device_id="brainflow_synthetic",
+        device_type=DeviceType.BRAINFLOW_SYNTHETIC,
+        model="BrainFlow Synthetic",
+        firmware_version="BrainFlow",
+        connection_type=ConnectionType.SYNTHETIC,
+        connection_params=connection_params,
+    )
+    return BrainFlowAdapter(device_info)
+
+
+class TestBrainFlowBlockProcessing:
+    """Test processing of board data blocks without a board session."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create an adapter with a small synthetic channel layout."""
+        adapter = _make_adapter(enable_filtering=True)
+        adapter.eeg_channels = [1, 2, 3]
+        adapter.aux_channels = [4, 5]
+        adapter.timestamp_channel = 6
+        adapter.marker_channel = 7
+        adapter.device_info.sampling_rate = 250.0
+        adapter._setup_filter_chain()
+        return adapter
+
+    def _board_data(self, n_samples: int, first_sample: int = 0) -> np.ndarray:
+        """Build board data rows for the fixture layout."""
+        rng = np.random.default_rng(first_sample)
+        data = np.zeros((8, n_samples))
+        data[0] = np.arange(first_sample, first_sample + n_samples) % 256
+        data[1:4] = rng.standard_normal((3, n_samples)) * 10
+        data[4:6] = rng.standard_normal((2, n_samples))
+        data[6] = 1000.0 + np.arange(first_sample, first_sample + n_samples) / 250
+        return data
+
+    def test_emits_one_filtered_block(self, adapter):
+        """Test a poll becomes one block filtered by the stateful chain."""
+        blocks = []
+        adapter.add_block_callback(blocks.append)
+        first = self._board_data(40)
+        second = self._board_data(25, first_sample=40)
+
+        adapter._process_board_data(first)
+        adapter._process_board_data(second)
+
+        reference = BlockFilterChain(adapter.filter_config, 250.0, 3)
+        expected = reference.process(np.concatenate([first, second], axis=1)[1:4])
+
+        assert [block.n_samples for block in blocks] == [40, 25]
+        assert [block.first_sample_number for block in blocks] == [0, 40]
+        np.testing.assert_allclose(
+            np.concatenate([block.data for block in blocks], axis=1),
+            expected,
+            rtol=1e-5,
+            atol=1e-5,
+        )
+        np.testing.assert_array_equal(blocks[1].timestamps, second[6])
+        assert blocks[0].metadata["aux_data"] == first[4:6].tolist()
+        json.dumps(blocks[0].metadata)
+        assert adapter.samples_processed == 65
+
+    def test_markers_are_extracted(self, adapter):
+        """Test non-zero marker values are reported with their offsets."""
+        blocks = []
+        adapter.add_block_callback(blocks.append)
+        data = self._board_data(30)
+        data[7, [3, 17]] = [2.0, 5.0]
+
+        adapter._process_board_data(data)
+
+        assert blocks[0].metadata["markers"] == [
+            {"sample_offset": 3, "marker": 2},
+            {"sample_offset": 17, "marker": 5},
+        ]
+
+    def test_unfiltered_block_passes_through(self, adapter):
+        """Test EEG rows pass unchanged when filtering is disabled."""
+        adapter.enable_filtering = False
+        blocks = []
+        adapter.add_block_callback(blocks.append)
+        data = self._board_data(10)
+
+        adapter._process_board_data(data)
+
+        np.testing.assert_allclose(blocks[0].data, data[1:4], rtol=1e-6)
+        assert "markers" not in blocks[0].metadata
+
+
+class TestBrainFlowSyntheticBoard:
+    """Test acquisition from the BrainFlow synthetic board."""
+
+    @pytest.mark.asyncio
+    async def test_streams_contiguous_blocks(self):
+        """Test the data thread emits contiguous multi-sample blocks."""
+        adapter = _make_adapter(enable_filtering=True, block_duration_ms=40.0)
+        blocks = []
+        adapter.add_block_callback(blocks.append)
+
+        assert await adapter.connect()
+        try:
+            assert await adapter.start_streaming()
+            await asyncio.sleep(0.5)
+            await adapter.stop_streaming()
+        finally:
+            await adapter.disconnect()
+
+        assert len(blocks) > 0
+        assert all(block.n_samples >= 10 for block in blocks)
+        assert all(block.n_channels == len(adapter.eeg_channels) for block in blocks)
+        for previous, block in zip(blocks, blocks[1:]):
+            assert block.first_sample_number == previous.sample_range[1]
@@ -0,0 +1,84 @@
+"""Unit tests for the block-wise device filter chain."""
+
+import numpy as np
+import pytest
+
+from common.streaming_filter import StreamingFilterBank
+from devices.filters import BlockFilterChain, FilterChainConfig
+from processing.preprocessing import StreamingFilterBank as PipelineFilterBank
+
+SAMPLING_RATE = 250.0
+
+
+def _tone(freq: float, n_samples: int, n_channels: int = 2) -> np.ndarray:
+    """Generate a sine tone on every channel."""
+    t = np.arange(n_samples) / SAMPLING_RATE
+    return np.tile(np.sin(2 * np.pi * freq * t), (n_channels, 1))
+
+
+class TestBlockFilterChain:
+    """Test BlockFilterChain."""
+
+    def test_blocks_match_continuous_filtering(self):
+        """Test filtering in blocks equals filtering the whole stream."""
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((4, 2000)) + 50.0
+
+        continuous = BlockFilterChain(FilterChainConfig(), SAMPLING_RATE, 4)
+        expected = continuous.process(data)
+
+        chain = BlockFilterChain(FilterChainConfig(), SAMPLING_RATE, 4)
+        blocks = [chain.process(data[:, i : i + 7]) for i in range(0, 2000, 7)]
+
+        np.testing.assert_allclose(np.concatenate(blocks, axis=1), expected)
+        assert chain.samples_filtered == 2000
+
+    def test_notch_and_passband(self):
+        """Test line noise is removed while in-band signal passes."""
+        chain = BlockFilterChain(FilterChainConfig(), SAMPLING_RATE, 2)
+        alpha = chain.process(_tone(10.0, 2500))
+        chain.reset()
+        line = chain.process(_tone(60.0, 2500))
+
+        # Compare steady-state amplitude after the filters settle
+        assert np.abs(alpha[:, 1000:]).max() > 0.9
+        assert np.abs(line[:, 1000:]).max() < 0.05
+
+    def test_detrend_removes_offset(self):
+        """Test the DC blocker removes a constant offset without a step."""
+        config = FilterChainConfig(
+            bandpass_low_hz=None, bandpass_high_hz=None, notch_freqs_hz=[]
+        )
+        chain = BlockFilterChain(config, SAMPLING_RATE, 2)
+
+        filtered = chain.process(np.full((2, 500), 200.0))
+
+        np.testing.assert_allclose(filtered, 0.0, atol=1e-3)
+
+    def test_config_from_dict(self):
+        """Test partial dictionaries override only the given fields."""
+        config = FilterChainConfig.from_dict(
+            {"notch_freqs_hz": [50.0], "bandpass_high_hz": 40.0, "unknown": 1}
+        )
+
+        assert config.notch_freqs_hz == [50.0]
+        assert config.bandpass_high_hz == 40.0
+        assert config.bandpass_low_hz == 1.0
+
+    def test_channel_mismatch(self):
+        """Test blocks with the wrong channel count are rejected."""
+        chain = BlockFilterChain(FilterChainConfig(), SAMPLING_RATE, 2)
+
+        with pytest.raises(ValueError):
+            chain.process(np.zeros((3, 10)))
+
+    def test_shares_streaming_filter_with_pipeline(self):
+        """Test the chain runs its cascade on the pipeline's filter bank."""
+        data = np.random.default_rng(1).standard_normal((2, 300))
+        chain = BlockFilterChain(FilterChainConfig(), SAMPLING_RATE, 2)
+
+        assert PipelineFilterBank is StreamingFilterBank
+        np.testing.assert_array_equal(
+            chain.process(data), StreamingFilterBank(chain.sos, 2).process(data)
+        )
+        assert chain.process(np.zeros((2, 0))).dtype == np.float32
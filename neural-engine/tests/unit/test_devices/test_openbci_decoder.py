@@ -0,0 +1,169 @@
+"""Unit tests for the vectorized OpenBCI Cyton stream decoder."""
+
+import numpy as np
+import pytest
+
+from devices.adapters.openbci_adapter import (
+    CytonStreamDecoder,
+    OpenBCIAdapter,
+    OpenBCIPacketParser,
+)
+from devices.base import ConnectionType, DeviceInfo, DeviceType
+
+
+def _make_frame(sample_num: int, counts, aux=(0, 0, 0), stop_byte=0xC0) -> bytes:
+    """Build a 33-byte Cyton frame from raw 24-bit channel counts."""
+    frame = bytearray([OpenBCIPacketParser.START_BYTE, sample_num % 256])
+    for value in counts:
+        frame += int(value).to_bytes(3, "big", signed=True)
+    for value in aux:
+        frame += int(value).to_bytes(2, "big", signed=True)
+    frame.append(stop_byte)
+    return bytes(frame)
+
+
+def _make_stream(n_frames: int, seed: int = 0, first_sample: int = 0):
+    """Build consecutive frames with random counts."""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(-(2**23), 2**23, size=(n_frames, 8))
+    aux = rng.integers(-(2**15), 2**15, size=(n_frames, 3))
+    stream = b"".join(
+        _make_frame(first_sample + i, counts[i], aux[i]) for i in range(n_frames)
+    )
+    return stream, counts, aux
+
+
+class TestCytonStreamDecoder:
+    """Test CytonStreamDecoder."""
+
+    def test_matches_per_packet_parser(self):
+        """Test decoded samples match parse_cyton_packet frame by frame."""
+        stream, _, aux = _make_stream(50)
+        frames = CytonStreamDecoder().decode(stream)
+
+        assert frames.channel_data.shape == (8, 50)
+        for i in range(50):
+            packet = stream[i * 33 : (i + 1) * 33]
+            expected = OpenBCIPacketParser.parse_cyton_packet(packet)
+            np.testing.assert_allclose(
+                frames.channel_data[:, i], expected["channel_data"], rtol=1e-12
+            )
+            assert frames.sample_nums[i] == expected["sample_num"]
+        np.testing.assert_array_equal(frames.aux_data, aux.T)
+
+    def test_sign_extension_extremes(self):
+        """Test full-scale positive and negative counts."""
+        counts = [2**23 - 1, -(2**23), -1, 0, 1, 123456, -123456, 42]
+        frames = CytonStreamDecoder().decode(_make_frame(0, counts))
+
+        scale = OpenBCIPacketParser.SCALE_FACTOR_24BIT * 1e6
+        np.testing.assert_allclose(frames.channel_data[:, 0], np.array(counts) * scale)
+
+    def test_split_reads_and_garbage(self):
+        """Test frames split across reads and surrounded by noise bytes."""
+        stream, counts, _ = _make_stream(20)
+        noisy = b"\x01\xa0\x02" + stream[:198] + b"\xff\xa0" + stream[198:]
+
+        decoder = CytonStreamDecoder(initial_capacity=16)
+        decoded = []
+        discarded = 0
+        for i in range(0, len(noisy), 7):
+            frames = decoder.decode(noisy[i : i + 7])
+            decoded.append(frames.channel_data)
+            discarded += frames.discarded_bytes
+
+        result = np.concatenate(decoded, axis=1)
+        scale = OpenBCIPacketParser.SCALE_FACTOR_24BIT * 1e6
+        assert result.shape == (8, 20)
+        np.testing.assert_allclose(result, counts.T * scale)
+        assert discarded == 5
+
+    def test_dropped_samples_across_reads(self):
+        """Test sample number gaps are counted across reads and wrap-around."""
+        decoder = CytonStreamDecoder()
+        counts = np.zeros(8)
+
+        first = decoder.decode(b"".join(_make_frame(n, counts) for n in (250, 251)))
+        second = decoder.decode(b"".join(_make_frame(n, counts) for n in (254, 3)))
+
+        assert first.dropped_samples == 0
+        assert second.dropped_samples == 2 + 4
+        assert decoder.last_sample_num == 3
+
+    def test_aux_stop_bytes_accepted(self):
+        """Test frames with 0xCx stop bytes are decoded."""
+        stream = _make_frame(0, np.zeros(8), stop_byte=0xC1) + _make_frame(
+            1, np.ones(8), stop_byte=0xC5
+        )
+        frames = CytonStreamDecoder().decode(stream)
+
+        assert frames.n_samples == 2
+
+    def test_daisy_merges_frame_pairs(self):
+        """Test Daisy frames are merged into 16-channel samples."""
+        board = np.arange(8)
+        daisy = np.arange(8) + 100
+        stream = b"".join(
+            [
+                _make_frame(1, board),  # Unpaired leading board frame
+                _make_frame(2, daisy),
+                _make_frame(3, board),
+                _make_frame(4, daisy),
+            ]
+        )
+
+        decoder = CytonStreamDecoder(daisy=True)
+        first = decoder.decode(stream)
+        second = decoder.decode(_make_frame(5, board))
+
+        scale = OpenBCIPacketParser.SCALE_FACTOR_24BIT * 1e6
+        expected = np.concatenate([board, daisy]) * scale
+        assert first.channel_data.shape == (16, 1)
+        np.testing.assert_allclose(first.channel_data[:, 0], expected)
+        assert first.discarded_bytes == 33
+        np.testing.assert_allclose(second.channel_data[:, 0], expected)
+        assert list(second.sample_nums) == [5]
+
+
+class TestOpenBCIAdapterBlocks:
+    """Test block emission from the OpenBCI adapter."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a Cyton adapter without opening a serial port."""
+        device_info = DeviceInfo(
+            device_id="cyton_test",
+            device_type=DeviceType.OPENBCI_CYTON,
+            model="Cyton",
+            firmware_version="3.1.2",
+            channel_count=8,
+            sampling_rate=250.0,
+            connection_type=ConnectionType.SERIAL,
+        )
+        adapter = OpenBCIAdapter(device_info)
+        adapter.is_streaming = True
+        return adapter
+
+    def test_serial_reads_are_emitted_as_blocks(self, adapter):
+        """Test small serial reads are decoded and emitted per block."""
+        blocks = []
+        adapter.add_block_callback(blocks.append)
+        stream, counts, _ = _make_stream(30)
+
+        # 20 ms blocks at 250 Hz hold 5 samples
+        assert adapter.block_bytes == 5 * 33
+        for i in range(0, len(stream), 10):
+            adapter._handle_serial_data(stream[i : i + 10])
+
+        assert [block.n_samples for block in blocks] == [5] * 6
+        assert [block.first_sample_number for block in blocks] == list(range(0, 30, 5))
+        np.testing.assert_allclose(
+            np.concatenate([block.data for block in blocks], axis=1),
+            counts.T * OpenBCIPacketParser.SCALE_FACTOR_24BIT * 1e6,
+            rtol=1e-6,
+        )
+        assert blocks[0].device_id == "cyton_test"
+        assert len(blocks[0].metadata["aux_data"]) == 3
+        assert adapter.packets_received == 30
+        assert adapter.packets_dropped == 0
+        assert adapter.sample_counter == 30
@@ -6,7 +6,7 @@ import numpy as np
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
-from src.ingestion import NeuralDataIngestion
+from src.ingestion import NeuralDataIngestion, decode_packet
 from src.ingestion.data_types import (
     NeuralDataPacket,
     NeuralSignalType,
@@ -14,6 +14,7 @@ from src.ingestion.data_types import (
     DeviceInfo,
     ChannelInfo,
 )
+from common.bigtable_writer import BatchWriterConfig, InMemoryBigtableBackend
 
 
 class TestNeuralDataIngestion:
@@ -179,6 +180,48 @@ class TestNeuralDataIngestion:
         assert original_subject_id in mappings
         assert mappings[original_subject_id].startswith("ANON_")
 
+    @pytest.mark.asyncio
+    async def test_bigtable_batched_storage(self, test_packet):
+        """Test packets are stored through the batch writer."""
+        backend = InMemoryBigtableBackend()
+        ingestion = NeuralDataIngestion(
+            project_id="test - project",
+            table_id="time-series",
+            enable_pubsub=False,
+            bigtable_backend=backend,
+        )
+
+        assert await ingestion.ingest_packet(test_packet)
+        await ingestion.close()
+
+        rows = backend.tables["time-series"]
+        assert len(rows) == 1
+        cells = next(iter(rows.values()))
+        np.testing.assert_array_equal(
+            np.frombuffer(cells[("data", "ch_000")]), test_packet.data[0]
+        )
+        assert ("metadata", "info") in cells
+        assert ingestion.metrics["storage_errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bigtable_write_failures_are_counted(self, test_packet):
+        """Test rows failing after retries count as storage errors."""
+        backend = InMemoryBigtableBackend()
+        backend.fail_next_rows(10)
+        ingestion = NeuralDataIngestion(
+            project_id="test - project",
+            enable_pubsub=False,
+            bigtable_backend=backend,
+            bigtable_writer_config=BatchWriterConfig(
+                max_retries=1, initial_backoff_ms=1.0
+            ),
+        )
+
+        await ingestion.ingest_packet(test_packet)
+        await ingestion.close()
+
+        assert ingestion.metrics["storage_errors"] == 1
+
     @pytest.mark.asyncio
     async def test_pubsub_integration(self):
         """Test Pub / Sub integration when enabled."""
@@ -213,8 +256,14 @@ class TestNeuralDataIngestion:
                 assert success
                 assert mock_publisher.publish.called
 
-    def test_serialize_packet(self, ingestion, test_packet):
-        """Test packet serialization."""
+    def test_serialize_packet(self, test_packet):
+        """Test packet serialization with the JSON fallback format."""
+        ingestion = NeuralDataIngestion(
+            project_id="test - project",
+            enable_pubsub=False,
+            enable_bigtable=False,
+            wire_format="json",
+        )
         serialized = ingestion._serialize_packet(test_packet)
 
         assert isinstance(serialized, bytes)
@@ -229,3 +278,13 @@ class TestNeuralDataIngestion:
         assert data["source"] == test_packet.source.value
         assert data["shape"] == list(test_packet.data.shape)
         assert len(data["data"]) == test_packet.n_channels
+
+    def test_serialize_packet_binary(self, ingestion, test_packet):
+        """Test packet serialization with the binary wire format."""
+        serialized = ingestion._serialize_packet(test_packet)
+
+        decoded = decode_packet(serialized)
+
+        assert decoded.metadata["session_id"] == test_packet.session_id
+        assert decoded.data.shape == test_packet.data.shape
+        np.testing.assert_allclose(decoded.data, test_packet.data, rtol=1e-6)
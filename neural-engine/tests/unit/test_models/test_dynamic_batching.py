@@ -0,0 +1,186 @@
+"""Tests for adaptive per-model request batching."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from models.dynamic_batching import BatchingConfig, ModelBatcher
+
+
+class _RecordingModel:
+    """Batch coroutine recording batch sizes and summing each example."""
+
+    def __init__(self, delay_s: float = 0.0, fail_shape=None):
+        self.batch_sizes = []
+        self.delay_s = delay_s
+        self.fail_shape = fail_shape
+        self.release = None
+
+    async def __call__(self, data: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(len(data))
+        if self.release is not None:
+            await self.release.wait()
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        if data.shape[1:] == self.fail_shape:
+            raise ValueError("bad batch")
+        return data.reshape(len(data), -1).sum(axis=1)
+
+
+def _examples(n: int, shape=(2, 3)):
+    return [np.full(shape, i, dtype=np.float32) for i in range(n)]
+
+
+def _expected(example: np.ndarray) -> float:
+    return float(example.sum())
+
+
+class TestModelBatcher:
+    """Test ModelBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_requests(self):
+        """Test queued examples run as one batch and get their own results."""
+        model = _RecordingModel()
+        batcher = ModelBatcher(
+            "m:v1",
+            model,
+            BatchingConfig(max_batch_size=8, initial_batch_size=8),
+        )
+        examples = _examples(8)
+
+        try:
+            predictions = await asyncio.gather(*map(batcher.submit, examples))
+        finally:
+            await batcher.close()
+
+        assert model.batch_sizes == [8]
+        assert [float(p) for p in predictions] == list(map(_expected, examples))
+        assert batcher.get_stats()["batch_size"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_flushes_partial_batch(self):
+        """Test a lone request waits at most the batch timeout."""
+        model = _RecordingModel()
+        batcher = ModelBatcher(
+            "m:v1", model, BatchingConfig(initial_batch_size=8, batch_timeout_ms=5)
+        )
+
+        try:
+            prediction = await asyncio.wait_for(batcher.submit(_examples(2)[1]), 1.0)
+        finally:
+            await batcher.close()
+
+        assert model.batch_sizes == [1]
+        assert float(prediction) == 6.0
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_while_under_target(self):
+        """Test full batches grow the limit up to max_batch_size."""
+        batcher = ModelBatcher(
+            "m:v1",
+            _RecordingModel(),
+            BatchingConfig(
+                max_batch_size=8, initial_batch_size=2, latency_target_ms=10_000
+            ),
+        )
+        limits = []
+
+        try:
+            for _ in range(8):
+                await asyncio.gather(*map(batcher.submit, _examples(16)))
+                limits.append(batcher.batch_limit)
+        finally:
+            await batcher.close()
+
+        assert limits == sorted(limits)
+        assert limits[0] > 2 and limits[-1] == 8
+
+    @pytest.mark.asyncio
+    async def test_limit_backs_off_over_target(self):
+        """Test a p99 over the latency target halves the limit."""
+        batcher = ModelBatcher(
+            "m:v1",
+            _RecordingModel(delay_s=0.02),
+            BatchingConfig(
+                max_batch_size=8,
+                initial_batch_size=8,
+                latency_target_ms=5,
+                min_latency_samples=1,
+            ),
+        )
+
+        try:
+            await asyncio.gather(*map(batcher.submit, _examples(8)))
+            after_one = batcher.batch_limit
+            await asyncio.gather(*map(batcher.submit, _examples(4)))
+        finally:
+            await batcher.close()
+
+        assert after_one == 4
+        assert batcher.batch_limit == 2
+
+    @pytest.mark.asyncio
+    async def test_models_do_not_block_each_other(self):
+        """Test a stalled model does not delay another model's queue."""
+        slow_model = _RecordingModel()
+        slow_model.release = asyncio.Event()
+        slow = ModelBatcher("slow:v1", slow_model, BatchingConfig(batch_timeout_ms=1))
+        fast = ModelBatcher("fast:v1", _RecordingModel(), BatchingConfig())
+
+        try:
+            stalled = asyncio.ensure_future(slow.submit(_examples(2)[1]))
+            prediction = await asyncio.wait_for(fast.submit(_examples(3)[2]), 1.0)
+            assert float(prediction) == 12.0
+            assert not stalled.done()
+
+            slow_model.release.set()
+            assert float(await asyncio.wait_for(stalled, 1.0)) == 6.0
+        finally:
+            await slow.close()
+            await fast.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_fan_out_to_their_group(self):
+        """Test a failing batch fails only its requests and the worker survives."""
+        model = _RecordingModel(fail_shape=(3,))
+        batcher = ModelBatcher(
+            "m:v1", model, BatchingConfig(max_batch_size=8, initial_batch_size=8)
+        )
+        good = _examples(3, shape=(2,))
+        bad = _examples(3, shape=(3,))
+
+        try:
+            results = await asyncio.gather(
+                *map(batcher.submit, good + bad), return_exceptions=True
+            )
+            after = await batcher.submit(good[2])
+        finally:
+            await batcher.close()
+
+        assert [float(r) for r in results[:3]] == list(map(_expected, good))
+        assert all(isinstance(r, ValueError) for r in results[3:])
+        assert float(after) == _expected(good[2])
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_requests(self):
+        """Test close fails in-flight and queued requests instead of hanging."""
+        model = _RecordingModel()
+        model.release = asyncio.Event()
+        batcher = ModelBatcher(
+            "m:v1", model, BatchingConfig(initial_batch_size=1, batch_timeout_ms=1)
+        )
+
+        in_flight = asyncio.ensure_future(batcher.submit(_examples(1)[0]))
+        while not model.batch_sizes:
+            await asyncio.sleep(0.001)
+        queued = asyncio.ensure_future(batcher.submit(_examples(2)[1]))
+        await asyncio.sleep(0.01)
+
+        await batcher.close()
+
+        for request in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="closed"):
+                await asyncio.wait_for(request, 1.0)
+        assert batcher.get_stats()["queue_depth"] == 0
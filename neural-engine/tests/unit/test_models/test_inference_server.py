@@ -0,0 +1,113 @@
+"""Tests for the batched inference server endpoints."""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from models.inference_server import NeuralInferenceServer
+
+
+class _SumModel:
+    """Model returning the sum of each example plus an offset."""
+
+    def __init__(self, offset: float = 0.0):
+        self.offset = offset
+        self.batch_sizes = []
+
+    def predict(self, data: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(len(data))
+        return data.reshape(len(data), -1).sum(axis=1, keepdims=True) + self.offset
+
+
+def _request(value: float, session_id: str = "s1", **overrides):
+    request = {
+        "session_id": session_id,
+        "data": [[value, value], [value, value]],
+        "model_name": "decoder",
+    }
+    request.update(overrides)
+    return request
+
+
+@pytest.fixture
+def server():
+    """Server with one registered model and a short batch timeout."""
+    server = NeuralInferenceServer(max_batch_size=8, batch_timeout_ms=20)
+    server.registry.register_model(_SumModel(), "decoder", "v1")
+    return server
+
+
+class TestInferenceEndpoints:
+    """Test the endpoints submitting through the model batchers."""
+
+    def test_inference(self, server):
+        """Test a single request is answered through its model's batcher."""
+        with TestClient(server.app) as client:
+            response = client.post("/inference", json=_request(1.5))
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["predictions"] == [6.0]
+        assert body["model_name"] == "decoder"
+        assert list(server.batchers) == [("decoder", "v1")]
+
+    def test_unknown_model_is_an_error(self, server):
+        """Test requests for unregistered models fail."""
+        with TestClient(server.app) as client:
+            response = client.post("/inference", json=_request(1.0, model_name="x"))
+
+        assert response.status_code == 500
+        assert "not found" in response.json()["detail"]
+
+    def test_batch_inference_coalesces(self, server):
+        """Test a batch request runs as one model call."""
+        model = server.registry.get_model("decoder")
+
+        with TestClient(server.app) as client:
+            response = client.post(
+                "/batch_inference",
+                json=[_request(float(i), session_id=f"s{i}") for i in range(4)],
+            )
+
+        assert response.status_code == 200
+        assert [r["predictions"] for r in response.json()] == [
+            [0.0],
+            [4.0],
+            [8.0],
+            [12.0],
+        ]
+        assert [r["session_id"] for r in response.json()] == ["s0", "s1", "s2", "s3"]
+        assert model.batch_sizes == [4]
+
+    def test_stream(self, server):
+        """Test the WebSocket endpoint answers each message."""
+        with TestClient(server.app) as client:
+            with client.websocket_connect("/stream/s1") as websocket:
+                predictions = []
+                for value in (1.0, 2.0):
+                    websocket.send_json(_request(value))
+                    predictions.append(websocket.receive_json()["predictions"])
+
+        assert predictions == [[4.0], [8.0]]
+        assert server.metrics["total_requests"] == 2
+
+    def test_metrics_report_batching(self, server):
+        """Test metrics include the per-model batching statistics."""
+        with TestClient(server.app) as client:
+            client.post("/inference", json=_request(1.0))
+            metrics = client.get("/metrics").json()
+
+        stats = metrics["batching"]["decoder:v1"]
+        assert metrics["total_requests"] == 1
+        assert stats["batch_size"]["count"] == 1
+        assert stats["batch_limit"] >= 1
+
+    def test_reregistered_model_is_used(self, server):
+        """Test a version re-registered after its batcher exists is served."""
+        with TestClient(server.app) as client:
+            first = client.post("/inference", json=_request(1.0)).json()
+            server.registry.register_model(_SumModel(offset=100.0), "decoder", "v1")
+            second = client.post("/inference", json=_request(1.0)).json()
+
+        assert first["predictions"] == [4.0]
+        assert second["predictions"] == [104.0]
@@ -0,0 +1,139 @@
+"""Unit tests for quantile sketches and custom metric series."""
+
+import numpy as np
+import pytest
+
+from monitoring.metrics.custom_metrics import CustomMetricsCollector, MetricType
+from monitoring.metrics.quantile_sketch import DDSketch, LogBucketMapping, MetricSeries
+
+
+@pytest.fixture
+def latencies():
+    """Log-normally distributed latencies in seconds."""
+    return np.random.default_rng(0).lognormal(mean=-4.0, sigma=1.0, size=20000)
+
+
+class TestDDSketch:
+    """Test DDSketch."""
+
+    def test_quantiles_within_relative_accuracy(self, latencies):
+        """Test estimates are within the mapping's relative accuracy."""
+        sketch = DDSketch(LogBucketMapping(relative_accuracy=0.01))
+        sketch.add_many(latencies)
+
+        qs = [0.01, 0.5, 0.9, 0.99]
+        expected = np.quantile(latencies, qs, method="lower")
+        np.testing.assert_allclose(sketch.quantiles(qs), expected, rtol=0.0101)
+        assert sketch.count == len(latencies)
+        assert sketch.min == latencies.min() and sketch.max == latencies.max()
+        assert sketch.mean == pytest.approx(latencies.mean())
+        assert sketch.std == pytest.approx(latencies.std(ddof=1))
+
+    def test_merge_equals_single_sketch(self, latencies):
+        """Test merging per-worker sketches equals one sketch of all values."""
+        whole = DDSketch()
+        whole.add_many(latencies)
+
+        merged = DDSketch()
+        for part in np.array_split(latencies, 4):
+            worker = DDSketch()
+            for value in part[:100]:
+                worker.add(value)
+            worker.add_many(part[100:])
+            merged.merge(DDSketch.from_dict(worker.to_dict()))
+
+        np.testing.assert_array_equal(merged.counts, whole.counts)
+        assert merged.quantile(0.95) == whole.quantile(0.95)
+
+        with pytest.raises(ValueError):
+            merged.merge(DDSketch(LogBucketMapping(relative_accuracy=0.05)))
+
+    def test_empty_and_out_of_range(self):
+        """Test empty sketches and values outside the mapped range."""
+        sketch = DDSketch()
+        assert np.isnan(sketch.quantile(0.5))
+
+        sketch.add_many(np.array([0.0, -1.0, 1e9]))
+        assert sketch.quantile(0.0) == -1.0
+        assert sketch.quantile(1.0) == 1e9
+
+
+class TestMetricSeries:
+    """Test MetricSeries."""
+
+    def test_window_covers_recent_buckets(self):
+        """Test windows include only buckets overlapping the window."""
+        series = MetricSeries(bucket_seconds=10.0, n_buckets=6, staging_size=8)
+        for t in range(60):
+            series.record(float(t), timestamp=1000.0 + t)
+
+        sketch, last, last_time = series.window(20.0, now=1059.0)
+
+        # Buckets [1030, 1040), [1040, 1050) and [1050, 1060)
+        assert sketch.count == 30
+        assert sketch.min == 30.0 and sketch.max == 59.0
+        assert sketch.sum == sum(range(30, 60))
+        assert (last, last_time) == (59.0, 1059.0)
+
+    def test_ring_reuses_buckets(self):
+        """Test old buckets are overwritten and late values are dropped."""
+        series = MetricSeries(bucket_seconds=1.0, n_buckets=3, staging_size=4)
+        for t in range(10):
+            series.record(1.0, timestamp=float(t))
+        series.record(1.0, timestamp=0.5)  # Older than the ring
+
+        assert series.retained == 3
+        assert series.sketch.count == 11
+        assert series.window(100.0, now=9.5)[0].count == 3
+
+
+class TestCustomMetricsCollector:
+    """Test CustomMetricsCollector."""
+
+    @pytest.fixture
+    def collector(self):
+        """Create collector with a latency histogram."""
+        collector = CustomMetricsCollector(config=None)
+        collector.register_metric(
+            "inference_latency", MetricType.HISTOGRAM, "Inference latency", "s"
+        )
+        return collector
+
+    def test_histogram_summary(self, collector, latencies):
+        """Test summaries come from the sketches of all label sets."""
+        for i, value in enumerate(latencies[:2000]):
+            collector.record_histogram(
+                "inference_latency", value, {"model": f"m{i % 2}"}
+            )
+
+        summary = collector.get_metric_summary("inference_latency")
+        values = latencies[:2000]
+        assert summary["events_count"] == 2000
+        assert summary["total_sum"] == pytest.approx(values.sum())
+        assert summary["median_value"] == pytest.approx(np.median(values), rel=0.03)
+        assert summary["percentiles"]["p99"] == pytest.approx(
+            np.quantile(values, 0.99), rel=0.03
+        )
+
+        only_m0 = collector.get_metric_summary(
+            "inference_latency", tags={"model": "m0"}
+        )
+        assert only_m0["events_count"] == 1000
+        assert collector.get_collector_stats()["metric_series"] == 2
+
+    def test_merge_exported_sketches(self, collector, latencies):
+        """Test sketches exported by a worker merge into the collector."""
+        worker = CustomMetricsCollector(config=None)
+        worker.register_metric(
+            "inference_latency", MetricType.HISTOGRAM, "Inference latency", "s"
+        )
+        for value in latencies[:500]:
+            collector.record_histogram("inference_latency", value)
+        for value in latencies[500:1000]:
+            worker.record_histogram("inference_latency", value)
+
+        assert collector.merge_sketches(worker.export_sketches()) == 1
+
+        sketch = collector.get_sketch("inference_latency")
+        assert sketch.count == 1000
+        assert sketch.sum == pytest.approx(latencies[:1000].sum())
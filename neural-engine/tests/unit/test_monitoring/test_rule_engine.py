@@ -0,0 +1,175 @@
+"""Unit tests for compiled alert rule evaluation."""
+
+import numpy as np
+import pytest
+
+from monitoring.alerting.alert_manager import (
+    AlertManager,
+    AlertRule,
+    AlertSeverity,
+    RuleCondition,
+)
+from monitoring.alerting.rule_engine import CompiledRuleSet
+
+
+def _rule(rule_id, metric, condition, threshold, **kwargs):
+    """Alert rule with defaults for the fields under test."""
+    return AlertRule(
+        id=rule_id,
+        name=rule_id,
+        description=rule_id,
+        metric_name=metric,
+        condition=condition,
+        threshold=threshold,
+        severity=AlertSeverity.WARNING,
+        **kwargs,
+    )
+
+
+class _Notifications:
+    """Notification service recording delivered alerts."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_alert_notification(self, alert, channel):
+        self.sent.append((alert.rule_id, channel))
+
+
+@pytest.fixture
+def manager():
+    """Alert manager with only test rules and a recording notifier."""
+    manager = AlertManager(config=None)
+    for rule_id in list(manager.rules):
+        manager.unregister_rule(rule_id)
+    manager.set_notification_service(_Notifications())
+    return manager
+
+
+class TestCompiledRuleSet:
+    """Test CompiledRuleSet."""
+
+    def test_conditions_match_comparators(self):
+        """Test every comparator against values around its threshold."""
+        conditions = [
+            RuleCondition.GREATER_THAN,
+            RuleCondition.LESS_THAN,
+            RuleCondition.EQUALS,
+            RuleCondition.NOT_EQUALS,
+            RuleCondition.GREATER_EQUAL,
+            RuleCondition.LESS_EQUAL,
+            RuleCondition.REGEX_MATCH,
+        ]
+        rules = CompiledRuleSet([_rule(c.value, c.value, c, 1.0) for c in conditions])
+
+        values = (0.5, 0.9995, 1.0, 1.0005, 1.5, np.nan)
+        held = [rules.conditions(np.full(7, value)) for value in values]
+
+        np.testing.assert_array_equal(
+            np.array(held).T,
+            [
+                [False, False, False, True, True, False],
+                [True, True, False, False, False, False],
+                [False, True, True, True, False, False],
+                [True, False, False, False, True, False],
+                [False, False, True, True, True, False],
+                [True, True, True, False, False, False],
+                [False, False, False, False, False, False],
+            ],
+        )
+
+    def test_for_duration_and_missing_metrics(self):
+        """Test rules fire after their duration and skip missing metrics."""
+        rules = CompiledRuleSet(
+            [
+                _rule("a", "x", RuleCondition.GREATER_THAN, 1.0, for_duration=10),
+                _rule("b", "y", RuleCondition.GREATER_THAN, 1.0, for_duration=10),
+            ]
+        )
+
+        started = rules.evaluate(np.array([2.0, np.nan]), now=0.0)
+        early = rules.evaluate(np.array([2.0, np.nan]), now=5.0)
+        due = rules.evaluate(np.array([2.0, 2.0]), now=10.0)
+        cleared = rules.evaluate(np.array([0.0, 2.0]), now=11.0)
+
+        assert list(started.started) == [0] and started.evaluated == 1
+        assert len(early.fired) == 0 and list(early.firing) == []
+        assert list(due.fired) == [0] and list(due.started) == [1]
+        assert list(cleared.resolved) == [0] and not rules.firing.any()
+
+    def test_recompilation_keeps_state(self):
+        """Test state follows rules by id when the set is recompiled."""
+        a = _rule("a", "x", RuleCondition.GREATER_THAN, 1.0)
+        rules = CompiledRuleSet([a])
+        rules.evaluate(np.array([2.0]), now=3.0)
+
+        b = _rule("b", "y", RuleCondition.LESS_THAN, 1.0)
+        recompiled = CompiledRuleSet([b, a], previous=rules)
+
+        assert recompiled.metric_names == ["y", "x"]
+        assert np.isnan(recompiled.condition_start[0])
+        assert recompiled.condition_start[1] == 3.0
+
+
+class TestAlertManagerEvaluation:
+    """Test AlertManager rule evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_notifications_only_on_transitions(self, manager):
+        """Test repeated evaluations of a firing rule do not notify again."""
+        manager.register_rule(
+            _rule(
+                "cpu",
+                "cpu",
+                RuleCondition.GREATER_THAN,
+                80.0,
+                for_duration=0,
+                cooldown_period=0,
+                notification_channels=["slack"],
+            )
+        )
+
+        triggered = [
+            await manager.evaluate_all_rules({"cpu": value})
+            for value in (90.0, 91.0, 92.0, 93.0)
+        ]
+
+        assert triggered == [0, 1, 0, 0]
+        assert manager.notification_service.sent == [("cpu", "slack")]
+        (alert,) = manager.get_active_alerts()
+        assert alert.metric_value == 93.0
+
+        await manager.evaluate_all_rules({"cpu": 50.0})
+
+        assert manager.get_active_alerts() == []
+        assert manager.get_rule_state("cpu")["condition_met"] is False
+        assert manager.total_alerts_resolved == 1
+
+    @pytest.mark.asyncio
+    async def test_cooldown_and_disabled_rules(self, manager):
+        """Test resolved rules are suppressed and disabled rules skipped."""
+        manager.register_rule(
+            _rule("mem", "mem", RuleCondition.GREATER_THAN, 90.0, for_duration=0)
+        )
+        manager.register_rule(
+            _rule("disk", "disk", RuleCondition.GREATER_THAN, 90.0, for_duration=0)
+        )
+        manager.set_rule_enabled("disk", False)
+
+        for value in (95.0, 95.0, 10.0, 95.0, 95.0):
+            await manager.evaluate_all_rules({"mem": value, "disk": value})
+
+        assert "mem" in manager.suppressed_rules
+        assert manager.get_active_alerts() == []
+        assert manager.get_rule_state("disk")["last_value"] is None
+
+    @pytest.mark.asyncio
+    async def test_evaluate_rule_shares_state(self, manager):
+        """Test single-rule and full evaluation advance the same state."""
+        manager.register_rule(
+            _rule("lat", "lat", RuleCondition.GREATER_EQUAL, 100.0, for_duration=0)
+        )
+
+        assert await manager.evaluate_rule("lat", {"lat": 100.0})
+        assert await manager.evaluate_all_rules({"lat": 120.0}) == 1
+        assert not await manager.evaluate_rule("missing", {})
@@ -0,0 +1 @@
+"""Unit tests for the signal processing package."""
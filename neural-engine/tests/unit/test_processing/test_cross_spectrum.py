@@ -0,0 +1,153 @@
+"""Tests for the batched cross-spectral density tensor."""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from processing.features.cross_spectrum import (
+    compute_cross_spectrum,
+    phase_locking_value,
+)
+
+SAMPLING_RATE = 250.0
+
+
+@pytest.fixture
+def data():
+    """Four seconds of correlated multi-channel noise with an alpha rhythm."""
+    rng = np.random.default_rng(3)
+    t = np.arange(int(4 * SAMPLING_RATE)) / SAMPLING_RATE
+    alpha = np.sin(2 * np.pi * 10 * t)
+    noise = rng.standard_normal((4, t.size))
+    return np.stack(
+        [
+            alpha + noise[0],
+            0.5 * np.roll(alpha, 5) + noise[1],
+            noise[2] + 0.3 * noise[0],
+            noise[3],
+        ]
+    )
+
+
+class TestCrossSpectrum:
+    """Test compute_cross_spectrum against scipy.signal."""
+
+    @pytest.mark.parametrize("nperseg", [256, 255])
+    def test_csd_matches_scipy(self, data, nperseg):
+        """Test every pair equals scipy.signal.csd, for even and odd nperseg."""
+        noverlap = nperseg // 2
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, nperseg, noverlap)
+
+        n_channels = data.shape[0]
+        for i in range(n_channels):
+            for j in range(n_channels):
+                freqs, expected = signal.csd(
+                    data[i], data[j], SAMPLING_RATE, nperseg=nperseg, noverlap=noverlap
+                )
+                np.testing.assert_allclose(spectrum.freqs, freqs)
+                np.testing.assert_allclose(
+                    spectrum.csd[i, j], expected, rtol=1e-12, atol=1e-15
+                )
+
+    def test_psd_matches_welch(self, data):
+        """Test the auto-spectra equal scipy.signal.welch."""
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, 256, 128)
+        _, expected = signal.welch(data, SAMPLING_RATE, nperseg=256, noverlap=128)
+
+        np.testing.assert_allclose(spectrum.psd, expected, rtol=1e-12, atol=1e-15)
+
+    def test_coherence_matches_scipy(self, data):
+        """Test coherence equals scipy.signal.coherence for every pair."""
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, 256, 128)
+        coherence = spectrum.coherence()
+
+        for i in range(data.shape[0]):
+            for j in range(data.shape[0]):
+                _, expected = signal.coherence(
+                    data[i], data[j], SAMPLING_RATE, nperseg=256, noverlap=128
+                )
+                np.testing.assert_allclose(
+                    coherence[i, j], expected, rtol=1e-12, atol=1e-15
+                )
+
+    def test_imaginary_coherence(self, data):
+        """Test imaginary coherency is antisymmetric and bounded."""
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, 256, 128)
+        imaginary = spectrum.imaginary_coherence()
+
+        i, j = 0, 1
+        _, csd = signal.csd(data[i], data[j], SAMPLING_RATE, nperseg=256)
+        _, psd = signal.welch(data[[i, j]], SAMPLING_RATE, nperseg=256)
+        np.testing.assert_allclose(
+            imaginary[i, j], np.imag(csd) / np.sqrt(psd[0] * psd[1]), atol=1e-12
+        )
+        np.testing.assert_allclose(imaginary, -imaginary.transpose(1, 0, 2))
+        assert np.all(np.abs(imaginary) <= 1 + 1e-12)
+
+    def test_nperseg_clipped_to_window(self, data):
+        """Test nperseg longer than the window is clipped to its length."""
+        short = data[:, :100]
+        spectrum = compute_cross_spectrum(short, SAMPLING_RATE, 256, 128)
+
+        freqs, expected = signal.csd(
+            short[0], short[1], SAMPLING_RATE, nperseg=100, noverlap=50
+        )
+        assert spectrum.csd.shape == (4, 4, freqs.size)
+        np.testing.assert_allclose(spectrum.freqs, freqs)
+        np.testing.assert_allclose(spectrum.csd[0, 1], expected, atol=1e-15)
+
+
+class TestBandAverage:
+    """Test CrossSpectrum.band_average."""
+
+    def test_averages_bins_in_band(self, data):
+        """Test the band average is the mean over bins inside the band."""
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, 256, 128)
+        coherence = spectrum.coherence()
+
+        mask = (spectrum.freqs >= 8) & (spectrum.freqs <= 13)
+        np.testing.assert_allclose(
+            spectrum.band_average(coherence, 8, 13),
+            coherence[:, :, mask].mean(axis=2),
+        )
+
+    def test_empty_band_returns_zeros(self, data):
+        """Test a band between frequency bins averages to zeros."""
+        spectrum = compute_cross_spectrum(data, SAMPLING_RATE, 256, 128)
+        resolution = spectrum.freqs[1]
+
+        result = spectrum.band_average(
+            spectrum.coherence(), 0.2 * resolution, 0.8 * resolution
+        )
+
+        assert result.shape == (4, 4)
+        assert not np.any(result)
+
+
+class TestPhaseLockingValue:
+    """Test phase_locking_value."""
+
+    def test_matches_pairwise_definition(self):
+        """Test the matrix equals |mean(exp(i * (phi_i - phi_j)))| per pair."""
+        rng = np.random.default_rng(11)
+        phases = rng.uniform(-np.pi, np.pi, size=(5, 500))
+        plv = phase_locking_value(phases)
+
+        for i in range(5):
+            for j in range(5):
+                expected = (
+                    0.0
+                    if i == j
+                    else np.abs(np.mean(np.exp(1j * (phases[i] - phases[j]))))
+                )
+                assert plv[i, j] == pytest.approx(expected, abs=1e-12)
+
+    def test_constant_phase_lag_is_fully_locked(self):
+        """Test channels with a constant phase lag have a PLV of one."""
+        t = np.arange(1000) / SAMPLING_RATE
+        base = 2 * np.pi * 10 * t
+        phases = np.stack([base, base + 0.7, base - 2.0])
+
+        plv = phase_locking_value(phases)
+
+        np.testing.assert_allclose(plv, 1.0 - np.eye(3), atol=1e-12)
@@ -0,0 +1,89 @@
+"""Tests for the feature extraction executor backends."""
+
+import numpy as np
+import pytest
+
+from processing.features.feature_extractor import (
+    CATEGORY_METHODS,
+    EXECUTOR_BACKENDS,
+    FeatureExtractor,
+)
+from processing.signal_processor import ProcessingConfig
+
+SAMPLING_RATE = 250.0
+N_CHANNELS = 8
+
+
+def _config(backend: str) -> ProcessingConfig:
+    """Processing config running every feature category on one backend."""
+    return ProcessingConfig(
+        sampling_rate=SAMPLING_RATE,
+        num_channels=N_CHANNELS,
+        feature_types=list(CATEGORY_METHODS),
+        default_feature_executor=backend,
+        feature_workers=2,
+    )
+
+
+def _window() -> np.ndarray:
+    """Two seconds of noisy alpha and beta activity."""
+    rng = np.random.default_rng(11)
+    t = np.arange(int(2 * SAMPLING_RATE)) / SAMPLING_RATE
+    phases = rng.uniform(0, 2 * np.pi, (N_CHANNELS, 1))
+    return (
+        10 * np.sin(2 * np.pi * 10 * t + phases)
+        + 5 * np.sin(2 * np.pi * 22 * t)
+        + rng.standard_normal((N_CHANNELS, t.size))
+    )
+
+
+async def _extract(backend: str, data: np.ndarray):
+    extractor = FeatureExtractor(_config(backend))
+    await extractor.initialize()
+    try:
+        features = await extractor.extract_features(data, quality_score=0.9)
+        timings = extractor.get_category_timings()
+    finally:
+        await extractor.cleanup()
+    return features, timings
+
+
+class TestExecutorBackends:
+    """Test the inline, thread and process backends."""
+
+    @pytest.mark.asyncio
+    async def test_backends_give_identical_features(self):
+        """Test every backend extracts exactly the inline features."""
+        data = _window()
+        expected, _ = await _extract("inline", data)
+        assert expected
+
+        for backend in EXECUTOR_BACKENDS[1:]:
+            features, timings = await _extract(backend, data)
+
+            assert features.keys() == expected.keys()
+            for name, value in expected.items():
+                np.testing.assert_array_equal(features[name], value, err_msg=name)
+            assert {stats["backend"] for stats in timings.values()} == {backend}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_worker_loops(self):
+        """Test cleanup closes the event loops of the thread-pool workers."""
+        extractor = FeatureExtractor(_config("thread"))
+        await extractor.initialize()
+        await extractor.extract_features(_window())
+        loops = list(extractor._thread_loops)
+
+        await extractor.cleanup()
+
+        assert loops and all(loop.is_closed() for loop in loops)
+        assert extractor._thread_loops == [] and extractor._thread_pool is None
+
+    def test_config_rejects_unknown_backend(self):
+        """Test the config only accepts the extractor's backends."""
+        with pytest.raises(ValueError, match="Feature executors"):
+            ProcessingConfig(
+                sampling_rate=SAMPLING_RATE,
+                num_channels=N_CHANNELS,
+                feature_executors={"spatial": "gpu"},
+            ).validate()
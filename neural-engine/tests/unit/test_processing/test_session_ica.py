@@ -0,0 +1,184 @@
+"""Tests for session-level ICA artifact removal."""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from processing.preprocessing import (
+    ArtifactRemover,
+    PreprocessingPipeline,
+    SessionICA,
+)
+from processing.signal_processor import ProcessingConfig
+
+SAMPLING_RATE = 250.0
+
+
+def _mixture(n_samples: int, seed: int = 0):
+    """Mix a rhythm, a sawtooth, noise and a blink-like artifact source."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_samples) / SAMPLING_RATE
+    blinks = np.zeros(n_samples)
+    blinks[rng.choice(n_samples, n_samples // 800, replace=False)] = 1.0
+    sources = np.stack(
+        [
+            np.sin(2 * np.pi * 10 * t),
+            (t * 3) % 1 - 0.5,
+            rng.normal(size=n_samples) * 0.3,
+            np.convolve(blinks, np.hanning(50), mode="same") * 5,
+        ]
+    )
+    mixing = rng.normal(size=(6, 4))
+    return mixing @ sources, sources, mixing
+
+
+def _blink_component(sources: np.ndarray):
+    """Classify the most peaked component as the artifact."""
+    return [int(np.argmax(stats.kurtosis(sources, axis=1)))]
+
+
+def _session_ica(**kwargs):
+    return SessionICA(_blink_component, n_components=4, **kwargs)
+
+
+def _config():
+    return ProcessingConfig(
+        sampling_rate=SAMPLING_RATE,
+        num_channels=6,
+        ica_components=4,
+        ica_calibration_s=8.0,
+        ica_buffer_s=16.0,
+    )
+
+
+class TestSessionICA:
+    """Test SessionICA."""
+
+    def test_calibrate_and_apply_removes_artifact(self):
+        """Test the cached projection removes the artifact component."""
+        data, sources, mixing = _mixture(4000)
+        session_ica = _session_ica()
+
+        model = session_ica.fit(data)
+        cleaned = session_ica.apply(data)
+
+        art = model.artifact_components
+        expected = data - model.mixing[:, art] @ (
+            model.unmixing[art] @ (data - model.mean[:, np.newaxis])
+        )
+        np.testing.assert_allclose(cleaned, expected, atol=1e-9)
+        # The blink source no longer correlates with any channel
+        n_channels = data.shape[0]
+        before = np.corrcoef(data, sources[3])[-1, :n_channels]
+        after = np.corrcoef(cleaned, sources[3])[-1, :n_channels]
+        assert np.max(np.abs(after)) < 0.1 < np.max(np.abs(before))
+        assert model.version == 1 and session_ica.is_fitted
+
+    def test_unfitted_model_returns_input(self):
+        """Test windows pass through until the model is calibrated."""
+        data, _, _ = _mixture(500)
+
+        assert _session_ica().apply(data) is data
+
+    def test_overlapping_windows_buffer_new_samples_once(self):
+        """Test only the new samples of overlapping windows are buffered."""
+        data, _, _ = _mixture(1000)
+        session_ica = _session_ica(calibration_samples=400, buffer_samples=800)
+
+        session_ica.add(data[:, 0:250])
+        for start in range(125, 751, 125):
+            session_ica.add(data[:, start : start + 250], new_samples=125)
+
+        np.testing.assert_array_equal(session_ica.buffered(), data[:, 200:1000])
+        assert session_ica.needs_fit()
+
+    @pytest.mark.asyncio
+    async def test_refit_keeps_component_order(self):
+        """Test refits run after the interval and keep component indices."""
+        data, _, _ = _mixture(6000)
+        session_ica = _session_ica(
+            calibration_samples=2000, buffer_samples=3000, refit_interval_samples=2000
+        )
+        first = session_ica.fit(data[:, :2000])
+
+        session_ica.add(data[:, 2000:3000])
+        assert not session_ica.needs_fit()
+        session_ica.add(data[:, 3000:5000])
+        assert session_ica.needs_fit()
+
+        await session_ica.refit_async()
+        await session_ica.wait_for_refit()
+        refitted = session_ica.model
+        session_ica.close()
+
+        similarity = np.sum(
+            (first.mixing / np.linalg.norm(first.mixing, axis=0))
+            * (refitted.mixing / np.linalg.norm(refitted.mixing, axis=0)),
+            axis=0,
+        )
+        assert refitted.version == 2
+        assert np.all(similarity > 0.95)
+        assert refitted.artifact_components == first.artifact_components
+
+    def test_match_components_undoes_permutation_and_signs(self):
+        """Test matching recovers the previous order and signs."""
+        rng = np.random.default_rng(1)
+        reference = rng.normal(size=(8, 5))
+        permutation = np.array([3, 0, 4, 1, 2])
+        signs = np.array([1.0, -1.0, -1.0, 1.0, -1.0])
+        mixing = reference[:, permutation] * signs * 2.0
+
+        order, matched_signs = SessionICA._match_components(reference, mixing)
+
+        np.testing.assert_allclose(mixing[:, order] * matched_signs, reference * 2.0)
+
+
+class TestArtifactRemoverSessions:
+    """Test ArtifactRemover keeps one SessionICA per session."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_isolated_and_released(self):
+        """Test calibration is per session and released on cleanup."""
+        remover = ArtifactRemover(_config())
+        data, _, _ = _mixture(4000)
+
+        info = await remover.calibrate_ica(data, [0], session_id="a")
+        cleaned_a, info_a = await remover.remove_artifacts_session_ica(
+            data[:, :500], session_id="a"
+        )
+        cleaned_b, info_b = await remover.remove_artifacts_session_ica(
+            data[:, :500], session_id="b"
+        )
+
+        assert info["calibrated"] and info_a["removed_components"] == [0]
+        assert not info_b["calibrated"]
+        np.testing.assert_array_equal(cleaned_b, data[:, :500])
+        assert not np.allclose(cleaned_a, data[:, :500])
+
+        assert remover.release_session_ica("a")
+        assert not remover.release_session_ica("a")
+        assert set(remover.session_icas) == {"b"}
+        await remover.cleanup()
+        assert remover.session_icas == {}
+
+
+class TestPreprocessingPipelineICA:
+    """Test the pipeline's choice of ICA model."""
+
+    @pytest.mark.asyncio
+    async def test_offline_calls_do_not_share_a_model(self):
+        """Test calls without a session fit ICA on their own data."""
+        data_a, _, _ = _mixture(4000, seed=0)
+        data_b, _, _ = _mixture(4000, seed=1)
+
+        pipeline = PreprocessingPipeline(_config())
+        cleaned_a, _ = await pipeline._remove_artifacts(data_a)
+        cleaned_b, _ = await pipeline._remove_artifacts(data_b)
+
+        assert pipeline.artifact_remover.session_icas == {}
+        assert not np.allclose(cleaned_a, data_a)
+
+        # The second signal is cleaned as if it were the first call
+        fresh = PreprocessingPipeline(_config())
+        expected_b, _ = await fresh._remove_artifacts(data_b)
+        np.testing.assert_allclose(cleaned_b, expected_b)
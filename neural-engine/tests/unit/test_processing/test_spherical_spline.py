@@ -0,0 +1,107 @@
+"""Tests for spherical-spline interpolation and surface Laplacian matrices."""
+
+import numpy as np
+
+from processing.preprocessing.spherical_spline import (
+    SplineMatrixCache,
+    spherical_spline_interpolation_matrix,
+    surface_laplacian_matrix,
+)
+
+
+def _fibonacci_sphere(n_points: int) -> np.ndarray:
+    """Nearly uniform points on the unit sphere."""
+    i = np.arange(n_points) + 0.5
+    polar = np.arccos(1 - 2 * i / n_points)
+    azimuth = np.pi * (1 + 5**0.5) * i
+    return np.column_stack(
+        [
+            np.cos(azimuth) * np.sin(polar),
+            np.sin(azimuth) * np.sin(polar),
+            np.cos(polar),
+        ]
+    )
+
+
+class TestSplineMatrices:
+    """Test the interpolation and Laplacian matrices."""
+
+    def test_laplacian_of_degree_one_harmonic(self):
+        """Test the Laplacian scales a degree-1 harmonic by -2."""
+        positions = _fibonacci_sphere(128)
+        harmonic = positions @ np.array([0.3, -0.5, 0.8])
+
+        laplacian = surface_laplacian_matrix(positions)
+
+        np.testing.assert_allclose(laplacian @ harmonic, -2 * harmonic, atol=1e-4)
+        # Constants have no curvature
+        np.testing.assert_allclose(laplacian.sum(axis=1), 0.0, atol=1e-8)
+
+    def test_laplacian_ignores_head_radius(self):
+        """Test positions are projected onto the unit sphere."""
+        positions = _fibonacci_sphere(64)
+
+        np.testing.assert_allclose(
+            surface_laplacian_matrix(positions * 0.09),
+            surface_laplacian_matrix(positions),
+        )
+
+    def test_interpolation_rows_sum_to_one(self):
+        """Test interpolation reproduces constants and smooth fields."""
+        positions = _fibonacci_sphere(64)
+        good, bad = positions[:-4], positions[-4:]
+
+        matrix = spherical_spline_interpolation_matrix(good, bad)
+
+        assert matrix.shape == (4, 60)
+        np.testing.assert_allclose(matrix.sum(axis=1), 1.0, atol=1e-10)
+        harmonic = positions @ np.array([1.0, 2.0, -1.0])
+        np.testing.assert_allclose(matrix @ harmonic[:-4], harmonic[-4:], atol=1e-3)
+
+
+class TestSplineMatrixCache:
+    """Test SplineMatrixCache."""
+
+    def test_hits_and_misses(self):
+        """Test a key is computed once and then served from the cache."""
+        cache = SplineMatrixCache(maxsize=4)
+        positions = _fibonacci_sphere(16)
+        computed = []
+
+        def compute():
+            computed.append(1)
+            return surface_laplacian_matrix(positions)
+
+        key = SplineMatrixCache.montage_key(positions)
+        first = cache.get_or_compute(key, compute)
+        second = cache.get_or_compute(
+            SplineMatrixCache.montage_key(positions.copy()), compute
+        )
+
+        assert second is first and len(computed) == 1
+        assert cache.get_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used key is evicted beyond maxsize."""
+        cache = SplineMatrixCache(maxsize=2)
+        computed = []
+
+        def compute(key):
+            def build():
+                computed.append(key)
+                return np.full((1, 1), key)
+
+            return build
+
+        cache.get_or_compute(1, compute(1))
+        cache.get_or_compute(2, compute(2))
+        cache.get_or_compute(1, compute(1))  # 2 is now least recently used
+        cache.get_or_compute(3, compute(3))
+        cache.get_or_compute(1, compute(1))
+        cache.get_or_compute(2, compute(2))
+
+        assert computed == [1, 2, 3, 2]
+        assert len(cache) == 2
+
+        cache.clear()
+        assert len(cache) == 0
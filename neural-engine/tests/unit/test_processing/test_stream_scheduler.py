@@ -0,0 +1,255 @@
+"""Tests for the shared stream scheduler and worker pool."""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+from processing.signal_processor import AdvancedSignalProcessor, ProcessingConfig
+from processing.stream_processor import (
+    SessionStream,
+    StreamConfig,
+    StreamProcessor,
+    _WorkerPool,
+)
+
+SAMPLING_RATE = 250.0
+N_CHANNELS = 4
+
+
+def _processor():
+    """Signal processor with a light pipeline."""
+    return AdvancedSignalProcessor(
+        ProcessingConfig(
+            sampling_rate=SAMPLING_RATE,
+            num_channels=N_CHANNELS,
+            preprocessing_steps=["bandpass_filter"],
+            feature_types=["time_domain"],
+            default_feature_executor="inline",
+        )
+    )
+
+
+async def _thread_name():
+    return threading.current_thread().name
+
+
+class TestWorkerPool:
+    """Test _WorkerPool."""
+
+    def test_sessions_are_pinned_to_one_worker(self):
+        """Test every coroutine of a key runs on the same worker thread."""
+        pool = _WorkerPool(3)
+        try:
+            threads = {}
+            for _ in range(5):
+                for key in (f"session-{i}" for i in range(12)):
+                    name = pool.submit(_thread_name(), key).result(timeout=5)
+                    threads.setdefault(key, set()).add(name)
+        finally:
+            pool.shutdown()
+
+        assert all(len(names) == 1 for names in threads.values())
+        used = set().union(*threads.values())
+        assert used <= {f"stream-worker-{i}" for i in range(3)}
+        assert len(used) > 1
+
+    def test_shutdown_stops_threads_and_closes_loops(self):
+        """Test shutdown joins the worker threads and closes their loops."""
+        pool = _WorkerPool(2)
+        threads = list(pool._threads)
+        loops = list(pool._loops)
+        assert pool.submit(_thread_name(), "a").result(timeout=5)
+
+        pool.shutdown()
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert all(loop.is_closed() for loop in loops)
+        assert pool._threads == [] and pool._loops == []
+
+
+class TestScheduler:
+    """Test window dispatch across sessions."""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_sessions(self):
+        """Test a backlogged session does not starve the others."""
+        stream = StreamProcessor(
+            _processor(),
+            StreamConfig(max_workers=2, max_processing_queue=100),
+        )
+        for session_id, n_windows in (("a", 6), ("b", 2), ("c", 2)):
+            session = SessionStream(session_id, 250, 125, 2500)
+            session.pending.extend((None, {}, 0.0) for _ in range(n_windows))
+            stream.sessions[session_id] = session
+            stream._session_order.append(session_id)
+
+        order = []
+        in_flight = []
+
+        async def run_window(session, window_data, window_info, ready_time):
+            order.append(session.session_id)
+            in_flight.append(stream._in_flight)
+            await asyncio.sleep(0)
+            session.in_flight -= 1
+            stream._in_flight -= 1
+
+        stream._run_window = run_window
+
+        for _ in range(100):
+            stream._dispatch_windows()
+            await asyncio.sleep(0.001)
+            if not any(s.pending for s in stream.sessions.values()):
+                break
+        await asyncio.sleep(0.01)
+
+        assert order == ["a", "b", "c", "a", "b", "c", "a", "a", "a", "a"]
+        assert max(in_flight) <= 2
+
+    @pytest.mark.asyncio
+    async def test_streams_run_pinned_and_shut_down(self):
+        """Test live sessions stay on one worker and the pool stops with them."""
+        processor = _processor()
+        calls = []
+        process_stream_chunk = processor.process_stream_chunk
+
+        async def recording_chunk(chunk, session_id, **kwargs):
+            calls.append((session_id, threading.current_thread().name))
+            return await process_stream_chunk(chunk, session_id, **kwargs)
+
+        processor.process_stream_chunk = recording_chunk
+
+        stream = StreamProcessor(
+            processor,
+            StreamConfig(
+                window_size_seconds=1.0,
+                window_overlap=0.5,
+                min_samples_to_process=1,
+                max_workers=2,
+            ),
+        )
+        info = {"n_channels": N_CHANNELS, "sampling_rate": SAMPLING_RATE}
+        sessions = ("s1", "s2", "s3")
+        for session_id in sessions:
+            assert await stream.start_stream(session_id, info)
+        pool = stream._worker_pool
+        threads = list(pool._threads)
+
+        data = np.random.default_rng(0).standard_normal((N_CHANNELS, 750))
+        for start in range(0, data.shape[1], 125):
+            for session_id in sessions:
+                assert await stream.process_chunk(
+                    data[:, start : start + 125], session_id=session_id
+                )
+            await asyncio.sleep(0.02)
+        for _ in range(200):
+            if all(
+                sum(call[0] == s for call in calls) >= 4
+                and not stream.sessions[s].pending
+                for s in sessions
+            ):
+                break
+            await asyncio.sleep(0.01)
+
+        # Windows ran on the workers, each session on a single one
+        window_calls = list(calls)
+        for session_id in sessions:
+            names = {name for s, name in window_calls if s == session_id}
+            assert len(names) == 1
+            assert names.pop().startswith("stream-worker-")
+
+        await stream.stop_all_streams()
+
+        assert not stream.is_running and stream._worker_pool is None
+        assert not any(thread.is_alive() for thread in threads)
+        assert processor.sessions == {}
+
+
+class TestSharedProcessor:
+    """Test a processor shared by several worker threads."""
+
+    def test_concurrent_sessions_keep_consistent_state(self):
+        """Test concurrent chunks of different sessions from many threads."""
+        processor = _processor()
+        sessions = [f"s{i}" for i in range(8)]
+        n_chunks = 5
+        chunk = np.random.default_rng(1).standard_normal((N_CHANNELS, 250))
+
+        async def setup():
+            for session_id in sessions:
+                await processor.setup_real_time_pipeline(session_id)
+
+        asyncio.run(setup())
+
+        def run_session(session_id):
+            async def run():
+                for _ in range(n_chunks):
+                    await processor.process_stream_chunk(chunk, session_id)
+
+            asyncio.run(run())
+
+        with concurrent.futures.ThreadPoolExecutor(len(sessions)) as executor:
+            list(executor.map(run_session, sessions))
+
+        stats = processor.get_processing_stats()
+        assert stats["total_samples_processed"] == len(sessions) * n_chunks * 250
+        assert len(stats["quality_scores"]) == len(sessions) * n_chunks
+        assert all(processor.sessions[s].chunks_processed == n_chunks for s in sessions)
+
+
+class TestQueueOverflow:
+    """Test the per-session processing queue bound."""
+
+    @staticmethod
+    async def _stream(drop_on_overflow):
+        """Stream with a session whose windows are never dispatched."""
+        stream = StreamProcessor(
+            _processor(),
+            StreamConfig(
+                window_size_seconds=1.0,
+                window_overlap=0.5,
+                max_processing_queue=2,
+                drop_on_overflow=drop_on_overflow,
+                max_workers=1,
+            ),
+        )
+        info = {"n_channels": N_CHANNELS, "sampling_rate": SAMPLING_RATE}
+        assert await stream.start_stream("s", info)
+        stream._dispatch_windows = lambda: None
+        return stream
+
+    @pytest.mark.asyncio
+    async def test_reject_mode_keeps_every_window(self):
+        """Test windows beyond the bound are kept and new input is rejected."""
+        stream = await self._stream(drop_on_overflow=False)
+        try:
+            data = np.random.default_rng(0).standard_normal((N_CHANNELS, 1250))
+            assert await stream.process_chunk(data, session_id="s")
+            await stream._collect_windows()
+
+            session = stream.sessions["s"]
+            assert len(session.pending) == 9
+            assert session.metrics.chunks_dropped == 0
+            assert not await stream.process_chunk(data[:, :125], session_id="s")
+        finally:
+            await stream.stop_all_streams()
+
+    @pytest.mark.asyncio
+    async def test_drop_mode_trims_oldest_windows(self):
+        """Test the oldest windows are dropped beyond the bound."""
+        stream = await self._stream(drop_on_overflow=True)
+        try:
+            data = np.random.default_rng(0).standard_normal((N_CHANNELS, 1250))
+            assert await stream.process_chunk(data, session_id="s")
+            await stream._collect_windows()
+
+            session = stream.sessions["s"]
+            assert [info["end_sample"] for _, info, _ in session.pending] == [
+                1125,
+                1250,
+            ]
+            assert session.metrics.chunks_dropped == 7
+        finally:
+            await stream.stop_all_streams()
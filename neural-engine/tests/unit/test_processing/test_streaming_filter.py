@@ -0,0 +1,158 @@
+"""Tests for causal filtering of streams as samples enter the buffer."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from processing.preprocessing import AdvancedFilters, StreamingFilterBank
+from processing.signal_processor import AdvancedSignalProcessor, ProcessingConfig
+from processing.stream_processor import StreamConfig, StreamProcessor
+
+SAMPLING_RATE = 250.0
+N_CHANNELS = 4
+
+
+def _config():
+    """Processing config with only the filter stages of the pipeline."""
+    return ProcessingConfig(
+        sampling_rate=SAMPLING_RATE,
+        num_channels=N_CHANNELS,
+        preprocessing_steps=["notch_filter", "bandpass_filter"],
+        feature_types=["time_domain"],
+        default_feature_executor="inline",
+    )
+
+
+def _signal(n_samples: int) -> np.ndarray:
+    """Alpha rhythm with line noise, drift and white noise."""
+    rng = np.random.default_rng(3)
+    t = np.arange(n_samples) / SAMPLING_RATE
+    return (
+        20 * np.sin(2 * np.pi * 10 * t)
+        + 15 * np.sin(2 * np.pi * 50 * t)
+        + 30 * t
+        + rng.standard_normal((N_CHANNELS, n_samples))
+    )
+
+
+def _continuous(sos: np.ndarray, data: np.ndarray) -> np.ndarray:
+    """One sosfilt call over the whole signal, starting in steady state."""
+    zi = signal.sosfilt_zi(sos)[:, np.newaxis, :] * data[np.newaxis, :, 0, np.newaxis]
+    filtered, _ = signal.sosfilt(sos, data, axis=1, zi=zi)
+    return filtered.astype(np.float32)
+
+
+class TestStreamingFilterBank:
+    """Test StreamingFilterBank."""
+
+    def _bank(self):
+        return AdvancedFilters(_config()).create_streaming_filter_bank(
+            N_CHANNELS,
+            SAMPLING_RATE,
+            notch_frequencies=[50.0, 100.0],
+            bandpass=(0.5, 100.0),
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 250])
+    def test_chunks_match_continuous_sosfilt(self, chunk_size):
+        """Test chunked filtering equals filtering the signal in one call."""
+        bank = self._bank()
+        data = _signal(1000)
+
+        chunks = [
+            bank.process(data[:, i : i + chunk_size])
+            for i in range(0, data.shape[1], chunk_size)
+        ]
+
+        np.testing.assert_allclose(
+            np.concatenate(chunks, axis=1),
+            _continuous(bank.sos, data),
+            rtol=1e-5,
+            atol=1e-4,
+        )
+        assert bank.samples_filtered == 1000
+
+    def test_reset_restarts_state(self):
+        """Test a reset filters the next chunk as the start of a stream."""
+        bank = self._bank()
+        data = _signal(500)
+        bank.process(data[:, :250])
+
+        bank.reset()
+
+        np.testing.assert_array_equal(
+            bank.process(data[:, 250:]), self._bank().process(data[:, 250:])
+        )
+
+    def test_rejects_channel_mismatch(self):
+        """Test chunks with the wrong channel count are refused."""
+        with pytest.raises(ValueError):
+            StreamingFilterBank(self._bank().sos, N_CHANNELS).process(np.zeros((2, 8)))
+
+
+class TestCausalStreamWindows:
+    """Test windows of causally filtered streams skip the offline filters."""
+
+    @pytest.mark.asyncio
+    async def test_windows_are_not_refiltered(self):
+        """Test windows equal the continuous causal filter output."""
+        processor = AdvancedSignalProcessor(_config())
+        calls = []
+        process = processor.preprocessor.process
+
+        async def recording_process(data, quality_metrics=None, **kwargs):
+            calls.append(kwargs)
+            return await process(data, quality_metrics, **kwargs)
+
+        processor.preprocessor.process = recording_process
+
+        windows = []
+
+        async def on_processed(session_id, result, window_info):
+            windows.append((result.processed_chunk, window_info))
+
+        stream = StreamProcessor(
+            processor,
+            StreamConfig(
+                window_size_seconds=1.0,
+                window_overlap=0.5,
+                causal_filtering=True,
+                min_samples_to_process=1,
+                max_processing_queue=100,
+                max_workers=1,
+                on_processed=on_processed,
+            ),
+        )
+        data = _signal(1000)
+
+        assert await stream.start_stream(
+            "s1", {"n_channels": N_CHANNELS, "sampling_rate": SAMPLING_RATE}
+        )
+        for start in range(0, data.shape[1], 50):
+            assert await stream.process_chunk(data[:, start : start + 50])
+            await asyncio.sleep(0.01)
+        for _ in range(200):
+            if len(windows) >= 7:
+                break
+            await asyncio.sleep(0.01)
+        await stream.stop_stream("s1")
+
+        sos = processor.preprocessor.create_streaming_filter_bank(
+            N_CHANNELS, SAMPLING_RATE
+        ).sos
+        expected = _continuous(sos, data)
+
+        assert len(windows) == 7
+        assert all(call["prefiltered"] for call in calls)
+        # Overlapping windows hand only their new samples to session state; the
+        # final flush of the buffer has none left
+        assert [call["new_samples"] for call in calls] == [250] + [125] * 6 + [0]
+        assert all(call["session_id"] == "s1" for call in calls)
+        for window, info in windows:
+            np.testing.assert_allclose(
+                window,
+                expected[:, info["start_sample"] : info["end_sample"]],
+                rtol=1e-6,
+            )
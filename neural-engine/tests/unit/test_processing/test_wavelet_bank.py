@@ -0,0 +1,102 @@
+"""Tests for the batched FFT Morlet wavelet transform."""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from processing.features.wavelet_bank import (
+    compute_wavelet_transform,
+    morlet_bank,
+    morlet_scales,
+)
+
+SAMPLING_RATE = 250.0
+FREQUENCIES = (4.0, 8.0, 12.0, 20.0, 30.0)
+
+
+def _morlet2(n_points: int, scale: float, omega0: float) -> np.ndarray:
+    """Complex Morlet wavelet as defined by scipy.signal.morlet2."""
+    x = (np.arange(n_points) - (n_points - 1) / 2) / scale
+    return np.pi**-0.25 * np.sqrt(1 / scale) * np.exp(1j * omega0 * x - 0.5 * x**2)
+
+
+def _direct_transform(data, frequencies, omega0):
+    """Centered direct convolution with odd-length morlet2 wavelets."""
+    n_samples = data.shape[-1]
+    coefficients = []
+    for scale in morlet_scales(frequencies, SAMPLING_RATE, omega0):
+        # Truncated to 10 scales like scipy.signal.cwt, at odd length
+        half = int(5 * scale)
+        wavelet = _morlet2(2 * half + 1, scale, omega0)
+        full = np.stack([signal.fftconvolve(x, wavelet) for x in data])
+        coefficients.append(full[:, half : half + n_samples])
+    return np.stack(coefficients, axis=1)
+
+
+@pytest.fixture
+def data():
+    """Four seconds of multi-channel noise with an alpha rhythm."""
+    rng = np.random.default_rng(5)
+    t = np.arange(int(4 * SAMPLING_RATE)) / SAMPLING_RATE
+    return 3 * np.sin(2 * np.pi * 10 * t) + rng.standard_normal((3, t.size))
+
+
+class TestWaveletTransform:
+    """Test compute_wavelet_transform."""
+
+    def test_matches_direct_morlet2_convolution(self, data):
+        """Test coefficients equal a centered convolution with morlet2."""
+        tensor = compute_wavelet_transform(data, SAMPLING_RATE, FREQUENCIES)
+        expected = _direct_transform(data, FREQUENCIES, 6.0)
+
+        assert tensor.coefficients.shape == (3, len(FREQUENCIES), data.shape[1])
+        scale = np.abs(expected).max()
+        np.testing.assert_allclose(
+            tensor.coefficients, expected, rtol=0, atol=2e-6 * scale
+        )
+
+    def test_unit_gain_passes_center_frequency(self):
+        """Test unit-gain wavelets keep the amplitude of their center sine."""
+        t = np.arange(int(4 * SAMPLING_RATE)) / SAMPLING_RATE
+        tone = np.sin(2 * np.pi * 10 * t)
+
+        tensor = compute_wavelet_transform(
+            tone, SAMPLING_RATE, [10.0], omega0=2 * np.pi, unit_gain=True
+        )
+
+        # Analytic wavelets keep half of the real sine's spectrum
+        middle = tensor.amplitude[0, 0, 250:-250]
+        np.testing.assert_allclose(middle, 0.5, atol=1e-3)
+
+
+class TestMorletBankCache:
+    """Test the morlet_bank LRU cache."""
+
+    def setup_method(self):
+        morlet_bank.cache_clear()
+
+    def teardown_method(self):
+        morlet_bank.cache_clear()
+
+    def test_bank_is_shared_and_read_only(self, data):
+        """Test repeated windows reuse one read-only bank."""
+        compute_wavelet_transform(data, SAMPLING_RATE, FREQUENCIES)
+        compute_wavelet_transform(data * 2, SAMPLING_RATE, list(FREQUENCIES))
+
+        info = morlet_bank.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+        bank = morlet_bank(SAMPLING_RATE, data.shape[1], FREQUENCIES)
+        assert bank is morlet_bank(SAMPLING_RATE, data.shape[1], FREQUENCIES)
+        assert not bank.flags.writeable
+
+    def test_evicts_least_recently_used(self):
+        """Test settings beyond maxsize evict the least recently used bank."""
+        maxsize = morlet_bank.cache_info().maxsize
+        first = morlet_bank(SAMPLING_RATE, 100, FREQUENCIES)
+        for n_samples in range(101, 101 + maxsize):
+            morlet_bank(SAMPLING_RATE, n_samples, FREQUENCIES)
+
+        assert morlet_bank.cache_info().currsize == maxsize
+        assert morlet_bank(SAMPLING_RATE, 100, FREQUENCIES) is not first
+        assert morlet_bank.cache_info().misses == maxsize + 2
@@ -0,0 +1,151 @@
+"""Tests for HeatmapGenerator, pinned to the previous per-point loops."""
+
+import numpy as np
+import pytest
+
+from src.visualization.omniverse.analytics.heatmap_generator import HeatmapGenerator
+
+
+def _reference_vertex_values(positions, values, vertices):
+    """Per-vertex inverse distance weighting used before."""
+    vertex_values = np.zeros(len(vertices))
+    for i, vertex in enumerate(vertices):
+        distances = np.linalg.norm(positions - vertex, axis=1)
+        weights = 1.0 / (distances + 1e-6)
+        weights /= np.sum(weights)
+        vertex_values[i] = np.sum(weights * values)
+    return vertex_values
+
+
+def _reference_smoothing(values, n_vertices, faces, smoothing_sigma):
+    """Per-vertex neighbour averaging used before."""
+    adjacency = {i: set() for i in range(n_vertices)}
+    for face in faces:
+        for i in range(3):
+            for j in range(3):
+                if i != j:
+                    adjacency[face[i]].add(face[j])
+
+    smoothed = values.copy()
+    for _ in range(int(smoothing_sigma * 2)):
+        new_values = smoothed.copy()
+        for i, neighbors in adjacency.items():
+            if neighbors:
+                neighbor_values = [smoothed[n] for n in neighbors]
+                new_values[i] = 0.7 * smoothed[i] + 0.3 * np.mean(neighbor_values)
+        smoothed = new_values
+    return smoothed
+
+
+def _reference_volume(positions, values, grid):
+    """Per-voxel Gaussian kernel weighting used before."""
+    xv, yv, zv = grid
+    volume = np.zeros(xv.shape)
+    for i in range(xv.shape[0]):
+        for j in range(xv.shape[1]):
+            for k in range(xv.shape[2]):
+                point = np.array([xv[i, j, k], yv[i, j, k], zv[i, j, k]])
+                distances = np.linalg.norm(positions - point, axis=1)
+                weights = np.exp(-(distances**2) / 0.1)
+                weights /= np.sum(weights)
+                volume[i, j, k] = np.sum(weights * values)
+    return volume
+
+
+def _small_mesh():
+    """Points on the unit sphere joined by random triangles."""
+    rng = np.random.default_rng(5)
+    vertices = rng.normal(size=(60, 3))
+    vertices /= np.linalg.norm(vertices, axis=1, keepdims=True)
+    faces = rng.integers(0, 60, (150, 3))
+    return vertices, faces
+
+
+@pytest.fixture
+def heatmap_generator():
+    """Create Heatmap Generator instance."""
+    return HeatmapGenerator()
+
+
+class TestHeatmapGenerator:
+    """Test HeatmapGenerator."""
+
+    def test_vertex_interpolation_matches_loop(self, heatmap_generator):
+        """Test the cached weight matrix equals per-vertex weighting."""
+        rng = np.random.default_rng(0)
+        vertices, _ = _small_mesh()
+        positions = rng.normal(size=(8, 3))
+        values = rng.random(8)
+
+        interpolated = heatmap_generator._interpolate_to_vertices(
+            positions, values, vertices
+        )
+
+        np.testing.assert_allclose(
+            interpolated,
+            _reference_vertex_values(positions, values, vertices),
+            rtol=0,
+            atol=1e-13,
+        )
+
+    @pytest.mark.parametrize("smoothing_sigma", [0.5, 1.0, 2.5])
+    def test_surface_smoothing_matches_loop(self, heatmap_generator, smoothing_sigma):
+        """Test the sparse smoothing operator equals neighbour averaging."""
+        vertices, faces = _small_mesh()
+        values = np.random.default_rng(1).random(len(vertices))
+        heatmap_generator.smoothing_sigma = smoothing_sigma
+
+        smoothed = heatmap_generator._smooth_on_surface(values, vertices, faces)
+
+        np.testing.assert_allclose(
+            smoothed,
+            _reference_smoothing(values, len(vertices), faces, smoothing_sigma),
+            rtol=0,
+            atol=1e-13,
+        )
+
+    def test_volume_interpolation_matches_loop(self, heatmap_generator):
+        """Test chunked volume interpolation equals the per-voxel loop."""
+        rng = np.random.default_rng(2)
+        positions = rng.uniform(-1, 1, size=(6, 3))
+        values = rng.random(6)
+        axis = np.linspace(-1, 1, 7)
+        grid = np.meshgrid(axis, axis, axis, indexing="ij")
+        heatmap_generator.volume_chunk_size = 50
+
+        volume = heatmap_generator._interpolate_to_volume(positions, values, grid)
+
+        np.testing.assert_allclose(
+            volume, _reference_volume(positions, values, grid), rtol=0, atol=1e-13
+        )
+
+    @pytest.mark.asyncio
+    async def test_surface_weights_cached(self, heatmap_generator):
+        """Test interpolation operators are reused across frames."""
+        positions = {"Fp1": (-0.3, 0.9, 0.0), "Fp2": (0.3, 0.9, 0.0)}
+        vertices = np.random.randn(100, 3) * 0.1
+        faces = np.random.randint(0, 100, (200, 3))
+
+        for value in (0.2, 0.8):
+            await heatmap_generator.generate_surface_heatmap(
+                positions, {"Fp1": value, "Fp2": 0.5}, vertices, faces
+            )
+
+        assert len(heatmap_generator.weight_cache) == 1
+        assert len(heatmap_generator.smoothing_cache) == 1
+
+        heatmap_generator.clear_cache()
+        assert not heatmap_generator.weight_cache
+
+    @pytest.mark.asyncio
+    async def test_generate_volume_heatmap(self, heatmap_generator):
+        """Test volume heatmap generation."""
+        heatmap_generator.volume_resolution = (8, 8, 8)
+        heatmap_generator.smoothing_sigma = 0
+        positions = {"Fp1": (-0.3, 0.9, 0.0), "Cz": (0.0, 0.0, 1.0)}
+        values = {"Fp1": 0.2, "Cz": 0.9}
+
+        volume = await heatmap_generator.generate_volume_heatmap(positions, values)
+
+        assert volume.shape == (8, 8, 8)
+        assert np.all(volume >= 0.2 - 1e-9) and np.all(volume <= 0.9 + 1e-9)